@@ -125,19 +125,21 @@ def getLumi ( data , *args ) :
             
             with rootError() : ## suppress errors from ROOT
                 
-                ## @attention here we are using sumVar! 
-                l1 = data.sumVar ( '1.0*IntegratedLuminosity+0.0*IntegratedLuminosityErr' , '0<=IntegratedLuminosity' )
-                l2 = data.sumVar ( '1.0*IntegratedLuminosity+1.0*IntegratedLuminosityErr' , '0<=IntegratedLuminosity' )
-                l3 = data.sumVar ( '1.0*IntegratedLuminosity-1.0*IntegratedLuminosityErr' , '0<=IntegratedLuminosity' )            
+                ## @attention here we are using the single-pass multi-accumulator! 
+                stats = data.statVars ( [
+                    ( '1.0*IntegratedLuminosity+0.0*IntegratedLuminosityErr' , '0<=IntegratedLuminosity'     ) ,
+                    ( '1.0*IntegratedLuminosity+1.0*IntegratedLuminosityErr' , '0<=IntegratedLuminosity'     ) ,
+                    ( '1.0*IntegratedLuminosity-1.0*IntegratedLuminosityErr' , '0<=IntegratedLuminosity'     ) ,
+                    ( 'IntegratedLuminosity'                                 , '0 >IntegratedLuminosity'     ) ,
+                    ( 'IntegratedLuminosity'                                 , 'IntegratedLuminosity>100000' ) ,
+                    ( 'IntegratedLuminosity'                                 , '0>IntegratedLuminosityErr'   ) ] )
+                l1 , l2 , l3 , c1 , c2 , c3 = [ VE ( s.sum () , s.sum2 () ) for s in stats ]
                 #
                 l1.setError ( 0.5 * abs ( l2.value () - l3.value () ) )
                 #
-                l0 = data.sumVar ( 'IntegratedLuminosity' , '0 >IntegratedLuminosity'      )
-                if 0 != l0.value() : logger.error( 'Something weird happens with Lumi/1: %s' % l0 )  
-                l0 = data.sumVar ( 'IntegratedLuminosity' , 'IntegratedLuminosity>100000'  )
-                if 0 != l0.value() : logger.error( 'Something weird happens with Lumi/2: %s' % l0 )  
-                l0 = data.sumVar ( 'IntegratedLuminosity' , '0>IntegratedLuminosityErr'    )
-                if 0 != l0.value() : logger.error( 'Something weird happens with Lumi/3: %s' % l0 )  
+                if 0 != c1.value() : logger.error( 'Something weird happens with Lumi/1: %s' % c1 )  
+                if 0 != c2.value() : logger.error( 'Something weird happens with Lumi/2: %s' % c2 )  
+                if 0 != c3.value() : logger.error( 'Something weird happens with Lumi/3: %s' % c3 )  
                 # 
                 return l1
         except :
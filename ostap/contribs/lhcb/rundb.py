@@ -24,8 +24,12 @@ __all__     = (
     'run_info'   , ## get run information from RunDB  
     'fill_info'  , ## get fill information from RunDB 
     'fill_number', ## get fill number from given run-number 
+    'prefetch'   , ## prefetch run&fill information for many runs 
     'run_url'    , ## pattern for run-information in LHCb RunDB 
     'fill_url'   , ## pattern for fill-information in LHCb RunDB 
+    'RunDBCache' , ## persistent cache for LHCb RunDB 
+    'use_cache'  , ## (re)define the default persistent cache 
+    'DEFAULT_RUNDB_CACHE' , ## the name of default database 
     ) 
 # =============================================================================
 # logging 
@@ -36,17 +40,281 @@ else                       : logger = getLogger ( __name__           )
 # =============================================================================
 logger.debug ( 'Collection of utilities to deal with LHCb RunDB')
 # =============================================================================
-import json,urllib
-# =============================================================================
-## local caches to minimize accesses to RunDB 
-# =============================================================================
-_fills_  = {} ## mapping: n-run  -> n-fill
-_finfos_ = {} ## mapping: n-fill -> fill-info
-_rinfos_ = {} ## mapping: n-run  -> run-info
+import os, time, json, urllib2
 # =============================================================================
 ## LHCb RunDB url format 
 run_url  = 'http://lbrundb.cern.ch/api/run/{0}/'  ## pattern for runs  
 fill_url = 'http://lbrundb.cern.ch/api/fill/{0}/' ## pattern for fills 
+# =============================================================================
+## the default database for the persistent cache 
+DEFAULT_RUNDB_CACHE = os.environ.get ( 'OSTAP_RUNDB_CACHE' , '~/.ostap/rundb_cache.msql' )
+## the default time-to-live for the cached records (in seconds): 30 days 
+DEFAULT_TTL         = 30 * 24 * 3600 
+# =============================================================================
+## @class RunDBCache
+#  Persistent cache for LHCb RunDB
+#  - the run/fill information is kept in the local database (SQLiteShelf)
+#    together with the time of the request, the records older than
+#    <code>ttl</code> seconds are refreshed
+#  - the missing information for many runs can be prefetched concurrently
+#  @code
+#  cache = RunDBCache ()  ## use the default database 
+#  cache.prefetch ( runs , nthreads = 8 )
+#  for run in runs : print run , cache.fill_number ( run ) 
+#  @endcode
+#  For tests one can use the local ``stand-in'' server:
+#  @code
+#  cache = RunDBCache ( dbname   = 'test.msql' ,
+#                       run_url  = 'http://localhost:8000/api/run/{0}/' ,
+#                       fill_url = 'http://localhost:8000/api/fill/{0}/' ) 
+#  @endcode
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+class RunDBCache(object) :
+    """Persistent cache for LHCb RunDB
+    - the run/fill information is kept in the local database (SQLiteShelf)
+    together with the time of the request, the records older than
+    ``ttl'' seconds are refreshed
+    - the missing information for many runs can be prefetched concurrently
+    >>> cache = RunDBCache ()  ## use the default database 
+    >>> cache.prefetch ( runs , nthreads = 8 )
+    >>> for run in runs : print run , cache.fill_number ( run ) 
+    For tests one can use the local ``stand-in'' server:
+    >>> cache = RunDBCache ( dbname   = 'test.msql' ,
+    ...                      run_url  = 'http://localhost:8000/api/run/{0}/' ,
+    ...                      fill_url = 'http://localhost:8000/api/fill/{0}/' ) 
+    """
+    def __init__ ( self                         ,
+                   dbname   = DEFAULT_RUNDB_CACHE ,
+                   ttl      = DEFAULT_TTL         ,
+                   run_url  = None                , 
+                   fill_url = None                ,
+                   timeout  = 10                  ) :
+        
+        self.__dbname   = os.path.expanduser ( os.path.expandvars ( dbname ) ) if dbname else None
+        self.__ttl      = ttl 
+        self.__run_url  = run_url 
+        self.__fill_url = fill_url
+        self.__timeout  = timeout 
+        self.__db       = None
+        self.__opened   = False 
+        ## in-memory caches 
+        self.__runs     = {} ## mapping: n-run  -> run-info
+        self.__fills    = {} ## mapping: n-fill -> fill-info
+
+    @property
+    def dbname ( self ) :
+        """``dbname'' : the name of the database (None for non-persistent cache)"""
+        return self.__dbname
+    
+    @property
+    def ttl    ( self ) :
+        """``ttl'' : time-to-live for the cached records (in seconds), None for infinite"""
+        return self.__ttl
+    
+    ## the URL for the run or fill 
+    def __url ( self , what , num ) :
+        if 'run' == what : return ( self.__run_url  or run_url  ).format ( num )
+        return                    ( self.__fill_url or fill_url ).format ( num )
+    
+    ## open the database (only once), None if not possible
+    def __open ( self ) :
+        if self.__opened : return self.__db
+        self.__opened = True 
+        if not self.__dbname : return None
+        try :
+            dirname = os.path.dirname ( self.__dbname )
+            if dirname and not os.path.exists ( dirname ) : os.makedirs ( dirname )
+            import ostap.io.sqliteshelve as sqliteshelve
+            self.__db = sqliteshelve.open ( self.__dbname , 'c' )
+        except Exception , e :
+            logger.warning ( "RunDBCache: unable to open database '%s': %s" % ( self.__dbname , e ) )
+        return self.__db
+
+    ## close the database 
+    def close ( self ) :
+        """Close the database"""
+        if self.__db is not None : self.__db.close ()
+        self.__db     = None
+        self.__opened = False
+        
+    def __enter__ ( self      ) : return self
+    def __exit__  ( self , *_ ) : self.close () 
+
+    # =========================================================================
+    ## fetch the information from RunDB
+    #  @return ( ok , info ) : ok is False for the failed request 
+    def _fetch ( self , what , num ) :
+        """Fetch the information from RunDB
+        - return ( ok , info ) : ok is False for the failed request 
+        """
+        url = self.__url ( what , num )
+        try :
+            _obj = urllib2.urlopen ( url , timeout = self.__timeout )
+            try :
+                info = json.load ( _obj )
+            finally :
+                _obj.close ()
+            return True , ( info if info else None )
+        except urllib2.HTTPError , e :
+            ## unknown run/fill: the valid (negative) answer 
+            if 404 == e.code : return True , None
+            logger.warning ( "RunDB: unable to get %s #%s from %s: %s" % ( what , num , url , e ) )
+        except Exception , e :
+            logger.warning ( "RunDB: unable to get %s #%s from %s: %s" % ( what , num , url , e ) )
+        return False , None 
+
+    ## the key in the database 
+    @staticmethod 
+    def __key ( what , num ) : return '%s:%s' % ( what , num )
+
+    ## get the valid record from the database 
+    def __lookup ( self , what , num ) :
+        db  = self.__open ()
+        if db is None : return False , None 
+        rec = db.get ( self.__key ( what , num ) , None )
+        if rec is None : return False , None 
+        if self.__ttl is not None and self.__ttl < time.time () - rec [ 'time' ] :
+            return False , None
+        return True , rec [ 'info' ] 
+
+    ## store the records in the database and in the memory 
+    def __store ( self , what , results ) :
+        memory = self.__runs if 'run' == what else self.__fills
+        now    = time.time () 
+        items  = []
+        for num , info in results :
+            memory [ num ] = info
+            items.append ( ( self.__key ( what , num ) , { 'time' : now , 'info' : info } ) )
+        db = self.__open ()
+        if db is not None and items : db.update ( items )
+
+    ## get the information for the run or fill 
+    def __info ( self , what , num ) :
+        memory = self.__runs if 'run' == what else self.__fills
+        if num in memory : return memory [ num ]
+        ok , info = self.__lookup ( what , num )
+        if ok :
+            memory [ num ] = info
+            return info
+        ok , info = self._fetch ( what , num )
+        if ok : self.__store ( what , [ ( num , info ) ] )
+        return info
+    
+    # =========================================================================
+    ## get run info for the given run
+    #  @see run_info 
+    def run_info  ( self , run_num  ) :
+        """Get run info for the given run
+        - see run_info
+        """
+        return self.__info ( 'run'  , run_num  )
+    
+    # =========================================================================
+    ## get fill info for the given fill
+    #  @see fill_info 
+    def fill_info ( self , fill_num ) :
+        """Get fill info for the given fill
+        - see fill_info
+        """
+        return self.__info ( 'fill' , fill_num )
+
+    # =========================================================================
+    ## get fill number for the given run, -1 if not known 
+    #  @see fill_number 
+    def fill_number ( self , run_num ) :
+        """Get fill number for the given run, -1 if not known
+        - see fill_number
+        """
+        rinfo = self.run_info ( run_num )
+        return rinfo.get ( 'fillid' , -1 ) if rinfo else -1
+    
+    # =========================================================================
+    ## resolve the missing information for many runs/fills concurrently
+    def __prefetch ( self , what , nums , nthreads ) :
+        memory = self.__runs if 'run' == what else self.__fills
+        todo   = []
+        seen   = set() ## NB: the set for the fast lookup, the list keeps the order 
+        for num in nums :
+            if num in memory or num in seen : continue
+            seen.add ( num ) 
+            ok , info = self.__lookup ( what , num )
+            if ok : memory [ num ] = info
+            else  : todo.append ( num )
+        if not todo : return 0
+        
+        nthreads = max ( 1 , min ( int ( nthreads ) , len ( todo ) ) ) 
+        if 1 < nthreads :
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool ( nthreads )
+            try :
+                fetched = pool.map ( lambda n : self._fetch ( what , n ) , todo )
+            finally : 
+                pool.close     ()
+                pool.terminate ()
+        else :
+            fetched = [ self._fetch ( what , n ) for n in todo ]
+            
+        results = [ ( n , info ) for n , ( ok , info ) in zip ( todo , fetched ) if ok ]
+        self.__store ( what , results )
+        return len ( results )
+    
+    # =========================================================================
+    ## prefetch the run information (and the fill information) for many runs:
+    #  the missing or expired entries are resolved concurrently
+    #  @code
+    #  cache = RunDBCache () 
+    #  cache.prefetch ( runs , nthreads = 8 )
+    #  @endcode
+    #  @param runs     the list of runs
+    #  @param nthreads the size of the pool of threads 
+    #  @param fills    prefetch also the fill information for the runs
+    #  @return number of fetched records 
+    def prefetch ( self , runs , nthreads = 8 , fills = True ) :
+        """Prefetch the run information (and the fill information) for many runs:
+        the missing or expired entries are resolved concurrently
+        >>> cache = RunDBCache () 
+        >>> cache.prefetch ( runs , nthreads = 8 )
+        - return number of fetched records 
+        """
+        runs = list ( runs )
+        n    = self.__prefetch ( 'run' , runs , nthreads )
+        if fills :
+            ## NB: only the resolved runs: the failed requests are not repeated here 
+            rinfos = [ self.__runs.get ( r , None ) for r in runs ]
+            fnums  = [ i.get ( 'fillid' , -1 ) for i in rinfos if i ]
+            n     += self.__prefetch ( 'fill' , [ f for f in fnums if 0 <= f ] , nthreads )
+        return n
+
+    def __repr__ ( self ) : return "RunDBCache('%s')" % self.__dbname
+    __str__ = __repr__
+
+# =============================================================================
+## the default cache 
+_rundb_ = None
+# =============================================================================
+## (re)define the default persistent cache for LHCb RunDB
+#  @code
+#  use_cache ( 'my_rundb.msql' , ttl = 3600 )
+#  use_cache ( None )  ## no persistent cache 
+#  @endcode
+#  @return the cache 
+def use_cache ( dbname = DEFAULT_RUNDB_CACHE , ttl = DEFAULT_TTL , **kwargs ) :
+    """(Re)define the default persistent cache for LHCb RunDB
+    >>> use_cache ( 'my_rundb.msql' , ttl = 3600 )
+    >>> use_cache ( None )  ## no persistent cache 
+    - return the cache 
+    """
+    global _rundb_
+    if _rundb_ is not None : _rundb_.close ()
+    _rundb_ = RunDBCache ( dbname , ttl , **kwargs ) 
+    return _rundb_
+
+# =============================================================================
+## get the default cache 
+def _cache_ () :
+    return _rundb_ if _rundb_ is not None else use_cache ()
+
 # =============================================================================
 ## get run info for the given run from LHCb runDB
 #  @code
@@ -59,8 +327,8 @@ fill_url = 'http://lbrundb.cern.ch/api/fill/{0}/' ## pattern for fills
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2015-01-12
 #  @param run_number  run number
-#  @return run information from LHCb RunDB 
-#  @code
+#  @return run information from LHCb RunDB
+#  @see RunDBCache 
 def run_info ( run_num ) :
     """Get run info for the given run from LHCb runDB
     >>> run  =  169064
@@ -69,25 +337,7 @@ def run_info ( run_num ) :
     >>> print 'Magnet: %s' % rinfo['magnetState']
     >>> print 'Velo  : %s' % rinfo['veloPosition']
     """    
-    global _rinfos_
-    rinfo  = _rinfos_.get ( run_num , None )
-    if rinfo : return rinfo 
-    
-    try :
-        
-        #
-        url   = run_url.format  ( run_num  )
-        _obj  = urllib.urlopen  ( url      )
-        rinfo = json.load       ( _obj     )
-
-        rinfo = rinfo if rinfo else None
-        _rinfos_ [ run_num ] = rinfo 
-        return rinfo
-        
-    except:
-        return None 
-
-    return None
+    return _cache_ ().run_info ( run_num ) 
 
 # =============================================================================
 ## get fill info for the given run from LHCb runDB
@@ -103,7 +353,7 @@ def run_info ( run_num ) :
 #  @date   2015-01-12
 #  @param fill_num  fill number
 #  @return fill information from LHCb RunDB 
-#  @code
+#  @see RunDBCache 
 def fill_info ( fill_num ) :
     """Get fill info for the given run from LHCb runDB
     >>> fill  =  4691
@@ -113,25 +363,7 @@ def fill_info ( fill_num ) :
     >>> print 'Beam-1 bunches    : %s' % finfo ['nBunchesB1']
     >>> print 'Beam-2 bunches    : %s' % finfo ['nBunchesB2']    
     """    
-    global _finfos_
-    finfo  = _finfos_.get ( fill_num , None )
-    if finfo : return finfo 
-    
-    try :
-        #
-        url   = fill_url.format ( fill_num  )
-        _obj  = urllib.urlopen  ( url      )
-        finfo = json.load       ( _obj     )
-        
-        finfo = finfo if finfo else None 
-        
-        _finfos_ [ fill_num ] = finfo 
-        return finfo
-    
-    except:
-        return None 
-
-    return None
+    return _cache_ ().fill_info ( fill_num ) 
     
 # ===============================================================================
 ## get n-fill from n-run using LHCb RunDB
@@ -153,15 +385,30 @@ def fill_number ( run_number ) :
     >>> fill = fill_number ( run )
     >>> print 'Run/Fill# %s/%s ' % ( run , fill)
     """
-    global _fills_
-    fill_num = _fills_.get( run_number , None )
-    if fill_num : return fill_num
+    return _cache_ ().fill_number ( run_number ) 
 
-    rinfo = run_info ( run_number )
-
-    fill_num = rinfo.get ( 'fillid' , -1 ) if rinfo else -1
-    _fills_ [ run_number ] = fill_num
-    return  fill_num
+# ===============================================================================
+## prefetch the run&fill information for many runs from LHCb RunDB:
+#  the missing or expired entries are resolved concurrently
+#  @code
+#  runs = ...
+#  prefetch ( runs , nthreads = 8 )
+#  for run in runs : print run , fill_number ( run ) 
+#  @endcode 
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+#  @param runs     the list of runs
+#  @param nthreads the size of the pool of threads 
+#  @return number of fetched records 
+#  @see RunDBCache 
+def prefetch ( runs , nthreads = 8 , fills = True ) :
+    """Prefetch the run&fill information for many runs from LHCb RunDB:
+    the missing or expired entries are resolved concurrently
+    >>> runs = ...
+    >>> prefetch ( runs , nthreads = 8 )
+    >>> for run in runs : print run , fill_number ( run ) 
+    """
+    return _cache_ ().prefetch ( runs , nthreads , fills ) 
     
 # =============================================================================
 if '__main__' == __name__  :
@@ -196,6 +443,8 @@ if '__main__' == __name__  :
 
     from ostap.utils.utils import timing    
     runs =  [ 0,  1 , 169064 , 5 , 6 , 98241980 , 169064  , 2334 , 2334 , 524387 ]
+    with timing() :
+        prefetch ( runs ) 
     for run in runs :
         with timing() :
             fill = fill_number ( run )
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for the persistent cache of LHCb RunDB from ostap/contribs/lhcb/rundb.py
+The local stand-in HTTP server is used instead of LHCb RunDB:
+- the records are persistent and expire after ``ttl'' seconds
+- the unknown runs (404) are cached
+- the failed requests are not cached
+- prefetch does not repeat the failed requests
+"""
+# =============================================================================
+import os, json, tempfile, threading
+import BaseHTTPServer, SocketServer
+from   ostap.contribs.lhcb.rundb import RunDBCache 
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_rundb' )
+else                       : logger = getLogger ( __name__     )
+# =============================================================================
+## the requests to the local server 
+requests = []
+# =============================================================================
+## local stand-in for LHCb RunDB:
+#  - run  #N  : fill #N/10
+#  - run  #404: unknown run
+#  - runs #500-599 : server failure 
+class RunDBHandler(BaseHTTPServer.BaseHTTPRequestHandler) :
+    def do_GET ( self ) :
+        requests.append ( self.path )
+        what , num = self.path.strip('/').split('/') [ -2: ]
+        num = int ( num )
+        if   404 == num        : self.send_response ( 404 ) 
+        elif 500 <= num < 600  : self.send_response ( 500 )
+        else :
+            self.send_response ( 200 )
+            self.end_headers   ()
+            info = { 'runid'  : num , 'fillid' : num // 10 } if 'run' == what else { 'fillid' : num }
+            self.wfile.write   ( json.dumps ( info ) )
+            return
+        self.end_headers () 
+    def log_message ( self , *args ) : pass
+    
+class RunDBServer(SocketServer.ThreadingMixIn,BaseHTTPServer.HTTPServer) :
+    daemon_threads = True
+
+# =============================================================================
+## create the cache that uses the local server 
+def make_cache ( server , dbname , ttl ) :
+    port = server.server_address [ 1 ]
+    return RunDBCache ( dbname   , ttl ,
+                        run_url  = 'http://127.0.0.1:%d/api/run/{0}/'  % port ,
+                        fill_url = 'http://127.0.0.1:%d/api/fill/{0}/' % port ,
+                        timeout  = 2 )
+
+# =============================================================================
+def test_rundb_cache () :
+
+    server = RunDBServer ( ( '127.0.0.1' , 0 ) , RunDBHandler )
+    thread = threading.Thread ( target = server.serve_forever )
+    thread.daemon = True 
+    thread.start ()
+    
+    dbname = tempfile.mktemp ( suffix = '.msql' )
+    try :
+        
+        with make_cache ( server , dbname , ttl = 3600 ) as cache :
+            assert 12 == cache.fill_number ( 123 ) , 'Invalid fill number!'
+            assert cache.run_info  ( 404 ) is None , 'Invalid info for unknown run!'
+            assert cache.run_info  ( 500 ) is None , 'Invalid info for failed request!'
+            assert 3 == len ( requests ) , 'Invalid number of requests!'
+
+            ## in-memory cache 
+            cache.run_info ( 123 )
+            assert 3 == len ( requests ) , 'Run is not cached in memory!'
+
+            ## prefetch: failed requests are not repeated for the fill numbers 
+            del requests [ : ]
+            cache.prefetch ( list ( range ( 130 , 140 ) ) + [ 501 , 502 ] , nthreads = 4 )
+            assert 13 == len ( requests ) , 'Invalid number of requests for prefetch: %d ' % len ( requests ) 
+            
+        ## persistent cache: known and unknown runs are not requested, failed runs are
+        del requests [ : ]
+        with make_cache ( server , dbname , ttl = 3600 ) as cache :
+            assert 12 == cache.fill_number ( 123 ) , 'Invalid fill number!'
+            assert cache.run_info ( 404 ) is None  , 'Invalid info for unknown run!'
+            assert not requests , 'Run is not cached persistently: %s' % requests
+            cache.run_info ( 500 )
+            assert 1 == len ( requests ) , 'Failed request is cached!'
+
+        ## expired records are requested again 
+        del requests [ : ]
+        with make_cache ( server , dbname , ttl = 0 ) as cache :
+            assert 12 == cache.fill_number ( 123 ) , 'Invalid fill number!'
+            assert cache.run_info ( 404 ) is None  , 'Invalid info for unknown run!'
+            assert 2 == len ( requests ) , 'Expired records are not refreshed!'
+            
+    finally :
+        server.shutdown ()
+        if os.path.exists ( dbname ) : os.remove ( dbname ) 
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_rundb_cache () 
+    
+# =============================================================================
+# The END
+# =============================================================================
@@ -49,7 +49,7 @@ __all__     = (
     'FAILURE'          ,  ## status code FAILURE 
     )
 # =============================================================================
-import ROOT, cppyy, math, sys
+import ROOT, cppyy, math, sys, os
 cpp = cppyy.gbl
 std = cpp.std 
 # =============================================================================
@@ -113,29 +113,72 @@ class ROOTCWD(object) :
             elif     self._dir.IsOpen()               : self._dir.cd()
             
 # =============================================================================
-## global identifier for ROOT objects 
+## the state of the allocator of unique ROOT identifiers:
+#  - per-prefix monotonic counters
+#  - the process ID: for the child processes (e.g. parallel workers)
+#    the identifiers are salted with PID and the counters are restarted 
+_root_IDs_ = { 'pid' : None , 'counters' : {} }
+# =============================================================================
+## is the identifier already used by some ROOT object?
+#  (the ``full'' check, used for the first allocation per prefix)
+def _root_used_ ( _id ) :
+    """Is the identifier already used by some ROOT object?
+    (the ``full'' check, used for the first allocation per prefix)
+    """
+    grd  = ROOT.gROOT
+    cwd  = grd.CurrentDirectory()
+    return grd.FindObject    ( _id ) or \
+           grd.FindObjectAny ( _id ) or \
+           cwd.FindObject    ( _id ) or \
+           cwd.FindObjectAny ( _id ) 
+    
+# =============================================================================
+## global identifier for ROOT objects
+#  - per-prefix monotonic counter: constant cost per call 
+#  - in the child processes (e.g. parallel workers) the identifiers
+#    are salted with PID, e.g. <code>h_12345_1000</code>
+#  - the full collision check (the recursive directory scan) is performed
+#    only for the first allocation per prefix, later only the cheap
+#    (hashed) lookup in the current directory is performed 
+#  @code
+#  hid = rootID ( 'h_' ) 
+#  @endcode 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
 def rootID ( prefix = 'o_' ) :
-    """ Construct the unique ROOT-id 
+    """ Construct the unique ROOT-id
+    - per-prefix monotonic counter: constant cost per call 
+    - in the child processes (e.g. parallel workers) the identifiers
+    are salted with PID, e.g. h_12345_1000
+    - the full collision check (the recursive directory scan) is performed
+    only for the first allocation per prefix, later only the cheap
+    (hashed) lookup in the current directory is performed 
+    >>> hid = rootID ( 'h_' ) 
     """
-    _fun = lambda i : prefix + '%d'% i
+    pid = os.getpid()
+    if   _root_IDs_ [ 'pid' ] is None : _root_IDs_ [ 'pid' ] = pid 
+    elif _root_IDs_ [ 'pid' ] != pid  :
+        ## child process: restart the counters in the salted namespace 
+        _root_IDs_ [ 'pid'      ] = pid
+        _root_IDs_ [ 'counters' ] = {}
+        _root_IDs_ [ 'salt'     ] = '%d_' % pid 
     
-    _root_ID = 1000
+    salt     = _root_IDs_.get ( 'salt' , '' )
+    counters = _root_IDs_ [ 'counters' ]
+    first    = not prefix in counters
+    _root_ID = counters.get ( prefix , 1000 ) 
     ## 
     with ROOTCWD() : ## keep the current working directory:
         
-        _id  = _fun ( _root_ID )
-        grd  = ROOT.gROOT
-        cwd  = grd.CurrentDirectory()
-        while grd.FindObject    ( _id ) or \
-              grd.FindObjectAny ( _id ) or \
-              cwd.FindObject    ( _id ) or \
-              cwd.FindObjectAny ( _id ) : 
-                
-            _root_ID += 10 
-            _id       = _fun ( _root_ID ) 
+        cwd  = ROOT.gROOT.CurrentDirectory()
+        while True :
+            _id       = '%s%s%d' % ( prefix , salt , _root_ID )
+            _root_ID += 1
+            if first :
+                if not _root_used_   ( _id ) : break
+            elif not cwd.FindObject  ( _id ) : break 
             
+    counters [ prefix ] = _root_ID 
     return _id                 ## RETURN
 # =============================================================================
 ## global ROOT identified for function objects 
@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file lazy.py
+#
+#  Registry of ``lazy'' decorations for ROOT objects:
+#  the module with decorations is imported only when the decorated
+#  class is touched for the first time:
+#  - the first access to the missing attribute for the instance of the
+#    ``trigger'' class
+#  - the first call of the special method (e.g. <code>len</code>,
+#    operators, etc) for the instance of the ``trigger'' class
+#
+#  @code
+#  import ostap.core.lazy as lazy
+#  lazy.register ( 'ostap.trees.trees' , triggers = ( 'ROOT.TTree' , ) ,
+#                  specials = ( 'ROOT.TTree.__len__' , ) )
+#  ...
+#  tree = ...
+#  tree.project ( ... )   ## ostap.trees.trees is imported here
+#  @endcode
+#
+#  Only the modules that add the new attributes can be lazy:
+#  <code>__getattr__</code> is never invoked for the existing attributes,
+#  therefore the modules that redefine them (e.g. <code>TMinuit.Print</code>)
+#  are imported immediately, @see register 
+#
+#  Eager loading of all registered decorations can be forced by
+#  the environment variable <code>OSTAP_EAGER</code> or by
+#  the explicit call
+#  @code
+#  import ostap.core.lazy as lazy
+#  lazy.load_all ()
+#  @endcode
+#
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Registry of ``lazy'' decorations for ROOT objects:
+the module with decorations is imported only when the decorated
+class is touched for the first time:
+- the first access to the missing attribute for the instance of the
+  ``trigger'' class
+- the first call of the special method (e.g. len, operators, etc)
+  for the instance of the ``trigger'' class
+
+>>> import ostap.core.lazy as lazy
+>>> lazy.register ( 'ostap.trees.trees' , triggers = ( 'ROOT.TTree' , ) ,
+...                 specials = ( 'ROOT.TTree.__len__' , ) )
+>>> tree = ...
+>>> tree.project ( ... )   ## ostap.trees.trees is imported here
+
+Only the modules that add the new attributes can be lazy:
+__getattr__ is never invoked for the existing attributes,
+therefore the modules that redefine them (e.g. TMinuit.Print)
+are imported immediately, see register
+
+Eager loading of all registered decorations can be forced by
+the environment variable OSTAP_EAGER or by the explicit call
+
+>>> import ostap.core.lazy as lazy
+>>> lazy.load_all ()
+"""
+# =============================================================================
+__version__ = '$Revision$'
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = '2018-05-20'
+__all__     = (
+    'register'    , ## register the lazy decorations
+    'load'        , ## load the registered decorations
+    'load_all'    , ## load all registered decorations
+    'lazy_stats'  , ## the status of the registered decorations
+    'eager'       , ## force eager loading?
+    )
+# =============================================================================
+import os, sys, time
+from   collections import OrderedDict
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__ : logger = getLogger ( 'ostap.core.lazy' )
+else                      : logger = getLogger ( __name__          )
+# =============================================================================
+## force the eager loading of all decorations?
+eager = os.environ.get ( 'OSTAP_EAGER' , '' ).lower() in ( '1' , 'yes' , 'true' , 'on' )
+# =============================================================================
+## the registered groups of decorations: { module : group }
+_groups_ = OrderedDict()
+## the installed attribute hooks: { class : [ groups ] }
+_hooks_  = {}
+## the marker for the lazy hooks&stubs
+_marker_ = '_ostap_lazy_'
+# =============================================================================
+## resolve the dotted name, e.g. <code>'ROOT.TTree'</code>
+def _resolve_ ( name ) :
+    """Resolve the dotted name, e.g. 'ROOT.TTree'"""
+    items = name.split ( '.' )
+    if   'ROOT'  == items [ 0 ] :
+        import ROOT
+        obj = ROOT
+    elif 'Ostap' == items [ 0 ] :
+        from ostap.core.core import Ostap
+        obj = Ostap
+    else :
+        obj = __import__ ( items [ 0 ] )
+    for item in items [ 1: ] : obj = getattr ( obj , item )
+    return obj
+
+# =============================================================================
+## is it our hook/stub?
+def _is_lazy_ ( obj ) :
+    """Is it our hook/stub?"""
+    return getattr ( obj , _marker_ , False )
+
+# =============================================================================
+## @class LazyGroup
+#  The group of decorations, defined in one module
+class LazyGroup(object) :
+    """The group of decorations, defined in one module"""
+    def __init__ ( self , module , triggers = () , specials = () ) :
+        self.module    = module
+        self.triggers  = tuple ( triggers )
+        self.specials  = tuple ( specials )
+        self.load_time = 0.0
+        self.__stubs   = []   ## installed stubs: ( class , name , previous )
+
+    @property
+    def loaded ( self ) :
+        """``loaded'' : is the module with decorations already imported?"""
+        return self.module in sys.modules
+
+    ## install the stubs for the special methods
+    def install ( self ) :
+        """Install the stubs for the special methods"""
+        for s in self.specials :
+            cname , name = s.rsplit ( '.' , 1 )
+            klass = _resolve_ ( cname )
+            prev  = klass.__dict__.get ( name , None )
+            setattr ( klass , name , _make_special_ ( self , name ) )
+            self.__stubs.append ( ( klass , name , prev ) )
+
+    ## remove the stubs, that are not replaced by the actual decorations
+    def uninstall ( self ) :
+        """Remove the stubs, that are not replaced by the actual decorations"""
+        while self.__stubs :
+            klass , name , prev = self.__stubs.pop()
+            if not _is_lazy_ ( klass.__dict__.get ( name , None ) ) : continue
+            if prev is None : delattr ( klass , name )
+            else            : setattr ( klass , name , prev )
+
+    ## load the decorations
+    def load ( self ) :
+        """Load the decorations"""
+        if not self.loaded :
+            start = time.time()
+            logger.debug ( 'Load decorations from %s' % self.module )
+            __import__ ( self.module )
+            self.load_time = time.time() - start
+        self.uninstall ()
+        return True
+
+    def __repr__ ( self ) :
+        return 'LazyGroup(%s,loaded=%s)' % ( self.module , self.loaded )
+    __str__ = __repr__
+
+# =============================================================================
+## create the stub for the special method
+def _make_special_ ( group , name ) :
+    """Create the stub for the special method"""
+    def _lazy_special_ ( self , *args , **kwargs ) :
+        group.load ()
+        method = getattr ( type ( self ) , name , None )
+        if method is None or _is_lazy_ ( method ) :
+            raise TypeError ( "'%s' object does not support '%s'" % ( type ( self ).__name__ , name ) )
+        return method ( self , *args , **kwargs )
+    setattr ( _lazy_special_ , _marker_ , True )
+    _lazy_special_.__name__ = name
+    return _lazy_special_
+
+# =============================================================================
+## load all the groups, triggered by the given class
+def _load_for_ ( klass ) :
+    """Load all the groups, triggered by the given class"""
+    hook   = _hooks_.get ( klass , None )
+    if not hook : return False
+    prev , groups = hook
+    loaded = False
+    for g in groups :
+        if not g.loaded : loaded = True
+        g.load ()
+    ## remove the hook
+    del _hooks_ [ klass ]
+    if _is_lazy_ ( klass.__dict__.get ( '__getattr__' , None ) ) :
+        if prev is None : delattr ( klass , '__getattr__' )
+        else            : setattr ( klass , '__getattr__' , prev )
+    return loaded
+
+# =============================================================================
+## create the attribute hook for the trigger class
+def _make_getattr_ ( klass , prev ) :
+    """Create the attribute hook for the trigger class"""
+    def _lazy_getattr_ ( self , attr ) :
+        if not ( attr.startswith ( '__' ) and attr.endswith ( '__' ) ) :
+            if _load_for_ ( klass ) : return getattr ( self , attr )
+        if prev is not None : return prev ( self , attr )
+        raise AttributeError ( "'%s' object has no attribute '%s'" % ( type ( self ).__name__ , attr ) )
+    setattr ( _lazy_getattr_ , _marker_ , True )
+    return _lazy_getattr_
+
+# =============================================================================
+## register the lazy decorations
+#  @code
+#  register ( 'ostap.trees.trees' , triggers = ( 'ROOT.TTree' , ) ,
+#             specials = ( 'ROOT.TTree.__len__' , ) )
+#  @endcode
+#  @param module   the module with decorations
+#  @param triggers the classes: the module is imported at the first access
+#                  to the missing attribute of their instances
+#  @param specials the special methods: the module is imported at their first call
+#  @param overrides the existing attributes, redefined by the module:
+#                  since <code>__getattr__</code> is never invoked for them,
+#                  the module is imported immediately
+def register ( module , triggers = () , specials = () , overrides = () ) :
+    """Register the lazy decorations
+    >>> register ( 'ostap.trees.trees' , triggers = ( 'ROOT.TTree' , ) ,
+    ...            specials = ( 'ROOT.TTree.__len__' , ) )
+    - module    : the module with decorations
+    - triggers  : the classes: the module is imported at the first access
+    to the missing attribute of their instances
+    - specials  : the special methods: the module is imported at their first call
+    - overrides : the existing attributes, redefined by the module:
+    since __getattr__ is never invoked for them, the module is imported immediately
+    """
+    group = LazyGroup ( module , triggers , specials )
+    _groups_ [ module ] = group
+
+    ## already loaded or can't be lazy?
+    if eager or overrides or group.loaded :
+        group.load ()
+        return group
+
+    for t in group.triggers :
+        klass = _resolve_ ( t )
+        hook  = _hooks_.get ( klass , None )
+        if hook is None :
+            prev = klass.__dict__.get ( '__getattr__' , None )
+            _hooks_ [ klass ] = prev , [ group ]
+            setattr ( klass , '__getattr__' , _make_getattr_ ( klass , prev ) )
+        else :
+            hook [ 1 ].append ( group )
+
+    group.install ()
+    return group
+
+# =============================================================================
+## load the registered decorations
+#  @code
+#  load ( 'ostap.fitting.roofit' )
+#  @endcode
+def load ( module ) :
+    """Load the registered decorations
+    >>> load ( 'ostap.fitting.roofit' )
+    """
+    group = _groups_.get ( module , None )
+    if group is None :
+        __import__ ( module )
+        return
+    group.load ()
+    for klass in [ k for k , h in _hooks_.items() if group in h [ 1 ] ] :
+        if all ( [ g.loaded for g in _hooks_ [ klass ] [ 1 ] ] ) : _load_for_ ( klass )
+
+# =============================================================================
+## load all registered decorations
+#  @code
+#  load_all ()
+#  @endcode
+def load_all () :
+    """Load all registered decorations
+    >>> load_all ()
+    """
+    for module in list ( _groups_.keys () ) : load ( module )
+
+# =============================================================================
+## the status of the registered decorations
+#  @code
+#  for module , ( loaded , load_time ) in lazy_stats().items() : ...
+#  @endcode
+def lazy_stats () :
+    """The status of the registered decorations
+    >>> for module , ( loaded , load_time ) in lazy_stats().items() : ...
+    """
+    return OrderedDict ( [ ( m , ( g.loaded , g.load_time ) ) for m , g in _groups_.items() ] )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+# The END
+# =============================================================================
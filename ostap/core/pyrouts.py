@@ -109,22 +109,99 @@ from ostap.histos.histos import ( binomEff_h1 , binomEff_h2 , binomEff_h3 ,
 # =============================================================================
 # Other decorations 
 # =============================================================================
-import ostap.trees.trees
-import ostap.trees.cuts
-
-import ostap.histos.param
-import ostap.histos.compare
-
-import ostap.io.root_file
-
+import ostap.trees.cuts         ## NB: operators for TCut 
+import ostap.io.root_file       ## NB: TFile/TDirectory protocols 
+## NB: decorations are spread over hundreds of C++ classes
+#      without the common base: no cheap trigger here 
 import ostap.math.models
-import ostap.utils.hepdata 
-import ostap.utils.pdg_format 
 
-import ostap.plotting.canvas
-
-import ostap.fitting.minuit 
-import ostap.fitting.roofit
+# =============================================================================
+## ``Lazy'' decorations: modules are imported when the decorated classes
+#  are touched for the first time, @see ostap.core.lazy
+#  NB: the modules that redefine the existing methods are imported immediately 
+#  Eager loading is forced by OSTAP_EAGER environment variable
+#  or by <code>ostap.core.lazy.load_all()</code>
+# =============================================================================
+import ostap.core.lazy as _lazy 
+_lazy.register ( 'ostap.trees.trees'     ,
+                 triggers = ( 'ROOT.TTree'            , ) ,
+                 specials = ( 'ROOT.TTree.__len__'    ,
+                              'ROOT.TTree.__call__'   ,
+                              'ROOT.TTree.__repr__'   ,
+                              'ROOT.TTree.__str__'    ,
+                              'ROOT.TChain.__call__'  ,
+                              'ROOT.TChain.__getslice__' ) )
+_lazy.register ( 'ostap.histos.param'    ,
+                 triggers = ( 'ROOT.TH1D' , 'ROOT.TH1F' ) )
+_lazy.register ( 'ostap.histos.compare'  ,
+                 triggers = ( 'ROOT.TH1D' , 'ROOT.TH1F' ) )
+_lazy.register ( 'ostap.utils.hepdata'   ,
+                 triggers = ( 'ROOT.TH1D' , 'ROOT.TH1F' , 'ROOT.TGraphErrors' , 'ROOT.TGraphAsymmErrors' ) )
+_lazy.register ( 'ostap.utils.pdg_format' ,
+                 triggers = ( 'Ostap.Math.ValueWithError' , ) )
+_lazy.register ( 'ostap.plotting.canvas' ,
+                 triggers = ( 'ROOT.TCanvas'            , ) ,
+                 specials = ( 'ROOT.TCanvas.__rshift__' , ) )
+_lazy.register ( 'ostap.fitting.minuit'  ,
+                 triggers = ( 'ROOT.TMinuit'              , ) ,
+                 specials = ( 'ROOT.TMinuit.__call__'     ,
+                              'ROOT.TMinuit.__contains__' ,
+                              'ROOT.TMinuit.__getitem__'  ,
+                              'ROOT.TMinuit.__setitem__'  ,
+                              'ROOT.TMinuit.__iter__'     ,
+                              'ROOT.TMinuit.__len__'      ,
+                              'ROOT.TMinuit.__repr__'     ,
+                              'ROOT.TMinuit.__str__'      ) ,
+                 ## NB: redefines the existing methods: no lazy loading here
+                 overrides = ( 'ROOT.TMinuit.Print'       ,
+                               'ROOT.TMinuit.GetErrorDef' ) )
+_lazy.register ( 'ostap.fitting.roofit'  ,
+                 triggers = ( 'ROOT.RooPrintable'         , ) ,
+                 specials = ( 'ROOT.RooPrintable.__repr__'       ,
+                              'ROOT.RooPrintable.__str__'        ,
+                              'ROOT.RooAbsData.__len__'          ,
+                              'ROOT.RooAbsData.__nonzero__'      ,
+                              'ROOT.RooAbsData.__contains__'     ,
+                              'ROOT.RooAbsData.__iter__'         ,
+                              'ROOT.RooAbsData.__getitem__'      ,
+                              'ROOT.RooDataHist.__len__'         ,
+                              'ROOT.RooArgList.__len__'          ,
+                              'ROOT.RooArgList.__contains__'     ,
+                              'ROOT.RooArgList.__iter__'         ,
+                              'ROOT.RooArgList.__nonzero__'      ,
+                              'ROOT.RooArgList.__repr__'         ,
+                              'ROOT.RooArgList.__str__'          ,
+                              'ROOT.RooArgSet.__len__'           ,
+                              'ROOT.RooArgSet.__iter__'          ,
+                              'ROOT.RooArgSet.__getitem__'       ,
+                              'ROOT.RooArgSet.__contains__'      ,
+                              'ROOT.RooArgSet.__nonzero__'       ,
+                              'ROOT.RooArgSet.__repr__'          ,
+                              'ROOT.RooArgSet.__str__'           ,
+                              'ROOT.RooFitResult.__call__'       ,
+                              'ROOT.RooFitResult.__iter__'       ,
+                              'ROOT.RooFitResult.__repr__'       ,
+                              'ROOT.RooFitResult.__str__'        ,
+                              'ROOT.RooAbsPdf.__mul__'           ,
+                              'ROOT.RooAbsRealLValue.__contains__' ,
+                              'ROOT.RooRealVar.__float__'        ,
+                              'ROOT.RooRealVar.__repr__'         ,
+                              'ROOT.RooRealVar.__add__'          ,
+                              'ROOT.RooRealVar.__radd__'         ,
+                              'ROOT.RooRealVar.__sub__'          ,
+                              'ROOT.RooRealVar.__rsub__'         ,
+                              'ROOT.RooRealVar.__mul__'          ,
+                              'ROOT.RooRealVar.__rmul__'         ,
+                              'ROOT.RooRealVar.__div__'          ,
+                              'ROOT.RooRealVar.__rdiv__'         ,
+                              'ROOT.RooRealVar.__pow__'          ,
+                              'ROOT.RooRealVar.__rpow__'         ,
+                              'ROOT.RooRealVar.__eq__'           ,
+                              'ROOT.RooRealVar.__ne__'           ,
+                              'ROOT.RooRealVar.__lt__'           ,
+                              'ROOT.RooRealVar.__le__'           ,
+                              'ROOT.RooRealVar.__gt__'           ,
+                              'ROOT.RooRealVar.__ge__'           ) )
 
 # =============================================================================
 ## graphs 
@@ -193,6 +193,13 @@ def parse_args ( args = [] ) :
         help    = "DisableImplicitMT" , 
         default = False               )
     # 
+    parser.add_argument ( 
+        '--lazy'                      ,        
+        dest    = 'Lazy'              , 
+        action  = 'store_true'        , 
+        help    = "Load decorations lazily, on demand" , 
+        default = False               )
+    # 
     group2 = parser.add_mutually_exclusive_group()
     group2.add_argument ( '-i' ,  
                          '--interactive' , dest='batch', 
@@ -318,6 +325,13 @@ if arguments.Quiet :
 else :
     from ostap.core.load_ostap import *
 
+# =============================================================================
+## interactive sessions: load all decorations eagerly
+# =============================================================================
+if not arguments.Lazy :
+    import ostap.core.lazy 
+    ostap.core.lazy.load_all ()
+    
     
 # =============================================================================
 ## create default canvas
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for unique ROOT identifiers from ostap/core/core.py
+- uniqueness of the identifiers
+- the identifiers of live and released objects are not reissued 
+- benchmark: the cost per call does not grow with number of allocated identifiers
+"""
+# =============================================================================
+import ROOT, time
+from   ostap.core.core import rootID, hID, dsID, funcID, _root_IDs_
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_core_ids' )
+else                       : logger = getLogger ( __name__        )
+# =============================================================================
+
+def test_ids_unique () :
+
+    ids = set ()
+    for i in range ( 10000 ) :
+        ids.add ( hID    () )
+        ids.add ( dsID   () )
+        ids.add ( funcID () )
+    assert 30000 == len ( ids ), 'Identifiers are not unique!'
+
+    ## the identifier is not reused if the object with such name exists
+    h   = ROOT.TH1D ( rootID ( 'h_' ) , '' , 10 , 0 , 1 )
+    hid = hID ()
+    assert hid != h.GetName () , 'Identifier of existing object is reused!'
+    assert not hid in ids      , 'Identifier is reissued!'
+    logger.info ( 'Identifiers are unique' )
+
+def test_ids_alive () :
+
+    ## the live objects with the allocated identifiers 
+    histos = [ ROOT.TH1F ( hID () , '' , 1 , 0 , 1 ) for i in range ( 1000 ) ]
+    issued = set ( [ h.GetName () for h in histos ] )
+    assert len ( histos ) == len ( issued ) , 'Identifiers of live objects are not unique!'
+
+    ## the objects, created ``by hand'' with the names ahead of the allocator  
+    counter = _root_IDs_ [ 'counters' ] [ 'h_' ]
+    salt    = _root_IDs_.get ( 'salt' , '' ) 
+    ahead   = [ ROOT.TH1F ( 'h_%s%d' % ( salt , counter + 2 * i ) , '' , 1 , 0 , 1 ) for i in range ( 100 ) ]
+    taken   = set ( [ h.GetName () for h in ahead ] )
+    
+    ## release half of the objects (deleted with the last reference)
+    released = set ( [ h.GetName () for h in histos [ : : 2 ] ] )
+    histos   = histos [ 1 : : 2 ]
+    for i in released : 
+        assert not ROOT.gROOT.FindObject ( i ) , 'Object %s is not released!' % i 
+    alive    = set ( [ h.GetName () for h in histos ] )
+
+    ## new identifiers: unique, and neither the identifiers of the live
+    #  objects nor the released identifiers are reissued  
+    new = [ hID () for i in range ( 1000 ) ]
+    assert len ( new ) == len ( set ( new ) ) , 'New identifiers are not unique!'
+    assert not set ( new ) & alive    , 'Identifiers of live objects are reissued!'
+    assert not set ( new ) & taken    , 'Names of existing objects are reused!'
+    assert not set ( new ) & released , 'Released identifiers are reissued!'
+    for i in new : 
+        assert not ROOT.gROOT.FindObject ( i ) , 'Identifier %s is used by existing object!' % i 
+
+    del histos, ahead 
+
+def test_ids_benchmark () :
+
+    ## keep the histograms alive: names are registered in the current directory
+    histos = []
+    costs  = []
+    for n in ( 1000 , 10000 , 100000 ) :
+        while len ( histos ) < n :
+            histos.append ( ROOT.TH1F ( hID () , '' , 1 , 0 , 1 ) )
+        start = time.time()
+        ids   = set ( [ hID () for i in range ( 1000 ) ] ) 
+        cost  = ( time.time() - start ) / 1000
+        costs.append ( cost ) 
+        logger.info ( 'rootID: #histos %7d, the cost per call %.2f[us]' % ( len ( histos ) , 1.e+6 * cost ) )
+        assert 1000 == len ( ids ) , 'Identifiers are not unique!'
+        assert not ids & set ( [ h.GetName () for h in histos ] ) , 'Identifiers of live objects are reissued!'
+
+    ## the cost per call does not grow with number of allocated identifiers
+    #  (100 times more objects, large margin for the timing noise)
+    assert costs [ -1 ] <= 10 * costs [ 0 ] + 1.e-5 , \
+           'The cost per call grows: %s[us]' % [ '%.2f' % ( 1.e+6 * c ) for c in costs ] 
+    
+    del histos
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_ids_unique    ()
+    test_ids_alive     ()
+    test_ids_benchmark ()
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for lazy decorations from ostap/core/lazy.py
+- decorations are loaded when the decorated class is touched
+- decorations are not loaded at import (in the fresh process) and are loaded 
+  at the first attribute access, all of them are loaded for eager loading 
+- benchmark: import time of ostap.core.pyrouts for lazy and eager loading 
+"""
+# =============================================================================
+import os, sys, time, subprocess
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_core_lazy' )
+else                       : logger = getLogger ( __name__        )
+# =============================================================================
+
+## import time of ostap.core.pyrouts in the fresh process 
+def import_time ( eager , repeat = 3 ) :
+    env = dict ( os.environ )
+    env [ 'OSTAP_EAGER' ] = '1' if eager else '0'
+    cmd = [ sys.executable , '-c' , 'import ostap.core.pyrouts' ]
+    times = []
+    for i in range ( repeat ) :
+        start = time.time()
+        subprocess.check_call ( cmd , env = env )
+        times.append ( time.time() - start )
+    return min ( times )
+
+## the script for the fresh process: the modules, loaded at import and after the first access 
+_script_ = '''
+import sys
+import ostap.core.pyrouts
+import ostap.core.lazy as lazy
+import ROOT
+modules = ( 'ostap.trees.trees' , 'ostap.fitting.roofit' )
+print ( 'LAZY:import:%s' % ','.join ( [ m for m in modules if m in sys.modules ] ) )
+tree = ROOT.TTree ( 'lazy_tree' , 'tree' )
+tree.project
+print ( 'LAZY:tree:%s'   % ','.join ( [ m for m in modules if m in sys.modules ] ) )
+args = ROOT.RooArgSet ()
+hasattr ( args , 'nonexisting_attribute_' )
+print ( 'LAZY:roofit:%s' % ','.join ( [ m for m in modules if m in sys.modules ] ) )
+print ( 'LAZY:all:%s'    % all ( [ l for l , t in lazy.lazy_stats().values() ] ) )
+'''
+## run the script in the fresh process and get the loaded modules at each step 
+def loaded_modules ( eager ) :
+    env = dict ( os.environ )
+    env [ 'OSTAP_EAGER' ] = '1' if eager else '0'
+    cmd = [ sys.executable , '-c' , _script_ ]
+    p   = subprocess.Popen ( cmd , env = env , stdout = subprocess.PIPE )
+    out , _ = p.communicate ()
+    assert 0 == p.returncode , 'The script fails: %s' % p.returncode 
+    result = {}
+    for line in out.decode ().splitlines () :
+        if line.startswith ( 'LAZY:' ) :
+            tag , _ , value = line [ 5 : ].partition ( ':' )
+            result [ tag ] = value 
+    return result 
+
+def test_lazy_load () :
+
+    import ROOT 
+    import ostap.core.pyrouts
+    import ostap.core.lazy as lazy 
+    
+    ## redefines the existing TMinuit methods: can't be lazy 
+    assert 'ostap.fitting.minuit' in sys.modules , 'ostap.fitting.minuit is not loaded!'
+    import ostap.fitting.minuit as minuit 
+    assert ROOT.TMinuit.__dict__ [ 'Print' ] is minuit._mn_str_ , 'TMinuit.Print is not decorated!'
+    
+    tree = ROOT.TTree ( 'lazy_tree' , 'tree' )
+    assert hasattr ( tree , 'project' ) , 'TTree is not decorated!'
+    assert 'ostap.trees.trees' in sys.modules , 'ostap.trees.trees is not loaded!'
+
+    lazy.load_all ()
+    for module , ( loaded , load_time ) in lazy.lazy_stats().items() :
+        assert loaded , 'Module %s is not loaded!' % module 
+        logger.info ( 'Module %-25s is loaded in %.3fs' % ( module , load_time ) )
+        
+def test_import_time () :
+
+    ## lazy loading: nothing at import, loaded at the first access 
+    result = loaded_modules ( eager = False )
+    assert ''                  == result [ 'import' ] , 'Decorations are loaded at import: %s' % result [ 'import' ]
+    assert 'ostap.trees.trees' == result [ 'tree'   ] , 'Invalid decorations after TTree access: %s' % result [ 'tree' ]
+    assert 'ostap.trees.trees,ostap.fitting.roofit' == result [ 'roofit' ] , \
+           'Invalid decorations after RooArgSet access: %s' % result [ 'roofit' ]
+    
+    ## eager loading: all at import 
+    result = loaded_modules ( eager = True  )
+    assert 'ostap.trees.trees,ostap.fitting.roofit' == result [ 'import' ] , \
+           'Decorations are not loaded for eager loading: %s' % result [ 'import' ]
+    assert 'True' == result [ 'all' ] , 'Not all decorations are loaded for eager loading!'
+    
+    lazy  = import_time ( eager = False )
+    eager = import_time ( eager = True  )
+    logger.info ( 'Import time of ostap.core.pyrouts: lazy %.2fs, eager %.2fs' % ( lazy , eager ) ) 
+    
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_lazy_load   ()
+    test_import_time ()
+
+# =============================================================================
+# The END
+# =============================================================================
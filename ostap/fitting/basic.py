@@ -37,6 +37,10 @@ import ROOT, math
 from   ostap.core.core     import cpp , Ostap , VE , hID , rootID
 from   ostap.histos.histos import h1_axis , h2_axes
 from   ostap.logger.utils  import roo_silent 
+try :
+    import numpy as _numpy
+except ImportError :
+    _numpy = None
 # =============================================================================
 from   ostap.logger.logger import getLogger
 if '__main__' ==  __name__ : logger = getLogger ( 'ostap.fitting.basic' )
@@ -47,6 +51,13 @@ _ncmax =     6  ## maximal number of CPUs: there are some problems with >= 7
                 ## @see https://sft.its.cern.ch/jira/browse/ROOT-4897
 _ncpus = []
 # =============================================================================
+## RooFit batch evaluation interface is implemented for Ostap::Models
+#  (the same condition as <code>OSTAP_MODELS_BATCH</code> in Ostap/PDFs.h)
+#  NB: the batch mode is activated by default for the fits to unbinned datasets,
+#      use <code>batch=False</code> to switch it off 
+#  @see Ostap::Models 
+_batch_mode_ = 62000 <= ROOT.gROOT.GetVersionInt () < 62200 and hasattr ( ROOT.RooFit , 'BatchMode' )
+# =============================================================================
 ## MINUIT covarinace matrix status:
 # - status = -1 :  not available (inversion failed or Hesse failed)
 # - status =  0 : available but not positive defined
@@ -246,7 +257,8 @@ def fitArgs ( name , dataset = None , *args , **kwargs ) :
         _args.append ( a )
         
     from ostap.plotting.fit_draw import keys     
-    ncpu_added = False 
+    ncpu_added  = False 
+    batch_added = False 
     for k,a in kwargs.iteritems() :
 
         ## skip "drawing" options 
@@ -271,6 +283,13 @@ def fitArgs ( name , dataset = None , *args , **kwargs ) :
             _args.append   (  ROOT.RooFit.NumCPU( a  ) ) 
             logger.debug   ( '%s add keyword argument %s/%s' % ( name , k , a ) )
             ncpu_added = True
+        elif k.upper() in ( 'BATCH'      ,
+                            'BATCHMODE'  ) and isinstance ( a , bool ) :
+            if hasattr ( ROOT.RooFit , 'BatchMode' ) : 
+                _args.append   (  ROOT.RooFit.BatchMode ( a ) ) 
+                logger.debug   ( '%s add keyword argument %s/%s' % ( name , k , a ) )
+            elif a : logger.warning( '%s batch mode is not available, skip %s' % ( name , k ) )
+            batch_added = True 
         elif k.upper() in ( 'CONSTRAINT'  ,
                             'CONSTRAINTS' ,
                             'PARS'        ,
@@ -291,6 +310,10 @@ def fitArgs ( name , dataset = None , *args , **kwargs ) :
     if not ncpu_added :
         logger.debug  ( '%s: NCPU is added ' % name ) 
         _args.append  (  ncpu ( len ( dataset ) ) )
+        
+    if not batch_added and _batch_mode_ and isinstance ( dataset , ROOT.RooDataSet ) :
+        logger.debug  ( '%s: BatchMode is added ' % name ) 
+        _args.append  (  ROOT.RooFit.BatchMode ( True ) )
             
     return tuple ( _args )
             
@@ -741,8 +764,13 @@ class PDF (object) :
         >>> pdf = ...
         >>> x = 0.45
         >>> print 'Value of PDF at x=%f is %f' % ( x , pdf ( x ) ) 
+        For the array of x-values the batch evaluation is used (if available)
+        >>> xs = numpy.linspace ( 0 , 1 , 1000 )
+        >>> values = pdf ( xs ) 
        """
         if isinstance ( self.mass , ROOT.RooRealVar ) :
+            if isinstance ( x , ( list , tuple ) ) or ( _numpy and isinstance ( x , _numpy.ndarray ) ) :
+                return _pdf_values_ ( self.pdf , self.mass , x )
             from ostap.fitting.roofit import SETVAR
             mn,mx = self.mass.xminmax()
             if mn <= x <= mx :
@@ -754,6 +782,40 @@ class PDF (object) :
         raise AttributeError, 'something wrong goes here'
         
 
+# =============================================================================
+## evaluate PDF for the array of x-values
+#  - the batch evaluation is used for <code>Ostap::Models</code> PDFs:
+#    the parameters are set only once 
+#  - the point-by-point evaluation is used otherwise
+#  @return numpy array of values, zero outside the range of variable  
+#  @see Ostap::Models::BreitWigner::evaluate 
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def _pdf_values_ ( pdf , var , xs ) :
+    """Evaluate PDF for the array of x-values
+    - the batch evaluation is used for Ostap::Models PDFs: the parameters are set only once 
+    - the point-by-point evaluation is used otherwise
+    - return numpy array of values, zero outside the range of variable  
+    """
+    if not _numpy : raise TypeError ( "numpy is required for the array of x-values" ) 
+    x       = _numpy.asarray ( xs , dtype = _numpy.float64 )
+    result  = _numpy.zeros_like ( x )
+    mn , mx = var.xminmax ()
+    inside  = ( mn <= x ) & ( x <= mx )
+    xi      = _numpy.ascontiguousarray ( x [ inside ] )
+    if 0 == len ( xi ) : return result
+    ri      = _numpy.zeros_like ( xi )
+    try :
+        pdf.evaluate ( xi , ri , len ( xi ) )
+    except ( TypeError , AttributeError ) : ## no batch evaluation (e.g. native RooFit PDFs) 
+        from ostap.fitting.roofit import SETVAR
+        with SETVAR ( var ) :
+            for i , v in enumerate ( xi ) :
+                var.setVal ( v )
+                ri [ i ] = pdf.getVal () 
+    result [ inside ] = ri
+    return result 
+
 # =============================================================================
 ## helper base class for implementation  of various helper pdfs 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
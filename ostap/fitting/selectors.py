@@ -100,7 +100,11 @@ __all__ = (
 'Selector2'        ,        ## The ``fixed'' TPySelector
 'SelectorWithCuts' ,        ## The ``fixed'' TPySelector with TTree-formula 
 'SelectorWithVars' ,        ## Generic selctor to fill RooDataSet form TTree/TChain       
-'SelectorWithVarsCached'    ## Generic selector with cache   
+'SelectorWithVarsCached'  , ## Generic selector with cache   
+'Expression'              , ## accessor for the variable defined by TTreeFormula expression 
+'columnar_variables'      , ## decode variables for columnar filling of RooDataSet 
+'fill_columns'            , ## fill columns for variables from TTree/TChain 
+'make_dataset'            , ## create RooDataSet from columns 
 )
 # =============================================================================
 import ROOT, cppyy, math
@@ -250,6 +254,11 @@ def _process_ ( self , selector , *args ) :
     >>> chain = ...
     >>> chain.process ( selector )  ## NB: note lowercase ``process'' here !!!    
     """
+    ## vectorized (block-wise) processing, if possible 
+    if isinstance ( selector , SelectorWithVars ) and selector.vectorized :
+        result = selector.fill ( self , *args )
+        if 0 <= result : return result
+        
     return Ostap.Process.process ( self , selector , *args )
 
 _process_. __doc__ += '\n' + Ostap.Process.process.__doc__
@@ -303,6 +312,161 @@ class VEntry(object) :
         ## finally the entry
         self.entry = ( self.var , self.vdesc , self.vmin , self.vmax , self.vfun )
          
+# ==============================================================================
+## decode the variables for the columnar (block-wise) filling of RooDataSet
+#  @code
+#  variables = [ ( 'pt' , 'pt' , 0 , 10 ) , ( 'y' , 'y' , 2 , 4.5 , 'abs(eta)' ) ]
+#  cvars     = columnar_variables ( variables ) 
+#  @endcode
+#  Variables without accessor or with string accessor (TTreeFormula expression)
+#  are suitable for columnar filling, python accessor functions are not.
+#  @return tuple of <code>( name , description , min , max , expression )</code>
+#          or <code>None</code> if some variables require python accessors 
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def columnar_variables ( variables ) :
+    """Decode the variables for the columnar (block-wise) filling of RooDataSet
+    >>> variables = [ ( 'pt' , 'pt' , 0 , 10 ) , ( 'y' , 'y' , 2 , 4.5 , 'abs(eta)' ) ]
+    >>> cvars     = columnar_variables ( variables ) 
+    Variables without accessor or with string accessor (TTreeFormula expression)
+    are suitable for columnar filling, python accessor functions are not.
+    - return tuple of ( name , description , min , max , expression )
+    or None if some variables require python accessors 
+    """
+    result = []
+    for v in variables :
+        if isinstance ( v , ( str , ROOT.RooRealVar ) ) : v = ( v , ) 
+        var , args = v[0] , v[1:]
+        if   isinstance ( var , str ) and 3 <= len ( args ) :
+            name , desc , vmin , vmax = var , args[0] , args[1] , args[2]
+            expr = args[3] if 3 < len ( args ) else name
+        elif isinstance ( var , ROOT.RooRealVar ) :
+            name , desc , vmin , vmax = var.GetName() , var.GetTitle() , var.getMin() , var.getMax()
+            expr = args[0] if args else name
+        else :
+            return None
+        if not isinstance ( expr , str ) : return None
+        result.append ( ( name , desc , vmin , vmax , expr ) )
+    return tuple ( result )
+
+# ==============================================================================
+## fill the columns (numpy arrays) for the variables from the tree/chain:
+#  expressions, selection and range checks are evaluated block-wise
+#  @code
+#  cvars = columnar_variables ( variables ) 
+#  columns , nsel , nskip = fill_columns ( chain , cvars , 'pt>1' )
+#  @endcode
+#  @param tree      the tree/chain
+#  @param variables the variables (as from <code>columnar_variables</code>)
+#  @param selection the selection criteria
+#  @return the dictionary of columns, number of selected and number of skipped
+#          (out-of-range) entries 
+#  @see ostap.trees.evaluator.Evaluator
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def fill_columns ( tree , variables , selection = '' , first = 0 , last = 2**64 , chunk = 100000 ) :
+    """Fill the columns (numpy arrays) for the variables from the tree/chain:
+    expressions, selection and range checks are evaluated block-wise
+    >>> cvars = columnar_variables ( variables ) 
+    >>> columns , nsel , nskip = fill_columns ( chain , cvars , 'pt>1' )
+    - return the dictionary of columns, number of selected and number of skipped
+    (out-of-range) entries 
+    """
+    import numpy
+    from ostap.trees.evaluator import evaluator
+    
+    ev    = evaluator ( tree , [ v[4] for v in variables ] , selection )
+    cols  = [ [] for v in variables ]
+    nsel  = 0
+    nskip = 0 
+    for block in ev.blocks ( tree , first , last , chunk ) :
+        n = len ( block.values [ 0 ] )
+        if 0 == n : continue
+        ## vectorized range checks 
+        mask = numpy.ones ( n , dtype = bool )
+        for v , a in zip ( variables , block.values ) :
+            mask &= ( v[2] <= a ) & ( a <= v[3] )
+        good   = int ( mask.sum() ) 
+        nsel  += n
+        nskip += n - good
+        for c , a in zip ( cols , block.values ) :
+            c.append ( numpy.asarray ( a [ mask ] , dtype = numpy.float64 ) )
+            
+    columns = dict ( [ ( v[0] , numpy.concatenate ( c ) if c else numpy.empty ( 0 ) ) for v , c in zip ( variables , cols ) ] )
+    return columns , nsel , nskip
+
+# ==============================================================================
+## create RooDataSet and fill it in bulk from the columns
+#  @code
+#  cvars   = columnar_variables ( variables ) 
+#  columns , nsel , nskip = fill_columns ( chain , cvars , 'pt>1' )
+#  dataset = make_dataset ( cvars , columns ) 
+#  @endcode
+#  @see Ostap::DataFill
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def make_dataset ( variables , columns , name = '' , title = '' ) :
+    """Create RooDataSet and fill it in bulk from the columns
+    >>> cvars   = columnar_variables ( variables ) 
+    >>> columns , nsel , nskip = fill_columns ( chain , cvars , 'pt>1' )
+    >>> dataset = make_dataset ( cvars , columns ) 
+    """
+    import numpy
+    if not name :
+        from ostap.core.core import dsID
+        name = dsID()
+        
+    rvars   = [ ROOT.RooRealVar ( v[0] , v[1] , v[2] , v[3] ) for v in variables ]
+    varset  = ROOT.RooArgSet  ()
+    varlist = ROOT.RooArgList ()
+    for r in rvars :
+        varset .add ( r )
+        varlist.add ( r )
+        
+    data  = ROOT.RooDataSet ( name , title if title else name , varset )
+    nrows = len ( columns [ variables [ 0 ] [ 0 ] ] ) if variables else 0 
+    if 0 < nrows :
+        values = numpy.concatenate ( [ numpy.asarray ( columns [ v[0] ] , dtype = numpy.float64 ) for v in variables ] )
+        values = numpy.ascontiguousarray ( values )
+        Ostap.DataFill.fill ( data , varlist , values , nrows )
+        
+    return data
+
+# ==============================================================================
+## helper class: the accessor for the variable defined by TTreeFormula expression
+#  (used for the entry-by-entry processing)
+#  @code
+#  fun   = Expression ( 'pt/1000' )
+#  value = fun ( tree ) 
+#  @endcode
+#  @see Ostap::Formula
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+class Expression(object) :
+    """Accessor for the variable defined by TTreeFormula expression
+    (used for the entry-by-entry processing)
+    >>> fun   = Expression ( 'pt/1000' )
+    >>> value = fun ( tree ) 
+    """
+    def __init__ ( self , expression ) :
+        self.expression = str ( expression ) 
+        self._tree      = None
+        self._formula   = None 
+    def __call__ ( self , tree ) :
+        ## NB: for chains the formula is recreated for each new tree 
+        t = tree.GetTree() if isinstance ( tree , ROOT.TChain ) else tree
+        if not self._formula or not t is self._tree : 
+            self._formula = Ostap.Formula ( '' , self.expression , t )
+            self._tree    = t
+            if not self._formula.ok() :
+                raise RuntimeError ( "Expression: invalid formula %s" % self.expression )
+        return self._formula.evaluate()
+    def __getstate__ ( self ) : return { 'expression' : self.expression }
+    def __setstate__ ( self , state ) :
+        self.__init__ ( state [ 'expression' ] ) 
+    def __str__      ( self ) : return self.expression
+    __repr__ = __str__
+    
 # ==============================================================================
 ## Define generic selector to fill RooDataSet from TChain
 #
@@ -328,6 +492,12 @@ class VEntry(object) :
 #   ( 'my_name3' , 'my_description3' , low       , high      , lambda s : s.var1+s.var2 ) 
 #  ]
 #
+#  ## the same, but as TTreeFormula expression (much faster!) 
+#  variables += [ 
+#   #  name       descriptor           min-value , max-value , expression 
+#   ( 'my_name3' , 'my_description3' , low       , high      , 'var1+var2' ) 
+#  ]
+#
 #  ## any function that gets TChain/Tree entry and evaluates to double.
 #  #  e.g. it could be TMVAReader
 #  def myvar ( chain ) : ....
@@ -360,6 +530,13 @@ class VEntry(object) :
 # 
 #  @endcode
 #
+#  If numpy is available, the selection and all variables, defined by names
+#  or TTreeFormula expressions, are evaluated block-wise, range checks are 
+#  vectorized and the dataset is filled in bulk. Python accessor functions
+#  (and python <code>cuts</code>) are called only for the selected entries.
+#  @see ostap.trees.evaluator.Evaluator
+#  @see Ostap::DataFill
+#
 #  @date   2014-03-02
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  - thanks to  Alexander BARANOV 
@@ -387,6 +564,12 @@ class SelectorWithVars(SelectorWithCuts) :
     #   ( 'my_name3' , 'my_description3' , low       , high      , lambda s : s.var1+s.var2 ) 
     #  ]
     #
+    #  ## the same, but as TTreeFormula expression (much faster!) 
+    #  variables += [ 
+    #   #  name       descriptor           min-value , max-value , expression 
+    #   ( 'my_name3' , 'my_description3' , low       , high      , 'var1+var2' ) 
+    #  ]
+    #
     #  ## any function that gets Tchain/Tree and avaluated to double.
     #  #  e.g. it coudl be TMVAReader
     #  def myvar ( chain ) : ....
@@ -417,18 +600,23 @@ class SelectorWithVars(SelectorWithCuts) :
     #  chain.process ( selector )
     #  dataset = selector.dataset
     # 
+    If numpy is available, the selection and all variables, defined by names
+    or TTreeFormula expressions, are evaluated block-wise, range checks are 
+    vectorized and the dataset is filled in bulk. Python accessor functions
+    (and python cuts) are called only for the selected entries.
     """
     ## constructor 
     def __init__ ( self                           ,
                    variables                      ,  ## list of variables  
                    selection                      ,  ## Tree-selection 
-                   cuts         = lambda s : True ,
+                   cuts         = None            ,
                    name         = ''              ,
                    fullname     = ''              ,
-                   silence      = False           ) :
+                   silence      = False           ,
+                   vectorized   = True            ) :
         
         if not     name :
-            from   Ostap.PyRoUts import dsID 
+            from   ostap.core.core import dsID 
             name = dsID()
             
         if not fullname : fullname = "%s/%s " % ( __name__ , name )
@@ -436,7 +624,6 @@ class SelectorWithVars(SelectorWithCuts) :
         #
         ## create the logger 
         #
-        from   Ostap.Logger           import getLogger
         self._logger = getLogger ( fullname ) 
         #
 
@@ -447,14 +634,16 @@ class SelectorWithVars(SelectorWithCuts) :
 
         #
         ## keep the cuts
-        # 
-        self._cuts   = cuts
+        #
+        self._pycuts = True if cuts else False
+        self._cuts   = cuts if cuts else lambda s : True 
 
         #
         ## variables
         # 
-        self.varset      = ROOT.RooArgSet()
-        self._variables  = []
+        self.varset       = ROOT.RooArgSet()
+        self._variables   = []
+        self._expressions = [] ## TTreeFormula expressions for block-wise evaluation 
         
         #
         ## add the variables one by one 
@@ -481,6 +670,9 @@ class SelectorWithVars(SelectorWithCuts) :
         self._total    = 1
         self._skip     = 0 
         self._silence  = silence
+        
+        from ostap.trees.evaluator import has_numpy 
+        self._vectorized = vectorized and has_numpy 
 
     ## delete the selector, try to clear and delete the dataset 
     def __del__    ( self  )  :
@@ -511,7 +703,7 @@ class SelectorWithVars(SelectorWithCuts) :
             self._total =  self.fChain.GetEntries()
             self._logger.info ( "Processing TChain('%s') #entries: %d" % ( self.fChain.GetName() , self._total ) )
             ## decoration:
-            from Ostap.progress_bar import ProgressBar
+            from ostap.utils.progress_bar import ProgressBar
             self._progress = ProgressBar ( max_value = self._total   ,
                                            silent    = self._silence )
             
@@ -566,8 +758,7 @@ class SelectorWithVars(SelectorWithCuts) :
             #
             ## accessor function
             #
-            if 3 < len ( args ) : vfun = args[3]
-            else                : vfun = lambda s : getattr( s , vname )
+            vfun = args[3] if 3 < len ( args ) else None 
             # 
             var = ROOT.RooRealVar ( vname , vdesc , vmin , vmax )
 
@@ -580,17 +771,164 @@ class SelectorWithVars(SelectorWithCuts) :
             #
             ## accessor function
             #
-            if 0 < len ( args ) : vfun = args[0]
-            else                : vfun = lambda s : getattr( s , vname )
+            vfun = args[0] if 0 < len ( args ) else None 
 
         else :
 
             self._logger.error   ( 'Invalid variable description!' )
             raise AttributeError ( 'Invalid variable description!' ) 
-        
+
+        ## the expression for block-wise evaluation (if possible)
+        if   vfun is None           :
+            vexpr = vname
+            vfun  = lambda s : getattr( s , vname )
+        elif isinstance ( vfun , str ) :
+            vexpr = vfun
+            vfun  = Expression ( vexpr ) 
+        else :
+            vexpr = None
+            
         ## finally the entry
         self.varset.add      ( var ) 
-        self._variables += [ ( var , vdesc , vmin , vmax , vfun ) ] 
+        self._variables   += [ ( var , vdesc , vmin , vmax , vfun ) ] 
+        self._expressions += [ vexpr ]
+
+    @property
+    def vectorized ( self ) :
+        """``vectorized'' : use the block-wise processing?"""
+        return self._vectorized
+    
+    # =========================================================================
+    ## fill the dataset block-wise (the vectorized alternative for <code>Process</code>):
+    #  - the selection and the variables defined by names/expressions
+    #    are evaluated block-wise 
+    #  - range checks and skip counting are vectorized 
+    #  - python accessor functions and python cuts are called only for
+    #    the selected entries
+    #  - the dataset is filled in bulk
+    #  @code
+    #  selector = SelectorWithVars ( ... )
+    #  selector.fill ( chain ) 
+    #  chain.process ( selector ) ## ditto 
+    #  @endcode
+    #  @param tree    the tree/chain
+    #  @param nevents number of entries to process 
+    #  @return number of selected entries or -1 if the block-wise processing is not possible
+    #  @see ostap.trees.evaluator.Evaluator
+    #  @see Ostap::DataFill
+    def fill ( self , tree , nevents = -1 , chunk = 100000 ) :
+        """Fill the dataset block-wise (the vectorized alternative for Process):
+        - the selection and the variables defined by names/expressions
+        are evaluated block-wise 
+        - range checks and skip counting are vectorized 
+        - python accessor functions and python cuts are called only for
+        the selected entries
+        - the dataset is filled in bulk
+        >>> selector = SelectorWithVars ( ... )
+        >>> selector.fill ( chain ) 
+        >>> chain.process ( selector ) ## ditto 
+        - return number of selected entries or -1 if the block-wise processing is not possible
+        """
+        self._total = len ( tree ) 
+        last        = self._total if nevents < 0 else min ( nevents , self._total )
+        
+        columns     = self._columns_ ( tree , last , chunk )
+        if columns is None : return -1
+
+        self._add_columns_ ( columns )
+        self.Terminate ()
+        return self._events 
+
+    # =========================================================================
+    ## evaluate the columns for all variables block-wise
+    #  @see SelectorWithVars.fill
+    #  @return list of arrays (one per variable) or <code>None</code>
+    #          if the block-wise processing is not possible
+    def _columns_ ( self , tree , last , chunk = 100000 ) :
+        """Evaluate the columns for all variables block-wise
+        - return list of arrays (one per variable) or None
+        if the block-wise processing is not possible
+        """
+        import numpy
+        from   ostap.trees.evaluator import evaluator
+
+        cindex = [ i for i , e in enumerate ( self._expressions ) if e is not None ]
+        pindex = [ i for i , e in enumerate ( self._expressions ) if e is     None ]
+        pyrows = True if pindex or self._pycuts else False 
+        
+        exprs  = [ self._expressions [ i ] for i in cindex ]
+        if pyrows : exprs.append ( 'Entry$' )
+        if not exprs : exprs = [ 'Entry$' ] 
+        
+        try : 
+            ev = evaluator ( tree , exprs , self.cuts () )
+        except ( TypeError , AttributeError ) :
+            self._logger.debug ( 'fill: block-wise processing is not possible, use Process' )
+            return None
+
+        if not self._silence :
+            self._logger.info ( "Processing TChain('%s') #entries: %d" % ( tree.GetName() , len ( tree ) ) )
+            
+        nvars   = len ( self._variables )
+        columns = [ [] for v in self._variables ] 
+        from ostap.utils.progress_bar import ProgressBar
+        with ProgressBar ( max_value = last , silent = self._silence ) as bar : 
+            for block in ev.blocks ( tree , 0 , last , chunk ) :
+
+                bar.update_amount ( block.last )
+                
+                n  = len ( block.values [ 0 ] )
+                if 0 == n : continue 
+                self._events += n
+
+                ## vectorized range checks 
+                mask = numpy.ones ( n , dtype = bool ) 
+                for i , a in zip ( cindex , block.values ) :
+                    v     = self._variables [ i ]
+                    mask &= ( v[2] <= a ) & ( a <= v[3] ) 
+
+                values = [ None ] * nvars
+                for i , a in zip ( cindex , block.values ) : values [ i ] = a 
+                
+                ## python accessors&cuts: only for the selected entries 
+                if pyrows :
+                    entries = block.values [ -1 ] 
+                    pyvals  = numpy.zeros ( ( len ( pindex ) , n ) , dtype = numpy.float64 )
+                    for r in numpy.nonzero ( mask ) [ 0 ] :
+                        if tree.GetEntry ( int ( entries [ r ] ) ) <= 0 or not self._cuts ( tree ) :
+                            mask [ r ] = False
+                            n         -= 1  ## not counted as skipped 
+                            continue
+                        for j , i in enumerate ( pindex ) :
+                            v     = self._variables [ i ] 
+                            value = v[4] ( tree )
+                            if not v[2] <= value <= v[3] :
+                                mask [ r ] = False
+                                break 
+                            pyvals [ j , r ] = value 
+                    for j , i in enumerate ( pindex ) : values [ i ] = pyvals [ j ]
+                    
+                good        = int ( mask.sum() ) 
+                self._skip += n - good
+                if 0 == good : continue 
+                for c , a in zip ( columns , values ) :
+                    c.append ( numpy.asarray ( a [ mask ] , dtype = numpy.float64 ) )
+
+        return [ numpy.concatenate ( c ) if c else numpy.empty ( 0 ) for c in columns ]
+
+    # =========================================================================
+    ## add the columns (one array per variable) to the dataset in bulk
+    #  @see Ostap::DataFill
+    def _add_columns_ ( self , columns ) :
+        """Add the columns (one array per variable) to the dataset in bulk"""
+        import numpy 
+        nrows = len ( columns [ 0 ] ) if columns else 0
+        if 0 < nrows : 
+            data    = numpy.ascontiguousarray ( numpy.concatenate ( columns ) , dtype = numpy.float64 )
+            varlist = ROOT.RooArgList ()
+            for v in self._variables : varlist.add ( v[0] )
+            Ostap.DataFill.fill ( self.data , varlist , data , nrows )
+        return nrows 
 
     #
     def Terminate ( self  ) :
@@ -643,105 +981,186 @@ class SelectorWithVars(SelectorWithCuts) :
  
 
 
-# =============================================================================
-import os
-from   ostap.core.workdir import workdir
-from   ostap.io.zipshelve import ZipShelf 
-# =============================================================================
-
 # ==============================================================================
 ## Generic selector which loads already loaded datasets from cache
 #
+#  The cache is content-addressed: the columnar chunk for each input file
+#  is keyed by the file identity (size, UUID and modification time) and
+#  the ``recipe'' (tree name, selection, variables, python accessors&cuts),
+#  therefore adding one file to the chain reuses the cached chunks for all
+#  other files. The cache has the disk quota with LRU eviction
+#  and it is safe for concurrent parallel jobs.
+#  @code
+#  selector = SelectorWithVarsCached ( variables , 'pt>1' , files = chain.files() )
+#  chain.process ( selector )
+#  dataset  = selector.data 
+#  @endcode
+#  @see ostap.io.dscache.DataCache
 #  @date   2014-07-02
 #  @author Sasha Baranov a.baranov@cern.ch
 class SelectorWithVarsCached(SelectorWithVars) :
     """Create and fill the basic dataset for RooFit. Or just load it from cache.
+    
+    The cache is content-addressed: the columnar chunk for each input file
+    is keyed by the file identity (size, UUID and modification time) and
+    the ``recipe'' (tree name, selection, variables, python accessors&cuts),
+    therefore adding one file to the chain reuses the cached chunks for all
+    other files. The cache has the disk quota with LRU eviction
+    and it is safe for concurrent parallel jobs.
+    >>> selector = SelectorWithVarsCached ( variables , 'pt>1' , files = chain.files() )
+    >>> chain.process ( selector )
+    >>> dataset  = selector.data 
     """
     ## constructor 
     def __init__ ( self                           ,
                    variables                      ,  ## list of variables  
                    selection                      ,  ## Tree-selection 
                    files                          ,  ## List of files
-                   cuts         = lambda s : True ,
+                   cuts         = None            ,
                    name         = ''              ,
-                   fullname     = ''              ) : 
+                   fullname     = ''              ,
+                   cache        = None            ) : 
 
         SelectorWithVars.__init__(self, variables, selection, cuts, name, fullname)
 
-        self.__selection = selection
-        self.__cuts      = cuts
         self.__filelist  = files
-
-        # Try load from cache
+        self.__cache     = cache 
+        self.__pending   = None  ## the key for the whole dataset to be cached 
         self._loaded_from_cache = False
-        self._cachepath = self._compute_cache_name()
 
-        if self._loadcache():
-            self.Process = lambda entry: 1
-            self._loaded_from_cache = True
-
-    def _l_internals(self, lmbd):
-        " Returns str of lambda expression internals"
-        if not hasattr(lmbd, "__code__"):
-            return ""
+    @property
+    def cache ( self ) :
+        """``cache'' : the dataset cache"""
+        if self.__cache is None :
+            from ostap.io.dscache import DataCache
+            self.__cache = DataCache()
+        return self.__cache
+    
+    ## the key for the ``recipe'': how the dataset is extracted from the file 
+    def _recipe_ ( self , tree ) :
+        """The key for the ``recipe'': how the dataset is extracted from the file"""
+        variables = []
+        for v , e in zip ( self._variables , self._expressions ) :
+            variables.append ( ( v[0].GetName() , v[1] , v[2] , v[3] , e if e else v[4] ) )
+        return self.cache.recipe ( tree.GetName ()       ,
+                                   str ( self.cuts () )  ,
+                                   variables             ,
+                                   self._cuts if self._pycuts else None )
 
-        code = lmbd.__code__
-        return str((code.co_code, code.co_consts))
+    ## always call <code>fill</code>: it takes care about the cache
+    #  @see SelectorWithVarsCached.fill 
+    @property
+    def vectorized ( self ) :
+        """``vectorized'' : always call ``fill'': it takes care about the cache"""
+        return True 
+        
+    # =========================================================================
+    ## block-wise processing with content-addressed cache:
+    #  the columnar chunks for the input files are taken from the cache, the
+    #  missing ones are evaluated and stored in the cache
+    #  - if the block-wise processing is not possible (or partial processing
+    #    is requested), the whole dataset is cached, and the dataset is filled
+    #    by <code>Process</code> on the cache miss
+    #  - the recipes with python callables that can't be represented
+    #    (e.g. they capture the arbitrary objects) are not cached 
+    #  @see SelectorWithVars.fill
+    #  @see ostap.io.dscache.DataCache 
+    def fill ( self , tree , nevents = -1 , chunk = 100000 ) :
+        """Block-wise processing with content-addressed cache:
+        the columnar chunks for the input files are taken from the cache, the
+        missing ones are evaluated and stored in the cache
+        - if the block-wise processing is not possible (or partial processing
+        is requested), the whole dataset is cached, and the dataset is filled
+        by ``Process'' on the cache miss
+        - the recipes with python callables that can't be represented
+        (e.g. they capture the arbitrary objects) are not cached 
+        """
+        self.__pending = None
+        
+        files = tree.files () if isinstance ( tree , ROOT.TChain ) else self.__filelist
+        if isinstance ( files , str ) : files = [ files ] 
+        if not files :
+            if not self._vectorized : return -1 
+            return SelectorWithVars.fill ( self , tree , nevents , chunk ) 
 
-    def _get_files_str(self):
-        "Returns string with used files and their modification times"
-        ret = ""
-        for filename in sorted(self.__filelist):
-            ret += filename
-            ret += str(int(os.stat(filename).st_mtime))
-        return ret
+        try : 
+            recipe = self._recipe_ ( tree )
+        except ( TypeError , ValueError ) as e :
+            self._logger.warning ( 'Dataset is not cached: %s' % e ) 
+            if not self._vectorized : return -1 
+            return SelectorWithVars.fill ( self , tree , nevents , chunk ) 
 
-    def _compute_cache_name(self):
-        " Computes dataset cache path(SHA512) "
-        h =  self._get_files_str()
-        h += self._l_internals(self.__cuts)
+        if self._vectorized and nevents < 0 :
+            result = self._fill_chunks_ ( tree , files , recipe , chunk )
+            if 0 <= result : return result 
 
-        for var , vdesc , vmin , vmax , vfun in self._variables:
-            h += var.GetName() + vdesc + str(vmin) + str(vmax)
-            h += self._l_internals(vfun)
+        ## cache the whole dataset 
+        key    = self.cache.key ( files , self.cache.recipe ( recipe , nevents ) )
+        cached = self.cache.get_dataset ( key )
+        if cached is not None :
+            self.data , self._events , self._skip = cached 
+            self._total = len ( tree ) 
+            self._loaded_from_cache = True
+            self.Terminate ()
+            return self._events
 
-        h += str(self.__selection)
+        ## NB: the dataset is stored into the cache by Terminate 
+        self.__pending = key 
+        if not self._vectorized : return -1 
+        return SelectorWithVars.fill ( self , tree , nevents , chunk ) 
 
-        import hashlib 
-        filename = hashlib.sha512(h).hexdigest() + ".shelve"
-        return os.path.join(workdir, "cache", filename)
+    # =========================================================================
+    ## block-wise processing of the files, one cached columnar chunk per file
+    #  @return number of processed events or -1 if the block-wise processing is not possible
+    def _fill_chunks_ ( self , tree , files , recipe , chunk = 100000 ) :
+        """Block-wise processing of the files, one cached columnar chunk per file
+        - return number of processed events or -1 if the block-wise processing is not possible
+        """
+        import numpy
+        names   = [ v[0].GetName() for v in self._variables ]
+        chunks  = []
+        hits    = 0
+        for fname in files :
 
-    def _loadcache(self):
-        " Loads cache from ZipShelf. Returns `True` on success, `False` othervise"
-        if not os.path.exists(self._cachepath):
-            return False
+            key = self.cache.key ( fname , recipe )
+            cached = self.cache.get ( key )
+            if cached is not None :
+                hits         += 1
+                self._events += cached.events
+                self._skip   += cached.skip 
+                chunks.append ( [ c for n , c in cached.columns ] )
+                continue
 
-        with ZipShelf(self._cachepath, 'r' ) as db : 
-            self.data = db['data']
+            ch = ROOT.TChain ( tree.GetName() )
+            ch.Add ( fname )
+            events , skip = self._events , self._skip 
+            columns = self._columns_ ( ch , len ( ch ) , chunk )
+            if columns is None :
+                ## NB: block-wise processing is not possible: process the full tree  
+                self._events , self._skip = 0 , 0 
+                return -1 
+            self.cache.put ( key , zip ( names , columns ) , self._events - events , self._skip - skip )
+            chunks.append ( columns ) 
 
-        return True
+        self._total = len ( tree )
+        if chunks : 
+            self._add_columns_ ( [ numpy.concatenate ( [ c [ i ] for c in chunks ] ) for i in range ( len ( names ) ) ] )
 
-    def _savecache(self):
+        self._loaded_from_cache = hits == len ( files ) 
+        self._logger.info ( 'Cache hits/files: %d/%d' % ( hits , len ( files ) ) )
         
-        " Saves cache to file. "
-        with ZipShelf(self._cachepath) as db : 
-            db['data'] = self.data
-
-        return True
+        self.Terminate ()
+        return self._events
     
     #
     def Terminate ( self  ) :
-        if not self._loaded_from_cache:
-            SelectorWithVars.Terminate(self)
-
-            if len(self.data):
-                self._savecache()
-
-        else:
+        SelectorWithVars.Terminate(self)
+        if self._loaded_from_cache :
             self._logger.info('Loaded from cache!')
-
+        elif self.__pending :
+            self.cache.put_dataset ( self.__pending , self.data , self._events , self._skip )
+            self.__pending = None 
         return 1
- 
 
 # =============================================================================
 if '__main__' == __name__ :
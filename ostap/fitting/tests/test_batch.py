@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developers.
+# =============================================================================
+# @file test_batch.py
+# Test module for the batch evaluation of Ostap::Models PDFs
+# - compare batch and point-by-point evaluation
+# - fit results and wall time with and without RooFit batch mode
+# =============================================================================
+""" Test module for the batch evaluation of Ostap::Models PDFs
+- compare batch and point-by-point evaluation
+- fit results and wall time with and without RooFit batch mode
+"""
+# =============================================================================
+__author__ = "Ostap developers"
+__all__    = () ## nothing to import
+# =============================================================================
+import ROOT, random
+import ostap.fitting.roofit
+import ostap.fitting.models as     Models
+import ostap.fitting.basic  as     basic
+from   ostap.core.core      import cpp, VE, dsID
+from   ostap.logger.utils   import rooSilent
+from   ostap.utils.timing   import timing
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__  or '__builtin__' == __name__ :
+    logger = getLogger ( 'test_batch' )
+else :
+    logger = getLogger ( __name__ )
+# =============================================================================
+## make simple test mass
+mass     = ROOT.RooRealVar ( 'test_mass' , 'Some test mass' , 3.0 , 3.2 )
+
+## book large data set
+varset0  = ROOT.RooArgSet  ( mass )
+dataset0 = ROOT.RooDataSet ( dsID() , 'Test Data set-0' , varset0 )
+
+m = VE(3.100,0.015**2)
+for i in xrange(0,200000) :
+    mass.setVal  ( m.gauss () )
+    dataset0.add ( varset0    )
+
+for i in xrange(0,20000) :
+    mass.setVal  ( random.uniform ( mass.getMin() , mass.getMax() ) )
+    dataset0.add ( varset0   )
+
+logger.info ('DATASET %s' % dataset0 )
+
+# =============================================================================
+## batch evaluation versus point-by-point evaluation
+def test_batch_evaluate () :
+
+    logger.info ('Test batch evaluation for CrystalBall_pdf' )
+
+    try :
+        import numpy
+    except ImportError :
+        logger.warning ('numpy is not available, skip the test')
+        return
+
+    cb = Models.CrystalBall_pdf ( name  = 'CBe'       ,
+                                  mass  = mass        ,
+                                  alpha = 2           ,
+                                  n     = 3           ,
+                                  sigma = m.error ()  ,
+                                  mean  = m.value ()  )
+
+    xs = numpy.linspace ( 2.95 , 3.25 , 100000 )
+    with timing ( 'batch evaluation'          , logger = logger ) :
+        v1 = cb ( xs )
+    with timing ( 'point-by-point evaluation' , logger = logger ) :
+        v2 = numpy.array ( [ cb ( float ( x ) ) for x in xs ] )
+
+    assert numpy.allclose ( v1 , v2 ) , 'Batch evaluation differs from point-by-point evaluation!'
+
+# =============================================================================
+## evaluation of native RooFit PDFs: point-by-point fallback 
+def test_native_evaluate () :
+
+    logger.info ('Test array evaluation for native RooFit PDFs (RooGaussian, RooAddPdf)' )
+
+    try :
+        import numpy
+    except ImportError :
+        logger.warning ('numpy is not available, skip the test')
+        return
+
+    gauss = Models.Gauss_pdf ( name  = 'Gn'        ,
+                               mass  = mass        ,
+                               sigma = m.error ()  ,
+                               mean  = m.value ()  )
+    model = Models.Fit1D ( signal     = gauss , 
+                           background = Models.Bkg_pdf ('BkgGn', mass = mass , power = 0 ) )
+
+    xs = numpy.linspace ( 2.95 , 3.25 , 1000 )
+    for pdf in ( gauss , model ) :
+        v1 = pdf ( xs )
+        v2 = numpy.array ( [ pdf ( float ( x ) ) for x in xs ] )
+        assert numpy.allclose ( v1 , v2 ) , 'Array evaluation differs from point-by-point evaluation for %s!' % pdf.name 
+
+# =============================================================================
+## fit results and wall time with and without batch mode
+def test_batch_fit () :
+
+    logger.info ('Test fit with and without batch mode for CrystalBall_pdf + background' )
+    if not basic._batch_mode_ :
+        logger.warning ('RooFit batch interface is not implemented for this ROOT version')
+
+    model = Models.Fit1D (
+        signal     = Models.CrystalBall_pdf ( name  = 'CBb'  ,
+                                              mass  = mass   ,
+                                              alpha = 2      ,
+                                              n     = 3      ,
+                                              sigma = m.error () ,
+                                              mean  = m.value () ) ,
+        background = Models.Bkg_pdf ('BkgCBb', mass = mass , power = 0 )
+        )
+    model.signal.mean .release ()
+    model.signal.sigma.release ()
+    model.signal.alpha.release ()
+
+    results = {}
+    for batch in ( False , True ) :
+        model.signal.mean .setVal ( m.value () + 0.001 )
+        model.signal.sigma.setVal ( m.error () * 1.1   )
+        with rooSilent () , timing ( 'fit with batch=%s' % batch , logger = logger ) as t :
+            result , frame = model.fitTo ( dataset0 , draw = False , silent = True , batch = batch )
+        results [ batch ] = result , t.delta
+        logger.info ( 'batch=%-5s  mean=%-28s sigma=%-28s time:%6.2fs' % (
+            batch , result ( model.signal.mean ) [ 0 ] , result ( model.signal.sigma ) [ 0 ] , t.delta ) )
+
+    r0 , t0 = results [ False ]
+    r1 , t1 = results [ True  ]
+    logger.info ( 'Fit wall time before/after: %.2fs/%.2fs' % ( t0 , t1 ) )
+
+    assert 0 == r0.status () and 0 == r1.status () , 'Fit status %s/%s' % ( r0.status () , r1.status () )
+    for p in ( model.signal.mean , model.signal.sigma , model.signal.alpha ) :
+        v0 = r0 ( p ) [ 0 ]
+        v1 = r1 ( p ) [ 0 ]
+        assert abs ( v0.value () - v1.value () ) <= 0.01 * v0.error () , \
+               'Fit results with and without batch mode differ for %s: %s vs %s' % ( p.GetName () , v0 , v1 )
+        assert abs ( v0.error () - v1.error () ) <= 0.01 * v0.error () , \
+               'Fit errors with and without batch mode differ for %s: %s vs %s' % ( p.GetName () , v0 , v1 )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_batch_evaluate () ## batch versus point-by-point evaluation
+    test_native_evaluate() ## array evaluation for native RooFit PDFs
+    test_batch_fit      () ## fit results and wall time with and without batch mode
+
+# =============================================================================
+# The END
+# =============================================================================
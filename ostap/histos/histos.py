@@ -1992,11 +1992,185 @@ def objectAsFunctionObject ( obj ) :
     ## the original stuff    
     return FUNC_OTHER ( obj ) 
 
+# =============================================================================
+## Zero-copy numpy views for the bin content and sum of squares of weights
+# =============================================================================
+try :
+    import numpy
+except ImportError :
+    numpy = None
+    logger.debug ( 'numpy is not available: vectorized histogram arithmetic is disabled' )
+# =============================================================================
+## native numpy types for the bin content 
+_h_dtypes_ = {}
+if numpy :
+    for _t , _d in ( ( ROOT.TH1D , numpy.float64 ) , ( ROOT.TH1F , numpy.float32 ) ,
+                     ( ROOT.TH2D , numpy.float64 ) , ( ROOT.TH2F , numpy.float32 ) ,
+                     ( ROOT.TH3D , numpy.float64 ) , ( ROOT.TH3F , numpy.float32 ) ) :
+        _h_dtypes_ [ _t ] = _d
+    del _t , _d
+## profiles are not eligible: the bin content is not the stored sum of weights 
+_h_profiles_ = tuple ( [ getattr ( ROOT , p ) for p in ( 'TProfile' , 'TProfile2D' , 'TProfile3D' ) if hasattr ( ROOT , p ) ] )
+# =============================================================================
+## the shape of numpy view (including underflow/overflow bins) 
+def _h_shape_ ( histo ) :
+    """The shape of numpy view (including underflow/overflow bins)"""
+    if   isinstance ( histo , ROOT.TH3 ) :
+        return histo.GetNbinsX() + 2 , histo.GetNbinsY() + 2 , histo.GetNbinsZ() + 2
+    elif isinstance ( histo , ROOT.TH2 ) :
+        return histo.GetNbinsX() + 2 , histo.GetNbinsY() + 2
+    return histo.GetNbinsX() + 2 ,
+
+## the view for ROOT-array of bins: indices are (ix,iy,iz) 
+def _h_view_ ( histo , buffer , dtype ) :
+    shape = _h_shape_ ( histo )
+    size  = 1
+    for s in shape : size *= s
+    ## NB: ROOT global bin: ix + nx*(iy+ny*iz), hence the reversed shape and transpose 
+    return numpy.frombuffer ( buffer , dtype = dtype , count = size ).reshape ( shape [ : : -1 ] ).T
+
+# =============================================================================
+## get the zero-copy numpy view for the bin content (including underflow/overflow bins)
+#  @code
+#  h2 = ...
+#  v  = h2.values ()     ## v [ ix , iy ] is the content of bin ( ix , iy )
+#  v [ 1:-1 , 1:-1 ] *= 2 
+#  @endcode
+#  @attention the view refers to the internal histogram array: keep the histogram alive!
+def _h_values_ ( histo ) :
+    """Get the zero-copy numpy view for the bin content (including underflow/overflow bins)
+    >>> h2 = ...
+    >>> v  = h2.values ()     ## v [ ix , iy ] is the content of bin ( ix , iy )
+    >>> v [ 1:-1 , 1:-1 ] *= 2 
+    - the view refers to the internal histogram array: keep the histogram alive!
+    """
+    if not numpy : raise TypeError ( "values: numpy is not available" )
+    if isinstance ( histo , _h_profiles_ ) :
+        raise TypeError ( "values: not defined for profiles %s" % type ( histo ) ) 
+    for t , d in _h_dtypes_.items () :
+        if isinstance ( histo , t ) : return _h_view_ ( histo , histo.GetArray () , d )
+    raise TypeError ( "values: unsupported histogram type %s" % type ( histo ) )
+
+# =============================================================================
+## get the zero-copy numpy view for the sum of squares of weights
+#  (including underflow/overflow bins)
+#  @code
+#  h2 = ...
+#  c  = h2.variances ()  ## c [ ix , iy ] is the squared error of bin ( ix , iy )
+#  @endcode
+#  @attention for histograms without Sumw2 the copy of (absolute) content is returned
+#  @attention the view refers to the internal histogram array: keep the histogram alive!
+def _h_variances_ ( histo ) :
+    """Get the zero-copy numpy view for the sum of squares of weights
+    (including underflow/overflow bins)
+    >>> h2 = ...
+    >>> c  = h2.variances ()  ## c [ ix , iy ] is the squared error of bin ( ix , iy )
+    - for histograms without Sumw2 the copy of (absolute) content is returned
+    - the view refers to the internal histogram array: keep the histogram alive!
+    """
+    if not histo.GetSumw2N () :
+        return numpy.abs ( _h_values_ ( histo ) ).astype ( numpy.float64 )
+    _h_values_ ( histo ) ## check the type 
+    return _h_view_ ( histo , histo.GetSumw2().GetArray() , numpy.float64 ) 
+
+for t in ( ROOT.TH1F , ROOT.TH1D ,
+           ROOT.TH2F , ROOT.TH2D ,
+           ROOT.TH3F , ROOT.TH3D ) :
+    t . values    = _h_values_
+    t . variances = _h_variances_
+
+# =============================================================================
+## vectorized operations: ( v1 , c1 , v2 , c2 ) -> ( v , c )
+#  the same error propagation as for Ostap::Math::ValueWithError
+#  @see Ostap::Math::ValueWithError
+# =============================================================================
+def _v_add_  ( v1 , c1 , v2 , c2 ) :
+    return v1 + v2 , c1 + numpy.where ( 0 < c2 , c2 , 0 )
+def _v_sub_  ( v1 , c1 , v2 , c2 ) :
+    return v1 - v2 , c1 + numpy.where ( 0 < c2 , c2 , 0 )
+def _v_mul_  ( v1 , c1 , v2 , c2 ) :
+    return v1 * v2 , c1 * v2 * v2 + numpy.where ( 0 < c2 , v1 * v1 * c2 , 0 )
+def _v_div_  ( v1 , c1 , v2 , c2 ) :
+    b2 = v2 * v2 
+    return v1 / v2 , c1 / b2 + numpy.where ( 0 < c2 , v1 * v1 * c2 / ( b2 * b2 ) , 0 )
+def _v_radd_ ( v1 , c1 , v2 , c2 ) : return _v_add_ ( v2 , c2 , v1 , c1 )
+def _v_rsub_ ( v1 , c1 , v2 , c2 ) : return _v_sub_ ( v2 , c2 , v1 , c1 )
+def _v_rmul_ ( v1 , c1 , v2 , c2 ) : return _v_mul_ ( v2 , c2 , v1 , c1 )
+def _v_rdiv_ ( v1 , c1 , v2 , c2 ) : return _v_div_ ( v2 , c2 , v1 , c1 )
+def _v_frac_ ( v1 , c1 , v2 , c2 ) :
+    s  = v1 + v2
+    s4 = s ** 4 
+    return v1 / s , ( numpy.abs ( c1 ) * v2 * v2 + numpy.abs ( c2 ) * v1 * v1 ) / s4
+def _v_asym_ ( v1 , c1 , v2 , c2 ) :
+    s  = v1 + v2
+    s4 = s ** 4 
+    return ( v1 - v2 ) / s , 4 * ( numpy.abs ( c1 ) * v2 * v2 + numpy.abs ( c2 ) * v1 * v1 ) / s4
+def _v_chi2_ ( v1 , c1 , v2 , c2 ) :
+    s  = c1 + c2
+    d  = v1 - v2 
+    v  = numpy.where ( 0 < s , d * d / s , -1.0 )
+    v  = numpy.where ( numpy.isclose ( v1 , v2 , rtol = 1.e-10 , atol = 0 ) , 0.0 , v )
+    return v , numpy.zeros_like ( v )
+def _v_mean_ ( v1 , c1 , v2 , c2 ) :
+    c  = 1.0 / ( 1.0 / c1 + 1.0 / c2 )
+    v  = c * ( v1 / c1 + v2 / c2 ) 
+    p1 , p2 = 0 < c1 , 0 < c2
+    v  = numpy.where ( p1 & p2 , v , numpy.where ( p1 , v1 , numpy.where ( p2 , v2 , 0.5 * ( v1 + v2 ) ) ) )
+    c  = numpy.where ( p1 & p2 , c , numpy.where ( p1 , c1 , numpy.where ( p2 , c2 , 0.0 ) ) )
+    return v , c 
+
+# =============================================================================
+## the slice for the regular bins (no underflow/overflow)
+def _h_inner_ ( histo ) :
+    return tuple ( [ slice ( 1 , n - 1 ) for n in _h_shape_ ( histo ) ] ) 
+
+# =============================================================================
+## vectorized binary operation for histograms with identical binning
+#  @param h1     the first  histogram
+#  @param h2     the second operand
+#  @param vop    the vectorized operation ( v1 , c1 , v2 , c2 ) -> ( v , c ) 
+#  @param result the result (clone of h1 or h1 itself for in-place operations) 
+#  @param keep   keep the content of the result for the invalid (non-finite) bins? 
+#  @return True if the operation is performed, False if the per-bin fallback is needed 
+def _h_voper_ ( h1 , h2 , vop , result , keep = False ) :
+    """Vectorized binary operation for histograms with identical binning
+    - return True if the operation is performed, False if the per-bin fallback is needed 
+    """
+    if vop is None or not numpy                                   : return False
+    for h in ( h1 , h2 ) :
+        if not isinstance ( h , ROOT.TH1 ) or isinstance ( h , _h_profiles_ ) : return False
+        if not [ t for t in _h_dtypes_ if isinstance ( h , t ) ]  : return False 
+    if not h1.same_bins ( h2 )                                    : return False
+    #
+    inner = _h_inner_ ( h1 )
+    v1 = h1.values    () [ inner ].astype ( numpy.float64 )
+    c1 = h1.variances () [ inner ]
+    v2 = h2.values    () [ inner ].astype ( numpy.float64 )
+    c2 = h2.variances () [ inner ]
+    #
+    with numpy.errstate ( all = 'ignore' ) :
+        v , c = vop ( v1 , c1 , v2 , c2 )
+        c     = numpy.abs ( c ) 
+    ok = numpy.isfinite ( v ) & numpy.isfinite ( c )
+    #
+    rv = result.values    () [ inner ]
+    rc = result.variances () [ inner ]
+    if keep :   ## invalid bins are kept intact
+        rv [ ok ] = v [ ok ]
+        rc [ ok ] = c [ ok ]
+    else :      ## invalid bins are zeroed 
+        rv [ ... ] = numpy.where ( ok , v , 0 )
+        rc [ ... ] = numpy.where ( ok , c , 0 )
+    #
+    result.ResetStats ()
+    return True 
+
 # =============================================================================
 ## operation with the histograms 
+#  - for histograms with identical binning the vectorized operation <code>vop</code> is used 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h1_oper_ ( h1 , h2 , oper ) :
+def _h1_oper_ ( h1 , h2 , oper , vop = None ) :
     """Operation with the histogram
     >>> h1     = ...
     >>> h2     = ...
@@ -2004,7 +2178,7 @@ def _h1_oper_ ( h1 , h2 , oper ) :
     """
     if isinstance ( h1 , ROOT.TProfile ) :
         hh = h1.asH1()
-        return _h1_oper_ ( hh , h2 , oper ) 
+        return _h1_oper_ ( hh , h2 , oper , vop ) 
     #
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
@@ -2012,6 +2186,9 @@ def _h1_oper_ ( h1 , h2 , oper ) :
     result = h1.Clone( hID() )
     if not result.GetSumw2() : result.Sumw2()
 
+    ## identical binning: vectorized operation 
+    if _h_voper_ ( h1 , h2 , vop , result ) : return result
+    
     ## 
     f2 = objectAsFunction ( h2 )
     
@@ -2037,7 +2214,7 @@ def _h1_oper_ ( h1 , h2 , oper ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h1_ioper_ ( h1 , h2 , oper ) :
+def _h1_ioper_ ( h1 , h2 , oper , vop = None ) :
     """Operation with the histogram
     >>> obj= ...
     >>> h2     = ...
@@ -2047,6 +2224,9 @@ def _h1_ioper_ ( h1 , h2 , oper ) :
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
     #
+    ## identical binning: vectorized operation 
+    if _h_voper_ ( h1 , h2 , vop , h1 , keep = True ) : return h1
+    #
     f2 = objectAsFunction ( h2 ) 
     ##
     for i1,x1,y1 in h1.iteritems() :
@@ -2075,7 +2255,7 @@ def _h1_div_ ( h1 , h2 ) :
     >>> result = h1 / h2  
     """
     #
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x/y , _v_div_ )
 # =============================================================================
 ##  Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2086,7 +2266,7 @@ def _h1_mul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2  
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x*y , _v_mul_ )
 # =============================================================================
 ##  Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2097,7 +2277,7 @@ def _h1_add_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2  
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x+y , _v_add_ )
 # =============================================================================
 ##  Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2108,7 +2288,7 @@ def _h1_sub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2  
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x-y , _v_sub_ )
 # =============================================================================
 ##  Fraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2119,7 +2299,7 @@ def _h1_frac_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1.frac  ( h2 ) 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x.frac(y) ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x.frac(y) , _v_frac_ )
 # =============================================================================
 ##  ``Asymmetry'' of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2130,7 +2310,7 @@ def _h1_asym_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1.asym ( h2 )     
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x.asym(y) ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x.asym(y) , _v_asym_ )
 # =============================================================================
 ## ``Difference'' of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2153,7 +2333,7 @@ def _h1_chi2_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1.chi2  ( h2 )     
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : VE ( x.chi2 ( y ) , 0 ) ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : VE ( x.chi2 ( y ) , 0 ) , _v_chi2_ )
 # =============================================================================
 ##  ``Average'' of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2164,7 +2344,7 @@ def _h1_mean_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1.average  ( h2 )     
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : x.mean ( y ) ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : x.mean ( y ) , _v_mean_ )
 
 # =============================================================================
 ## 'pow' the histograms 
@@ -2234,7 +2414,7 @@ def _h1_idiv_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 /=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x/y , _v_div_ )
 
 # =============================================================================
 ## Multiplication with the histograms 
@@ -2246,7 +2426,7 @@ def _h1_imul_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 *=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x*y , _v_mul_ )
 
 # =============================================================================
 ## Addition with the histograms 
@@ -2258,7 +2438,7 @@ def _h1_iadd_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 +=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x+y , _v_add_ )
 # =============================================================================
 ##  Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2269,7 +2449,7 @@ def _h1_isub_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 -=  h2     
     """
-    return _h1_ioper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h1_ioper_ ( h1 , h2 , lambda x,y : x-y , _v_sub_ )
 
 # =============================================================================
 ## Division with the histograms 
@@ -2281,7 +2461,7 @@ def _h1_rdiv_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj / h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y/x ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y/x , _v_rdiv_ )
 # =============================================================================
 ## Multiplication with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2292,7 +2472,7 @@ def _h1_rmul_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj * h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y*x ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y*x , _v_rmul_ )
 
 # =============================================================================
 ## Addition with the histograms 
@@ -2304,7 +2484,7 @@ def _h1_radd_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj + h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y+x )
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y+x , _v_radd_ )
 
 # =============================================================================
 ## Subtraction of the histograms 
@@ -2316,7 +2496,7 @@ def _h1_rsub_ ( h1 , h2 ) :
     >>> obj    = ...
     >>> result = obj - h1 
     """
-    return _h1_oper_ ( h1 , h2 , lambda x,y : y-x ) 
+    return _h1_oper_ ( h1 , h2 , lambda x,y : y-x , _v_rsub_ )
 
 # =============================================================================
 ## Feed the histogram from other object, e.g. function
@@ -2641,7 +2821,7 @@ ROOT.TH1D.random = lambda s : s.GetRandom()
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h2_oper_ ( h1 , h2 , oper ) :
+def _h2_oper_ ( h1 , h2 , oper , vop = None ) :
     """Operation with the histogram        
     >>> h1     = ...
     >>> h2     = ...
@@ -2653,6 +2833,9 @@ def _h2_oper_ ( h1 , h2 , oper ) :
     result = h1.Clone( hID() )
     if not result.GetSumw2() : result.Sumw2()
     #
+    ## identical binning: vectorized operation 
+    if _h_voper_ ( h1 , h2 , vop , result ) : return result
+    #
     f2 = objectAsFunction ( h2 )
     # 
     for ix1,iy1,x1,y1,z1 in h1.iteritems() :
@@ -2675,13 +2858,16 @@ def _h2_oper_ ( h1 , h2 , oper ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2012-06-03
-def _h2_ioper_ ( h1 , h2 , oper ) :
+def _h2_ioper_ ( h1 , h2 , oper , vop = None ) :
     """
     Operation with the histogram 
     """
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
     #
+    ## identical binning: vectorized operation 
+    if _h_voper_ ( h1 , h2 , vop , h1 ) : return h1
+    #
     f2 = objectAsFunction ( h2 )
     # 
     for ix1,iy1,x1,y1,z1 in h1.iteritems() :
@@ -2711,7 +2897,7 @@ def _h2_div_ ( h1 , h2 ) :
     >>> result = h1 / h2
     
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x/y , _v_div_ )
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2722,7 +2908,7 @@ def _h2_mul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x*y , _v_mul_ )
 # =============================================================================
 ## Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2733,7 +2919,7 @@ def _h2_add_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x+y , _v_add_ )
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2744,7 +2930,7 @@ def _h2_sub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x-y , _v_sub_ )
 
 
 
@@ -2759,7 +2945,7 @@ def _h2_rdiv_ ( h1 , h2 ) :
     >>> result = h1 / h2
     
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y/x ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y/x , _v_rdiv_ )
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2770,7 +2956,7 @@ def _h2_rmul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y*x ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y*x , _v_rmul_ )
 # =============================================================================
 ## Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2781,7 +2967,7 @@ def _h2_radd_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y+x ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y+x , _v_radd_ )
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2792,7 +2978,7 @@ def _h2_rsub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : y-x ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : y-x , _v_rsub_ )
 
 
 # =============================================================================
@@ -2805,7 +2991,7 @@ def _h2_frac_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> frac   = h1.frac ( h2 )
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x.frac(y) ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x.frac(y) , _v_frac_ )
 # =============================================================================
 ## ``Asymmetry'' of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2816,7 +3002,7 @@ def _h2_asym_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> asym   = h1.asym ( h2 )
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x.asym(y) ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x.asym(y) , _v_asym_ )
 # =============================================================================
 ## ``Difference'' of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2838,7 +3024,7 @@ def _h2_chi2_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> chi2   = h1.chi2 ( h2 ) 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : VE ( x.chi2 ( y ) , 0 ) ) 
+    return _h2_oper_ ( h1 , h2 , lambda x,y : VE ( x.chi2 ( y ) , 0 ) , _v_chi2_ )
 
 # =============================================================================
 ##  ``Average'' the histograms 
@@ -2850,7 +3036,7 @@ def _h2_mean_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> mean   = h1.average ( h2 ) 
     """
-    return _h2_oper_ ( h1 , h2 , lambda x,y : x.mean ( y ) )  
+    return _h2_oper_ ( h1 , h2 , lambda x,y : x.mean ( y ) , _v_mean_ )
 
 # =============================================================================
 ## 'pow' the histograms 
@@ -2916,7 +3102,7 @@ def _h2_idiv_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 /=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x/y , _v_div_ )
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2927,7 +3113,7 @@ def _h2_imul_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 *=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x*y , _v_mul_ )
 
 # =============================================================================
 ## Addition with the histograms 
@@ -2939,7 +3125,7 @@ def _h2_iadd_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 +=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x+y , _v_add_ )
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -2950,7 +3136,7 @@ def _h2_isub_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 -=  h2     
     """
-    return _h2_ioper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h2_ioper_ ( h1 , h2 , lambda x,y : x-y , _v_sub_ )
 # =============================================================================
 
 def _h2_box_   ( self , opts = '' ) : return self.Draw ( opts + ' box'   )
@@ -2997,7 +3183,7 @@ for t in ( ROOT.TH2F , ROOT.TH2D ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2011-06-07
-def _h3_oper_ ( h1 , h2 , oper ) :
+def _h3_oper_ ( h1 , h2 , oper , vop = None ) :
     """ Operation with the 3D-histogram     
     >>> h1 = ...
     >>> h2 = ...
@@ -3009,6 +3195,9 @@ def _h3_oper_ ( h1 , h2 , oper ) :
     result = h1.Clone( hID() )
     if not result.GetSumw2() : result.Sumw2()
     #
+    ## identical binning: vectorized operation 
+    if _h_voper_ ( h1 , h2 , vop , result ) : return result
+    #
     f2 = objectAsFunction ( h2 ) 
     # 
     for ix1,iy1,iz1,x1,y1,z1,v1 in h1.iteritems() :
@@ -3033,12 +3222,15 @@ def _h3_oper_ ( h1 , h2 , oper ) :
 ## operation with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2012-06-03
-def _h3_ioper_ ( h1 , h2 , oper ) :
+def _h3_ioper_ ( h1 , h2 , oper , vop = None ) :
     """Operation with the 3D-histogram 
     """
     if                                 not h1.GetSumw2() : h1.Sumw2()
     if hasattr ( h2 , 'GetSumw2' ) and not h2.GetSumw2() : h2.Sumw2()
     #
+    ## identical binning: vectorized operation 
+    if _h_voper_ ( h1 , h2 , vop , h1 ) : return h1
+    #
     f2 = objectAsFunction ( h2 ) 
     # 
     for ix1,iy1,iz1,x1,y1,z1,v1 in h1.iteritems() :
@@ -3067,7 +3259,7 @@ def _h3_div_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 / h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x/y , _v_div_ )
 # =============================================================================
 ##  Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3078,7 +3270,7 @@ def _h3_mul_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 * h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x*y , _v_mul_ )
 # =============================================================================
 ##  Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3089,7 +3281,7 @@ def _h3_add_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 + h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x+y , _v_add_ )
 # =============================================================================
 ##  Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3100,7 +3292,7 @@ def _h3_sub_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1 - h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x-y , _v_sub_ )
 # =============================================================================
 ##  ``Fraction'' of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3111,7 +3303,7 @@ def _h3_frac_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1.frac ( h2 )    
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x.frac(y) )
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x.frac(y) , _v_frac_ )
 
 # =============================================================================
 ##  ``Asymmetry'' of the histograms 
@@ -3123,7 +3315,7 @@ def _h3_asym_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1.asym ( h2 )    
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x.asym(y) ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x.asym(y) , _v_asym_ )
 # =============================================================================
 ##  ``Chi2-tension'' the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3134,7 +3326,7 @@ def _h3_chi2_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1.chi2 ( h2 )    
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : VE ( x.chi2 ( y ) , 0 ) ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : VE ( x.chi2 ( y ) , 0 ) , _v_chi2_ )
 # =============================================================================
 ##  ``Average'' the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3145,7 +3337,7 @@ def _h3_mean_ ( h1 , h2 ) :
     >>> h2 = ...
     >>> h3 = h1.average ( h2 ) 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : x.mean ( y ) )  
+    return _h3_oper_ ( h1 , h2 , lambda x,y : x.mean ( y ) , _v_mean_ )
 
 
 
@@ -3188,7 +3380,7 @@ def _h3_rdiv_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 / h2    
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y/x ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y/x , _v_rdiv_ )
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3199,7 +3391,7 @@ def _h3_rmul_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 * h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y*x ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y*x , _v_rmul_ )
 
 
 
@@ -3213,7 +3405,7 @@ def _h3_radd_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 + h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y+x ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y+x , _v_radd_ )
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3224,7 +3416,7 @@ def _h3_rsub_ ( h1 , h2 ) :
     >>> h2     = ...
     >>> result = h1 - h2 
     """
-    return _h3_oper_ ( h1 , h2 , lambda x,y : y-x ) 
+    return _h3_oper_ ( h1 , h2 , lambda x,y : y-x , _v_rsub_ )
 
 
 # =============================================================================
@@ -3263,7 +3455,7 @@ def _h3_idiv_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 /=  h2 
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x/y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x/y , _v_div_ )
 # =============================================================================
 ## Division with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3274,7 +3466,7 @@ def _h3_imul_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 *=  h2     
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x*y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x*y , _v_mul_ )
 # =============================================================================
 ## Addition with the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3285,7 +3477,7 @@ def _h3_iadd_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 +=  h2     
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x+y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x+y , _v_add_ )
 # =============================================================================
 ## Subtraction of the histograms 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -3296,7 +3488,7 @@ def _h3_isub_ ( h1 , h2 ) :
     >>> h2  = ...
     >>> h1 -=  h2     
     """
-    return _h3_ioper_ ( h1 , h2 , lambda x,y : x-y ) 
+    return _h3_ioper_ ( h1 , h2 , lambda x,y : x-y , _v_sub_ )
 # =============================================================================
 
 
@@ -6248,10 +6440,12 @@ def _h_same_bins_ ( histo , another ) :
         if a1 != a2 : return False
         a1 = histo  .GetYaxis()
         a2 = another.GetYaxis()
+        if a1 != a2 : return False
         return True
     elif isinstance ( histo , ROOT.TH1 ) and isinstance ( another , ROOT.TH1 ) : 
         a1 = histo  .GetXaxis()
         a2 = another.GetXaxis()
+        if a1 != a2 : return False
         return True
     
     return False 
@@ -6414,6 +6608,19 @@ _new_methods_   = (
     ROOT.TH1   . same_dims    , 
     ROOT.TH1   . same_bins    , 
     #
+    ROOT.TH1D  . values       ,
+    ROOT.TH1D  . variances    ,
+    ROOT.TH1F  . values       ,
+    ROOT.TH1F  . variances    ,
+    ROOT.TH2D  . values       ,
+    ROOT.TH2D  . variances    ,
+    ROOT.TH2F  . values       ,
+    ROOT.TH2F  . variances    ,
+    ROOT.TH3D  . values       ,
+    ROOT.TH3D  . variances    ,
+    ROOT.TH3F  . values       ,
+    ROOT.TH3F  . variances    ,
+    #
     ROOT.TH1F. __setitem__    ,
     ROOT.TH1D. __setitem__    ,
     #
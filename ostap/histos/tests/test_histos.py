@@ -319,6 +319,42 @@ def test_efficiency() :
                     
             
 
+# =============================================================================
+## Test for numpy views and vectorized operations with histograms
+def test_vectorized () :
+
+    logger.info ( 'Test for numpy views and vectorized operations with histograms')
+
+    try :
+        import numpy
+    except ImportError :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return 
+    
+    from ostap.utils.timing import timing
+    
+    h1 = ROOT.TH2D ( hID() , '' , 200 , 0 , 1 , 200 , 0 , 1 )
+    h2 = h1.clone() 
+    for i in range ( 200000 ) :
+        h1.Fill ( random.uniform ( 0 , 1 ) , random.uniform ( 0 , 1 ) )
+        h2.Fill ( random.uniform ( 0 , 1 ) , random.uniform ( 0 , 1 ) )
+
+    ## zero-copy views 
+    v = h1.values    ()
+    c = h1.variances ()
+    assert v.shape == ( 202 , 202 ) and v [ 3 , 5 ] == h1.GetBinContent ( 3 , 5 ) , 'Invalid view!'
+    assert c [ 3 , 5 ] == h1.GetBinError ( 3 , 5 ) ** 2                           , 'Invalid view!'
+    
+    for name , oper , fun in ( ( 'div' , lambda a , b : a / b         , lambda x , y : x / y         ) ,
+                               ( 'mul' , lambda a , b : a * b         , lambda x , y : x * y         ) ,
+                               ( 'add' , lambda a , b : a + b         , lambda x , y : x + y         ) ,
+                               ( 'sub' , lambda a , b : a - b         , lambda x , y : x - y         ) ,
+                               ( 'asym', lambda a , b : a.asym  ( b ) , lambda x , y : x.asym  ( y ) ) ) :
+        with timing ( 'vectorized %-4s' % name , logger = logger ) : r1 = oper     ( h1 , h2 )
+        with timing ( 'per-bin    %-4s' % name , logger = logger ) : r2 = h1._oper_ ( h2 , fun ) 
+        assert numpy.allclose ( r1.values    () , r2.values    () ) , 'Invalid values for %s'    % name 
+        assert numpy.allclose ( r1.variances () , r2.variances () ) , 'Invalid variances for %s' % name 
+
 # =============================================================================
 if '__main__' == __name__ :
 
@@ -328,6 +364,8 @@ if '__main__' == __name__ :
     
     test_efficiency () 
     
+    test_vectorized () 
+    
 # =============================================================================
 # The END 
 # =============================================================================
@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file blockdb.py
+#
+#  Simple random-access container of binary blocks with ``dbm''-like interface,
+#  used as the storage for the compressed shelves (e.g. ZipShelf)
+#  - each value is stored as one (already compressed) block
+#  - the key index is stored at the end of file
+#  - the file is opened in O(index) time, the blocks are read via mmap
+#  - the new/updated blocks are appended, the index is rewritten at close,
+#    the file is compacted if the fraction of the dead records is large
+#  - each record has a header with the key and the checksum: if the file
+#    is not properly closed (no valid index), the index is recovered by
+#    scanning the records
+#  - the new blocks overwrite the old index, no dead indices are kept 
+#
+#  File layout:
+#  @code
+#  [ header : MAGIC , version ] [ record ] [ record ] ... [ index record ] [ trailer: index offset&size , MAGIC ]
+#  record : [ tag , key size , value size , crc32 ] [ key ] [ value ]
+#  @endcode
+#
+#  @code
+#  db = BlockDB ( 'file.zdb' , 'c' )
+#  db [ 'key' ] = b'some bytes'
+#  db.close()
+#  @endcode
+#
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Simple random-access container of binary blocks with ``dbm''-like interface,
+used as the storage for the compressed shelves (e.g. ZipShelf)
+- each value is stored as one (already compressed) block
+- the key index is stored at the end of file
+- the file is opened in O(index) time, the blocks are read via mmap
+- the new/updated blocks are appended, the index is rewritten at close,
+  the file is compacted if the fraction of the dead records is large
+- each record has a header with the key and the checksum: if the file
+  is not properly closed (no valid index), the index is recovered by
+  scanning the records
+- the new blocks overwrite the old index, no dead indices are kept 
+
+File layout:
+
+[ header : MAGIC , version ] [ record ] ... [ index record ] [ trailer: index offset&size , MAGIC ]
+record : [ tag , key size , value size , crc32 ] [ key ] [ value ]
+
+>>> db = BlockDB ( 'file.zdb' , 'c' )
+>>> db [ 'key' ] = b'some bytes'
+>>> db.close()
+"""
+# =============================================================================
+__version__ = '$Revision$'
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = '2018-05-20'
+__all__     = (
+    'BlockDB'    , ## random-access container of binary blocks
+    'is_blockdb' , ## is the file in BlockDB format?
+    )
+# =============================================================================
+import os, mmap, struct, zlib
+try:
+    from cPickle   import dumps, loads, HIGHEST_PROTOCOL
+except ImportError:
+    from  pickle   import dumps, loads, HIGHEST_PROTOCOL
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__ : logger = getLogger ( 'ostap.io.blockdb' )
+else                      : logger = getLogger ( __name__           )
+# =============================================================================
+MAGIC    = b'OSTAPBDB'
+VERSION  = 2
+_header_  = struct.Struct ( '<8sI4x' ) ## magic , version
+_trailer_ = struct.Struct ( '<QQ8s'  ) ## index offset , index size , magic
+_record_  = struct.Struct ( '<4sIQI' ) ## tag , key size , value size , crc32
+## record tags 
+_PUT_     = b'BPUT' ## the block 
+_DEL_     = b'BDEL' ## the removed key 
+_IDX_     = b'BIDX' ## the index 
+# =============================================================================
+## is the file in BlockDB format?
+def is_blockdb ( filename ) :
+    """Is the file in BlockDB format?"""
+    if not os.path.exists ( filename ) : return False
+    if os.path.getsize ( filename ) < _header_.size + _trailer_.size : return False
+    with open ( filename , 'rb' ) as f :
+        magic , version = _header_.unpack ( f.read ( _header_.size ) )
+    return MAGIC == magic
+
+# =============================================================================
+## @class BlockDB
+#  Random-access container of binary blocks with ``dbm''-like interface
+#  Modes:
+#  - 'r' Open existing database for reading only
+#  - 'w' Open existing database for reading and writing
+#  - 'c' Open database for reading and writing, creating it if it doesn't exist
+#  - 'n' Always create a new, empty database, open for reading and writing
+#  @code
+#  db = BlockDB ( 'file.zdb' , 'c' )
+#  db [ 'key' ] = b'some bytes'
+#  db.close()
+#  @endcode
+class BlockDB(object) :
+    """Random-access container of binary blocks with ``dbm''-like interface
+    Modes:
+    - 'r' Open existing database for reading only
+    - 'w' Open existing database for reading and writing
+    - 'c' Open database for reading and writing, creating it if it doesn't exist
+    - 'n' Always create a new, empty database, open for reading and writing
+    >>> db = BlockDB ( 'file.zdb' , 'c' )
+    >>> db [ 'key' ] = b'some bytes'
+    >>> db.close()
+    """
+    ## compact the modified file at close if the fraction of dead records exceeds this
+    compact_fraction = 0.5
+
+    def __init__ ( self , filename , mode = 'c' ) :
+
+        self.__filename = filename
+        self.__readonly = 'r' == mode
+        self.__index    = {}     ## key -> ( offset , size )
+        self.__dirty    = False  ## index is modified?
+        self.__mmap     = None
+        self.__file     = None
+
+        exists = os.path.exists ( filename )
+        if   'r' == mode and not exists :
+            raise IOError ( "BlockDB: file '%s' does not exist" % filename )
+        elif 'w' == mode and not exists :
+            raise IOError ( "BlockDB: file '%s' does not exist" % filename )
+
+        self.__version = VERSION
+        if 'n' == mode or not exists :
+            with open ( filename , 'wb' ) as f :
+                f.write ( _header_.pack ( MAGIC , VERSION ) )
+            self.__end   = _header_.size
+            self.__dirty = True
+        else :
+            self.__end   = self.__read_index ()
+
+        self.__tail = os.path.getsize ( filename ) > self.__end  ## index&trailer after the data?
+        self.__file = open ( filename , 'rb' if self.__readonly else 'r+b' )
+        self.__remap ()
+        ## convert the old format 
+        if VERSION != self.__version and not self.__readonly : self.compact ()
+
+    ## read the index from the end of the file
+    def __read_index ( self ) :
+        """Read the index from the end of the file
+        - the index is recovered from the records, if there is no valid index
+        - return the end of the data region
+        """
+        with open ( self.__filename , 'rb' ) as f :
+            magic , version = _header_.unpack ( f.read ( _header_.size ) )
+            if MAGIC != magic :
+                raise IOError ( "BlockDB: '%s' is not BlockDB file" % self.__filename )
+            if VERSION < version :
+                raise IOError ( "BlockDB: unsupported version %s of '%s'" % ( version , self.__filename ) )
+            self.__version = version 
+            offset , size , magic = 0 , 0 , None
+            if _header_.size + _trailer_.size <= os.path.getsize ( self.__filename ) :
+                f.seek ( - _trailer_.size , os.SEEK_END )
+                offset , size , magic = _trailer_.unpack ( f.read ( _trailer_.size ) )
+            if 1 == version :
+                if MAGIC != magic :
+                    raise IOError ( "BlockDB: '%s' has no valid index (not properly closed?)" % self.__filename )
+                f.seek ( offset )
+                self.__index = loads ( zlib.decompress ( f.read ( size ) ) )
+                return offset + size + _trailer_.size
+            if MAGIC == magic :
+                f.seek ( offset )
+                record = self.__read_record ( f )
+                if record and _IDX_ == record [ 0 ] and size == f.tell () - offset :
+                    self.__index = loads ( zlib.decompress ( record [ 2 ] ) )
+                    ## NB: the new blocks overwrite the index 
+                    return offset
+            logger.warning ( "BlockDB: '%s' has no valid index (not properly closed?), recover it" % self.__filename )
+            return self.__recover ( f ) 
+
+    ## read one record from the file
+    #  @return ( tag , key , value ) or None for truncated/corrupted record
+    @staticmethod
+    def __read_record ( f ) :
+        """Read one record from the file
+        - return ( tag , key , value ) or None for truncated/corrupted record 
+        """
+        header = f.read ( _record_.size )
+        if len ( header ) < _record_.size : return None
+        tag , ksize , vsize , crc = _record_.unpack ( header )
+        if not tag in ( _PUT_ , _DEL_ , _IDX_ ) : return None
+        key   = f.read ( ksize )
+        value = f.read ( vsize )
+        if len ( key ) < ksize or len ( value ) < vsize : return None
+        if crc != zlib.crc32 ( value , zlib.crc32 ( key ) ) & 0xffffffff : return None
+        return tag , key , value 
+
+    ## recover the index by scanning the records
+    #  @return the end of the valid records 
+    def __recover ( self , f ) :
+        """Recover the index by scanning the records
+        - return the end of the valid records 
+        """
+        index = {}
+        end   = _header_.size
+        f.seek ( end )
+        while True :
+            record = self.__read_record ( f )
+            if record is None : break
+            tag , key , value = record
+            if   _PUT_ == tag : index [ loads ( key ) ] = f.tell () - len ( value ) , len ( value )
+            elif _DEL_ == tag : index.pop ( loads ( key ) , None )
+            end = f.tell ()
+        self.__index = index
+        self.__dirty = True
+        logger.info ( "BlockDB: %d block(s) are recovered from '%s'" % ( len ( index ) , self.__filename ) )
+        return end
+
+    ## write one record at the end of the data region
+    #  @return the offset of the value 
+    def __write_record ( self , tag , key , value ) :
+        """Write one record at the end of the data region
+        - return the offset of the value 
+        """
+        if self.__tail :
+            ## remove the old index&trailer: it is not valid anymore 
+            if self.__mmap is not None :
+                self.__mmap.close ()
+                self.__mmap = None
+            self.__file.truncate ( self.__end )
+            self.__tail = False
+        crc = zlib.crc32 ( value , zlib.crc32 ( key ) ) & 0xffffffff
+        self.__file.seek  ( self.__end )
+        self.__file.write ( _record_.pack ( tag , len ( key ) , len ( value ) , crc ) )
+        self.__file.write ( key   )
+        self.__file.write ( value )
+        self.__end  += _record_.size + len ( key ) + len ( value )
+        return self.__end - len ( value )
+
+    ## (re)map the file into memory
+    def __remap ( self ) :
+        """(Re)map the file into memory"""
+        if self.__mmap is not None :
+            self.__mmap.close ()
+            self.__mmap = None
+        if not self.__readonly : self.__file.flush ()
+        if 0 < os.path.getsize ( self.__filename ) :
+            self.__mmap = mmap.mmap ( self.__file.fileno () , 0 , access = mmap.ACCESS_READ )
+
+    @property
+    def filename ( self ) :
+        """``filename'' : the file name"""
+        return self.__filename
+    @property
+    def readonly ( self ) :
+        """``readonly'' : is database opened in read-only mode?"""
+        return self.__readonly
+
+    # =========================================================================
+    ## dictionary-like interface
+    # =========================================================================
+    def keys        ( self )       : return list ( self.__index.keys () )
+    def __iter__    ( self )       : return iter ( self.keys () )
+    def __len__     ( self )       : return len  ( self.__index )
+    def __contains__( self , key ) : return key in self.__index
+    def has_key     ( self , key ) : return key in self.__index
+
+    ## get the block
+    def __getitem__ ( self , key ) :
+        offset , size = self.__index [ key ]
+        if self.__mmap is None or len ( self.__mmap ) < offset + size : self.__remap ()
+        return self.__mmap [ offset : offset + size ]
+
+    ## get the block
+    def get ( self , key , default = None ) :
+        return self [ key ] if key in self.__index else default
+
+    ## put the block: it is appended at the end of the data region
+    def __setitem__ ( self , key , value ) :
+        if self.__readonly : raise IOError ( "BlockDB: '%s' is opened in read-only mode" % self.__filename )
+        offset = self.__write_record ( _PUT_ , dumps ( key , HIGHEST_PROTOCOL ) , value )
+        self.__index [ key ] = offset , len ( value )
+        self.__dirty = True
+
+    ## remove the block (the space is reclaimed by compaction)
+    def __delitem__ ( self , key ) :
+        if self.__readonly : raise IOError ( "BlockDB: '%s' is opened in read-only mode" % self.__filename )
+        del self.__index [ key ]
+        self.__write_record ( _DEL_ , dumps ( key , HIGHEST_PROTOCOL ) , b'' )
+        self.__dirty = True
+
+    # =========================================================================
+    ## the total size of live records (headers, keys and blocks)
+    def live_size ( self ) :
+        """The total size of live records (headers, keys and blocks)"""
+        return sum ( [ _record_.size + len ( dumps ( k , HIGHEST_PROTOCOL ) ) + s for k , ( o , s ) in self.__index.items () ] )
+
+    ## write the index and the trailer
+    #  NB: the next blocks overwrite the index and the trailer 
+    def sync ( self ) :
+        """Write the index and the trailer
+        - the next blocks overwrite the index and the trailer 
+        """
+        if self.__readonly or not self.__dirty : return
+        end   = self.__end 
+        index = zlib.compress ( dumps ( self.__index , HIGHEST_PROTOCOL ) )
+        self.__write_record  ( _IDX_ , b'' , index )
+        self.__file.write    ( _trailer_.pack ( end , self.__end - end , MAGIC ) )
+        self.__file.truncate ()
+        self.__file.flush    ()
+        self.__end   = end
+        self.__tail  = True 
+        self.__dirty = False
+
+    ## compact the file: rewrite only the live blocks
+    def compact ( self ) :
+        """Compact the file: rewrite only the live blocks"""
+        if self.__readonly : return
+        tmpname = self.__filename + '.compact'
+        index   = {}
+        with open ( tmpname , 'wb' ) as f :
+            f.write ( _header_.pack ( MAGIC , VERSION ) )
+            pos = _header_.size
+            for key in sorted ( self.__index ) :
+                value = self [ key ]
+                k     = dumps ( key , HIGHEST_PROTOCOL )
+                f.write ( _record_.pack ( _PUT_ , len ( k ) , len ( value ) , zlib.crc32 ( value , zlib.crc32 ( k ) ) & 0xffffffff ) )
+                f.write ( k     )
+                f.write ( value )
+                pos += _record_.size + len ( k ) 
+                index [ key ] = pos , len ( value )
+                pos += len ( value )
+            data = zlib.compress ( dumps ( index , HIGHEST_PROTOCOL ) )
+            f.write ( _record_.pack ( _IDX_ , 0 , len ( data ) , zlib.crc32 ( data , zlib.crc32 ( b'' ) ) & 0xffffffff ) )
+            f.write ( data )
+            f.write ( _trailer_.pack ( pos , _record_.size + len ( data ) , MAGIC ) )
+        if self.__mmap is not None :
+            self.__mmap.close ()
+            self.__mmap = None
+        self.__file.close ()
+        os.rename ( tmpname , self.__filename )
+        self.__index   = index
+        self.__end     = pos
+        self.__tail    = True 
+        self.__version = VERSION 
+        self.__dirty   = False
+        self.__file  = open ( self.__filename , 'r+b' )
+        self.__remap ()
+
+    ## close the database
+    def close ( self ) :
+        """Close the database"""
+        if self.__file is None : return
+        if not self.__readonly and self.__dirty :
+            total = self.__end - _header_.size
+            if 0 < total and self.live_size () < ( 1 - self.compact_fraction ) * total : self.compact ()
+            else : self.sync ()
+        if self.__mmap is not None :
+            self.__mmap.close ()
+            self.__mmap = None
+        self.__file.close ()
+        self.__file = None
+
+    def __enter__ ( self      ) : return self
+    def __exit__  ( self , *_ ) : self.close ()
+    def __del__   ( self      ) :
+        try :
+            self.close ()
+        except :
+            pass
+
+    def __repr__  ( self ) : return "BlockDB('%s'): %d block(s)" % ( self.__filename , len ( self ) )
+    __str__ = __repr__
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+# The END
+# =============================================================================
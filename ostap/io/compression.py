@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file compression.py
+#
+#  Pluggable compression codecs for ostap shelves (ZipShelf, SQLiteShelf)
+#  - zlib, lzma and bz2 from the standard library
+#  - lz4 and zstd, if the corresponding modules are installed
+#  - the per-database ``trained'' dictionaries for small records
+#    (for zstd and for zlib with preset dictionary support)
+#
+#  Each record carries the tag with the codec and the dictionary identifiers,
+#  the records without tag are plain zlib streams (the old format),
+#  therefore the old data are still readable.
+#  The records written with zlib codec without dictionary are not tagged,
+#  therefore they are readable also by the old versions.
+#
+#  @code
+#  codec = make_codec ( 'zstd' , 3 )
+#  blob  = encode ( data , codec )
+#  data  = decode ( blob )
+#  @endcode
+#
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Pluggable compression codecs for ostap shelves (ZipShelf, SQLiteShelf)
+- zlib, lzma and bz2 from the standard library
+- lz4 and zstd, if the corresponding modules are installed
+- the per-database ``trained'' dictionaries for small records
+  (for zstd and for zlib with preset dictionary support)
+
+Each record carries the tag with the codec and the dictionary identifiers,
+the records without tag are plain zlib streams (the old format),
+therefore the old data are still readable.
+The records written with zlib codec without dictionary are not tagged,
+therefore they are readable also by the old versions.
+
+>>> codec = make_codec ( 'zstd' , 3 )
+>>> blob  = encode ( data , codec )
+>>> data  = decode ( blob )
+"""
+# =============================================================================
+__version__ = '$Revision$'
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = '2018-05-20'
+__all__     = (
+    'Codec'            , ## the base class for codecs
+    'make_codec'       , ## get the codec by name
+    'available_codecs' , ## the names of available codecs
+    'encode'           , ## compress and tag the record
+    'decode'           , ## decompress the (tagged or old) record
+    'Dictionary'       , ## the compression dictionary
+    'Dictionaries'     , ## collection of compression dictionaries of the database
+    'train_dictionary' , ## train the compression dictionary
+    )
+# =============================================================================
+import struct, zlib
+try:
+    from cPickle   import dumps, loads
+except ImportError:
+    from  pickle   import dumps, loads
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__ : logger = getLogger ( 'ostap.io.compression' )
+else                      : logger = getLogger ( __name__               )
+# =============================================================================
+## optional codecs
+# =============================================================================
+try :
+    import bz2
+except ImportError :
+    bz2 = None
+try :
+    import lzma
+except ImportError :
+    try :
+        from backports import lzma
+    except ImportError :
+        lzma = None
+try :
+    import lz4.frame as lz4
+except ImportError :
+    lz4 = None
+try :
+    import zstandard
+except ImportError :
+    zstandard = None
+# =============================================================================
+## does zlib support the preset dictionaries?
+try :
+    zlib.compressobj ( 1 , zlib.DEFLATED , zlib.MAX_WBITS , 8 , zlib.Z_DEFAULT_STRATEGY , b'ostap' )
+    _zdict_ = True
+except TypeError :
+    _zdict_ = False
+# =============================================================================
+## the tag of the record: tag byte, codec id, dictionary id.
+#  NB: zlib streams never start with 0xFF
+TAG      = 0xFF
+_header_ = struct.Struct ( '<BBI' )
+# =============================================================================
+## @class Codec
+#  The base class for compression codecs
+class Codec(object) :
+    """The base class for compression codecs"""
+    name          = None
+    cid           = None
+    default_level = None
+    dictionaries  = False  ## does codec support the dictionaries?
+    module        = True   ## the required module
+    def __init__ ( self , level = None ) :
+        self.level = self.default_level if level is None else level
+    @classmethod
+    def available ( klass ) :
+        """Is the codec available?"""
+        return klass.module is not None
+    def compress   ( self , data , dictionary = None ) :
+        """Compress the data"""
+        raise NotImplementedError
+    def decompress ( self , data , dictionary = None ) :
+        """Decompress the data"""
+        raise NotImplementedError
+    def __repr__ ( self ) : return "Codec(%s,level=%s)" % ( self.name , self.level )
+    __str__ = __repr__
+
+# =============================================================================
+## no compression
+class NoneCodec(Codec) :
+    """No compression"""
+    name = 'none'
+    cid  = 0
+    def compress   ( self , data , dictionary = None ) : return data
+    def decompress ( self , data , dictionary = None ) : return data
+
+# =============================================================================
+## zlib codec, optionally with the preset dictionary
+class ZlibCodec(Codec) :
+    """Zlib codec, optionally with the preset dictionary"""
+    name          = 'zlib'
+    cid           = 1
+    default_level = zlib.Z_BEST_COMPRESSION
+    dictionaries  = _zdict_
+    module        = zlib
+    def compress   ( self , data , dictionary = None ) :
+        if dictionary is None : return zlib.compress ( data , self.level )
+        c = zlib.compressobj ( self.level , zlib.DEFLATED , zlib.MAX_WBITS , 8 ,
+                               zlib.Z_DEFAULT_STRATEGY , dictionary.data )
+        return c.compress ( data ) + c.flush ()
+    def decompress ( self , data , dictionary = None ) :
+        if dictionary is None : return zlib.decompress ( data )
+        d = zlib.decompressobj ( zlib.MAX_WBITS , dictionary.data )
+        return d.decompress ( data ) + d.flush ()
+
+# =============================================================================
+## lzma codec
+class LzmaCodec(Codec) :
+    """Lzma codec"""
+    name          = 'lzma'
+    cid           = 2
+    default_level = 6
+    module        = lzma
+    def compress   ( self , data , dictionary = None ) : return lzma.compress   ( data , preset = self.level )
+    def decompress ( self , data , dictionary = None ) : return lzma.decompress ( data )
+
+# =============================================================================
+## bz2 codec
+class Bz2Codec(Codec) :
+    """Bz2 codec"""
+    name          = 'bz2'
+    cid           = 3
+    default_level = 9
+    module        = bz2
+    def compress   ( self , data , dictionary = None ) : return bz2.compress   ( data , self.level )
+    def decompress ( self , data , dictionary = None ) : return bz2.decompress ( data )
+
+# =============================================================================
+## lz4 codec (requires lz4 module)
+class Lz4Codec(Codec) :
+    """Lz4 codec (requires lz4 module)"""
+    name          = 'lz4'
+    cid           = 4
+    default_level = 0
+    module        = lz4
+    def compress   ( self , data , dictionary = None ) : return lz4.compress   ( data , compression_level = self.level )
+    def decompress ( self , data , dictionary = None ) : return lz4.decompress ( data )
+
+# =============================================================================
+## zstd codec, optionally with the dictionary (requires zstandard module)
+class ZstdCodec(Codec) :
+    """Zstd codec, optionally with the dictionary (requires zstandard module)"""
+    name          = 'zstd'
+    cid           = 5
+    default_level = 3
+    dictionaries  = True
+    module        = zstandard
+    def __init__ ( self , level = None ) :
+        Codec.__init__ ( self , level )
+        self.__compressors   = {}
+        self.__decompressors = {}
+    def __zdict ( self , dictionary ) :
+        return None if dictionary is None else zstandard.ZstdCompressionDict ( dictionary.data )
+    def compress   ( self , data , dictionary = None ) :
+        key = dictionary.id if dictionary else 0
+        c   = self.__compressors.get ( key , None )
+        if c is None :
+            c = zstandard.ZstdCompressor ( level = self.level , dict_data = self.__zdict ( dictionary ) )
+            self.__compressors [ key ] = c
+        return c.compress ( data )
+    def decompress ( self , data , dictionary = None ) :
+        key = dictionary.id if dictionary else 0
+        d   = self.__decompressors.get ( key , None )
+        if d is None :
+            d = zstandard.ZstdDecompressor ( dict_data = self.__zdict ( dictionary ) )
+            self.__decompressors [ key ] = d
+        return d.decompress ( data )
+
+# =============================================================================
+## all known codecs
+_codecs_     = dict ( [ ( c.name , c ) for c in ( NoneCodec , ZlibCodec , LzmaCodec , Bz2Codec , Lz4Codec , ZstdCodec ) ] )
+_codecs_id_  = dict ( [ ( c.cid  , c ) for c in _codecs_.values() ] )
+## the codec instances used for decoding
+_decoders_   = {}
+# =============================================================================
+## the names of available codecs
+#  @code
+#  print available_codecs ()
+#  @endcode
+def available_codecs () :
+    """The names of available codecs
+    >>> print available_codecs ()
+    """
+    return tuple ( sorted ( [ n for n , c in _codecs_.items() if c.available () ] ) )
+
+# =============================================================================
+## get the codec by name
+#  @code
+#  codec = make_codec ( 'zstd' , 3 )
+#  @endcode
+#  @param codec the name of codec or the codec itself
+#  @param level the compression level (the codec default if None)
+def make_codec ( codec = 'zlib' , level = None ) :
+    """Get the codec by name
+    >>> codec = make_codec ( 'zstd' , 3 )
+    - codec : the name of codec or the codec itself
+    - level : the compression level (the codec default if None)
+    """
+    if isinstance ( codec , Codec ) : return codec
+    klass = _codecs_.get ( str ( codec ).lower () , None )
+    if klass is None :
+        raise ValueError  ( "Unknown codec '%s', known are %s" % ( codec , sorted ( _codecs_.keys () ) ) )
+    if not klass.available () :
+        raise ImportError ( "Codec '%s' is not available, available are %s" % ( codec , available_codecs () ) )
+    return klass ( level )
+
+# =============================================================================
+## @class Dictionary
+#  The compression dictionary
+class Dictionary(object) :
+    """The compression dictionary"""
+    def __init__ ( self , data ) :
+        self.data = bytes ( data )
+        self.id   = ( zlib.crc32 ( self.data ) & 0xFFFFFFFF ) or 1
+    def __len__  ( self ) : return len ( self.data )
+    def __repr__ ( self ) : return "Dictionary(id=%08x,size=%d)" % ( self.id , len ( self ) )
+    __str__ = __repr__
+
+# =============================================================================
+## @class Dictionaries
+#  Collection of compression dictionaries of the database:
+#  the last added dictionary is used for compression,
+#  all dictionaries are used for decompression
+class Dictionaries(object) :
+    """Collection of compression dictionaries of the database:
+    the last added dictionary is used for compression,
+    all dictionaries are used for decompression
+    """
+    def __init__ ( self , blob = None ) :
+        self.__dicts   = {}
+        self.__current = None
+        if blob :
+            current , dicts = loads ( bytes ( blob ) )
+            for data in dicts : self.add ( Dictionary ( data ) )
+            self.__current = self.__dicts.get ( current , None )
+    @property
+    def current ( self ) :
+        """``current'' : the dictionary used for compression"""
+        return self.__current
+    def add ( self , dictionary ) :
+        """Add the dictionary and make it current"""
+        self.__dicts [ dictionary.id ] = dictionary
+        self.__current = dictionary
+    def get ( self , did , default = None ) : return self.__dicts.get ( did , default )
+    def __len__ ( self ) : return len ( self.__dicts )
+    def dumps ( self ) :
+        """Serialize the dictionaries"""
+        current = self.__current.id if self.__current else 0
+        return dumps ( ( current , [ d.data for d in self.__dicts.values() ] ) , 2 )
+
+# =============================================================================
+## compress and tag the record
+#  @code
+#  blob = encode ( data , codec , dictionary )
+#  @endcode
+def encode ( data , codec , dictionary = None ) :
+    """Compress and tag the record
+    >>> blob = encode ( data , codec , dictionary )
+    """
+    if dictionary is not None and not codec.dictionaries : dictionary = None
+    ## old format: plain zlib stream
+    if dictionary is None and isinstance ( codec , ZlibCodec ) : return codec.compress ( data )
+    return _header_.pack ( TAG , codec.cid , dictionary.id if dictionary else 0 ) + codec.compress ( data , dictionary )
+
+# =============================================================================
+## decompress the (tagged or old) record
+#  @code
+#  data = decode ( blob , dictionaries )
+#  @endcode
+def decode ( blob , dictionaries = None ) :
+    """Decompress the (tagged or old) record
+    >>> data = decode ( blob , dictionaries )
+    """
+    if not blob or TAG != ord ( blob [ 0 : 1 ] ) : return zlib.decompress ( blob )
+    tag , cid , did = _header_.unpack_from ( blob )
+    codec = _decoders_.get ( cid , None )
+    if codec is None :
+        klass = _codecs_id_.get ( cid , None )
+        if klass is None :
+            raise IOError ( "Unknown codec id %d" % cid )
+        if not klass.available () :
+            raise IOError ( "Codec '%s' is not available" % klass.name )
+        codec = klass ()
+        _decoders_ [ cid ] = codec
+    dictionary = None
+    if did :
+        dictionary = dictionaries.get ( did , None ) if dictionaries else None
+        if dictionary is None :
+            raise IOError ( "Compression dictionary %08x is not available" % did )
+    return codec.decompress ( blob [ _header_.size : ] , dictionary )
+
+# =============================================================================
+## train the compression dictionary from the samples of (uncompressed) records
+#  - zstd-trained dictionary, if zstandard module is available
+#  - otherwise the ``raw-content'' dictionary from the most recent samples
+#  @code
+#  samples    = [ ... ]
+#  dictionary = train_dictionary ( samples , 16 * 1024 )
+#  @endcode
+def train_dictionary ( samples , size = 16 * 1024 ) :
+    """Train the compression dictionary from the samples of (uncompressed) records
+    - zstd-trained dictionary, if zstandard module is available
+    - otherwise the ``raw-content'' dictionary from the most recent samples
+    >>> samples    = [ ... ]
+    >>> dictionary = train_dictionary ( samples , 16 * 1024 )
+    """
+    samples = [ bytes ( s ) for s in samples if s ]
+    if not samples : return None
+    if zstandard is not None :
+        try :
+            return Dictionary ( zstandard.train_dictionary ( size , samples ).as_bytes () )
+        except zstandard.ZstdError :
+            logger.debug ( 'train_dictionary: zstd training fails, use raw-content dictionary' )
+    ## zlib uses the end of dictionary more efficiently
+    return Dictionary ( b''.join ( samples ) [ -size : ] )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+    logger.info ( 'Available codecs: %s' % list ( available_codecs () ) )
+
+# =============================================================================
+# The END
+# =============================================================================
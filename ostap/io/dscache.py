@@ -0,0 +1,529 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file dscache.py
+#
+#  Content-addressed cache of the columnar data (e.g. datasets)
+#  extracted from ROOT files:
+#  - the entries are keyed by the identity of the input file
+#    (size, inode and modification time) and the ``recipe'' key
+#    (tree name, selection, variables, ...)
+#  - each input file is cached separately as the columnar chunk
+#    (compressed numpy arrays), therefore adding one file to the chain
+#    reuses the cached chunks for all other files
+#  - the whole datasets are cached for the non-vectorized processing
+#  - LRU eviction with the disk quota
+#  - writes are atomic (write to the temporary file and rename),
+#    the cache is safe for concurrent parallel jobs
+#
+#  @code
+#  cache  = DataCache ()
+#  recipe = cache.recipe ( 'MyTree' , 'pt>1' , variables )
+#  key    = cache.key    ( 'file.root' , recipe )
+#  chunk  = cache.get    ( key )
+#  if chunk is None :
+#      columns = ...
+#      cache.put ( key , columns , events = 100 , skip = 2 )
+#  @endcode
+#
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Content-addressed cache of the columnar data (e.g. datasets)
+extracted from ROOT files:
+- the entries are keyed by the identity of the input file
+  (size, inode and modification time) and the ``recipe'' key
+  (tree name, selection, variables, ...)
+- each input file is cached separately as the columnar chunk
+  (compressed numpy arrays), therefore adding one file to the chain
+  reuses the cached chunks for all other files
+- the whole datasets are cached for the non-vectorized processing
+- LRU eviction with the disk quota
+- writes are atomic (write to the temporary file and rename),
+  the cache is safe for concurrent parallel jobs
+
+>>> cache  = DataCache ()
+>>> recipe = cache.recipe ( 'MyTree' , 'pt>1' , variables )
+>>> key    = cache.key    ( 'file.root' , recipe )
+>>> chunk  = cache.get    ( key )
+>>> if chunk is None :
+...     columns = ...
+...     cache.put ( key , columns , events = 100 , skip = 2 )
+"""
+# =============================================================================
+__version__ = '$Revision$'
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = '2018-05-20'
+__all__     = (
+    'DataCache'     , ## content-addressed cache of the columnar data
+    'file_identity' , ## identity of the (ROOT) file: size, inode/UUID, mtime
+    'Chunk'         , ## the cached chunk
+    )
+# =============================================================================
+import os, types, hashlib, tempfile, zlib
+from   collections import namedtuple
+try :
+    from cPickle   import dumps, loads, HIGHEST_PROTOCOL
+except ImportError:
+    from  pickle   import dumps, loads, HIGHEST_PROTOCOL
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__ : logger = getLogger ( 'ostap.io.dscache' )
+else                      : logger = getLogger ( __name__           )
+# =============================================================================
+## the cached chunk: columns and processing counters
+Chunk = namedtuple ( 'Chunk' , ( 'columns' , 'events' , 'skip' ) )
+## the suffix of the cache entries
+_suffix_ = '.npz'
+## the suffix of the cache entries for the whole datasets 
+_ds_suffix_ = '.dsz'
+# =============================================================================
+## get the identity of the (ROOT) file: size, inode/UUID and modification time
+#  @code
+#  size , ident , mtime = file_identity ( 'file.root' )
+#  @endcode
+#  For the local files the identity is taken from the file system
+#  (the file is not opened), for remote files from <code>TFile</code>
+#  @see TFile::GetUUID
+def file_identity ( fname ) :
+    """Get the identity of the (ROOT) file: size, inode/UUID and modification time
+    >>> size , ident , mtime = file_identity ( 'file.root' )
+    For the local files the identity is taken from the file system
+    (the file is not opened), for remote files from TFile
+    """
+    if os.path.exists ( fname ) :
+        st = os.stat ( fname )
+        return st.st_size , 'inode:%d:%d' % ( st.st_dev , st.st_ino ) , repr ( st.st_mtime )
+
+    import ROOT
+    f = ROOT.TFile.Open ( fname , 'READ' )
+    if not f or f.IsZombie() :
+        raise IOError ( "file_identity: can't open file '%s'" % fname )
+    try :
+        return f.GetSize () , f.GetUUID().AsString() , f.GetModificationDate().Convert()
+    finally :
+        f.Close()
+
+# =============================================================================
+## the simple values, that are represented by <code>repr</code>
+_simple_types_ = ( bool , int , float , complex , str , bytes , type ( None ) )
+try :
+    _simple_types_ += ( long , unicode )
+except NameError :
+    pass
+# =============================================================================
+## get the string that represents the value, captured by python callable
+#  @exception TypeError the value can't be represented 
+def _value_str_ ( value ) :
+    """Get the string that represents the value, captured by python callable
+    - TypeError is raised if the value can't be represented
+    """
+    if   isinstance ( value , _simple_types_ ) : return repr ( value )
+    elif isinstance ( value , ( list , tuple ) ) :
+        return '(' + ','.join ( [ _value_str_ ( v ) for v in value ] ) + ')'
+    elif isinstance ( value , ( set , frozenset ) ) :
+        return '{' + ','.join ( sorted ( [ _value_str_ ( v ) for v in value ] ) ) + '}'
+    elif isinstance ( value , dict ) :
+        return '{' + ','.join ( sorted ( [ _value_str_ ( k ) + ':' + _value_str_ ( v ) for k , v in value.items () ] ) ) + '}'
+    elif isinstance ( value , types.CodeType   ) : return _code_str_ ( value )
+    elif isinstance ( value , types.ModuleType ) : return 'module:%s' % value.__name__
+    elif hasattr    ( value , 'GetName' ) :
+        return '%s:%s' % ( type ( value ).__name__ , value.GetName () )
+    elif callable   ( value ) : return _callable_str_ ( value )
+    raise TypeError ( "Can't get the fingerprint of %s" % type ( value ).__name__ )
+
+# =============================================================================
+## get the string that represents the code object: bytecode, constants and names
+def _code_str_ ( code ) :
+    """Get the string that represents the code object: bytecode, constants and names"""
+    return repr ( ( code.co_code , _value_str_ ( code.co_consts ) , code.co_names ) )
+
+# =============================================================================
+## get the string that represents python callable (e.g. lambda)
+#  - the bytecode, the constants and the names
+#  - the default values of arguments
+#  - the values, captured by the closure
+#  - the (simple) values of the global variables and the global functions,
+#    referenced by the callable (also from the nested functions)
+#  - the state of the callable object 
+#  @exception TypeError the callable can't be represented,
+#             (e.g. it captures the arbitrary object), it must not be cached 
+def _callable_str_ ( fun , seen = None ) :
+    """Get the string that represents python callable (e.g. lambda):
+    - the bytecode, the constants and the names
+    - the default values of arguments
+    - the values, captured by the closure
+    - the (simple) values of the global variables and the global functions,
+    referenced by the callable (also from the nested functions)
+    - the state of the callable object 
+    TypeError is raised if the callable can't be represented
+    (e.g. it captures the arbitrary object): it must not be cached
+    """
+    state = ()
+    if   isinstance ( fun , types.MethodType ) :
+        state = fun.__self__ ,
+        fun   = fun.__func__
+    elif not isinstance ( fun , ( types.FunctionType , types.BuiltinFunctionType ) ) :
+        call  = getattr ( type ( fun ) , '__call__' , None )
+        call  = getattr ( call , '__func__' , call )
+        if isinstance ( call , types.FunctionType ) :
+            state = getattr ( fun , '__dict__' , None ) ,
+            fun   = call
+        
+    code = getattr ( fun , '__code__' , None )
+    if code is None : return repr ( fun )   ## e.g. builtin function 
+
+    items = [ _code_str_ ( code ) ]
+    items.append ( _value_str_ ( fun.__defaults__ ) )
+    items.append ( _value_str_ ( getattr ( fun , '__kwdefaults__' , None ) ) )
+    for cell in ( fun.__closure__ or () ) :
+        try :
+            value = cell.cell_contents
+        except ValueError :                 ## empty cell 
+            value = None 
+        items.append ( _value_str_ ( value ) )
+    ## the global names: NB the global functions are followed (once) 
+    seen = set () if seen is None else seen
+    seen.add ( id ( fun ) ) 
+    glbs = getattr ( fun , '__globals__' , {} )
+    for name in _global_names_ ( code ) :
+        if not name in glbs : continue 
+        value = glbs [ name ]
+        if   isinstance ( value , _simple_types_ ) :
+            items.append ( '%s=%r' % ( name , value ) )
+        elif isinstance ( value , types.FunctionType ) :
+            if id ( value ) in seen : items.append ( '%s=<seen>' % name )
+            else                    : items.append ( '%s=%s' % ( name , _callable_str_ ( value , seen ) ) )
+        elif isinstance ( value , ( list , tuple , set , frozenset , dict ) ) :
+            items.append ( '%s=%s' % ( name , _value_str_ ( value ) ) )
+    items.append ( _value_str_ ( state ) ) 
+    return '|'.join ( items )
+
+# =============================================================================
+## get the (sorted) names, used by the code object and the nested code objects
+def _global_names_ ( code ) :
+    """Get the (sorted) names, used by the code object and the nested code objects"""
+    names = set ( code.co_names )
+    for c in code.co_consts :
+        if isinstance ( c , types.CodeType ) : names.update ( _global_names_ ( c ) )
+    return sorted ( names ) 
+
+# =============================================================================
+## @class DataCache
+#  Content-addressed cache of the columnar data (e.g. datasets)
+#  extracted from ROOT files
+#  - the entries are keyed by the file identity and the ``recipe''
+#  - one entry (compressed numpy arrays) per input file
+#  - LRU eviction with disk quota: the modification time of the entry
+#    is updated at each access
+#  - atomic writes: safe for concurrent parallel jobs
+#  @code
+#  cache  = DataCache ( quota = 10 * 1024**3 )
+#  recipe = cache.recipe ( 'MyTree' , 'pt>1' , variables )
+#  key    = cache.key    ( 'file.root' , recipe )
+#  chunk  = cache.get    ( key )
+#  @endcode
+class DataCache(object) :
+    """Content-addressed cache of the columnar data (e.g. datasets)
+    extracted from ROOT files
+    - the entries are keyed by the file identity and the ``recipe''
+    - one entry (compressed numpy arrays) per input file
+    - LRU eviction with disk quota: the modification time of the entry
+    is updated at each access
+    - atomic writes: safe for concurrent parallel jobs
+    >>> cache  = DataCache ( quota = 10 * 1024**3 )
+    >>> recipe = cache.recipe ( 'MyTree' , 'pt>1' , variables )
+    >>> key    = cache.key    ( 'file.root' , recipe )
+    >>> chunk  = cache.get    ( key )
+    """
+    ## default disk quota: 2GB
+    default_quota = 2 * 1024**3
+
+    def __init__ ( self , directory = None , quota = None ) :
+
+        if directory is None :
+            from ostap.core.workdir import workdir
+            directory = os.path.join ( workdir , 'cache' , 'datasets' )
+
+        self.__directory = directory
+        self.__quota     = quota if quota else self.default_quota
+        self.__hits      = 0
+        self.__misses    = 0
+
+        if not os.path.exists ( directory ) :
+            try :
+                os.makedirs ( directory )
+            except OSError :
+                ## NB: it could be created by the concurrent job
+                if not os.path.isdir ( directory ) : raise
+
+    @property
+    def directory ( self ) :
+        """``directory'' : the cache directory"""
+        return self.__directory
+    @property
+    def quota     ( self ) :
+        """``quota'' : the disk quota (in bytes)"""
+        return self.__quota
+    @property
+    def hits      ( self ) :
+        """``hits'' : number of cache hits"""
+        return self.__hits
+    @property
+    def misses    ( self ) :
+        """``misses'' : number of cache misses"""
+        return self.__misses
+
+    # =========================================================================
+    ## get the key for the ``recipe'': how the data are extracted from the file
+    #  @code
+    #  cache  = ...
+    #  recipe = cache.recipe ( 'MyTree' , 'pt>1' , variables , cuts )
+    #  @endcode
+    #  Python callables (accessors, cuts) are represented by their bytecode,
+    #  the default values of arguments and the captured values
+    #  @exception TypeError the recipe can't be represented, it must not be cached 
+    #  @see _callable_str_ 
+    def recipe ( self , *items ) :
+        """Get the key for the ``recipe'': how the data are extracted from the file
+        >>> cache  = ...
+        >>> recipe = cache.recipe ( 'MyTree' , 'pt>1' , variables , cuts )
+        Python callables (accessors, cuts) are represented by their bytecode,
+        the default values of arguments and the captured values
+        - TypeError is raised if the recipe can't be represented: it must not be cached 
+        """
+        try :
+            key = _value_str_ ( items )
+        except RuntimeError : ## e.g. recursive closure 
+            raise TypeError ( "Can't get the fingerprint of the recipe" )
+        return hashlib.sha1 ( key.encode ( 'utf-8' ) ).hexdigest()
+
+    # =========================================================================
+    ## get the full key for the input file and the recipe
+    #  @code
+    #  cache  = ...
+    #  recipe = cache.recipe ( ... )
+    #  key    = cache.key ( 'file.root' , recipe )
+    #  key    = cache.key ( [ 'file1.root' , 'file2.root' ] , recipe ) ## several files 
+    #  @endcode
+    #  @see file_identity
+    def key ( self , fname , recipe ) :
+        """Get the full key for the input file(s) and the recipe
+        >>> cache  = ...
+        >>> recipe = cache.recipe ( ... )
+        >>> key    = cache.key ( 'file.root' , recipe )
+        >>> key    = cache.key ( [ 'file1.root' , 'file2.root' ] , recipe ) ## several files 
+        """
+        if isinstance ( fname , ( list , tuple ) ) :
+            ident = repr ( [ file_identity ( f ) for f in fname ] )
+        else :
+            ident = repr ( file_identity ( fname ) )
+        return '%s-%s' % ( recipe , hashlib.sha1 ( ident.encode ( 'utf-8' ) ).hexdigest() )
+
+    ## the path to the cache entry
+    def _path_ ( self , key ) :
+        return os.path.join ( self.__directory , key + _suffix_ )
+
+    # =========================================================================
+    ## get the cached chunk
+    #  @code
+    #  cache = ...
+    #  chunk = cache.get ( key )
+    #  if chunk is not None :
+    #     columns , events , skip = chunk
+    #  @endcode
+    #  @return the chunk or <code>None</code>
+    def get ( self , key ) :
+        """Get the cached chunk
+        >>> cache = ...
+        >>> chunk = cache.get ( key )
+        >>> if chunk is not None :
+        ...     columns , events , skip = chunk
+        - return the chunk or None
+        """
+        import numpy
+        path = self._path_ ( key )
+        try :
+            with open ( path , 'rb' ) as f :
+                data    = numpy.load ( f )
+                names   = [ str ( n ) for n in data [ '__names__' ] ]
+                columns = [ ( n , data [ 'c%d' % i ] ) for i , n in enumerate ( names ) ]
+                events  = int ( data [ '__events__' ] )
+                skip    = int ( data [ '__skip__'   ] )
+                data.close()
+        except ( IOError , OSError , KeyError , ValueError ) :
+            ## NB: missing, corrupted or concurrently evicted entry
+            self.__misses += 1
+            return None
+
+        ## mark as recently used
+        try                          : os.utime ( path , None )
+        except ( IOError , OSError ) : pass
+
+        self.__hits += 1
+        return Chunk ( columns , events , skip )
+
+    # =========================================================================
+    ## put the chunk into the cache
+    #  @code
+    #  cache = ...
+    #  cache.put ( key , [ ( 'pt' , pt_array ) , ( 'y' , y_array ) ] , events = 10 , skip = 1 )
+    #  @endcode
+    #  The entry is written to the temporary file, that is atomically
+    #  renamed into the final one, that is safe for concurrent jobs
+    def put ( self , key , columns , events = 0 , skip = 0 ) :
+        """Put the chunk into the cache
+        >>> cache = ...
+        >>> cache.put ( key , [ ( 'pt' , pt_array ) , ( 'y' , y_array ) ] , events = 10 , skip = 1 )
+        The entry is written to the temporary file, that is atomically
+        renamed into the final one, that is safe for concurrent jobs
+        """
+        import numpy
+        ## NB: columns could be an iterator: materialize it once 
+        columns = [ ( c [ 0 ] , numpy.asarray ( c [ 1 ] ) ) for c in columns ]
+        arrays  = dict ( [ ( 'c%d' % i , c [ 1 ] ) for i , c in enumerate ( columns ) ] )
+        arrays [ '__names__'  ] = numpy.array ( [ c [ 0 ] for c in columns ] )
+        arrays [ '__events__' ] = numpy.array ( events )
+        arrays [ '__skip__'   ] = numpy.array ( skip   )
+
+        fd , tmp = tempfile.mkstemp ( prefix = '.tmp-' , suffix = _suffix_ , dir = self.__directory )
+        try :
+            with os.fdopen ( fd , 'wb' ) as f :
+                numpy.savez_compressed ( f , **arrays )
+            os.rename ( tmp , self._path_ ( key ) ) ## NB: atomic!
+        except :
+            if os.path.exists ( tmp ) : os.remove ( tmp )
+            raise
+
+        self.evict ()
+
+    # =========================================================================
+    ## get the cached (whole) dataset, e.g. for non-vectorized processing
+    #  @code
+    #  cache = ...
+    #  entry = cache.get_dataset ( key )
+    #  if entry is not None :
+    #     dataset , events , skip = entry
+    #  @endcode
+    #  @return ( dataset , events , skip ) or <code>None</code>
+    def get_dataset ( self , key ) :
+        """Get the cached (whole) dataset, e.g. for non-vectorized processing
+        >>> cache = ...
+        >>> entry = cache.get_dataset ( key )
+        >>> if entry is not None :
+        ...     dataset , events , skip = entry
+        - return ( dataset , events , skip ) or None
+        """
+        path = os.path.join ( self.__directory , key + _ds_suffix_ )
+        try :
+            with open ( path , 'rb' ) as f :
+                entry = loads ( zlib.decompress ( f.read () ) )
+        except Exception :
+            ## NB: missing, corrupted or concurrently evicted entry
+            self.__misses += 1
+            return None
+
+        ## mark as recently used
+        try                          : os.utime ( path , None )
+        except ( IOError , OSError ) : pass
+
+        self.__hits += 1
+        return entry
+
+    # =========================================================================
+    ## put the (whole) dataset into the cache, e.g. for non-vectorized processing
+    #  @code
+    #  cache = ...
+    #  cache.put_dataset ( key , dataset , events = 10 , skip = 1 )
+    #  @endcode
+    #  The entry is written to the temporary file, that is atomically
+    #  renamed into the final one, that is safe for concurrent jobs
+    def put_dataset ( self , key , dataset , events = 0 , skip = 0 ) :
+        """Put the (whole) dataset into the cache, e.g. for non-vectorized processing
+        >>> cache = ...
+        >>> cache.put_dataset ( key , dataset , events = 10 , skip = 1 )
+        The entry is written to the temporary file, that is atomically
+        renamed into the final one, that is safe for concurrent jobs
+        """
+        data   = zlib.compress ( dumps ( ( dataset , events , skip ) , HIGHEST_PROTOCOL ) )
+        fd , tmp = tempfile.mkstemp ( prefix = '.tmp-' , suffix = _ds_suffix_ , dir = self.__directory )
+        try :
+            with os.fdopen ( fd , 'wb' ) as f :
+                f.write ( data )
+            os.rename ( tmp , os.path.join ( self.__directory , key + _ds_suffix_ ) ) ## NB: atomic!
+        except :
+            if os.path.exists ( tmp ) : os.remove ( tmp )
+            raise
+
+        self.evict ()
+
+    # =========================================================================
+    ## the list of cache entries: ( last_access_time , size , path )
+    def _entries_ ( self ) :
+        """The list of cache entries: ( last_access_time , size , path )"""
+        entries = []
+        for n in os.listdir ( self.__directory ) :
+            if n.startswith ( '.tmp-' ) : continue
+            if not n.endswith ( _suffix_ ) and not n.endswith ( _ds_suffix_ ) : continue
+            path = os.path.join ( self.__directory , n )
+            try :
+                st = os.stat ( path )
+            except OSError :
+                continue
+            entries.append ( ( st.st_mtime , st.st_size , path ) )
+        return entries
+
+    # =========================================================================
+    ## LRU eviction: remove the least recently used entries
+    #  until the total size is within the quota
+    #  @return number of removed entries
+    def evict ( self , quota = None ) :
+        """LRU eviction: remove the least recently used entries
+        until the total size is within the quota
+        - return number of removed entries
+        """
+        quota   = self.__quota if quota is None else quota
+        entries = self._entries_ ()
+        total   = sum ( [ e[1] for e in entries ] )
+        if total <= quota : return 0
+
+        entries.sort () ## the oldest first
+        removed = 0
+        for atime , size , path in entries :
+            if total <= quota : break
+            try :
+                os.remove ( path )
+                removed += 1
+            except OSError :
+                pass          ## NB: removed by the concurrent job
+            total -= size
+
+        logger.debug ( 'DataCache: %d entries are evicted' % removed )
+        return removed
+
+    # =========================================================================
+    ## the total size of the cache (in bytes)
+    def size ( self ) :
+        """The total size of the cache (in bytes)"""
+        return sum ( [ e[1] for e in self._entries_ () ] )
+
+    # =========================================================================
+    ## clear the cache
+    def clear ( self ) :
+        """Clear the cache"""
+        return self.evict ( quota = 0 )
+
+    def __len__  ( self ) : return len ( self._entries_ () )
+    def __repr__ ( self ) :
+        return 'DataCache(%s,#entries=%d,quota=%d)' % ( self.__directory , len ( self ) , self.__quota )
+    __str__ = __repr__
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+# The END
+# =============================================================================
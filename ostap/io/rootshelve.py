@@ -389,6 +389,9 @@ def tmpdb ( *args ) :
     """    
     return TmpRootShelf ( *args )
 
+# =============================================================================
+## a bit more decorations for shelve  (optional)
+import ostap.io.shelve_ext
 
 # =============================================================================
 if '__main__' == __name__ :
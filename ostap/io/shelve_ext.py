@@ -15,6 +15,20 @@
 #
 # @endcode 
 #
+# The keyed append-only history: each ``append'' writes only the new object
+#
+# @code
+#
+# >>> db.append ( 'pt-weights' , h1 ) 
+# >>> db.append ( 'pt-weights' , h2 ) 
+# >>> history = db.history ( 'pt-weights' ) ## lazy sequence of objects
+# >>> len ( history ) 
+# >>> h = history [ -1 ]                     ## only the last object is read
+#
+# @endcode 
+#
+# The internal entries of history are not listed by ``keys'', ``len'' and ``ls''
+#
 # @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 # @date   2012-05-13
 # 
@@ -26,12 +40,26 @@
 ...
 >>> db1.ls()  ## list the content 
 
+The keyed append-only history: each ``append'' writes only the new object
+
+>>> db.append ( 'pt-weights' , h1 ) 
+>>> db.append ( 'pt-weights' , h2 ) 
+>>> history = db.history ( 'pt-weights' ) ## lazy sequence of objects
+>>> len ( history ) 
+>>> h = history [ -1 ]                     ## only the last object is read
+
+The internal entries of history are not listed by ``keys'', ``len'' and ``ls''
 """
 # =============================================================================
 __author__  = "Vanya BELYAEV Ivan.Belyaev@itep.ru"
 __date__    = "2012-05-13"
 __version__ = "$Revision$" 
-__all__     = ()   ## nothing to import 
+__all__     = (
+    'History'    , ## the keyed append-only history 
+    'db_append'  , ## append the object to the keyed history 
+    'db_history' , ## get the keyed history 
+    'db_keys'    , ## the public keys (the internal entries of history are excluded)
+    )
 # =============================================================================
 from ostap.logger.logger import getLogger 
 if '__main__' ==  __name__ : logger = getLogger( 'ostap.io.shelve_ext' )
@@ -62,6 +90,37 @@ def _new_shelve_open_ ( filename , *kargs , **kwargs ) :
 
 _new_shelve_open_ .__doc__ += '\n' + _old_shelve_open_ .__doc__ 
 
+# =============================================================================
+## the suffix for the header of the keyed history 
+_HEADER_ = '#history'
+## the format for the keys of history items 
+_ITEM_   = '%s#%06d'
+## the internal entries of the keyed history: header and items 
+import re
+_internal_ = re.compile ( r'#(history|\d{6,})\Z' )
+# =============================================================================
+## is it the internal entry of the keyed history?
+def internal_key ( key ) :
+    """Is it the internal entry of the keyed history?"""
+    return isinstance ( key , basestring ) and None is not _internal_.search ( key )
+
+# =============================================================================
+## the public keys: the internal entries of the keyed history are excluded
+#  @code
+#  db   = ...
+#  keys = db.keys() 
+#  @endcode 
+def db_keys ( self ) :
+    """The public keys: the internal entries of the keyed history are excluded
+    >>> db   = ...
+    >>> keys = db.keys() 
+    """
+    return [ k for k in self.dict.keys() if not internal_key ( k ) ]
+## the number of public keys: the internal entries of the keyed history are excluded
+def _db_len_ ( self ) :
+    """The number of public keys: the internal entries of the keyed history are excluded"""
+    return len ( self.keys () )
+
 # =============================================================================
 ## List DB-keys 
 def _ls_ ( self )  :
@@ -82,6 +141,14 @@ if not hasattr  ( shelve , '_new_open_' ) :
     shelve.     open  = _new_shelve_open_
     logger.debug ( 'Decorate shelve.open method') 
 
+# =============================================================================
+## hide the internal entries of the keyed history, if not done yet 
+if not hasattr ( shelve.Shelf , '_old_keys_' ) :
+    shelve.Shelf._old_keys_ = shelve.Shelf.keys
+    shelve.Shelf.keys       = db_keys
+    shelve.Shelf.__len__    = _db_len_
+    logger.debug ( "Hide the internal entries of history for shelve.Shelf class") 
+
 # =============================================================================
 ## add method to Shelve, if not done yet
 if not hasattr ( shelve.Shelf, 'ls' ) : 
@@ -119,6 +186,127 @@ else :
     shelve.Shelf.__exit__  = _shelf_exit_
     logger.debug ( "Add 'enter/exit' methods for shelve.Shelf class") 
 
+# =============================================================================
+## @class History
+#  The keyed append-only history: the lazy sequence of objects.
+#  The objects are stored as the separate (internal) entries, the small header keeps
+#  the unique identifier and the size of history.
+#  For the old format (no header), the object stored under the key itself
+#  (e.g. the list of objects) is considered as the history. 
+#  The old-format history is converted at the first ``append''.
+#  @code
+#  db = ...
+#  history = db.history ( 'pt-weights' )
+#  print len ( history )
+#  last = history [ -1 ]
+#  @endcode 
+class History(object) :
+    """The keyed append-only history: the lazy sequence of objects.
+    The objects are stored as the separate (internal) entries, the small header keeps
+    the unique identifier and the size of history.
+    For the old format (no header), the object stored under the key itself
+    (e.g. the list of objects) is considered as the history. 
+    The old-format history is converted at the first ``append''.
+    >>> db = ...
+    >>> history = db.history ( 'pt-weights' )
+    >>> print len ( history )
+    >>> last = history [ -1 ]
+    """
+    def __init__ ( self , db , key ) :
+        self.__db     = db
+        self.__key    = key
+        header        = db.get ( key + _HEADER_ , None ) 
+        self.__uid    = header [ 'uid'  ] if header else None
+        self.__size   = header [ 'size' ] if header else 0
+        self.__base   = None
+        self.__old    = not header and key in db  ## the old format?
+        
+    @property
+    def key ( self ) :
+        """``key'' : the key of the history"""
+        return self.__key
+    @property
+    def uid ( self ) :
+        """``uid'' : the unique identifier of the (new-format) history, None for old format"""
+        return None if self.__old else self.__uid 
+
+    ## the old-format history, stored under the key itself
+    def __base_items ( self ) :
+        if self.__base is None :
+            if self.__old : 
+                base = self.__db [ self.__key ]
+                self.__base = list ( base ) if isinstance ( base , ( list , tuple ) ) else [ base ]
+            else :
+                self.__base = []
+        return self.__base 
+        
+    def __len__ ( self ) : return len ( self.__base_items () ) + self.__size 
+    
+    def __getitem__ ( self , index ) :
+        n = len ( self )
+        if index < 0 : index += n
+        if not 0 <= index < n : raise IndexError ( "History('%s'): index out of range" % self.__key )
+        base = self.__base_items()
+        if index < len ( base ) : return base [ index ]
+        return self.__db [ _ITEM_ % ( self.__key , index - len ( base ) ) ]
+    
+    def __iter__ ( self ) :
+        for i in range ( len ( self ) ) : yield self [ i ]
+
+    def __repr__ ( self ) : return "History('%s',#%d)" % ( self.__key , len ( self ) ) 
+    __str__ = __repr__ 
+    
+# =============================================================================
+## append the object to the keyed append-only history:
+#  only the new object (and the small header) is written
+#  @code
+#  db = ...
+#  db.append ( 'pt-weights' , histo ) 
+#  @endcode
+#  The old-format history (stored under the key itself) is converted 
+#  @return the number of objects in the history 
+def db_append ( db , key , obj ) :
+    """Append the object to the keyed append-only history:
+    only the new object (and the small header) is written
+    >>> db = ...
+    >>> db.append ( 'pt-weights' , histo )
+    - the old-format history (stored under the key itself) is converted
+    - return the number of objects in the history 
+    """
+    header = db.get ( key + _HEADER_ , None ) 
+    if not header :
+        import uuid
+        header = { 'uid' : uuid.uuid4().hex , 'size' : 0 }
+        ## convert the old-format history 
+        for item in History ( db , key ) :
+            db [ _ITEM_ % ( key , header [ 'size' ] ) ] = item
+            header [ 'size' ] += 1 
+    db [ _ITEM_ % ( key , header [ 'size' ] ) ] = obj
+    header [ 'size' ] += 1
+    db [ key + _HEADER_ ] = header
+    return header [ 'size' ]
+
+# =============================================================================
+## get the keyed append-only history: the lazy sequence of objects
+#  @code
+#  db = ...
+#  history = db.history ( 'pt-weights' ) 
+#  @endcode
+#  @see History 
+def db_history ( db , key ) :
+    """Get the keyed append-only history: the lazy sequence of objects
+    >>> db = ...
+    >>> history = db.history ( 'pt-weights' ) 
+    """
+    return History ( db , key )
+
+# =============================================================================
+## add methods to Shelve, if not done yet
+if not hasattr ( shelve.Shelf , 'append'  ) : 
+    shelve.Shelf.append  = db_append
+    shelve.Shelf.history = db_history
+    logger.debug ( "Add 'append/history' methods for shelve.Shelf class") 
+
 # =============================================================================
 if '__main__' == __name__ :
 
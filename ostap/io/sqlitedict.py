@@ -33,7 +33,7 @@ import logging
 from cPickle import dumps, loads, HIGHEST_PROTOCOL as PICKLE_PROTOCOL
 from UserDict import DictMixin
 from Queue import Queue
-from threading import Thread
+from threading import Thread, Lock, local
 
 
 logger = logging.getLogger('sqlitedict')
@@ -57,7 +57,7 @@ def decode(obj):
 
 class SqliteDict(object, DictMixin):
     def __init__(self, filename=None, tablename='unnamed', flag='c',
-                 autocommit=False, journal_mode="DELETE"):
+                 autocommit=False, journal_mode="DELETE", cached_statements=100):
         """
         Initialize a thread-safe sqlite-backed dictionary. The dictionary will
         be a table `tablename` in database file `filename`. A single file (=database)
@@ -72,11 +72,18 @@ class SqliteDict(object, DictMixin):
 
         Set `journal_mode` to 'OFF' if you're experiencing sqlite I/O problems
         or if you need performance and don't care about crash-consistency.
+        Set `journal_mode` to 'WAL' to allow the concurrent readers
+        (e.g. the dictionaries opened with 'r' flag) during writing.
+
+        `cached_statements` is the size of the prepared-statement cache
+        of each sqlite connection.
 
         The `flag` parameter:
           'c': default mode, open for read/write, creating the db/table if necessary.
           'w': open for r/w, but drop `tablename` contents first (start with empty table)
           'n': create a new database (erasing any existing tables, not just `tablename`!).
+          'r': open existing database for reading only, each reading thread
+               gets its own read-only connection (no request queue)
 
         """
         self.in_temp = filename is None
@@ -95,8 +102,15 @@ class SqliteDict(object, DictMixin):
         self.tablename = tablename
 
         logger.info("opening Sqlite table %r in %s" % (tablename, filename))
+        if flag == 'r':
+            if not os.path.exists(filename):
+                raise RuntimeError('Error! The database does not exist, %s' % filename)
+            self.conn = SqliteReaders(filename, cached_statements=cached_statements)
+            return
+
         MAKE_TABLE = 'CREATE TABLE IF NOT EXISTS %s (key TEXT PRIMARY KEY, value BLOB)' % self.tablename
-        self.conn = SqliteMultithread(filename, autocommit=autocommit, journal_mode=journal_mode)
+        self.conn = SqliteMultithread(filename, autocommit=autocommit, journal_mode=journal_mode,
+                                      cached_statements=cached_statements)
         self.conn.execute(MAKE_TABLE)
         self.conn.commit()
         if flag == 'w':
@@ -243,20 +257,23 @@ class SqliteMultithread(Thread):
     in a separate thread (in the same order they arrived).
 
     """
-    def __init__(self, filename, autocommit, journal_mode):
+    def __init__(self, filename, autocommit, journal_mode, cached_statements=100):
         super(SqliteMultithread, self).__init__()
         self.filename = filename
         self.autocommit = autocommit
         self.journal_mode = journal_mode
+        self.cached_statements = cached_statements
         self.reqs = Queue() # use request queue of unlimited size
         self.setDaemon(True) # python2.5-compatible
         self.start()
 
     def run(self):
         if self.autocommit:
-            conn = sqlite3.connect(self.filename, isolation_level=None, check_same_thread=False)
+            conn = sqlite3.connect(self.filename, isolation_level=None, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
         else:
-            conn = sqlite3.connect(self.filename, check_same_thread=False)
+            conn = sqlite3.connect(self.filename, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
         conn.execute('PRAGMA journal_mode = %s' % self.journal_mode)
         conn.text_factory = str
         cursor = conn.cursor()
@@ -267,6 +284,13 @@ class SqliteMultithread(Thread):
                 break
             elif req == '--commit--':
                 conn.commit()
+            elif res == '--many--':
+                # all items are written in one transaction
+                if self.autocommit:
+                    cursor.execute('BEGIN')
+                cursor.executemany(req, arg)
+                if self.autocommit:
+                    cursor.execute('COMMIT')
             else:
                 cursor.execute(req, arg)
                 if res:
@@ -285,8 +309,12 @@ class SqliteMultithread(Thread):
         self.reqs.put((req, arg or tuple(), res))
 
     def executemany(self, req, items):
-        for item in items:
-            self.execute(req, item)
+        """
+        `executemany` calls are non-blocking: all items are queued as one request
+        and are written in one transaction.
+
+        """
+        self.execute(req, list(items), '--many--')
 
     def select(self, req, arg=None):
         """
@@ -319,3 +347,57 @@ class SqliteMultithread(Thread):
         self.execute('--close--')
         self.join()
 #endclass SqliteMultithread
+
+
+
+class SqliteReaders(object):
+    """
+    Read-only access to sqlite database with the separate connection for each thread.
+
+    The readers do not share the request queue, therefore they are not serialized
+    behind each other, and (in WAL journal mode) behind the writer.
+
+    """
+    def __init__(self, filename, cached_statements=100):
+        self.filename = filename
+        self.autocommit = False
+        self.cached_statements = cached_statements
+        self.local = local()
+        self.lock = Lock()
+        self.conns = []
+
+    def connection(self):
+        """The read-only connection for the current thread."""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.filename, check_same_thread=False,
+                                   cached_statements=self.cached_statements)
+            conn.text_factory = str
+            conn.execute('PRAGMA query_only = ON')
+            self.local.conn = conn
+            with self.lock:
+                self.conns.append(conn)
+        return conn
+
+    def execute(self, req, arg=None, res=None):
+        raise sqlite3.OperationalError('Database %s is opened in read-only mode' % self.filename)
+
+    def executemany(self, req, items):
+        raise sqlite3.OperationalError('Database %s is opened in read-only mode' % self.filename)
+
+    def select(self, req, arg=None):
+        for rec in self.connection().execute(req, arg or tuple()).fetchall():
+            yield rec
+
+    def select_one(self, req, arg=None):
+        """Return only the first row of the SELECT, or None if there are no matching rows."""
+        return self.connection().execute(req, arg or tuple()).fetchone()
+
+    def commit(self):
+        pass
+
+    def close(self):
+        with self.lock:
+            while self.conns:
+                self.conns.pop().close()
+#endclass SqliteReaders
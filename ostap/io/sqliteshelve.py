@@ -115,8 +115,12 @@ from ostap.logger.logger import getLogger
 if '__main__' == __name__ : logger = getLogger ( 'ostap.io.sqliteshelve' )
 else                      : logger = getLogger ( __name__ )
 # =============================================================================
-from   ostap.io.sqlitedict import SqliteDict
-import zlib 
+from   ostap.io.sqlitedict  import SqliteDict
+from   ostap.io.compression import make_codec, encode, decode, Dictionaries, train_dictionary
+import zlib, sqlite3
+# =============================================================================
+## the key for the compression dictionaries 
+_DICTS_ = 'dictionaries'
 # =============================================================================
 _modes_ = {
     # =========================================================================
@@ -205,7 +209,9 @@ class SQLiteShelf(SqliteDict):
                    tablename      = 'Ostap'   ,
                    writeback      = True      , ## original name: "autocommit"
                    compress_level = zlib.Z_BEST_COMPRESSION , 
-                   journal_mode   = "DELETE"  ) :
+                   journal_mode   = "DELETE"  ,
+                   codec          = 'zlib'    ,
+                   cached_statements = 100    ) :
         """Initialize a thread-safe sqlite-backed dictionary.
         The dictionary will be a table ``tablename`` in database file
         ``filename``. A single file (=database) may contain multiple tables.
@@ -223,11 +229,20 @@ class SQLiteShelf(SqliteDict):
         Set ``journal_mode`` to ``OFF``
         if you're experiencing sqlite I/O problems
         or if you need performance and don't care about crash-consistency.
+        Set ``journal_mode`` to ``WAL`` to allow the concurrent readers
+        (the databases opened in 'r' mode, see also ``reader``) during writing.
+
+        The ``codec`` is the compression codec (name or instance),
+        see ostap.io.compression; ``compress_level`` is applied for zlib only.
+
+        ``cached_statements`` is the size of prepared-statement cache
+        of sqlite connections.
         
         The `mode` parameter:
         - 'c': default mode, open for read/write, creating the db/table if necessary.
         - 'w': open for r/w, but drop `tablename` contents first (start with empty table)
         - 'n': create a new database (erasing any existing tables, not just `tablename`!).
+        - 'r': open for reading only: each reading thread gets its own connection
         
         Modes: %s 
         """ % _modes_ 
@@ -252,9 +267,129 @@ class SQLiteShelf(SqliteDict):
                               tablename    = tablename    ,
                               flag         = mode         ,
                               autocommit   = writeback    ,
-                              journal_mode = journal_mode )
+                              journal_mode = journal_mode ,
+                              cached_statements = cached_statements )
         
         self.compression = compress_level 
+        self.codec       = make_codec ( codec , compress_level if 'zlib' == codec else None )
+
+        self.cached_statements = cached_statements 
+        
+        ## the compression dictionaries are kept in the separate table 
+        if 'r' == mode :
+            try : 
+                item = self.conn.select_one ( 'SELECT value FROM %s WHERE key = ?' % self.dictsname , ( _DICTS_ , ) )
+            except sqlite3.OperationalError : ## no table: the database is written by the old version 
+                item = None
+        else : 
+            self.conn.execute ( 'CREATE TABLE IF NOT EXISTS %s (key TEXT PRIMARY KEY, value BLOB)' % self.dictsname )
+            item = self.conn.select_one ( 'SELECT value FROM %s WHERE key = ?' % self.dictsname , ( _DICTS_ , ) )
+        self.dictionaries = Dictionaries ( str ( item [ 0 ] ) if item else None )
+
+    ## pickle and compress the object 
+    def _encode_ ( self , value ) :
+        """Pickle and compress the object"""
+        f     = StringIO()
+        p     = Pickler(f, HIGHEST_PROTOCOL  )
+        p.dump(value)
+        return sqlite3.Binary ( encode ( f.getvalue() , self.codec , self.dictionaries.current ) )
+
+    ## update the database: all items are written in one transaction 
+    #  @code
+    #  db = ...
+    #  db.update ( { 'a' : 1 , 'b' : 2 } )
+    #  db.update ( ( 'key%d' % i , i ) for i in range ( 100000 ) )
+    #  @endcode
+    def update ( self , items = () , **kwargs ) :
+        """Update the database: all items are written in one transaction 
+        >>> db = ...
+        >>> db.update ( { 'a' : 1 , 'b' : 2 } )
+        >>> db.update ( ( 'key%d' % i , i ) for i in range ( 100000 ) )
+        """
+        if hasattr ( items , 'iteritems' ) : items = items.iteritems()
+        elif hasattr ( items , 'items'   ) : items = items.items    ()
+        ADD_ITEMS = 'REPLACE INTO %s (key, value) VALUES (?,?)' % self.tablename
+        self.conn.executemany ( ADD_ITEMS , [ ( k , self._encode_ ( v ) ) for k , v in items ] )
+        if kwargs : self.update ( kwargs )
+
+    ## the context manager for batched writing: the items are written
+    #  by chunks, each chunk in one transaction 
+    #  @code
+    #  db = ...
+    #  with db.write_batch () as batch :
+    #      for i in range ( 100000 ) : batch [ 'key%d' % i ] = i
+    #  @endcode
+    #  @param chunk the number of items in one transaction
+    def write_batch ( self , chunk = 10000 ) :
+        """The context manager for batched writing: the items are written
+        by chunks, each chunk in one transaction 
+        >>> db = ...
+        >>> with db.write_batch () as batch :
+        ...     for i in range ( 100000 ) : batch [ 'key%d' % i ] = i
+        - chunk : the number of items in one transaction
+        """
+        return WriteBatch ( self , chunk )
+
+    ## open the read-only companion of the database, e.g. for the reading threads
+    #  @code
+    #  db = sqliteshelve.open ( 'a_db' , 'c' , journal_mode = 'WAL' )
+    #  ...
+    #  rdb = db.reader () 
+    #  @endcode
+    def reader ( self ) :
+        """Open the read-only companion of the database, e.g. for the reading threads
+        >>> db = sqliteshelve.open ( 'a_db' , 'c' , journal_mode = 'WAL' )
+        >>> rdb = db.reader () 
+        """
+        self.commit ()
+        ## wait till all queued requests are processed 
+        self.conn.select_one ( 'SELECT 1' )
+        return SQLiteShelf ( self.filename                               ,
+                             'r'                                         ,
+                             self.tablename                              ,
+                             codec             = self.codec              ,
+                             cached_statements = self.cached_statements  )
+
+    @property
+    def dictsname ( self ) :
+        """``dictsname'' : the name of table with compression dictionaries"""
+        return '%s_dictionaries' % self.tablename 
+
+    ## train the compression dictionary for small records
+    #  @code
+    #  db = sqliteshelve.open ( 'a_db' , 'c' , codec = 'zstd' )
+    #  ... fill db with some typical records 
+    #  db.train_dictionary ()
+    #  ... the next records are compressed using the dictionary 
+    #  @endcode
+    #  @param size    the size of dictionary
+    #  @param samples the samples of typical objects (use the stored records if not specified)
+    #  @param nmax    the maximal number of stored records to be used for training 
+    def train_dictionary ( self , size = 16 * 1024 , samples = None , nmax = 1000 ) :
+        """Train the compression dictionary for small records
+        >>> db = sqliteshelve.open ( 'a_db' , 'c' , codec = 'zstd' )
+        >>> ... fill db with some typical records 
+        >>> db.train_dictionary ()
+        >>> ... the next records are compressed using the dictionary 
+        - size    : the size of dictionary
+        - samples : the samples of typical objects (use the stored records if not specified)
+        - nmax    : the maximal number of stored records to be used for training 
+        """
+        if samples is None :
+            GET_ITEMS = 'SELECT value FROM %s LIMIT ?' % self.tablename
+            samples   = [ decode ( str ( i [ 0 ] ) , self.dictionaries ) for i in self.conn.select ( GET_ITEMS , ( nmax , ) ) ]
+        else :
+            samples   = [ dumps ( o , HIGHEST_PROTOCOL ) for o in samples ]
+        dictionary = train_dictionary ( samples , size )
+        if dictionary is None :
+            logger.warning ( 'train_dictionary: no samples, dictionary is not created' )
+            return None 
+        if not self.codec.dictionaries :
+            logger.warning ( "train_dictionary: codec '%s' does not support dictionaries" % self.codec.name )
+        self.dictionaries.add ( dictionary )
+        ADD_ITEM = 'REPLACE INTO %s (key, value) VALUES (?,?)' % self.dictsname
+        self.conn.execute ( ADD_ITEM , ( _DICTS_ , sqlite3.Binary ( self.dictionaries.dumps () ) ) )
+        return dictionary 
 
     ## list the avilable keys 
     def __dir ( self , pattern = '' ) :
@@ -292,9 +427,9 @@ class SQLiteShelf(SqliteDict):
 
 # =============================================================================
 try:
-    from cPickle import Pickler, Unpickler, HIGHEST_PROTOCOL
+    from cPickle import Pickler, Unpickler, HIGHEST_PROTOCOL, dumps
 except ImportError:
-    from  pickle import Pickler, Unpickler, HIGHEST_PROTOCOL 
+    from  pickle import Pickler, Unpickler, HIGHEST_PROTOCOL, dumps
 
 try:
     from cStringIO import StringIO
@@ -310,25 +445,18 @@ def _zip_getitem (self, key):
     item = self.conn.select_one(GET_ITEM, (key,))
     if item is None: raise KeyError(key)
     
-    f     = StringIO ( zlib.decompress ( str ( item[0] ) ) ) 
+    f     = StringIO ( decode ( str ( item[0] ) , self.dictionaries ) ) 
     value = Unpickler(f).load()
 
     return value
 
-import sqlite3
 # =============================================================================
 ## ``set-and-compress-item'' to dbase 
 def _zip_setitem ( self , key , value ) :
     """ ``set-and-compress-item'' to dbase 
     """
     ADD_ITEM = 'REPLACE INTO %s (key, value) VALUES (?,?)' % self.tablename
-    
-    f     = StringIO()
-    p     = Pickler(f, HIGHEST_PROTOCOL  )
-    p.dump(value)
-    blob  = f.getvalue() 
-    zblob = zlib.compress ( blob , self.compression ) 
-    self.conn.execute(ADD_ITEM, (key, sqlite3.Binary( zblob ) ) )
+    self.conn.execute(ADD_ITEM, (key, self._encode_ ( value ) ) )
 
                       
 SQLiteShelf.__setitem__ = _zip_setitem
@@ -343,6 +471,47 @@ def _sql_exit_  ( self , *_ ) :
 SQLiteShelf.__enter__ = _sql_enter_
 SQLiteShelf.__exit__  = _sql_exit_ 
 
+# =============================================================================
+## @class WriteBatch
+#  Batched writing into SQLiteShelf: the items are pickled and compressed
+#  and written by chunks, each chunk in one transaction
+#  @code
+#  db = ...
+#  with db.write_batch () as batch :
+#      for i in range ( 100000 ) : batch [ 'key%d' % i ] = i
+#  @endcode
+#  @see SQLiteShelf.write_batch
+class WriteBatch(object) :
+    """Batched writing into SQLiteShelf: the items are pickled and compressed
+    and written by chunks, each chunk in one transaction
+    >>> db = ...
+    >>> with db.write_batch () as batch :
+    ...     for i in range ( 100000 ) : batch [ 'key%d' % i ] = i
+    """
+    def __init__ ( self , db , chunk = 10000 ) :
+        self.db    = db
+        self.chunk = max ( 1 , chunk ) 
+        self.items = []
+        self.sql   = 'REPLACE INTO %s (key, value) VALUES (?,?)' % db.tablename
+    def __setitem__ ( self , key , value ) :
+        self.items.append ( ( key , self.db._encode_ ( value ) ) )
+        if self.chunk <= len ( self.items ) : self.flush ()
+    def update ( self , items = () , **kwargs ) :
+        if hasattr ( items , 'iteritems' ) : items = items.iteritems()
+        elif hasattr ( items , 'items'   ) : items = items.items    ()
+        for k , v in items            : self [ k ] = v
+        for k , v in kwargs.items()   : self [ k ] = v
+    ## write the collected items in one transaction 
+    def flush ( self ) :
+        """Write the collected items in one transaction"""
+        if self.items :
+            self.db.conn.executemany ( self.sql , self.items )
+            self.items = []
+    def __enter__ ( self ) : return self
+    def __exit__  ( self , *_ ) :
+        self.flush     ()
+        self.db.commit ()
+
 # =============================================================================
 ## add an object into data base
 #  @code
@@ -371,6 +540,32 @@ def _db_rrshift_ ( db , obj ) :
     
 SQLiteShelf.__rrshift__ = _db_rrshift_
 
+## the keyed append-only history 
+from ostap.io.shelve_ext import db_append, db_history, internal_key  
+SQLiteShelf.append  = db_append
+SQLiteShelf.history = db_history
+
+# =============================================================================
+## the internal entries of the keyed history are excluded from the public keys
+def _sql_iterkeys_  ( self ) :
+    """Iterator over the keys (the internal entries of history are excluded)"""
+    for key in SqliteDict.iterkeys ( self ) :
+        if not internal_key ( key ) : yield key 
+def _sql_iteritems_ ( self ) :
+    """Iterator over the items (the internal entries of history are excluded)"""
+    for key in _sql_iterkeys_ ( self ) : yield key , self [ key ] 
+def _sql_itervalues_ ( self ) :
+    """Iterator over the values (the internal entries of history are excluded)"""
+    for key in _sql_iterkeys_ ( self ) : yield self [ key ] 
+def _sql_len_ ( self ) :
+    """The number of keys (the internal entries of history are excluded)"""
+    return sum ( 1 for key in _sql_iterkeys_ ( self ) ) 
+
+SQLiteShelf.iterkeys   = _sql_iterkeys_
+SQLiteShelf.iteritems  = _sql_iteritems_
+SQLiteShelf.itervalues = _sql_itervalues_
+SQLiteShelf.__len__    = _sql_len_
+
 # =============================================================================
 ## open new SQLiteShelve data base
 #  @code
@@ -400,7 +595,8 @@ class TmpSQLiteShelf(SQLiteShelf):
     def __init__ ( self                        ,
                    tablename      = 'Ostap'    ,
                    compress_level = zlib.Z_BEST_COMPRESSION , 
-                   journal_mode   = "DELETE"   ) :
+                   journal_mode   = "DELETE"   ,
+                   codec          = 'zlib'     ) :
         
         SQLiteShelf.__init__ ( self            ,
                                None            ,
@@ -408,7 +604,8 @@ class TmpSQLiteShelf(SQLiteShelf):
                                tablename       ,
                                True            , ## False , ## writeback/autocommit
                                compress_level  ,
-                               journal_mode    ) 
+                               journal_mode    ,
+                               codec           ) 
         
 # =============================================================================
 ## open new TEMPORARY SQLiteShelve data base
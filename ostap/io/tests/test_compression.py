@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for compression codecs of data storages, i.e. modules
+  /ostap/io/compression.py
+  /ostap/io/sqliteshelve.py
+  /ostap/io/zipshelve.py
+- benchmark: size and throughput for typical ostap payloads
+- the stored values are read back for each codec, with and without dictionary
+- the records, written with different codecs and dictionaries, are readable
+"""
+# =============================================================================
+import os, tempfile
+import ROOT
+from   ostap.core.pyrouts    import VE
+from   ostap.utils.timing    import timing
+from   ostap.io.compression  import available_codecs
+import ostap.io.zipshelve    as zipshelve
+import ostap.io.sqliteshelve as sqliteshelve
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_compression' )
+else                       : logger = getLogger ( __name__           )
+# =============================================================================
+## typical payloads: histograms, values with errors, small ``fit-results''
+payloads = {}
+for i in range ( 20 ) :
+    h = ROOT.TH1D ( 'h%d' % i , '' , 100 , -5 , 5 ) ; h.Sumw2()
+    for j in range ( 1000 ) : h.Fill ( VE ( 0 , 1 ).gauss () )
+    payloads [ 'histo-%d' % i ] = h
+for i in range ( 1000 ) :
+    payloads [ 've-%d'  % i ] = VE ( i , i + 1 )
+    payloads [ 'fit-%d' % i ] = { 'mean' : VE ( i , 1 ) , 'sigma' : VE ( 1 , 0.1 ) , 'status' : 0 , 'cov' : 3 }
+
+## compare the stored and the original values 
+def same ( a , b ) :
+    if isinstance ( a , ROOT.TH1 ) :
+        return isinstance ( b , ROOT.TH1 ) and a.GetNbinsX () == b.GetNbinsX () and \
+               a.GetEntries () == b.GetEntries () and \
+               all ( [ a.GetBinContent ( i ) == b.GetBinContent ( i ) and
+                       a.GetBinError   ( i ) == b.GetBinError   ( i ) for i in range ( a.GetNbinsX () + 2 ) ] )
+    return a == b
+
+## check that all stored values are equal to the original ones 
+def check ( db , values , what ) :
+    assert sorted ( values.keys () ) == sorted ( db.keys () ) , 'Invalid keys for %s' % what 
+    for k , v in values.items () :
+        assert same ( v , db [ k ] ) , "Invalid value of '%s' for %s" % ( k , what ) 
+
+def bench ( module , suffix , codec , dictionary ) :
+
+    name = tempfile.mktemp ( suffix = suffix )
+    db   = module.open ( name , 'c' , codec = codec )
+    if dictionary :
+        db.train_dictionary ( samples = list ( payloads.values () ) [ : 200 ] )
+    with timing ( 'write' , logger = logger ) as tw :
+        for k , v in payloads.items () : db [ k ] = v
+    db.close ()
+    db   = module.open ( name , 'r' )
+    with timing ( 'read'  , logger = logger ) as tr :
+        for k in payloads : db [ k ]
+    check ( db , payloads , '%s/%s/dict:%s' % ( module.__name__ , codec , dictionary ) )
+    db.close ()
+
+    size = os.path.getsize ( name )
+    os.remove ( name )
+    logger.info ( '%-10s %-5s dict:%-5s size:%8d write:%6.2fs read:%6.2fs' % (
+        module.__name__.split('.')[-1] , codec , dictionary , size , tw.delta , tr.delta ) )
+
+def test_codecs () :
+
+    logger.info ( 'Available codecs: %s' % list ( available_codecs () ) )
+    for codec in available_codecs () :
+        for dictionary in ( False , True ) :
+            bench ( zipshelve    , '.zdb.gz' , codec , dictionary )
+            bench ( sqliteshelve , '.msql'   , codec , dictionary )
+
+def test_mixed () :
+
+    logger.info ( 'Records with different codecs and dictionaries' )
+    keys = sorted ( payloads.keys () )
+    for module , suffix in ( ( zipshelve , '.zdb.gz' ) , ( sqliteshelve , '.msql' ) ) :
+        
+        name    = tempfile.mktemp ( suffix = suffix )
+        written = {}
+        mode    = 'c'
+        ## each ``session'' writes the records with its own codec/dictionary 
+        for i , ( codec , dictionary ) in enumerate ( [ ( c , d ) for d in ( False , True ) for c in available_codecs () ] ) :
+            db = module.open ( name , mode , codec = codec )
+            mode = 'w'
+            if dictionary :
+                db.train_dictionary ( samples = [ payloads [ k ] for k in keys [ i :: 7 ] ] )
+            for k in keys [ i :: 11 ] :
+                db [ k ] = payloads [ k ]
+                written [ k ] = payloads [ k ]
+            check ( db , written , '%s/%s/dict:%s' % ( module.__name__ , codec , dictionary ) )
+            db.close ()
+
+        ## read all records, written by the different codecs with different dictionaries 
+        for codec in available_codecs () :
+            db = module.open ( name , 'r' , codec = codec )
+            check ( db , written , '%s/mixed/%s' % ( module.__name__ , codec ) )
+            db.close ()
+            
+        os.remove ( name )
+        
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_codecs ()
+    test_mixed  ()
+
+# =============================================================================
+# The END
+# =============================================================================
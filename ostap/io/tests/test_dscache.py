@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for ostap/io/dscache.py
+- the columns, given as iterator, are stored
+- the identity of the local file is taken from the file system
+- the recipe depends on the global functions, referenced by the callables
+"""
+# =============================================================================
+import os, tempfile, shutil
+from   ostap.io.dscache import DataCache, file_identity
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_dscache' )
+else                       : logger = getLogger ( __name__       )
+# =============================================================================
+## global helper, used by the accessor
+def helper ( x ) : return x + 1
+## global constant, used by the helper
+SCALE = 2
+def scaled ( x ) : return SCALE * x
+
+# =============================================================================
+def test_dscache_put () :
+
+    try :
+        import numpy
+    except ImportError :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+
+    directory = tempfile.mkdtemp ()
+    cache     = DataCache ( directory )
+
+    names   = [ 'x' , 'y' ]
+    arrays  = [ numpy.arange ( 10 , dtype = float ) , numpy.arange ( 10 ) * 2 ]
+    cache.put ( 'key' , zip ( names , arrays ) , events = 10 , skip = 1 )  ## NB: iterator in python3
+    chunk = cache.get ( 'key' )
+    assert chunk is not None , 'The chunk is not stored!'
+    assert names == [ c [ 0 ] for c in chunk.columns ] , 'Invalid names: %s' % [ c [ 0 ] for c in chunk.columns ]
+    assert all ( [ numpy.array_equal ( a , c [ 1 ] ) for a , c in zip ( arrays , chunk.columns ) ] ) , 'Invalid columns!'
+    assert ( 10 , 1 ) == ( chunk.events , chunk.skip ) , 'Invalid counters!'
+
+    cache.put ( 'key2' , iter ( zip ( names , arrays ) ) )
+    assert 2 == len ( cache.get ( 'key2' ).columns ) , 'The columns from iterator are not stored!'
+
+    shutil.rmtree ( directory )
+
+# =============================================================================
+def test_dscache_identity () :
+
+    ## not a ROOT file: the file is not opened
+    fname = tempfile.mktemp ( suffix = '.root' )
+    with open ( fname , 'w' ) as f : f.write ( 'not a ROOT file' )
+    i1 = file_identity ( fname )
+    assert i1 == file_identity ( fname ) , 'Unstable identity!'
+
+    with open ( fname , 'a' ) as f : f.write ( '!' )
+    assert i1 != file_identity ( fname ) , 'The modified file has the same identity!'
+    os.remove ( fname )
+
+# =============================================================================
+def test_dscache_recipe () :
+
+    global helper, SCALE
+
+    directory = tempfile.mkdtemp ()
+    cache     = DataCache ( directory )
+
+    accessor  = lambda s : helper ( s.x )
+    r1 = cache.recipe ( 'T' , accessor )
+    assert r1 == cache.recipe ( 'T' , accessor ) , 'Unstable recipe!'
+
+    ## redefine the global helper
+    old    = helper
+    helper = lambda x : x + 2
+    r2     = cache.recipe ( 'T' , accessor )
+    helper = old
+    assert r1 != r2 , 'The recipe does not depend on the global helper!'
+
+    ## the global constant, used by the global helper
+    accessor  = lambda s : scaled ( s.x )
+    r1 = cache.recipe ( 'T' , accessor )
+    SCALE = 3
+    r2 = cache.recipe ( 'T' , accessor )
+    SCALE = 2
+    assert r1 != r2 , 'The recipe does not depend on the global constant!'
+
+    ## nested function
+    def accessor ( s ) :
+        inner = lambda v : helper ( v )
+        return inner ( s.x )
+    r1 = cache.recipe ( 'T' , accessor )
+    helper = lambda x : x + 2
+    r2     = cache.recipe ( 'T' , accessor )
+    helper = old
+    assert r1 != r2 , 'The recipe does not depend on the global helper of nested function!'
+
+    shutil.rmtree ( directory )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_dscache_put      ()  ## the columns from the iterator
+    test_dscache_identity ()  ## the identity of the local file
+    test_dscache_recipe   ()  ## the global names of callables
+
+# =============================================================================
+# The END
+# =============================================================================
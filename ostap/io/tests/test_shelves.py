@@ -128,10 +128,161 @@ def test_shelves():
         d['h2'] = h2
         d.ls()
 
+def test_zipshelve_gz () :
+    """Random-access format for ``.gz'' ZipShelf"""
+    
+    db_gz_name = tempfile.mktemp ( suffix = '.zdb.gz' )
+    
+    with timing ( 'Write ZIP/gz' ) :
+        db = zipshelve.open ( db_gz_name , 'c' )
+        for i in range ( 100 ) : db [ 'h1-%d' % i ] = h1
+        db [ 'histo-2D' ] = h2
+        db.close ()
+        
+    ## opening costs O(index), only one entry is read 
+    with timing ( 'Open&read ZIP/gz' ) :
+        db = zipshelve.open ( db_gz_name , 'r' )
+        h2_gz = db [ 'histo-2D' ]
+        assert 101 == len ( db ) , 'Invalid number of keys!'
+        db.close ()
+        
+    for i in h2_gz :
+        v = h2_gz [ i ] - h2 [ i ]
+        if not iszero ( v.value() ) :
+            logger.error('Large difference for 2D histogram(gz)!')
+
+    ## update&remove 
+    db = zipshelve.open ( db_gz_name , 'w' )
+    for i in range ( 50 ) : del db [ 'h1-%d' % i ]
+    db [ 'both' ] = data [ 'both' ]
+    db.close ()
+    
+    db = zipshelve.open ( db_gz_name , 'r' )
+    assert 52 == len ( db ) , 'Invalid number of keys!'
+    logger.info ( 'ZipShelve/gz keys: %d, size: %d ' % ( len ( db ) , os.path.getsize ( db_gz_name ) ) ) 
+    db.close ()
+    
+    os.remove ( db_gz_name ) 
+
+def test_sqlite_batch () :
+    """Batched writes and concurrent readers for SQLiteShelf"""
+
+    import threading
+    N = 10000
+    for journal_mode in ( 'DELETE' , 'WAL' ) :
+        
+        name = tempfile.mktemp ( suffix = '.msql' )
+        db   = sqliteshelve.open ( name , 'c' , journal_mode = journal_mode )
+        
+        with timing ( 'setitem/%s'     % journal_mode ) :
+            for i in range ( N ) : db [ 'k%d' % i ] = VE ( i , i )
+            len ( db ) ## wait for the queue
+        with timing ( 'update/%s'      % journal_mode ) :
+            db.update ( ( 'u%d' % i , VE ( i , i ) ) for i in range ( N ) )
+            len ( db ) ## wait for the queue
+        with timing ( 'write_batch/%s' % journal_mode ) :
+            with db.write_batch () as batch :
+                for i in range ( N ) : batch [ 'b%d' % i ] = VE ( i , i )
+            assert 3 * N == len ( db ) , 'Invalid number of keys!'
+
+        ## concurrent readers 
+        rdb     = db.reader ()
+        results = []
+        def read () :
+            results.append ( sum ( [ rdb [ 'u%d' % i ].value() for i in range ( N ) ] ) )
+        readers = [ threading.Thread ( target = read ) for i in range ( 4 ) ]
+        with timing ( 'readers/%s'     % journal_mode ) :
+            for r in readers : r.start ()
+            for r in readers : r.join  ()
+        assert 4 == len ( results ) and all ( [ r == N * ( N - 1 ) / 2 for r in results ] ) , 'Invalid reading!'
+        
+        rdb.close ()
+        db .close ()
+        os.remove ( name ) 
 
+def test_history () :
+    """Keyed append-only history for shelves"""
+
+    for module , suffix in ( ( zipshelve    , '.zdb' ) ,
+                             ( sqliteshelve , '.msql' ) ,
+                             ( rootshelve   , '.root' ) ) :
+        
+        name = tempfile.mktemp ( suffix = suffix )
+        with module.open ( name , 'c' ) as db :
+            db [ 'old' ] = [ VE ( 0 , 0 ) ] ## the old format: list of objects 
+            for i in range ( 1 , 10 ) :
+                db.append ( 'old' , VE ( i , i ) )
+                db.append ( 'new' , VE ( i , i ) )
+                
+        with module.open ( name , 'r' ) as db :
+            old = db.history ( 'old' )
+            new = db.history ( 'new' )
+            assert 10 == len ( old ) and 9 == len ( new ) , 'Invalid history length!'
+            assert 9  == old [ -1 ].value () and 1 == new [ 0 ].value () , 'Invalid history item!'
+            assert [ v.value () for v in old ] == list ( range ( 10 ) ) , 'Invalid history!'
+            assert new.uid and not db.history ( 'none' ) , 'Invalid history!'
+            ## the internal entries of history are hidden 
+            assert sorted ( db.keys () ) == [ 'old' ] and 1 == len ( db ) , 'Internal keys are visible: %s' % db.keys ()
+            assert [ 'old' ] == list ( db ) , 'Internal keys are visible!' 
+
+        ## the object under the key does not affect the converted history 
+        with module.open ( name , 'c' ) as db :
+            db [ 'old' ] = VE ( -1 , 1 )
+            db.append ( 'old' , VE ( 10 , 10 ) )
+            assert [ v.value () for v in db.history ( 'old' ) ] == list ( range ( 11 ) ) , 'Invalid history!'
+            assert -1 == db [ 'old' ].value () , 'Invalid object!' 
+            
+        os.remove ( name ) 
+
+def test_blockdb_recover () :
+    """Recover the index of BlockDB file that is not properly closed"""
+
+    from ostap.io.blockdb import BlockDB
+    
+    name = tempfile.mktemp ( suffix = '.zdb' )
+    db   = BlockDB ( name , 'n' )
+    for i in range ( 100 ) : db [ 'key%d' % i ] = b'value%d' % i 
+    db.close ()
+    size = os.path.getsize ( name )
+
+    ## unmodified file is not rewritten at close 
+    inode = os.stat ( name ).st_ino
+    with BlockDB ( name , 'c' ) as db : assert 100 == len ( db ) , 'Invalid number of blocks!'
+    assert inode == os.stat ( name ).st_ino and size == os.path.getsize ( name ) , 'Unmodified file is rewritten!'
+    
+    ## the new blocks overwrite the old index 
+    for i in range ( 10 ) :
+        with BlockDB ( name , 'w' ) as db : db [ 'key0' ] = b'new'
+    assert inode == os.stat ( name ).st_ino , 'File is compacted!'
+    assert os.path.getsize ( name ) - size < 10 * 100 , 'The old indices are not reclaimed!'
+
+    ## the dead blocks are reclaimed by the explicit compaction 
+    grown = os.path.getsize ( name )
+    with BlockDB ( name , 'w' ) as db :
+        db.compact ()
+        assert 100 == len ( db ) and b'new' == db [ 'key0' ] , 'Invalid compaction!'
+    assert os.path.getsize ( name ) < grown , 'The dead blocks are not reclaimed!'
+    
+    ## "crash" while the index is written: the index and the trailer are truncated 
+    with BlockDB ( name , 'w' ) as db :
+        db [ 'key100' ] = b'value100'
+        del db [ 'key1' ]
+    with open ( name , 'r+b' ) as f : f.truncate ( os.path.getsize ( name ) - 30 )
+    
+    with BlockDB ( name , 'r' ) as db :
+        assert 100 == len ( db ) , 'Invalid number of recovered blocks!'
+        assert 'key1' not in db , 'Invalid recovery!'
+        assert b'new' == db [ 'key0' ] and b'value100' == db [ 'key100' ] , 'Invalid recovery!'
+
+    os.remove ( name ) 
+        
 # =============================================================================
 if '__main__' == __name__ :    
     test_shelves()
+    test_zipshelve_gz ()
+    test_sqlite_batch ()
+    test_history ()
+    test_blockdb_recover ()
 
 # =============================================================================
 # The END
@@ -61,8 +61,12 @@
 #
 # @endcode 
 #
-# @attention: In case DB-name has extention "gz", the whole data base
-#             will be gzipped. 
+# @attention: In case DB-name has extention "gz", the data base is kept
+#             in the random-access container (ostap.io.blockdb): the
+#             compressed entries are stored as blocks with the key index at
+#             the end of file, and are read on demand via mmap.
+#             The old-style gzipped files are converted in place at the
+#             first opening in the update mode. 
 #
 # @author Vanya BELYAEV Ivan.Belyaev@cern.ch
 # @date   2010-04-30
@@ -113,7 +117,11 @@ The module has been developed and used with great success in
  ...
  >>> abcd = db['some_key']
  
- In case DB-name has extension 'gz', the whole data base will be gzipped
+ In case DB-name has extension 'gz', the data base is kept in the random-access
+ container (ostap.io.blockdb): the compressed entries are stored as blocks with
+ the key index at the end of file, and are read on demand via mmap.
+ The old-style gzipped files are converted in place at the first opening
+ in the update mode.
 
 """
 # =============================================================================
@@ -132,9 +140,9 @@ if '__main__' == __name__ : logger = getLogger ( 'ostap.io.zipshelve' )
 else                      : logger = getLogger ( __name__             )
 # =============================================================================
 try:
-    from cPickle   import Pickler, Unpickler, HIGHEST_PROTOCOL
+    from cPickle   import Pickler, Unpickler, HIGHEST_PROTOCOL, dumps
 except ImportError:
-    from  pickle   import Pickler, Unpickler, HIGHEST_PROTOCOL 
+    from  pickle   import Pickler, Unpickler, HIGHEST_PROTOCOL, dumps
 # =============================================================================
 try:
     from cStringIO import StringIO
@@ -144,7 +152,12 @@ except ImportError:
 import os
 import zlib        ## use zlib to compress DB-content 
 import shelve      ## 
-import shutil
+from   ostap.io.blockdb     import BlockDB, is_blockdb
+from   ostap.io.compression import make_codec, encode, decode, Dictionaries, train_dictionary
+from   ostap.io.shelve_ext  import internal_key 
+# =============================================================================
+## the reserved key for the compression dictionaries 
+_DICTS_ = '__ostap_compression_dictionaries__'
 # =============================================================================
 _modes_ = {
     # =========================================================================
@@ -198,7 +211,8 @@ class ZipShelf(shelve.Shelf):
         protocol  = HIGHEST_PROTOCOL           , 
         compress  = zlib.Z_BEST_COMPRESSION    ,
         writeback = False                      ,
-        silent    = False                      ) :
+        silent    = False                      ,
+        codec     = 'zlib'                     ) :
 
         ## the mode 
         mode = _modes_.get( mode.lower() , '' )
@@ -213,7 +227,6 @@ class ZipShelf(shelve.Shelf):
         filename  = os.path.expandvars ( filename )
         filename  = os.path.expandvars ( filename )
         
-        self.__gzip          = False 
         self.__filename      = filename
         self.__remove        = False
         self.__silent        = silent
@@ -221,11 +234,11 @@ class ZipShelf(shelve.Shelf):
 
         if not self.__silent :
             logger.info ( 'Open DB: %s' % filename ) 
-        
-        if filename.endswith( '.gz' ) :
+
+        if filename.endswith( '.gz' ) and os.path.exists ( filename ) and not is_blockdb ( filename ) :
             
-            if os.path.exists ( filename ) and 'r' == mode :
-                ## gunzip into temporary location
+            if 'r' == mode :
+                ## old-style gzipped database: gunzip into temporary location
                 filename_ = self._gunzip ( filename ) 
                 if not os.path.exists ( filename_ ) :
                     raise TypeError ( "Unable to gunzip properly: %s" % filename )
@@ -236,38 +249,29 @@ class ZipShelf(shelve.Shelf):
                 filename        = filename_ 
                 self.__filename = filename_
                 self.__remove   = True
-            elif os.path.exists ( filename ) and 'r' != mode :
-                ## unzip in place
-                filename_     = filename[:-3]
-                # remove existing file (if needed) 
-                if os.path.exists ( filename_ ) : os.remove ( filename_ )
-                size1 = os.path.getsize ( filename  ) 
-                # gunzip in place 
-                self.__in_place_gunzip  ( filename ) 
-                ##
-                if not os.path.exists ( filename_ ) :
-                    raise TypeError ( "Unable to gunzip properly: %s" % filename )
-                if not self.__silent : 
-                    size2 = os.path.getsize ( filename_ )
-                    logger.info("GZIP uncompression %s: %.1f%%" %  ( filename , (size2*100.0)/size1 ) ) 
-                filename        = filename_ 
-                self.__gzip     = True 
-                self.__filename = filename_
-                self.__remove   = False
-            else : 
-                ## 
-                filename        = filename[:-3]
-                self.__gzip     = True 
-                self.__filename = filename
-
-        import anydbm
+            elif 'n' != mode :
+                ## old-style gzipped database: convert it in place 
+                self._migrate ( filename )
+
+        if filename.endswith( '.gz' ) : 
+            ## random-access container with per-key compressed blocks 
+            dbase = BlockDB ( self.__filename , mode )
+        else :
+            import anydbm
+            dbase = anydbm.open ( self.__filename , mode )
+            
         shelve.Shelf.__init__ (
-            self                                   ,
-            anydbm.open ( self.__filename , mode ) ,
-            protocol                               ,
-            writeback                              )
+            self      ,
+            dbase     , 
+            protocol  ,
+            writeback )
         
         self.compresslevel = compress
+        ## the compression codec: the level is applied for zlib only,
+        #  for other codecs use the codec instance, e.g. make_codec('zstd',3)
+        self.codec         = make_codec ( codec , compress if 'zlib' == codec else None ) 
+        ## the compression dictionaries of the database 
+        self.dictionaries  = Dictionaries ( self.dict [ _DICTS_ ] if _DICTS_ in self.dict else None )
         self.__opened      = True
 
         ## keep in the list of known/opened databases 
@@ -276,6 +280,54 @@ class ZipShelf(shelve.Shelf):
     def filename ( self ) : return self.__filename
     def opened   ( self ) : return self.__opened
 
+    ## the keys (the reserved key for compression dictionaries and
+    #  the internal entries of the keyed history are excluded)
+    #  @see ostap.io.shelve_ext.internal_key
+    def keys     ( self ) :
+        """The keys (the reserved key for compression dictionaries and
+        the internal entries of the keyed history are excluded)
+        """
+        return [ k for k in self.dict.keys() if k != _DICTS_ and not internal_key ( k ) ]
+    def __len__  ( self ) :
+        return len ( self.keys () ) 
+    def __contains__ ( self , key ) :
+        return key != _DICTS_ and key in self.dict 
+    has_key = __contains__
+    
+    ## train the compression dictionary for small records
+    #  @code
+    #  db = zipshelve.open ( 'a_db' , 'c' , codec = 'zstd' )
+    #  ... fill db with some typical records 
+    #  db.train_dictionary ()
+    #  ... the next records are compressed using the dictionary 
+    #  @endcode
+    #  @param size    the size of dictionary
+    #  @param samples the samples of typical objects (use the stored records if not specified)
+    #  @param nmax    the maximal number of stored records to be used for training 
+    def train_dictionary ( self , size = 16 * 1024 , samples = None , nmax = 1000 ) :
+        """Train the compression dictionary for small records
+        >>> db = zipshelve.open ( 'a_db' , 'c' , codec = 'zstd' )
+        >>> ... fill db with some typical records 
+        >>> db.train_dictionary ()
+        >>> ... the next records are compressed using the dictionary 
+        - size    : the size of dictionary
+        - samples : the samples of typical objects (use the stored records if not specified)
+        - nmax    : the maximal number of stored records to be used for training 
+        """
+        if samples is None :
+            samples = [ decode ( self.dict [ k ] , self.dictionaries ) for k in self.keys() [ : nmax ] ]
+        else :
+            samples = [ dumps ( o , self._protocol ) for o in samples ]
+        dictionary = train_dictionary ( samples , size )
+        if dictionary is None :
+            logger.warning ( 'train_dictionary: no samples, dictionary is not created' )
+            return None 
+        if not self.codec.dictionaries :
+            logger.warning ( "train_dictionary: codec '%s' does not support dictionaries" % self.codec.name )
+        self.dictionaries.add ( dictionary )
+        self.dict [ _DICTS_ ] = self.dictionaries.dumps()
+        return dictionary 
+
     ## valid, opened DB 
     def __nonzero__ ( self ) :
         return self.opened() and not isinstance ( self.dict , shelve._ClosedDict ) and not self.dict is None 
@@ -321,9 +373,9 @@ class ZipShelf(shelve.Shelf):
         """
         for k in self.ikeys( pattern ): print k
         
-    ## close and gzip (if needed)
+    ## close the database 
     def close ( self ) :
-        """ Close the file (and gzip it if required) 
+        """ Close the database 
         """
         if not self.opened() : return 
         ##
@@ -335,68 +387,10 @@ class ZipShelf(shelve.Shelf):
                 logger.info( 'REMOVE: ', self.__filename )
             os.remove ( self.__filename )
         ##
-        if self.__gzip and os.path.exists ( self.__filename ) :
-            # get the initial size 
-            size1 = os.path.getsize ( self.__filename )
-            # gzip the file
-            self.__in_place_gzip ( self.__filename ) 
-            #
-            if not os.path.exists ( self.__filename + '.gz' ) :
-                logger.warning( 'Unable to compress the file %s ' % self.__filename  )
-            size2 = os.path.getsize( self.__filename + '.gz' )
-            if not self.__silent : 
-                logger.info( 'GZIP compression %s: %.1f%%' % ( self.__filename, (size2*100.0)/size1 ) ) 
-
         ## remove from list of known databases 
         if self in _dbases :
             _dbases.remove ( self )
             
-    ## gzip the file (``in-place'') 
-    def __in_place_gzip   ( self , filein ) :
-        """Gzip the file ``in-place''
-        
-        It is better to use here ``os.system'' or ``popen''-family,
-        but it does not work properly for multiprocessing environemnt        
-        """
-        if os.path.exists ( filein + '.gz' ) : os.remove ( filein + '.gz' )
-        #
-        # gzip the file 
-        fileout = self._gzip ( filein )
-        # 
-        if os.path.exists ( fileout ) :
-            # rename the temporary file 
-            shutil.move ( fileout , filein + '.gz' )
-            #
-            import time
-            time.sleep( 3 )
-            #
-            # remove the original
-            os.remove   ( filein ) 
-
-    ## gunzip the file (``in-place'') 
-    def __in_place_gunzip   ( self , filein ) :
-        """Gunzip the file ``in-place''
-        
-        It is better to use here ``os.system'' or ``popen''-family,
-        but unfortunately it does not work properly for multithreaded environemnt        
-        """
-        #
-        filename = filein[:-3]            
-        if os.path.exists ( filename ) : os.remove ( filename )
-        #
-        # gunzip the file 
-        fileout = self._gunzip ( filein )
-        #        
-        if os.path.exists ( fileout ) :
-            # rename the temporary file 
-            shutil.move ( fileout , filename )
-            #
-            import time
-            time.sleep( 3 )
-            #
-            # remove the original
-            os.remove   ( filein ) 
-
     ## gzip the file into temporary location, keep original
     def _gzip   ( self , filein ) :
         """ Gzip the file into temporary location, keep original
@@ -444,6 +438,28 @@ class ZipShelf(shelve.Shelf):
             time.sleep( 3 ) 
         return fileout
 
+    ## convert old-style (gzipped) database into random-access format, in place
+    def _migrate ( self , filename ) :
+        """Convert old-style (gzipped) database into random-access format, in place
+        - the compressed entries are copied as they are, without re-pickling
+        """
+        import anydbm 
+        tmpdb   = self._gunzip ( filename )
+        newfile = filename + '.new'
+        try :
+            old = anydbm.open ( tmpdb   , 'r' )
+            new = BlockDB     ( newfile , 'n' )
+            for key in old.keys() : new [ key ] = old [ key ]
+            nkeys = len ( new ) 
+            new.close ()
+            old.close ()
+            os.rename ( newfile , filename )
+        finally :
+            for f in ( tmpdb , newfile ) :
+                if os.path.exists ( f ) : os.remove ( f )
+        if not self.__silent :
+            logger.info ( "Converted %s into random-access format: %d key(s)" % ( filename , nkeys ) )
+
     #
     ## some context manager functionality
     # 
@@ -476,7 +492,7 @@ def _zip_getitem (self, key):
     try:
         value = self.cache[key]
     except KeyError:
-        f = StringIO(zlib.decompress(self.dict[key]))
+        f = StringIO(decode(self.dict[key],self.dictionaries))
         value = Unpickler(f).load()
         if self.writeback:
             self.cache[key] = value
@@ -492,7 +508,7 @@ def _zip_setitem ( self , key , value ) :
     f = StringIO()
     p = Pickler(f, self._protocol)
     p.dump(value)
-    self.dict[key] = zlib.compress( f.getvalue(), self.compresslevel)
+    self.dict[key] = encode ( f.getvalue() , self.codec , self.dictionaries.current )
 
 ZipShelf.__getitem__ = _zip_getitem
 ZipShelf.__setitem__ = _zip_setitem
@@ -535,7 +551,8 @@ def open ( filename                                   ,
            protocol      = HIGHEST_PROTOCOL           ,
            compresslevel = zlib.Z_BEST_COMPRESSION    , 
            writeback     = False                      ,
-           silent        = True                       ) : 
+           silent        = True                       ,
+           codec         = 'zlib'                     ) : 
     """Open a persistent dictionary for reading and writing.
     
     The filename parameter is the base filename for the underlying
@@ -553,7 +570,8 @@ def open ( filename                                   ,
                       protocol      ,
                       compresslevel ,
                       writeback     ,
-                      silent        )
+                      silent        ,
+                      codec         )
 
 
 
@@ -569,7 +587,8 @@ class TmpZipShelf(ZipShelf):
         self                                   ,
         protocol  = HIGHEST_PROTOCOL           , 
         compress  = zlib.Z_BEST_COMPRESSION    ,
-        silent    = False                      ) :
+        silent    = False                      ,
+        codec     = 'zlib'                     ) :
 
         ## create temporary file name 
         import tempfile
@@ -581,7 +600,8 @@ class TmpZipShelf(ZipShelf):
                             protocol ,
                             compress , 
                             False    , ## writeback 
-                            silent   ) 
+                            silent   ,
+                            codec    ) 
         
     ## close and delete the file 
     def close ( self )  :
@@ -601,7 +621,8 @@ class TmpZipShelf(ZipShelf):
 #  @date   2010-04-30
 def tmpdb ( protocol      = HIGHEST_PROTOCOL           ,
             compresslevel = zlib.Z_BEST_COMPRESSION    , 
-            silent        = True                       ) : 
+            silent        = True                       ,
+            codec         = 'zlib'                     ) : 
     """Open a TEMPORARY persistent dictionary for reading and writing.
     
     The optional protocol parameter specifies the
@@ -611,7 +632,8 @@ def tmpdb ( protocol      = HIGHEST_PROTOCOL           ,
     """
     return TmpZipShelf ( protocol      ,
                          compresslevel ,
-                         silent        )
+                         silent        ,
+                         codec         )
     
 
 # ============================================================================
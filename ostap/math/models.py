@@ -14,7 +14,9 @@
 __version__ = "$Revision$"
 __author__  = "Vanya BELYAEV Ivan.Belyaev@cern.ch"
 __date__    = "2011-12-01"
-__all__     = ()
+__all__     = (
+    'integral_cache_stats' , ## total statistics of the caches of integrals
+    )
 # =============================================================================
 import  ROOT 
 from    ostap.core.core import cpp, Ostap, funID
@@ -1058,6 +1060,54 @@ _decorated_classes_ = set( [
     Ostap.Math.BreitWigner   ,
     ])
 
+
+# =============================================================================
+## printout for the cache of integrals
+#  @code
+#  bw = Ostap.Math.BreitWigner ( ... )
+#  bw.integral ( 0.5 , 1.0 ) 
+#  print bw.integralCache() 
+#  @endcode 
+#  @see Ostap::Math::IntegralCache
+def _ic_str_ ( self ) :
+    """Printout for the cache of integrals
+    >>> bw = Ostap.Math.BreitWigner ( ... )
+    >>> bw.integral ( 0.5 , 1.0 ) 
+    >>> print bw.integralCache() 
+    """
+    return 'IntegralCache(size=%d/%d,hits=%d,misses=%d)' % ( self.size     () ,
+                                                              self.capacity () ,
+                                                              self.hits     () ,
+                                                              self.misses   () )
+
+Ostap.Math.IntegralCache.__str__  = _ic_str_
+Ostap.Math.IntegralCache.__repr__ = _ic_str_
+
+# =============================================================================
+## get the total statistics of hits&misses for all caches of integrals,
+#  e.g. to see the savings in the long fits 
+#  @code
+#  hits , misses = integral_cache_stats () 
+#  model.fitTo ( dataset ) 
+#  hits , misses = integral_cache_stats () 
+#  @endcode
+#  @param reset reset the total statistics 
+#  @return ( hits , misses ) 
+#  @see Ostap::Math::IntegralCache
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def integral_cache_stats ( reset = False ) :
+    """Get the total statistics of hits&misses for all caches of integrals,
+    e.g. to see the savings in the long fits 
+    >>> hits , misses = integral_cache_stats () 
+    >>> model.fitTo ( dataset ) 
+    >>> hits , misses = integral_cache_stats () 
+    - return ( hits , misses ) 
+    """
+    IC     = Ostap.Math.IntegralCache
+    result = IC.totalHits () , IC.totalMisses () 
+    if reset : IC.resetTotal ()
+    return result 
     
 # =============================================================================
 if '__main__' == __name__ :
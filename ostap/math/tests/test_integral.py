@@ -44,9 +44,33 @@ def test_integral ():
         logger.info ( '%20s: Delta/I  %-20s %-20s' % ( func , (vi-value)/vi.error() ,
                                                        (vr - value)/vr.error() ) ) 
 # =============================================================================
+def test_integral_cache ():
+    """Cache of integrals for numerically integrated shapes"""
+
+    import ostap.math.models 
+    from   ostap.core.core   import Ostap
+    from   ostap.math.models import integral_cache_stats
+
+    bw = Ostap.Math.BreitWigner ( 0.770 , 0.150 , 0.139 , 0.139 , 1 )
+
+    h0 , m0 = integral_cache_stats ()
+    v1 = bw.integral ( 0.5 , 1.0 ) 
+    v2 = bw.integral ( 0.5 , 1.0 ) 
+    bw.setGamma ( 0.160 )
+    v3 = bw.integral ( 0.5 , 1.0 ) 
+    h1 , m1 = integral_cache_stats ()
+    
+    cache = bw.integralCache ()
+    logger.info ( 'Breit-Wigner: %s' % cache ) 
+    assert v1 == v2 and v1 != v3           , 'Invalid cached integral!'
+    assert 1 == cache.hits () and 2 == cache.misses () , 'Invalid cache statistics!'
+    assert 1 == h1 - h0 and 2 == m1 - m0   , 'Invalid total cache statistics!' 
+
+
 if '__main__' == __name__ :
 
     test_integral ()
+    test_integral_cache ()
     
 # =============================================================================
 # The END 
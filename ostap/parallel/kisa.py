@@ -19,10 +19,13 @@ __author__  = "Vanya BELYAEV Ivan.Belyaev@itep.ru"
 __date__    = "2011-06-07"
 __all__     = (
     'ProjectTask' , ## "Project task" for very looooong chains/trees 
+    'SharedProjectTask' , ## "Project task" with shared-memory accumulation 
     'FillTask'    , ## "Fill task" for loooong chains/trees  
+    'ColumnFillTask' , ## "Fill task" for columnar fill of RooDataSet 
     'cproject'    , ##  project looong TChain into historgam   
     'tproject'    , ##  project looong TTree into histogram
-    'fillDataSet' 
+    'fillDataSet' , ##  fill dataset from looong TChain 
+    'chain_shards', ##  split TChain into balanced entry-range shards 
     ) 
 # =============================================================================
 # logging 
@@ -88,8 +91,8 @@ class ProjectTask(Parallel.Task) :
         """
 
         import ROOT
-        from ostap.logger.utils import logWarning
-        with logWarning() : import ostap.core.pyrouts 
+        from ostap.parallel.worker import preload, get_chain
+        preload() 
 
         if   isinstance ( params , str ) : params = ( param , 0 , n_large  )
         elif isinstance ( params , ROOT.TChainElement ) :
@@ -104,19 +107,32 @@ class ProjectTask(Parallel.Task) :
         
         if isinstance ( fname , ROOT.TChainElement ) : fname = fname.GetTitle() 
         
-        chain = ROOT.TChain ( tname )
-        chain.Add ( fname )
+        ## NB: the chain is cached and reused across tasks 
+        chain = get_chain ( tname , fname )
         
         ## Create the output histogram   NB! (why here???) 
         self.output = 0 , self.histo.Clone()
         
-        ## use the regular projection  
-        from ostap.trees.trees import _tt_project_ 
-        self.output = _tt_project_ ( chain      , self.output[1] ,
-                                     what       , cuts           ,
-                                     ''         ,
-                                     nentries   , first          )
-        del chain 
+        if isinstance ( what , ( list , tuple ) ) and 1 < len ( what ) :
+            
+            ## all expressions for the shard in one pass through the tree
+            from ostap.trees.trees import _tt_project_many_
+            histos = [ self.histo.Clone() for w in what ]
+            last   = first + nentries if nentries < n_large else n_large  
+            n      = _tt_project_many_ ( chain , zip ( histos , what ) , cuts , first , last )
+            for h in histos :
+                self.output[1].Add ( h ) 
+                h.Delete() 
+            self.output = n * len ( what ) , self.output[1]
+            
+        else :
+            
+            ## use the regular projection  
+            from ostap.trees.trees import _tt_project_ 
+            self.output = _tt_project_ ( chain      , self.output[1] ,
+                                         what       , cuts           ,
+                                         ''         ,
+                                         nentries   , first          )
 
     ## finalization (executed at the end at parent process)
     def finalize ( self ) : pass 
@@ -130,6 +146,212 @@ class ProjectTask(Parallel.Task) :
         result[1].Delete () 
  
    
+# =============================================================================
+## The task object for projection of loooong chains/trees into histograms
+#  where partial histograms are accumulated in the shared memory:
+#  workers do not send the partial histograms back to the parent process
+#  @see ostap.parallel.shared.SharedHisto
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+class SharedProjectTask(ProjectTask) :
+    """The task object for projection of loooong chains/trees into histograms
+    where partial histograms are accumulated in the shared memory:
+    workers do not send the partial histograms back to the parent process
+    """
+    ## constructor: histogram and the shared buffer
+    def __init__ ( self , histo , shared ) :
+        """Constructor: the histogram and the shared buffer 
+        >>> histo  = ...
+        >>> shared = SharedHisto ( histo ) 
+        >>> task   = SharedProjectTask ( histo , shared ) 
+        """
+        ProjectTask.__init__ ( self , histo )
+        self.shared = shared 
+        
+    ## local initialization (executed once in parent process)
+    def initializeLocal   ( self ) :
+        """Local initialization (executed once in parent process)
+        """
+        self.output = 0 , 
+        
+    ## the actual processing: project and add result into the shared buffer 
+    def process ( self , params ) :
+        """The actual processing: project and add the result into the shared buffer
+        """
+        ProjectTask.process ( self , params )
+        filtered , histo = self.output
+        self.shared.add ( histo )
+        histo.Delete () 
+        self.output = filtered ,
+        
+    ## merge results: only number of selected entries  
+    def _mergeResults(self, result) :
+        self.output = self.output[0] + result[0] , 
+
+# =============================================================================
+## run the projection task in parallel
+#  @param histo  the histogram
+#  @param params the list of parameters for the task
+#  @param shared use the shared-memory accumulation of partial histograms
+#  @param wmgr   the work manager 
+def _project_ ( histo , params , shared = False , wmgr = None ) :
+    """Run the projection task in parallel
+    """
+    from ostap.parallel.shared import SharedHisto, shareable
+    
+    if wmgr is None : wmgr = Parallel.WorkManager ()
+    
+    if shared and shareable ( histo ) :
+        
+        buffer = SharedHisto ( histo )
+        try : 
+            task   = SharedProjectTask ( histo , buffer )
+            wmgr.process ( task , params )
+            buffer.fill  ( histo )
+        finally :
+            buffer.close () 
+            
+        return task.output[0] , histo
+
+    if shared : logger.warning ( 'Shared-memory accumulation is not possible, use the regular one' )
+        
+    task  = ProjectTask ( histo )
+    wmgr.process( task, params )
+
+    filtered   = task.output[0] 
+    histo     += task.output[1]
+    
+    return filtered , histo 
+    
+# =============================================================================
+## get number of entries and the cluster (basket) boundaries for the tree
+#  @code
+#  nentries , clusters = tree_clusters ( 'file.root' , 'MyTree' )
+#  @endcode 
+#  @see TTree::GetClusterIterator
+def tree_clusters ( fname , tname ) :
+    """Get number of entries and the cluster (basket) boundaries for the tree
+    >>> nentries , clusters = tree_clusters ( 'file.root' , 'MyTree' )
+    """
+    import ROOT
+    from ostap.core.core import ROOTCWD
+    with ROOTCWD() :
+        
+        rfile = ROOT.TFile.Open ( fname , 'READ' )
+        if not rfile or rfile.IsZombie() : return 0 , ()
+        
+        tree  = rfile.Get ( tname )
+        if not tree or not isinstance ( tree , ROOT.TTree ) :
+            rfile.Close()
+            return 0 , ()
+        
+        nentries = tree.GetEntries()
+        clusters = []
+        it       = tree.GetClusterIterator ( 0 )
+        entry    = it.Next()
+        while 0 <= entry < nentries :
+            clusters.append ( entry )
+            entry = it.Next()
+            
+        rfile.Close()
+        
+    return nentries , tuple ( clusters ) 
+
+# =============================================================================
+## get number of entries and the cluster (basket) boundaries for the files,
+#  the files are opened in parallel (thread pool)
+#  @code
+#  for nentries , clusters in files_clusters ( files , 'MyTree' , nthreads = 8 ) : ...
+#  @endcode 
+#  @see tree_clusters
+def files_clusters ( files , tname , nthreads = 8 ) :
+    """Get number of entries and the cluster (basket) boundaries for the files,
+    the files are opened in parallel (thread pool)
+    >>> for nentries , clusters in files_clusters ( files , 'MyTree' , nthreads = 8 ) : ...
+    """
+    nthreads = max ( 1 , min ( int ( nthreads ) , len ( files ) ) )
+    if 1 == nthreads : return [ tree_clusters ( f , tname ) for f in files ]
+    
+    import ROOT
+    from multiprocessing.pool import ThreadPool
+    ROOT.ROOT.EnableThreadSafety ()
+    ## release GIL while the file is being opened (only while the pool is running)
+    threaded = getattr ( ROOT.TFile.Open , '_threaded' , False ) 
+    ROOT.TFile.Open._threaded = True
+    pool = ThreadPool ( nthreads )
+    try :
+        return pool.map ( lambda f : tree_clusters ( f , tname ) , files )
+    finally :
+        pool.close ()
+        pool.join  ()
+        ROOT.TFile.Open._threaded = threaded 
+
+# =============================================================================
+## split the chain into (approximately) balanced entry-range shards
+#  - shards do not cross the file boundaries 
+#  - if the number of entries is known for all files in the chain
+#    (e.g. the files are added as <code>chain.Add ( fname , nentries )</code>),
+#    the tree offsets of the chain are used and no file is opened
+#  - otherwise the files are opened in parallel, and 
+#    shard boundaries are aligned with cluster (basket) boundaries
+#  - shards are ordered by decreasing size (``largest first'') that
+#    minimizes the idle time when shards are handed out dynamically 
+#  @code
+#  chain  = ...
+#  shards = chain_shards ( chain , 48 ) 
+#  for fname , first , nentries in shards : ...
+#  @endcode
+#  @param chain    the chain
+#  @param nshards  (approximate) number of shards
+#  @param nthreads the number of threads to open the files 
+#  @return list of shards <code>( file_name , first_entry , num_entries )</code>
+#  @see TChain::GetTreeOffset
+#  @see ostap.trees.data.Data
+def chain_shards ( chain , nshards , nthreads = 8 ) :
+    """Split the chain into (approximately) balanced entry-range shards
+    - shards do not cross the file boundaries 
+    - if the number of entries is known for all files in the chain
+    (e.g. the files are added as chain.Add ( fname , nentries ) ),
+    the tree offsets of the chain are used and no file is opened
+    - otherwise the files are opened in parallel, and 
+    shard boundaries are aligned with cluster (basket) boundaries
+    - shards are ordered by decreasing size (``largest first'') that
+    minimizes the idle time when shards are handed out dynamically 
+    >>> chain  = ...
+    >>> shards = chain_shards ( chain , 48 ) 
+    >>> for fname , first , nentries in shards : ...
+    """
+    import ROOT
+    tname = chain.GetName() 
+    files = chain.files()
+    if not files : return []
+    
+    if isinstance ( chain , ROOT.TChain ) and 0 <= chain.GetEntriesFast () < ROOT.TTree.kMaxEntries :
+        ## the number of entries is known for all files: no need to open them 
+        offsets = chain.GetTreeOffset ()
+        info    = [ ( f , offsets [ i + 1 ] - offsets [ i ] , () ) for i , f in enumerate ( files ) ]
+    else :
+        info    = [ ( f , ) + c for f , c in zip ( files , files_clusters ( files , tname , nthreads ) ) ]
+        
+    total = sum ( [ i[1] for i in info ] )
+    if 0 >= total : return []
+    
+    size   = max ( 1 , total // max ( 1 , nshards ) ) ## target shard size 
+    shards = []
+    for fname , nentries , clusters in info :
+        if 0 >= nentries : continue
+        if not clusters  : clusters = tuple ( range ( 0 , nentries , size ) )
+        start = 0
+        for b in clusters [1:] + ( nentries , ) :
+            if size <= b - start :
+                shards.append ( ( fname , start , b - start ) )
+                start = b
+        if start < nentries :
+            shards.append ( ( fname , start , nentries - start ) )
+            
+    shards.sort ( key = lambda s : s[2] , reverse = True )
+    return shards 
+    
 # =============================================================================  
 ## make a projection of the loooooooong chain into histogram using
 #  multiprocessing functionality for per-file parallelisation
@@ -141,16 +363,32 @@ class ProjectTask(Parallel.Task) :
 #  >>> chain.cproject ( histo , 'mass' , 'pt>0' ) ## ditto 
 #  @endcode
 #  For 12-core machine, clear speedup factor of about 8 is achieved 
+#
+#  The chain is split into balanced entry-range shards (aligned with
+#  the cluster boundaries, if known), all expressions for the shard are processed
+#  by the same worker in one pass, and shards are handed out dynamically,
+#  the largest first
+#  @see chain_shards 
+#  @param granularity number of shards per worker
+#  @param shared      accumulate partial histograms in shared memory 
+#  @see ostap.parallel.shared.SharedHisto
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2014-09-23
-def  cproject ( chain , histo , what , cuts ) :
+def  cproject ( chain , histo , what , cuts , granularity = 4 , shared = False ) :
     """Make a projection of the loooong chain into histogram
     >>> chain = ... ## large chain
     >>> histo = ... ## histogram template 
     >>> cproject        ( chain , histo , 'mass' , 'pt>10' )
     >>> chain.ppropject ( histo , 'mass' , 'pt>0' ) ## ditto 
     >>> chain.cpropject ( histo , 'mass' , 'pt>0' ) ## ditto     
-    For 12-core machine, clear speedup factor of about 8 is achieved     
+    For 12-core machine, clear speedup factor of about 8 is achieved
+    
+    The chain is split into balanced entry-range shards (aligned with
+    the cluster boundaries, if known), all expressions for the shard are processed
+    by the same worker in one pass, and shards are handed out dynamically,
+    the largest first
+    - granularity : number of shards per worker 
+    - shared      : accumulate partial histograms in shared memory 
     """
     #
     if not chain :
@@ -174,20 +412,15 @@ def  cproject ( chain , histo , what , cuts ) :
     if isinstance ( what  , str ) : what = [ what ] 
     
     import ostap.trees.trees
-    files = chain.files()
-
-    cname = chain.GetName() 
     
-    params = [ ( f , cname , str(w) , cuts ) for f in files for w in what ] 
+    what  = tuple ( [ str ( w ) for w in what ] )
+    cname = chain.GetName() 
 
-    task  = ProjectTask          ( histo )
-    wmgr  = Parallel.WorkManager ()
-    wmgr.process( task, params )
+    wmgr   = Parallel.WorkManager ()
+    shards = chain_shards ( chain , granularity * wmgr.ncpus )
+    params = [ ( f , cname , what , cuts , first , nentries ) for f , first , nentries in shards ] 
 
-    filtered   = task.output[0] 
-    histo     += task.output[1]
-    
-    return filtered , histo 
+    return _project_ ( histo , params , shared , wmgr )
 
 import ROOT 
 ROOT.TChain.cproject = cproject
@@ -212,6 +445,7 @@ ROOT.TChain.pproject = cproject
 #  @param nentries   number of entries to process  (>0: all entries in th tree)
 #  @param first      the first entry to process
 #  @param maxentries chunk size for parallel processing 
+#  @param shared     accumulate partial histograms in shared memory 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2014-09-23
 def  tproject ( tree                 ,   ## the tree 
@@ -220,7 +454,8 @@ def  tproject ( tree                 ,   ## the tree
                 cuts       = ''      ,   ## selection/weighting criteria 
                 nentries   = -1      ,   ## number of entries 
                 first      =  0      ,   ## the first entry 
-                maxentries = 1000000 ) : ## chunk size 
+                maxentries = 1000000 ,   ## chunk size 
+                shared     = False   ) : ## use shared memory accumulation 
     """Make a projection of the loooong tree into histogram
     >>> tree  = ... ## large chain
     >>> histo = ... ## histogram template 
@@ -236,6 +471,7 @@ def  tproject ( tree                 ,   ## the tree
     - nentries   number of entries to process  (>0: all entries in th tree)
     - first      the first entry to process
     - maxentries chunk size for parallel processing 
+    - shared     accumulate partial histograms in shared memory 
     """
     if not tree  :
         return 0 , histo
@@ -332,14 +568,7 @@ def  tproject ( tree                 ,   ## the tree
         for w in what : 
             params.append ( ( fname , tname , str(w) , cuts , first + nchunks * csize , rest  ) )
 
-    task  = ProjectTask          ( histo )
-    wmgr  = Parallel.WorkManager ()
-    wmgr.process( task, params )
-
-    filtered   = task.output[0] 
-    histo     += task.output[1]
-    
-    return filtered , histo 
+    return _project_ ( histo , params , shared )
 
 import ROOT 
 ROOT.TTree.tproject = tproject
@@ -382,7 +611,7 @@ class  FillTask(Parallel.Task) :
         with logWarning() : 
             
             import ostap.core.pyrouts
-            from   ostap.roofit.selectors import SelectorWithVars
+            from   ostap.fitting.selectors import SelectorWithVars
             
         selector = SelectorWithVars ( self.variables ,
                                       self.selection ,
@@ -416,31 +645,151 @@ class  FillTask(Parallel.Task) :
         logger.debug ( 'Merging: %d entries ' % len( self.output ) )
 
 
+# =============================================================================
+## The task object for the columnar fill of RooDataSet from TChain:
+#  the workers evaluate the variables, selection and range checks block-wise
+#  and send back the plain numpy columns, that are concatenated (once) and
+#  converted into RooDataSet in one bulk call in the parent process
+#  @see ostap.fitting.selectors.fill_columns
+#  @see ostap.fitting.selectors.make_dataset
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+class  ColumnFillTask(Parallel.Task) :
+    """The task object for the columnar fill of RooDataSet from TChain:
+    the workers evaluate the variables, selection and range checks block-wise
+    and send back the plain numpy columns, that are concatenated (once) and
+    converted into RooDataSet in one bulk call in the parent process
+    """
+    ## constructor: the (columnar) variables and the selection 
+    def __init__ ( self ,  variables , selection ) :
+        
+        self.variables = variables
+        self.selection = selection 
+        self.output    = 0 , 0 , None 
+        
+    def initializeLocal   ( self ) : self.output = 0 , 0 , None 
+    def initializeRemote  ( self ) : pass
+
+    ## the actual processing
+    #   ``params'' is assumed to be a tuple/list :
+    #  - the file name
+    #  - the tree name in the file
+    #  - the first entry in tree to process
+    #  - number of entries to process
+    def process ( self , params ) :
+        """The actual processing
+        ``params'' is assumed to be a tuple-like entity:
+        - the file name
+        - the tree name in the file
+        - the first entry in tree to process
+        - number of entries to process
+        """
+        import ROOT
+        from ostap.parallel.worker import preload, get_chain
+        preload()
+        
+        fname    = params[0] ## file name 
+        tname    = params[1] ## tree name 
+        first    = params[2] if 2 < len ( params ) else 0        ## the first event
+        nentries = params[3] if 3 < len ( params ) else n_large  ## number of events 
+        
+        chain = get_chain ( tname , fname )
+        last  = first + nentries if nentries < n_large else n_large  
+
+        from ostap.fitting.selectors import fill_columns
+        columns , nsel , nskip = fill_columns ( chain          ,
+                                                self.variables ,
+                                                self.selection ,
+                                                first , last   )
+        self.output = nsel , nskip , columns 
+        
+    def finalize ( self ) : pass 
+
+    ## merge results/columns: the chunks are collected and concatenated only once
+    #  @see ColumnFillTask.results 
+    def _mergeResults(self, result) :
+        #
+        nsel , nskip , columns = self.output
+        if result[2] is not None :
+            if columns is None : columns = {}
+            for k , c in result[2].items () :
+                chunks = columns.setdefault ( k , [] )
+                if not isinstance ( chunks , list ) : chunks = columns [ k ] = [ chunks ]
+                ## NB: the (premerged) result could be the list of chunks 
+                if isinstance ( c , list ) : chunks.extend ( c )
+                else                       : chunks.append ( c )
+        self.output = nsel + result[0] , nskip + result[1] , columns 
+
+    ## get the results: the collected chunks are concatenated (once)
+    def results ( self ) :
+        """Get the results: the collected chunks are concatenated (once)"""
+        nsel , nskip , columns = self.output
+        if columns is not None :
+            import numpy 
+            columns = dict ( [ ( k , numpy.concatenate ( c ) if isinstance ( c , list ) else c ) for k , c in columns.items () ] )
+            self.output = nsel , nskip , columns 
+        return self.output 
+        
 # ==============================================================================
-## Fill dataset from looooong TChain using per-file parallelisation
+## Fill dataset from looooong TChain using parallelisation
 #  @code
 #  >>> chain =
 #  >>> vars  = ...
 #  >>> dset  = fillDataSet ( chain , vars , 'pt>10' )
 #  @endcode
-#  @see GaudiMP.Parallel
-#  @see GaudiMP.Parallel.Task
+#  If numpy is available and all variables are defined by names or
+#  (string) expressions, the chain is split into the balanced entry-range
+#  shards, the workers fill plain numpy columns, and RooDataSet is
+#  assembled once in the parent process. Otherwise the per-file
+#  parallelisation with <code>SelectorWithVars</code> is used
+#  @see ColumnFillTask
+#  @see FillTask 
 #  @see Ostap.SelectorWithVars
+#  @param granularity number of shards per worker (columnar mode)
 #  For 12-core machine, clear speed-up factor of about 8 is achieved 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2014-09-23 
-def  fillDataSet ( chain , variables , selection , ppservers = () ) :
-    """Fill dataset from loooong TChain using per-file parallelisation
+def  fillDataSet ( chain , variables , selection , ppservers = () , granularity = 4 ) :
+    """Fill dataset from loooong TChain using parallelisation
     >>> chain =
     >>> vars  = ...
     >>> dset  = fillDataSet ( chain , vars , 'pt>10' )
+    If numpy is available and all variables are defined by names or
+    (string) expressions, the chain is split into the balanced entry-range
+    shards, the workers fill plain numpy columns, and RooDataSet is
+    assembled once in the parent process. Otherwise the per-file
+    parallelisation with SelectorWithVars is used
+    - granularity : number of shards per worker (columnar mode)
     - for 12-core machine, clear speed-up factor of about 8 is achieved 
     """
-        
-    task  = FillTask ( variables , selection )
+
+    import ROOT 
+    from ostap.trees.evaluator   import has_numpy
+    from ostap.fitting.selectors import columnar_variables
+    
+    if isinstance ( selection , ROOT.TCut ) : selection = str ( selection ) 
+    cvars = columnar_variables ( variables ) if has_numpy and isinstance ( selection , str ) else None
+    
     wmgr  = Parallel.WorkManager( ppservers = ppservers )
+    cname = chain.GetName()
+
+    if cvars :
+
+        task   = ColumnFillTask ( cvars , selection )
+        shards = chain_shards   ( chain , granularity * wmgr.ncpus )
+        params = [ ( f , cname , first , nentries ) for f , first , nentries in shards ] 
+        wmgr.process ( task , params )
+
+        nsel , nskip , columns = task.results ()
+        if nskip :
+            logger.info ( 'fillDataSet: %d/%d entries are skipped (out of range)' % ( nskip , nsel ) )
+
+        from ostap.fitting.selectors import make_dataset
+        if columns is None : columns = dict ( [ ( v[0] , () ) for v in cvars ] )
+        return make_dataset ( cvars , columns )
+    
+    task  = FillTask ( variables , selection )
     
-    cname = chain.GetName() 
     files = chain.files() 
     pairs = [ ( cname,i ) for i in files ] 
 
@@ -52,6 +52,8 @@ __date__    = '2016-02-23'
 __all__     = (
     'Task'        , ## the base class for task
     'TaskManager' , ## task manager 
+    'persistent_pool' , ## get the persistent (reusable) pool of workers 
+    'close_pools'     , ## close all persistent pools 
     )
 # =============================================================================
 from ostap.logger.logger import getLogger
@@ -70,20 +72,28 @@ import pathos.parallel
 import dill 
 
 
+## initialize the remote side of the task once per job and worker process:
+#  the workers of the persistent pool are reused by the subsequent jobs 
+def _initialize( task ) :
+    from ostap.parallel.worker import new_job
+    if new_job ( getattr ( task , '_job_id' , None ) ) :
+        for k,v in task.environ.items() :
+            if k not in excluded_varnames : os.environ[k] = v
+        task.initializeRemote()
+
 def _prefunction( f, task, item) :
     return f((task,item))
 
 def _ppfunction( args ) :
-    import ROOT 
     #--- Unpack arguments
     task, item = args
     stat = Statistics()
-    #--- Initialize the remote side (at least once)
-    if not task.__class__._initializeDone :
-        for k,v in task.environ.items() :
-            if k not in excluded_varnames : os.environ[k] = v
-        task.initializeRemote()
-        task.__class__._initializeDone = True
+    #--- Load ROOT&ostap (once per worker process)
+    from ostap.parallel.worker import preload, worker_stats 
+    stat.warm      = preload()
+    stat.load_time = 0.0 if stat.warm else worker_stats()['load_time']
+    #--- Initialize the remote side (once per job and worker process)
+    _initialize(task)
     #--- Reset the task output
     task._resetOutput()
     #--- Call processing
@@ -92,6 +102,54 @@ def _ppfunction( args ) :
     stat.stop()
     return (copy.deepcopy(task.output), stat)
 
+## process the batch of items and merge the results in the worker 
+def _ppbatch( args ) :
+    #--- Unpack arguments
+    task, items = args
+    stat = Statistics()
+    #--- Load ROOT&ostap (once per worker process)
+    from ostap.parallel.worker import preload, worker_stats 
+    stat.warm      = preload()
+    stat.load_time = 0.0 if stat.warm else worker_stats()['load_time']
+    #--- Initialize the remote side (once per job and worker process)
+    _initialize(task)
+    #--- Reset the task output and keep the empty output 
+    task._resetOutput()
+    empty   = copy.deepcopy ( task.output )
+    partial = None 
+    for item in items :
+        task.output = copy.deepcopy ( empty ) 
+        #--- Call processing
+        task.process(item)
+        #--- Merge the results in the worker 
+        if partial is None : partial = task.output
+        else :
+            result      = task.output
+            task.output = partial 
+            task._mergeResults ( result )
+            partial     = task.output
+    #--- Collect statistics
+    stat.njob = len ( items ) 
+    stat.stop()
+    return (copy.deepcopy(partial), stat)
+
+## merge two partial results in the worker 
+def _ppmerge( args ) :
+    task, result1, result2 = args
+    from ostap.parallel.worker import preload
+    preload()
+    task.output = result1
+    task._mergeResults ( result2 )
+    return copy.deepcopy ( task.output )
+
+## split the items into (at most) <code>nbatch</code> interleaved batches:
+#  for items ordered ``largest-first'' each batch gets the similar mix
+#  of large and small items 
+def _batches_ ( items , nbatch ) :
+    items  = list ( items ) 
+    nbatch = max ( 1 , min ( len ( items ) , nbatch ) )
+    return [ items [ k::nbatch ] for k in range ( nbatch ) ]
+
 # =============================================================================
 ## @class Statistics
 #  helper class to collect statistics 
@@ -102,9 +160,13 @@ class Statistics(object):
     def __init__(self):
         import time, os 
         self.name  = os.getenv('HOSTNAME')
+        self.pid   = os.getpid()
         self.start = time.time()
         self.time  = 0.0
         self.njob  = 0
+        self.warm      = False ## has the job been executed by the ``warm'' worker?
+        self.load_time = 0.0   ## time spent for loading ROOT&ostap 
+        self.nwarm     = 0     ## number of jobs executed by the ``warm'' workers 
     def stop ( self ) :
         import time
         self.time = time.time() - self.start
@@ -172,17 +234,70 @@ class Task(object) :
         for o in output :
             if hasattr( o , 'Reset'): o.Reset()
 
+# =============================================================================
+## the persistent (reusable) pools of worker processes: { ncpus : pool }
+_pools_ = {}
+# =============================================================================
+## load ROOT&ostap in the worker process (used for pool warm-up) 
+def _warmup ( i ) :
+    from ostap.parallel.worker import preload
+    preload()
+    return os.getpid()
+
+# =============================================================================
+## get the persistent (reusable) pool of worker processes
+#  - the pool is created once per session (for the given number of processes)
+#  - ROOT and ostap are preloaded in all worker processes
+#  @code
+#  pool = persistent_pool ( 8 ) 
+#  @endcode 
+def persistent_pool ( ncpus ) :
+    """Get the persistent (reusable) pool of worker processes
+    - the pool is created once per session (for the given number of processes)
+    - ROOT and ostap are preloaded in all worker processes
+    >>> pool = persistent_pool ( 8 ) 
+    """
+    pool = _pools_.get ( ncpus , None )
+    if pool is None :
+        from pathos.multiprocessing import ProcessPool as MPPool
+        pool = MPPool ( ncpus )
+        start = time.time() 
+        pids  = set ( pool.map ( _warmup , range ( 4 * ncpus ) ) )
+        logger.info ( 'Persistent pool with %d processes is started (warm-up %.2fs, %d warm workers)' % ( ncpus , time.time() - start , len ( pids ) ) )
+        _pools_ [ ncpus ] = pool
+    return pool
+
+# =============================================================================
+## close all persistent pools
+def close_pools () :
+    """Close all persistent pools"""
+    while _pools_ :
+        ncpus , pool = _pools_.popitem()
+        pool.close ()
+        pool.join  ()
+        pool.clear ()
+        logger.debug ( 'Persistent pool with %d processes is closed' % ncpus ) 
+
+import atexit
+atexit.register ( close_pools )
+
 # =============================================================================
 ## @class WorkManager
 #  Class to in charge of managing the tasks and distributing them to
 #  the workers. They can be local (using other cores) or remote
 #  using other nodes in the local cluster """
+#  - <code>persistent=True</code> (multicore mode only): use the persistent pool
+#    of ``warm'' workers, that is shared by the subsequent jobs
+#  @see persistent_pool 
 #  @author Pere MATO Pere.Meto@cern.ch
 class WorkManager(object) :
     """ Class to in charge of managing the tasks and distributing them to
         the workers. They can be local (using other cores) or remote
-        using other nodes in the local cluster """
-    def __init__( self, ncpus='autodetect', ppservers=None , silent = False ) :
+        using other nodes in the local cluster
+        - persistent=True (multicore mode only): use the persistent pool
+          of ``warm'' workers, that is shared by the subsequent jobs 
+    """
+    def __init__( self, ncpus='autodetect', ppservers=None , silent = False , persistent = False ) :
         
         if ncpus == 'autodetect' :
             from pathos.helpers import cpu_count
@@ -197,19 +312,34 @@ class WorkManager(object) :
             self.mode       = 'cluster'
             from pathos.parallel import stats as pp_stats
             self.pp_stats   = pp_stats
+        elif persistent :
+            self.pool = persistent_pool ( self.ncpus )
+            self.mode = 'multicore'
         else :
             from pathos.multiprocessing import ProcessPool as MPPool
             self.pool = MPPool(self.ncpus)
             self.mode = 'multicore'
+        self.persistent = persistent and not ppservers 
         self.stats  = {}
         self.silent = silent
         
     def __del__(self):
         del self.pool
 
-    def process(self, task, items, timeout=90000 ):
+    ## process the items 
+    #  - <code>premerge=True</code> (multicore mode only):
+    #    items are interleaved into <code>granularity*ncpus</code> batches,
+    #    (for ``largest-first'' items all batches get the similar load),
+    #    the batches are handed out dynamically to the idle workers,
+    #    each worker merges the results of its batch before returning,
+    #    and the partial results are reduced pairwise in the pool (tree-reduction),
+    #    so the parent process merges only the final result 
+    def process(self, task, items, timeout=90000 , premerge = True , granularity = 2 ):
         if not isinstance(task,Task) :
             raise TypeError("task argument needs to be an 'Task' instance")
+        # --- The unique job identifier: the remote side is initialized once per job
+        import uuid 
+        task._job_id = uuid.uuid4().hex
         # --- Call the Local initialialization
         task.initializeLocal()
         # --- Schedule all the jobs ....
@@ -231,6 +361,32 @@ class WorkManager(object) :
             self._printStatistics()
             self.pp_stats() 
 
+        elif self.mode == 'multicore' and premerge and self.ncpus < len ( items ) :
+
+            start   = time.time()
+            batches = _batches_ ( items , granularity * self.ncpus )
+            results = []
+            from ostap.utils.progress_bar import ProgressBar
+            with ProgressBar ( max_value = len(items) , silent = self.silent ) as bar : 
+                jobs = self.pool.uimap ( _ppbatch , zip ( [ task for b in batches ] , batches ) )
+                for result, stat in  jobs :
+                    bar += stat.njob 
+                    results.append ( result )
+                    self._mergeStatistics ( stat   )
+                    
+            ## hierarchical (tree) reduction of the partial results in the pool
+            while 1 < len ( results ) : 
+                pairs   = [ ( task , results [ i ] , results [ i + 1 ] ) for i in range ( 0 , len ( results ) - 1 , 2 ) ]
+                rest    = results [ 2 * len ( pairs ) : ]
+                results = list ( self.pool.uimap ( _ppmerge , pairs ) ) + rest
+                
+            ## final merge in the parent process 
+            for result in results : task._mergeResults ( result )
+            end = time.time()
+            
+            self._printStatistics()
+            logger.info ( 'Time elapsed since server creation %f' %(end-start) ) 
+
         elif self.mode == 'multicore' :
             
             start = time.time()
@@ -255,12 +411,28 @@ class WorkManager(object) :
             logger.info ( 'job count | % of all jobs | job time sum | time per job | job server' ) 
             for name, stat  in self.stats.items():
                 logger.info ( '       %d |        %6.2f |     %8.3f |    %8.3f | %s' % (stat.njob, 100.*stat.njob/njobs, stat.time, stat.time/stat.njob, name) ) 
+        warm = self.warm_stats()
+        logger.info ( 'Warm-start statistics: %(warm)d warm/%(cold)d cold jobs, %(load_time).3fs spent for loading ROOT&ostap' % warm ) 
                 
     def _mergeStatistics(self, stat):
         if stat.name not in self.stats : self.stats[stat.name] = Statistics()
         s = self.stats[stat.name]
-        s.time += stat.time
-        s.njob += 1
+        njob         = max ( 1 , stat.njob ) 
+        s.time      += stat.time
+        s.njob      += njob 
+        s.nwarm     += njob if getattr ( stat , 'warm' , False ) else 0 
+        s.load_time += getattr ( stat , 'load_time' , 0.0 )
+
+    ## get the warm-start statistics: number of jobs executed by ``warm''
+    #  and ``cold'' workers and the time spent for loading ROOT&ostap
+    def warm_stats ( self ) :
+        """Get the warm-start statistics: number of jobs executed by ``warm''
+        and ``cold'' workers and the time spent for loading ROOT&ostap
+        """
+        njob  = sum ( [ s.njob      for s in self.stats.values() ] )
+        nwarm = sum ( [ s.nwarm     for s in self.stats.values() ] )
+        load  = sum ( [ s.load_time for s in self.stats.values() ] )
+        return { 'warm' : nwarm , 'cold' : njob - nwarm , 'load_time' : load } 
 
 # =============================================================================
 ## @class ppServer
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file shared.py
+#
+#  Shared-memory (mmap-backed) accumulation of histograms for
+#  multicore processing:
+#  - the parent process creates the shared buffer for bin contents,
+#    sums of squared weights and the histogram statistics
+#  - workers add their partial histograms directly into the shared buffer
+#    (the update is protected by the file lock), so the partial histograms
+#    are not pickled back to the parent process
+#  - the parent process fills the final histogram from the buffer
+#
+#  @code
+#  histo  = ...
+#  shared = SharedHisto ( histo )
+#  ...
+#  shared.add ( partial_histo )  ## in worker processes
+#  ...
+#  shared.fill ( histo )         ## in parent process
+#  shared.close ()
+#  @endcode
+#
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Shared-memory (mmap-backed) accumulation of histograms for multicore processing
+- the parent process creates the shared buffer for bin contents,
+  sums of squared weights and the histogram statistics
+- workers add their partial histograms directly into the shared buffer
+  (the update is protected by the file lock), so the partial histograms
+  are not pickled back to the parent process
+- the parent process fills the final histogram from the buffer
+
+>>> histo  = ...
+>>> shared = SharedHisto ( histo )
+>>> shared.add ( partial_histo )  ## in worker processes
+>>> shared.fill ( histo )         ## in parent process
+>>> shared.close ()
+"""
+# =============================================================================
+__version__ = '$Revision$'
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = '2018-05-20'
+__all__     = (
+    'SharedHisto' , ## shared-memory accumulator for histograms
+    'shareable'   , ## can the histogram be accumulated in shared memory?
+    )
+# =============================================================================
+import os, mmap, tempfile, array
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__ : logger = getLogger ( 'ostap.parallel.shared' )
+else                      : logger = getLogger ( __name__                )
+# =============================================================================
+## size of the statistics array, @see TH1::GetStats
+_NSTAT = 13
+# =============================================================================
+## get numpy type of bin contents for the histogram
+def _dtype_ ( histo ) :
+    """Get numpy type of bin contents for the histogram"""
+    import ROOT
+    if   isinstance ( histo , ROOT.TArrayD ) : return 'float64'
+    elif isinstance ( histo , ROOT.TArrayF ) : return 'float32'
+    return None
+
+# =============================================================================
+## can the histogram be accumulated in shared memory?
+#  - numpy and <code>fcntl</code> must be available
+#  - the histogram must be double- or float-based
+#  - profiles are not shareable: bin entries and their sum of weights are not kept 
+def shareable ( histo ) :
+    """Can the histogram be accumulated in shared memory?
+    - numpy and fcntl must be available
+    - the histogram must be double- or float-based
+    - profiles are not shareable: bin entries and their sum of weights are not kept 
+    """
+    try :
+        import numpy, fcntl
+    except ImportError :
+        return False
+    import ROOT
+    if isinstance ( histo , ( ROOT.TProfile , ROOT.TProfile2D , ROOT.TProfile3D ) ) : return False
+    return _dtype_ ( histo ) is not None
+
+# =============================================================================
+## @class SharedHisto
+#  Shared-memory (mmap-backed) accumulator for histograms.
+#  The buffer layout: <code>[ contents | sumw2 | statistics | entries ]</code>
+#  @code
+#  histo  = ...
+#  shared = SharedHisto ( histo )
+#  shared.add  ( partial_histo )  ## in worker processes
+#  shared.fill ( histo )          ## in parent process
+#  shared.close ()
+#  @endcode
+#  @attention the object is pickled to workers by the file name
+class SharedHisto(object) :
+    """Shared-memory (mmap-backed) accumulator for histograms.
+    The buffer layout: [ contents | sumw2 | statistics | entries ]
+    >>> histo  = ...
+    >>> shared = SharedHisto ( histo )
+    >>> shared.add  ( partial_histo )  ## in worker processes
+    >>> shared.fill ( histo )          ## in parent process
+    >>> shared.close ()
+    """
+    def __init__ ( self , histo , directory = None ) :
+
+        self.ncells = histo.GetNcells()
+        self.size   = 2 * self.ncells + _NSTAT + 1
+
+        if directory is None and os.path.isdir ( '/dev/shm' ) : directory = '/dev/shm'
+        fd , self.fname = tempfile.mkstemp ( prefix = 'ostap-shared-' , suffix = '.hbuf' , dir = directory )
+        os.ftruncate ( fd , 8 * self.size ) ## NB: filled by zeros
+        os.close     ( fd )
+
+    # =========================================================================
+    ## the views of the histogram arrays: contents&sumw2
+    def _views_ ( self , histo ) :
+        """The views of the histogram arrays: contents&sumw2"""
+        import numpy
+        dtype    = _dtype_ ( histo )
+        contents = numpy.frombuffer ( histo.GetArray() , dtype = dtype , count = self.ncells )
+        if not histo.GetSumw2N() : histo.Sumw2()
+        sumw2    = numpy.frombuffer ( histo.GetSumw2().GetArray() , dtype = numpy.float64 , count = self.ncells )
+        return contents , sumw2
+
+    # =========================================================================
+    ## add the (partial) histogram into the shared buffer (in worker process)
+    def add ( self , histo ) :
+        """Add the (partial) histogram into the shared buffer (in worker process)"""
+        if histo.GetNcells() != self.ncells :
+            raise TypeError ( "SharedHisto: mismatch in number of cells %d/%d" % ( histo.GetNcells() , self.ncells ) )
+
+        import numpy, fcntl
+        contents , sumw2 = self._views_ ( histo )
+        stats = array.array ( 'd' , _NSTAT * [ 0.0 ] )
+        histo.GetStats ( stats )
+
+        n = self.ncells
+        with open ( self.fname , 'r+b' ) as f :
+            fcntl.lockf ( f , fcntl.LOCK_EX )
+            try :
+                m   = mmap.mmap ( f.fileno() , 8 * self.size )
+                buf = numpy.frombuffer ( m , dtype = numpy.float64 , count = self.size )
+                buf [       :     n ] += contents
+                buf [ n     : 2 * n ] += sumw2
+                buf [ 2 * n : -1    ] += numpy.frombuffer ( stats , dtype = numpy.float64 )
+                buf [ -1            ] += histo.GetEntries()
+                del buf
+                m.flush ()
+                m.close ()
+            finally :
+                fcntl.lockf ( f , fcntl.LOCK_UN )
+
+    # =========================================================================
+    ## fill the histogram from the shared buffer (in parent process)
+    def fill ( self , histo ) :
+        """Fill the histogram from the shared buffer (in parent process)"""
+        import numpy
+        n = self.ncells
+        with open ( self.fname , 'r+b' ) as f :
+            m   = mmap.mmap ( f.fileno() , 8 * self.size )
+            buf = numpy.frombuffer ( m , dtype = numpy.float64 , count = self.size )
+            contents , sumw2 = self._views_ ( histo )
+            contents [ : ] = buf [       :     n ]
+            sumw2    [ : ] = buf [ n     : 2 * n ]
+            stats   = array.array ( 'd' , buf [ 2 * n : -1 ] )
+            entries = buf [ -1 ]
+            del buf
+            m.close ()
+        histo.PutStats   ( stats   )
+        histo.SetEntries ( entries )
+        return histo
+
+    # =========================================================================
+    ## remove the shared buffer
+    def close ( self ) :
+        """Remove the shared buffer"""
+        if self.fname and os.path.exists ( self.fname ) : os.remove ( self.fname )
+        self.fname = None
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for ostap/parallel/kisa.py
+- the chain shards cover all entries exactly once
+- the shards are built both from the known tree offsets and from the opened files
+"""
+# =============================================================================
+import ROOT, os, array, tempfile
+import ostap.trees.trees
+from   ostap.parallel.kisa import chain_shards
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_kisa' )
+else                       : logger = getLogger ( __name__    )
+# =============================================================================
+## write the file with the test tree 
+def make_file ( fname , entries ) :
+    f = ROOT.TFile ( fname , 'RECREATE' )
+    f.cd ()
+    t = ROOT.TTree ( 'T' , 'Test tree' )
+    x = array.array ( 'd' , [ 0 ] )
+    t.Branch ( 'x' , x , 'x/D' )
+    for i in range ( entries ) :
+        x [ 0 ] = i
+        t.Fill ()
+    t.Write ()
+    f.Close ()
+
+# =============================================================================
+def test_kisa_shards () :
+
+    sizes = [ 1000 , 2500 , 300 , 4000 ]
+    files = [ tempfile.mktemp ( suffix = '.root' ) for s in sizes ]
+    for f , s in zip ( files , sizes ) : make_file ( f , s )
+
+    known   = ROOT.TChain ( 'T' )
+    unknown = ROOT.TChain ( 'T' )
+    for f , s in zip ( files , sizes ) :
+        known  .Add ( f , s )  ## the number of entries is known: the files are not opened 
+        unknown.Add ( f     )
+
+    for nshards in ( 1 , 7 , 48 ) :
+        for chain in ( known , unknown ) : 
+            shards = chain_shards ( chain , nshards , nthreads = 4 )
+            for f , s in zip ( files , sizes ) :
+                ranges = sorted ( [ ( first , n ) for fname , first , n in shards if fname == f ] )
+                start  = 0
+                for first , n in ranges :
+                    assert first == start and 0 < n , 'Invalid shards for %s: %s' % ( f , ranges )
+                    start += n
+                assert s == start , 'Invalid number of entries for %s: %s/%s' % ( f , start , s )
+            assert all ( [ a[2] >= b[2] for a , b in zip ( shards , shards [ 1: ] ) ] ) , 'Shards are not ordered!'
+
+    for f in files : os.remove ( f )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_kisa_shards ()  ## chain shards
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for ostap/parallel/mp_pathos.py
+- batches of ``largest-first'' items get the similar load
+- the results, merged in the workers and reduced in the pool, are correct
+- the remote side is initialized for each job in the persistent pool 
+"""
+# =============================================================================
+import ROOT
+from   ostap.core.core           import hID
+from   ostap.parallel.mp_pathos  import Task, WorkManager, _batches_
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_parallel' )
+else                       : logger = getLogger ( __name__        )
+# =============================================================================
+## simple task: count the items and fill their sizes into the histogram
+class CountTask(Task) :
+    def __init__ ( self , nbins ) :
+        self.nbins = nbins
+    def initializeLocal ( self ) :
+        self.output = 0 , ROOT.TH1D ( hID () , 'sizes' , self.nbins , 0 , self.nbins )
+    def process ( self , item ) :
+        index , size = item
+        self.output [ 1 ].Fill ( index , size )
+        self.output = self.output [ 0 ] + 1 , self.output [ 1 ]
+    def _mergeResults ( self , result ) :
+        self.output [ 1 ].Add ( result [ 1 ] )
+        self.output = self.output [ 0 ] + result [ 0 ] , self.output [ 1 ]
+
+## the jobs, initialized in the worker process 
+_initialized_ = set()
+## simple task: count the items, processed by the initialized workers 
+class InitTask(Task) :
+    def __init__ ( self , tag ) :
+        self.tag = tag 
+    def initializeLocal  ( self ) :
+        self.output = 0 
+    def initializeRemote ( self ) :
+        _initialized_.add ( self.tag )
+    def process ( self , item ) :
+        self.output = 1 if self.tag in _initialized_ else 0 
+
+## the items ``largest-first'', e.g. as from chain shards
+items = [ ( i , 1000 - 7 * i ) for i in range ( 100 ) ]
+
+# =============================================================================
+def test_parallel_balance () :
+
+    for nbatch in ( 3 , 8 , 16 ) :
+
+        batches = _batches_ ( items , nbatch )
+        assert nbatch == len ( batches ) , 'Invalid number of batches %d/%d' % ( len ( batches ) , nbatch )
+        assert sorted ( items ) == sorted ( sum ( batches , [] ) ) , 'Items are lost or duplicated!'
+
+        loads = [ sum ( [ size for i , size in b ] ) for b in batches ]
+        logger.info ( 'Load of %2d batches: min/max %d/%d' % ( nbatch , min ( loads ) , max ( loads ) ) )
+        ## the loads differ at most by the largest item 
+        assert max ( loads ) - min ( loads ) <= items [ 0 ] [ 1 ] , 'Load is not balanced: %s' % loads
+
+# =============================================================================
+def test_parallel_merge () :
+
+    task = CountTask ( len ( items ) )
+    wm   = WorkManager ( ncpus = 4 , silent = True )
+    wm.process ( task , items , granularity = 3 )
+
+    count , histo = task.output
+    assert len ( items ) == count , 'Invalid number of processed items %d/%d' % ( count , len ( items ) )
+    for i , size in items :
+        assert size == histo.GetBinContent ( i + 1 ) , 'Invalid merged result for item %d' % i
+
+# =============================================================================
+def test_parallel_init () :
+
+    items = range ( 50 )
+    for tag in ( 'job1' , 'job2' ) :
+        task = InitTask ( tag )
+        wm   = WorkManager ( ncpus = 4 , silent = True , persistent = True )
+        wm.process ( task , items , premerge = False )
+        assert len ( items ) == task.output , 'The remote side is not initialized for %s: %s/%s' % ( tag , task.output , len ( items ) ) 
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_parallel_balance ()  ## load balance of batches
+    test_parallel_merge   ()  ## merged results
+    test_parallel_init    ()  ## initialization of the remote side 
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file worker.py
+#
+#  Per-process state of the (persistent) parallel workers:
+#  - ROOT and ostap decorations are loaded once per worker process
+#  - opened TChain handles are cached and reused across tasks
+#  - the remote side of each job is initialized once per worker process
+#  - warm-start statistics of the worker
+#
+#  @code
+#  from ostap.parallel.worker import preload, get_chain
+#  warm  = preload ()                           ## load ROOT&ostap (once)
+#  chain = get_chain ( 'MyTree' , 'file.root' ) ## cached chain
+#  @endcode
+#
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Per-process state of the (persistent) parallel workers:
+- ROOT and ostap decorations are loaded once per worker process
+- opened TChain handles are cached and reused across tasks
+- the remote side of each job is initialized once per worker process
+- warm-start statistics of the worker
+
+>>> from ostap.parallel.worker import preload, get_chain
+>>> warm  = preload ()                           ## load ROOT&ostap (once)
+>>> chain = get_chain ( 'MyTree' , 'file.root' ) ## cached chain
+"""
+# =============================================================================
+__version__ = '$Revision$'
+__author__  = 'Vanya BELYAEV Ivan.Belyaev@itep.ru'
+__date__    = '2018-05-20'
+__all__     = (
+    'preload'      , ## load ROOT and ostap once per process
+    'get_chain'    , ## get the cached TChain
+    'clear_chains' , ## clear the cache of TChains
+    'new_job'      , ## is it the new job for this worker?
+    'worker_stats' , ## statistics of the worker
+    )
+# =============================================================================
+import os, time
+from   collections import OrderedDict
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' == __name__ : logger = getLogger ( 'ostap.parallel.worker' )
+else                      : logger = getLogger ( __name__                )
+# =============================================================================
+## the per-process state
+_state_ = {
+    'pid'       : None ,  ## PID of the process (the state is reset after fork)
+    'loaded'    : False,  ## are ROOT&ostap loaded?
+    'load_time' : 0.0  ,  ## time spent for loading ROOT&ostap
+    'tasks'     : 0    ,  ## number of processed tasks
+    'hits'      : 0    ,  ## number of reused chains
+    'misses'    : 0    ,  ## number of created chains
+    }
+## the cache of opened chains
+_chains_     = OrderedDict()
+## maximal number of chains to keep
+max_chains   = 20
+## the jobs, initialized in this process 
+_jobs_       = set()
+# =============================================================================
+## reset the state for the new process
+def _check_pid_ () :
+    """Reset the state for the new (e.g. forked) process"""
+    pid = os.getpid()
+    if pid != _state_ [ 'pid' ] :
+        _state_.update ( pid = pid , tasks = 0 , hits = 0 , misses = 0 )
+        _chains_.clear()
+        _jobs_  .clear()
+
+# =============================================================================
+## load ROOT and ostap decorations (once per process)
+#  @return <code>True</code> if the worker is already ``warm''
+#  @code
+#  warm = preload ()
+#  @endcode
+def preload () :
+    """Load ROOT and ostap decorations (once per process)
+    - return True if the worker is already ``warm''
+    >>> warm = preload ()
+    """
+    _check_pid_ ()
+    _state_ [ 'tasks' ] += 1
+    if _state_ [ 'loaded' ] : return True
+
+    start = time.time()
+    import ROOT
+    ROOT.PyConfig.IgnoreCommandLineOptions = True
+    from ostap.logger.logger import logWarning
+    with logWarning() : import ostap.core.pyrouts
+    _state_ [ 'load_time' ] = time.time() - start
+    _state_ [ 'loaded'    ] = True
+    return False
+
+# =============================================================================
+## get the cached chain for the given tree name and file(s)
+#  @code
+#  chain = get_chain ( 'MyTree' , 'file.root' )
+#  chain = get_chain ( 'MyTree' , [ 'file1.root' , 'file2.root' ] )
+#  @endcode
+#  @attention the chain is owned by the cache, do not delete it!
+def get_chain ( tname , files ) :
+    """Get the cached chain for the given tree name and file(s)
+    >>> chain = get_chain ( 'MyTree' , 'file.root' )
+    >>> chain = get_chain ( 'MyTree' , [ 'file1.root' , 'file2.root' ] )
+    - attention: the chain is owned by the cache, do not delete it!
+    """
+    _check_pid_ ()
+
+    import ROOT
+    if   isinstance ( files , str                ) : files = ( files , )
+    elif isinstance ( files , ROOT.TChainElement ) : files = ( files.GetTitle() , )
+    key = ( tname , ) + tuple ( files )
+
+    chain = _chains_.pop ( key , None )
+    if chain :
+        _state_ [ 'hits'   ] += 1
+    else     :
+        _state_ [ 'misses' ] += 1
+        chain = ROOT.TChain ( tname )
+        for f in files : chain.Add ( f )
+        while max_chains <= len ( _chains_ ) :
+            _chains_.popitem ( last = False )
+
+    _chains_ [ key ] = chain   ## the most recently used is the last
+    return chain
+
+# =============================================================================
+## is it the new job for this worker process?
+#  The remote side of the task needs to be initialized once per job and process
+#  @code
+#  if new_job ( task._job_id ) : task.initializeRemote()
+#  @endcode
+def new_job ( job ) :
+    """Is it the new job for this worker process?
+    The remote side of the task needs to be initialized once per job and process
+    >>> if new_job ( task._job_id ) : task.initializeRemote()
+    """
+    _check_pid_ ()
+    if job in _jobs_ : return False
+    _jobs_.add ( job )
+    return True
+
+# =============================================================================
+## clear the cache of chains
+def clear_chains () :
+    """Clear the cache of chains"""
+    _chains_.clear()
+
+# =============================================================================
+## get the statistics of the worker
+#  @code
+#  stats = worker_stats ()
+#  @endcode
+def worker_stats () :
+    """Get the statistics of the worker
+    >>> stats = worker_stats ()
+    """
+    _check_pid_ ()
+    return dict ( _state_ )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for ostap/stats/ustat.py
+- nearest-neighbour distances from k-d tree versus brute force
+"""
+# =============================================================================
+import ROOT, math, random
+from   ostap.core.core   import dsID, hID
+from   ostap.stats.ustat import uCalc
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_ustat' )
+else                       : logger = getLogger ( __name__      )
+# =============================================================================
+
+## volume of n-ball with unit radius
+def ball_volume ( n ) :
+    if   0 == n : return 0.0
+    elif 1 == n : return 2.0
+    elif 2 == n : return math.pi
+    return 2 * math.pi / n * ball_volume ( n - 2 )
+
+## U-statistics and T-statistics with the brute-force nearest neighbours
+def brute_force ( pdf , args , points ) :
+
+    num    = len ( points )
+    dim    = len ( points [ 0 ] )
+    volume = ball_volume ( dim )
+
+    values = []
+    for i , p in enumerate ( points ) :
+
+        best = 1.e+200
+        for j , q in enumerate ( points ) :
+            if i == j : continue
+            d2 = sum ( [ ( a - b ) ** 2 for a , b in zip ( p , q ) ] )
+            best = min ( best , d2 )
+
+        for a , v in zip ( [ a for a in args ] , p ) : a.setVal ( v )
+        pdf_value = pdf.getVal ( args )
+
+        value = volume * math.sqrt ( best ) ** dim
+        values.append ( math.exp ( -value * num * pdf_value ) )
+
+    values.sort()
+    tstat = sum ( [ ( v - float ( k + 1 ) / num ) ** 2 for k , v in enumerate ( values ) ] )
+    return values , tstat
+
+# =============================================================================
+def test_ustat_nearest () :
+
+    random.seed ( 12345 )
+
+    for dim in ( 1 , 2 , 3 ) :
+
+        xs     = [ ROOT.RooRealVar ( 'ux%d' % i , 'x%d' % i , -5 , 5 ) for i in range ( dim ) ]
+        means  = [ ROOT.RooRealVar ( 'um%d' % i , 'm%d' % i ,  0     ) for i in range ( dim ) ]
+        sigmas = [ ROOT.RooRealVar ( 'us%d' % i , 's%d' % i ,  1     ) for i in range ( dim ) ]
+        gauss  = [ ROOT.RooGaussian ( 'ug%d' % i , 'g%d' % i , x , m , s ) for i , ( x , m , s ) in enumerate ( zip ( xs , means , sigmas ) ) ]
+
+        plist  = ROOT.RooArgList ()
+        for g in gauss : plist.add ( g )
+        pdf    = ROOT.RooProdPdf ( 'updf%d' % dim , 'pdf' , plist )
+
+        args   = ROOT.RooArgSet  ()
+        for x in xs : args.add ( x )
+        data   = ROOT.RooDataSet ( dsID () , 'U-statistics data' , args )
+
+        points = [ tuple ( [ random.gauss ( 0 , 1 ) for x in xs ] ) for i in range ( 400 ) ]
+        ## add some duplicates
+        points += points [ : 10 ]
+        points  = [ p for p in points if all ( [ -5 < v < 5 for v in p ] ) ]
+        for p in points :
+            for x , v in zip ( xs , p ) : x.setVal ( v )
+            data.add ( args )
+
+        ## the order of variables as used by Ostap::UStat
+        order = [ [ x.GetName () for x in xs ].index ( a.GetName () ) for a in args ]
+        pts   = [ tuple ( [ p [ k ] for k in order ] ) for p in points ]
+
+        values , tbf = brute_force ( pdf , args , pts )
+
+        for nthreads in ( 1 , 4 ) :
+
+            histo = ROOT.TH1F ( hID () , 'U-statistics' , 20 , 0 , 1 )
+            histo , tstat = uCalc ( pdf , args , data , histo , nthreads = nthreads )
+
+            logger.info ( 'dim=%d nthreads=%d T-statistics: k-d tree %.10g, brute force %.10g' % ( dim , nthreads , tstat , tbf ) )
+            assert histo.GetEntries () == len ( values ) , \
+                   'Invalid number of entries %s/%s' % ( histo.GetEntries () , len ( values ) )
+            assert abs ( tstat - tbf ) <= 1.e-9 * max ( 1.0 , abs ( tbf ) ) , \
+                   'k-d tree differs from brute force: %s vs %s (dim=%d, nthreads=%d)' % ( tstat , tbf , dim , nthreads )
+
+            hbf = ROOT.TH1F ( hID () , 'U-statistics' , 20 , 0 , 1 )
+            for v in values : hbf.Fill ( v )
+            for i in range ( 1 , 21 ) :
+                assert abs ( histo.GetBinContent ( i ) - hbf.GetBinContent ( i ) ) <= 1 , \
+                       'U-statistics histograms differ in bin %d (dim=%d, nthreads=%d)' % ( i , dim , nthreads )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_ustat_nearest ()  ## k-d tree versus brute force
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -101,25 +101,30 @@ def uDist ( x , y ) :
 #   @param args   (input) arguments/variables
 #   @param data   (input) dataset 
 #   @param histo  (input) the histogram to be filled 
+#   @param nthreads (input) number of threads for nearest-neighbour queries 
 #   @author Vanya Belyaev Ivan.Belyaev@cern.ch
 #   @see Analysis::UStat
 #   @see Analysis::UStat::calculate
 #   @date 2011-09-21
-def uCalc ( pdf            ,
-            args           , 
-            data           ,
-            histo          ,
-            silent = False )  :
+def uCalc ( pdf              ,
+            args             , 
+            data             ,
+            histo            ,
+            silent   = False ,
+            nthreads = 1     )  :
     """Calculate U-statistics 
+    - nthreads : number of threads for nearest-neighbour queries 
     """
     import sys
     
     tStat = ROOT.Double(-1)
-    sc    = Ostap.UStat.calculate ( pdf   ,
-                                    data  ,
-                                    histo ,
-                                    tStat ,
-                                    args  )
+    sc    = Ostap.UStat.calculate ( pdf      ,
+                                    data     ,
+                                    histo    ,
+                                    tStat    ,
+                                    args     ,
+                                    nthreads )
+    if sc.isFailure() : logger.error ( 'Error from Ostap::UStat::calculate %s' % sc ) 
     return histo, tStat 
     
     numEntries = data.numEntries ()
@@ -193,11 +198,13 @@ def uCalc ( pdf            ,
 #   @param data   (input) dataset 
 #   @param bins   (input) bumbef of bins in histogram 
 #   @param silent (input) keep the silence 
-def uPlot ( pdf            ,
-            data           ,
-            bins   = None  ,
-            args   = None  ,
-            silent = False ) :
+#   @param nthreads (input) number of threads for nearest-neighbour queries 
+def uPlot ( pdf              ,
+            data             ,
+            bins     = None  ,
+            args     = None  ,
+            silent   = False ,
+            nthreads = 1     ) :
     """Make the plot of U-statistics 
     
     >>> pdf  = ...               ## pdf
@@ -237,7 +244,8 @@ def uPlot ( pdf            ,
                       args      ,
                       data      ,
                       histo     ,
-                      silent    )    
+                      silent    ,
+                      nthreads  )    
     
     res  = histo.Fit         ( 'pol0' , 'SLQ0+' )
     func = histo.GetFunction ( 'pol0' )
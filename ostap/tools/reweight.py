@@ -31,8 +31,37 @@ else                       : logger = getLogger ( __name__              )
 # =============================================================================
 logger.info ( 'Set of utitilities for re-weigthing')
 from   ostap.core.pyrouts import VE, SE
+from   ostap.core.core    import ROOTCWD
 from   ostap.math.base    import iszero
 import ostap.io.zipshelve as     DBASE ## needed to store the weights&histos 
+# =============================================================================
+## the cache of merged functions: history uid -> ( length , product )
+_products_ = {}
+# =============================================================================
+## merge the history of weighting functions into the single function (product).
+#  The product is cached (per process) using the unique identifier of history:
+#  for the history that has grown since the last call, only the new functions
+#  are read from the database and multiplied
+#  @see ostap.io.shelve_ext.History
+def _merged_ ( history ) :
+    """Merge the history of weighting functions into the single function (product).
+    The product is cached (per process) using the unique identifier of history:
+    for the history that has grown since the last call, only the new functions
+    are read from the database and multiplied
+    """
+    uid   = history.uid
+    size  = len ( history )
+    first , product = 0 , None
+    if uid and uid in _products_ :
+        n , p = _products_ [ uid ]
+        if n <= size : first , product = n , p 
+    for i in range ( first , size ) :
+        fun = history [ i ]
+        ## NB: do not use in-place multiplication: the cached product is shared 
+        product = fun if product is None else product * fun 
+    if uid : _products_ [ uid ] = size , product
+    return product
+
 # =============================================================================
 ## @class Weight
 #  helper class for semiautomatic reweighting of data 
@@ -80,6 +109,11 @@ class Weight(object) :
     # db['pt-data'] = [h1,h2,h3,...,hn]
     where h1,...,hn are iteratively obtained histograms with corrections, such as
     the total correction is calculated by the product of them
+    The iterations are stored as the append-only history, and the
+    product of them is stored under the address itself:
+    # db.append ( 'pt-data' , h ) ## only the new histogram is written
+    # db['pt-data']               ## the product of all iterations 
+    # db.history ( 'pt-data' )    ## the lazy sequence of iterations 
     """
     def __init__ ( self                   ,
                    dbase   = "weights.db" , ## the name of data base with the weights 
@@ -90,6 +124,7 @@ class Weight(object) :
         #
         self._counter = SE ()
         self._nzeroes = 0 
+        self._vfuncs  = {}  ## vectorized functions 
 
         self.vars = [] 
         if not factors : return
@@ -97,10 +132,9 @@ class Weight(object) :
         ## open database 
         with DBASE.open ( dbase , 'r' ) as db : ## READONLY
             
+            ## NB: do not unpickle all the entries, just list the keys 
             for k in db :
-                e = db[k]
-                if hasattr ( e , '__len__' ) :  
-                    logger.debug( 'DBASE "%.15s" key "%.15s" #%d' % ( dbase ,  k, len( e ) ) ) 
+                logger.debug( 'DBASE "%.15s" key "%.15s"' % ( dbase ,  k ) )
                 
             ## loop over the weighting factors and build the function
             for f in factors :
@@ -108,32 +142,30 @@ class Weight(object) :
                 funval  = f[0]  ## accessor to the variable 
                 funname = f[1]  ## address  in database 
 
+                ## the column names for vectorized evaluation 
+                columns = None 
                 if isinstance ( funval , str ) :
-                    varnam = funval 
-                    funval = lambda s : getattr ( s , varnam )
+                    varnam  = funval
+                    columns = varnam ,
+                    funval  = lambda s , v = varnam : getattr ( s , v )
+                elif isinstance ( funval , ( tuple , list ) ) and \
+                         all ( [ isinstance ( v , str ) for v in funval ] ) :
+                    columns = tuple ( funval )
+                    funval  = lambda s , v = columns : tuple ( [ getattr ( s , n ) for n in v ] ) 
                     
                 ## 
-                functions  = db.get ( funname , [] ) ## db[ funname ]
-                if not functions :
+                history = db.history ( funname ) ## the lazy sequence of functions 
+                if not history :
                     logger.warning('No reweighting is available for %s, skip it' % funname )
 
                 merge = True
                 if 2 < len ( f ) : merge = f[2] 
                 
-                if not isinstance (  functions , ( list , tuple ) ) :
-                    functions = [ functions ]
-                    
                 ## merge list of functions into single function 
-                if merge and 1 < len ( functions)  : 
-                
-                    single_func = functions[0] * functions [1] 
-                    
-                    for fun in functions [2:] :
-                        single_func *= fun
-                            
-                    functions  = [ single_func ]
+                if merge and 1 < len ( history ) : functions = [ _merged_ ( history ) ]
+                else                             : functions = list ( history ) 
                     
-                self.vars += [ ( funname , funval , functions , SE() ) ]  
+                self.vars += [ ( funname , funval , functions , SE() , columns ) ]  
 
 
     ## get the statistic of weights 
@@ -188,6 +220,249 @@ class Weight(object) :
             
         return vw 
 
+    ## the names of columns, needed for vectorized evaluation
+    @property
+    def columns ( self ) :
+        """``columns'' : the names of columns, needed for vectorized evaluation"""
+        cols = [] 
+        for i in self.vars :
+            if i[4] is None :
+                raise TypeError ( "Weight: no column names for '%s', vectorized evaluation is impossible" % i[0] )
+            for c in i[4] :
+                if not c in cols : cols.append ( c )
+        return tuple ( cols )
+    
+    ## calculate the weights for the arrays of data (vectorized version of __call__)
+    #  - the factors must be specified via the column names
+    #  - 1D and 2D histograms are evaluated with vectorized interpolation
+    #    (the default interpolation for histograms: linear between bin centers)
+    #  - other functions are called for each entry
+    #  @code
+    #  weighter = Weight ( 'weights.db' , [ ( 'pt' , 'pt-data' ) , ( ( 'x' , 'y' ) , 'xy-data' ) ] )
+    #  weights  = weighter.evaluate ( { 'pt' : pt_array , 'x' : x_array , 'y' : y_array } ) 
+    #  @endcode
+    #  @param arrays the mapping: column name -> array of values 
+    #  @return numpy array of weights 
+    def evaluate ( self , arrays ) :
+        """Calculate the weights for the arrays of data (vectorized version of __call__)
+        - the factors must be specified via the column names
+        - 1D and 2D histograms are evaluated with vectorized interpolation
+        (the default interpolation for histograms: linear between bin centers)
+        - other functions are called for each entry
+        >>> weighter = Weight ( 'weights.db' , [ ( 'pt' , 'pt-data' ) , ( ( 'x' , 'y' ) , 'xy-data' ) ] )
+        >>> weights  = weighter.evaluate ( { 'pt' : pt_array , 'x' : x_array , 'y' : y_array } ) 
+        """
+        import numpy
+        
+        self.columns ## check columns 
+        if not self.vars : 
+            return numpy.ones ( len ( arrays [ list ( arrays.keys() ) [ 0 ] ] ) if arrays else 0 , dtype = numpy.float64 )
+
+        weight = None 
+        for i in self.vars :
+            
+            functions = i[2]
+            cnt       = i[3]
+            args      = [ numpy.asarray ( arrays [ c ] , dtype = numpy.float64 ) for c in i[4] ]
+
+            ww = numpy.ones ( len ( args [ 0 ] ) , dtype = numpy.float64 )
+            for f in functions :
+                vf = self._vfuncs.get ( id ( f ) , None )
+                if vf is None :
+                    vf = _vectorized_ ( f )
+                    self._vfuncs [ id ( f ) ] = vf 
+                ww *= vf ( *args )
+
+            ## keep the statistics
+            if len ( ww ) : cnt += _stat_ ( ww ) 
+
+            ## update the global weight 
+            if weight is None : weight  = ww
+            else              : weight *= ww
+
+        if len ( weight ) : 
+            self._counter += _stat_ ( weight )
+            self._nzeroes += int ( numpy.count_nonzero ( weight == 0 ) )
+            
+        return weight
+
+    ## add the weight as the new branch to TTree or the new variable to RooDataSet
+    #  - the columns are read in bulk, the weights are calculated by <code>evaluate</code>
+    #  - the branch/variable is filled in one pass 
+    #  @code
+    #  weighter = Weight ( 'weights.db' , [ ( 'pt' , 'pt-data' ) ] )
+    #  weighter.add_to ( dataset , 'weight' )
+    #  weighter.add_to ( tree    , 'weight' ) ## the tree must be in the writable file 
+    #  @endcode
+    #  @param target  TTree or RooDataSet
+    #  @param name    the name of new branch/variable
+    #  @param chunk   the number of entries to read in one block (for TTree)
+    #  @return the numpy array of weights 
+    def add_to ( self , target , name = 'weight' , chunk = 1000000 ) :
+        """Add the weight as the new branch to TTree or the new variable to RooDataSet
+        - the columns are read in bulk, the weights are calculated by `evaluate`
+        - the branch/variable is filled in one pass 
+        >>> weighter = Weight ( 'weights.db' , [ ( 'pt' , 'pt-data' ) ] )
+        >>> weighter.add_to ( dataset , 'weight' )
+        >>> weighter.add_to ( tree    , 'weight' ) ## the tree must be in the writable file 
+        """
+        import numpy
+        from ostap.core.core import Ostap
+        
+        columns = self.columns
+        
+        if   isinstance ( target , ROOT.RooAbsData ) :
+
+            if not isinstance ( target , ROOT.RooDataSet ) :
+                raise TypeError ( "Weight.add_to: only RooDataSet is supported, got %s" % type ( target ) )
+            
+            n      = len ( target ) 
+            arrays = {}
+            for c in columns :
+                a = numpy.empty ( n , dtype = numpy.float64 )
+                if n != Ostap.DataFill.get_column ( target , c , a , n ) :
+                    raise TypeError ( "Weight.add_to: unable to get column '%s' from %s" % ( c , target.GetName() ) )
+                arrays [ c ] = a
+            weights = self.evaluate ( arrays )
+            
+            wmin , wmax = ( weights.min () , weights.max () ) if n else ( 0 , 1 )
+            var = ROOT.RooRealVar ( name , 'weight' , min ( 0 , wmin ) , max ( 1 , wmax ) )
+            if n != Ostap.DataFill.add_column ( target , var , weights , n ) :
+                raise TypeError ( "Weight.add_to: unable to add variable '%s' to %s" % ( name , target.GetName() ) )
+
+        elif isinstance ( target , ROOT.TTree ) :
+
+            if isinstance ( target , ROOT.TChain ) :
+                raise TypeError ( "Weight.add_to: can't add branch to TChain, process the trees one-by-one" ) 
+            
+            from ostap.trees.evaluator import evaluator
+            ev     = evaluator ( target , columns )
+            blocks = [ b.values for b in ev.blocks ( target , chunk = chunk ) ]
+            arrays = dict ( [ ( c , numpy.concatenate ( [ b [ i ] for b in blocks ] ) if blocks else numpy.empty ( 0 ) )
+                              for i , c in enumerate ( ev.columns ) ] )
+            del blocks 
+            weights = numpy.ascontiguousarray ( self.evaluate ( arrays ) , dtype = numpy.float64 )
+            
+            n = len ( weights )
+            if n != Ostap.DataFill.add_branch ( target , name , weights , n ) :
+                raise TypeError ( "Weight.add_to: unable to add branch '%s' to %s" % ( name , target.GetName() ) )
+            
+            tdir = target.GetDirectory()
+            if tdir and tdir.IsWritable() :
+                with ROOTCWD () : 
+                    tdir.cd ()
+                    target.Write ( '' , ROOT.TObject.kOverwrite )
+                    
+        else :
+            raise TypeError ( "Weight.add_to: invalid target %s" % type ( target ) )
+
+        return weights
+
+# =============================================================================
+## build the statistics counter from the array of values 
+def _stat_ ( values ) :
+    """Build the statistics counter from the array of values"""
+    return SE ( len ( values )                  ,
+                float ( values.sum ()          ) ,
+                float ( ( values * values ).sum () ) ,
+                float ( values.min ()          ) ,
+                float ( values.max ()          ) )
+
+# =============================================================================
+## get the float value of VE/number 
+def _value_ ( w ) :
+    """Get the float value of VE/number"""
+    return w.value() if hasattr ( w , 'value' ) else float ( w ) 
+
+# =============================================================================
+## vectorized evaluation of 1D-histogram:
+#  linear interpolation between bin centers, constant in the edge half-bins,
+#  zero outside the histogram range
+#  (the default interpolation scheme for 1D-histograms) 
+def _h1_vectorized_ ( h1 ) :
+    """Vectorized evaluation of 1D-histogram:
+    linear interpolation between bin centers, constant in the edge half-bins,
+    zero outside the histogram range
+    (the default interpolation scheme for 1D-histograms) 
+    """
+    import numpy
+    ax      = h1.GetXaxis () 
+    nx      = ax.GetNbins () 
+    centers = numpy.array ( [ ax.GetBinCenter ( i )  for i in range ( 1 , nx + 1 ) ] , dtype = numpy.float64 )
+    values  = numpy.array ( [ h1.GetBinContent ( i ) for i in range ( 1 , nx + 1 ) ] , dtype = numpy.float64 )
+    xmin , xmax = ax.GetXmin () , ax.GetXmax ()
+    def _evaluate_ ( x ) :
+        result = numpy.interp ( x , centers , values )
+        result [ ( x < xmin ) | ( xmax < x ) ] = 0.0
+        return result
+    return _evaluate_
+
+# =============================================================================
+## get indices and fractions for the linear interpolation along the axis 
+def _linear_ ( centers , x ) :
+    """Get indices and fractions for the linear interpolation along the axis"""
+    import numpy
+    n  = len ( centers ) 
+    xc = numpy.clip ( x , centers [ 0 ] , centers [ -1 ] )
+    i0 = numpy.clip ( numpy.searchsorted ( centers , xc , 'right' ) - 1 , 0 , n - 1 )
+    i1 = numpy.minimum ( i0 + 1 , n - 1 )
+    dx = centers [ i1 ] - centers [ i0 ]
+    t  = numpy.where ( 0 < dx , ( xc - centers [ i0 ] ) / numpy.where ( 0 < dx , dx , 1.0 ) , 0.0 )
+    return i0 , i1 , t
+    
+# =============================================================================
+## vectorized evaluation of 2D-histogram:
+#  bilinear interpolation between bin centers, constant in the edge half-bins,
+#  zero outside the histogram range
+#  (the default interpolation scheme for 2D-histograms) 
+def _h2_vectorized_ ( h2 ) :
+    """Vectorized evaluation of 2D-histogram:
+    bilinear interpolation between bin centers, constant in the edge half-bins,
+    zero outside the histogram range
+    (the default interpolation scheme for 2D-histograms) 
+    """
+    import numpy
+    ax , ay = h2.GetXaxis () , h2.GetYaxis ()
+    nx , ny = ax.GetNbins () , ay.GetNbins ()
+    cx      = numpy.array ( [ ax.GetBinCenter ( i ) for i in range ( 1 , nx + 1 ) ] , dtype = numpy.float64 )
+    cy      = numpy.array ( [ ay.GetBinCenter ( j ) for j in range ( 1 , ny + 1 ) ] , dtype = numpy.float64 )
+    values  = numpy.array ( [ [ h2.GetBinContent ( i , j ) for j in range ( 1 , ny + 1 ) ]
+                              for i in range ( 1 , nx + 1 ) ] , dtype = numpy.float64 )
+    xmin , xmax = ax.GetXmin () , ax.GetXmax ()
+    ymin , ymax = ay.GetXmin () , ay.GetXmax ()
+    def _evaluate_ ( x , y ) :
+        ix0 , ix1 , tx = _linear_ ( cx , x )
+        iy0 , iy1 , ty = _linear_ ( cy , y )
+        result = ( ( 1 - tx ) * ( 1 - ty ) * values [ ix0 , iy0 ] +
+                   (     tx ) * ( 1 - ty ) * values [ ix1 , iy0 ] +
+                   ( 1 - tx ) * (     ty ) * values [ ix0 , iy1 ] +
+                   (     tx ) * (     ty ) * values [ ix1 , iy1 ] )
+        result [ ( x < xmin ) | ( xmax < x ) | ( y < ymin ) | ( ymax < y ) ] = 0.0
+        return result
+    return _evaluate_
+
+# =============================================================================
+## get the vectorized version of the weighting function
+#  - 1D and 2D histograms: vectorized interpolation
+#  - other functions: the function is called for each entry 
+def _vectorized_ ( func ) :
+    """Get the vectorized version of the weighting function
+    - 1D and 2D histograms: vectorized interpolation
+    - other functions: the function is called for each entry 
+    """
+    import numpy
+    if   isinstance ( func , ROOT.TH3 ) : vf = None 
+    elif isinstance ( func , ROOT.TH2 ) : vf = _h2_vectorized_ ( func )
+    elif isinstance ( func , ROOT.TH1 ) : vf = _h1_vectorized_ ( func )
+    else                                : vf = None
+    
+    if vf is None :
+        def vf ( *args ) :
+            return numpy.fromiter ( ( _value_ ( func ( *a ) ) for a in zip ( *args ) ) ,
+                                    dtype = numpy.float64 , count = len ( args [ 0 ] ) )
+
+    return vf
+
 # =============================================================================
 ## make one re-weighting iteration 
 #  and reweight "MC"-data set to looks as "data"(reference) dataset
@@ -290,12 +565,15 @@ def makeWeights  ( dataset                 ,
         if save and database and address :
             with DBASE.open ( database ) as db :
 
-                db[address] = db.get( address , [] ) + [ w ]
+                ## NB: only the new object is written to the history 
+                db.append ( address , w )
+                ## ... and the merged product is kept under the address itself
+                db [ address ] = _merged_ ( db.history ( address ) )
                 
                 if debug :
                     addr        = address + ':REWEIGHTING'
                     entry       = ( hdata0 , hmc0 , hdata , hmc , w ) 
-                    db [ addr ] = db.get ( addr , [] ) + [ entry ]
+                    db.append ( addr , entry )
                     
         ## 
         more = more or save
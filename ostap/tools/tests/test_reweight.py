@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for ostap/tools/reweight.py
+- vectorized weights versus the per-event Weight, including the bin edges
+  and the points outside the histogram range
+- the new variable/branch for RooDataSet/TTree via Ostap::DataFill
+"""
+# =============================================================================
+import ROOT, os, array, random, tempfile
+import ostap.histos.histos
+import ostap.io.zipshelve      as     DBASE
+from   ostap.core.core         import Ostap, hID, dsID
+from   ostap.tools.reweight    import Weight
+from   ostap.trees.evaluator   import has_numpy
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_reweight' )
+else                       : logger = getLogger ( __name__        )
+# =============================================================================
+## simple ``event''
+class Event(object) :
+    def __init__ ( self , x , y ) :
+        self.x = x
+        self.y = y
+
+## make the database with weights: the history of 1D-histograms and 2D-histogram
+def make_weights ( dbname ) :
+    with DBASE.open ( dbname , 'c' ) as db :
+        for i in range ( 2 ) :
+            h1 = ROOT.TH1D ( hID () , 'x-weights' , 10 , 0 , 10 )
+            for b in range ( 1 , 11 ) : h1.SetBinContent ( b , random.uniform ( 0.5 , 1.5 ) )
+            db.append ( 'x-data' , h1 )
+        h2 = ROOT.TH2D ( hID () , 'xy-weights' , 5 , 0 , 10 , 4 , -2 , 2 )
+        for i in range ( 1 , 6 ) :
+            for j in range ( 1 , 5 ) : h2.SetBinContent ( i , j , random.uniform ( 0.5 , 1.5 ) )
+        db.append ( 'xy-data' , h2 )
+
+## the test points: random, bin edges, bin centers, outside the range
+def make_points () :
+    points  = [ ( random.uniform ( -1 , 11 ) , random.uniform ( -3 , 3 ) ) for i in range ( 1000 ) ]
+    points += [ ( float ( x ) , y ) for x in range ( -1 , 12 ) for y in ( -2.5 , -2 , -1 , 0 , 1 , 2 , 2.5 ) ]
+    points += [ ( x + 0.5     , y ) for x in range ( 0 , 10  ) for y in ( -1.5 , -0.5 , 0.5 , 1.5 ) ]
+    return points
+
+# =============================================================================
+def test_reweight_vectorized () :
+
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+    import numpy
+
+    random.seed ( 12345 )
+    dbname = tempfile.mktemp ( suffix = '.db' )
+    make_weights ( dbname )
+
+    points = make_points ()
+    xs     = numpy.array ( [ p [ 0 ] for p in points ] )
+    ys     = numpy.array ( [ p [ 1 ] for p in points ] )
+
+    for factors in ( [ ( 'x' , 'x-data' ) ] ,
+                     [ ( ( 'x' , 'y' ) , 'xy-data' ) ] ,
+                     [ ( 'x' , 'x-data' ) , ( ( 'x' , 'y' ) , 'xy-data' ) ] ,
+                     [ ( 'x' , 'x-data' , False ) ] ) :
+
+        weighter = Weight ( dbname , factors )
+        expected = numpy.array ( [ weighter ( Event ( x , y ) ) for x , y in points ] )
+        weights  = weighter.evaluate ( { 'x' : xs , 'y' : ys } )
+
+        bad = [ p for p , w , e in zip ( points , weights , expected ) if abs ( w - e ) > 1.e-9 * max ( 1 , abs ( e ) ) ]
+        assert not bad , 'Vectorized weights differ for %s at %s' % ( factors , bad [ : 5 ] )
+        assert 0 < numpy.count_nonzero ( 0 == expected ) , 'No points outside the histogram range!'
+
+    if os.path.exists ( dbname ) : os.remove ( dbname )
+
+# =============================================================================
+def test_reweight_add_to () :
+
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+    import numpy
+
+    random.seed ( 54321 )
+    dbname = tempfile.mktemp ( suffix = '.db' )
+    make_weights ( dbname )
+
+    points   = make_points ()
+    factors  = [ ( 'x' , 'x-data' ) , ( ( 'x' , 'y' ) , 'xy-data' ) ]
+    weighter = Weight ( dbname , factors )
+    expected = numpy.array ( [ weighter ( Event ( x , y ) ) for x , y in points ] )
+
+    ## RooDataSet: get_column & add_column
+    vx   = ROOT.RooRealVar ( 'x' , 'x' , -100 , 100 )
+    vy   = ROOT.RooRealVar ( 'y' , 'y' , -100 , 100 )
+    args = ROOT.RooArgSet  ( vx , vy )
+    data = ROOT.RooDataSet ( dsID () , 'data' , args )
+    for x , y in points :
+        vx.setVal ( x )
+        vy.setVal ( y )
+        data.add ( args )
+
+    n      = len ( data )
+    column = numpy.empty ( n , dtype = numpy.float64 )
+    assert n == Ostap.DataFill.get_column ( data , 'y' , column , n ) , 'Unable to get column!'
+    assert all ( [ c == p [ 1 ] for c , p in zip ( column , points ) ] ) , 'Invalid column!'
+
+    weights = Weight ( dbname , factors ).add_to ( data , 'weight' )
+    assert numpy.allclose ( weights , expected , rtol = 1.e-9 ) , 'Invalid weights for RooDataSet!'
+    for i in range ( n ) :
+        assert abs ( data.get ( i ).getRealValue ( 'weight' ) - expected [ i ] ) <= 1.e-9 , 'Invalid variable for entry %d' % i
+
+    ## TTree: add_branch
+    fname = tempfile.mktemp ( suffix = '.root' )
+    tfile = ROOT.TFile ( fname , 'RECREATE' )
+    tfile.cd ()
+    tree  = ROOT.TTree ( 'T' , 'Test tree' )
+    x     = array.array ( 'd' , [ 0 ] )
+    y     = array.array ( 'd' , [ 0 ] )
+    tree.Branch ( 'x' , x , 'x/D' )
+    tree.Branch ( 'y' , y , 'y/D' )
+    for p in points :
+        x [ 0 ] , y [ 0 ] = p
+        tree.Fill ()
+    weights = Weight ( dbname , factors ).add_to ( tree , 'weight' , chunk = 300 )
+    assert numpy.allclose ( weights , expected , rtol = 1.e-9 ) , 'Invalid weights for TTree!'
+    for i in range ( tree.GetEntries () ) :
+        tree.GetEntry ( i )
+        assert abs ( tree.weight - expected [ i ] ) <= 1.e-9 , 'Invalid branch for entry %d' % i
+    tfile.Close ()
+    os.remove ( fname )
+
+    ## only RooDataSet is supported
+    hdata = ROOT.RooDataHist ( dsID () , 'binned' , args , data )
+    try :
+        Weight ( dbname , factors ).add_to ( hdata , 'weight' )
+        assert False , 'TypeError is not raised for RooDataHist!'
+    except TypeError :
+        pass
+
+    if os.path.exists ( dbname ) : os.remove ( dbname )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_reweight_vectorized ()  ## vectorized weights versus per-event weights
+    test_reweight_add_to     ()  ## new variable/branch via Ostap::DataFill
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for ostap/tools/tmva.py
+- batch evaluation of TMVA versus the per-entry Reader
+- the new branch/variable for TTree/RooDataSet
+"""
+# =============================================================================
+import ROOT, os, array, random, tempfile, shutil
+from   ostap.core.core      import Ostap, dsID
+from   ostap.tools.tmva     import Trainer, Reader
+from   ostap.trees.evaluator import has_numpy
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_tmva' )
+else                       : logger = getLogger ( __name__    )
+# =============================================================================
+## make the test tree
+def make_tree ( name , mean , entries = 2000 ) :
+    tree = ROOT.TTree ( name , 'Test tree' )
+    x    = array.array ( 'f' , [ 0 ] )
+    y    = array.array ( 'f' , [ 0 ] )
+    tree.Branch ( 'x' , x , 'x/F' )
+    tree.Branch ( 'y' , y , 'y/F' )
+    for i in range ( entries ) :
+        x [ 0 ] = random.gauss ( mean , 1 )
+        y [ 0 ] = random.gauss ( mean , 2 )
+        tree.Fill ()
+    return tree
+
+# =============================================================================
+def test_tmva_batch () :
+
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+    import numpy
+
+    random.seed ( 12345 )
+
+    cwd    = os.getcwd ()
+    tmpdir = tempfile.mkdtemp ()
+    os.chdir ( tmpdir )
+    try :
+
+        ROOT.gROOT.cd ()
+        signal     = make_tree ( 'S' ,  1 )
+        background = make_tree ( 'B' , -1 )
+
+        trainer = Trainer ( methods = [ ( ROOT.TMVA.Types.kFisher , 'Fisher' , 'H:!V:Fisher' ) ] , verbose = False )
+        weights = trainer.train ( [ 'x' , 'y' ] , signal , background , outputfile = 'TMVA_test.root' )
+        reader  = Reader ( 'Fisher' , [ 'x' , ( 'y' , lambda s : s.y ) ] , weights )
+
+        ## per-entry evaluation
+        xs , ys , expected = [] , [] , []
+        for i in range ( signal.GetEntries () ) :
+            signal.GetEntry ( i )
+            xs.append ( signal.x )
+            ys.append ( signal.y )
+            expected.append ( reader ( signal ) )
+        expected = numpy.array ( expected )
+
+        ## batch evaluation
+        for nthreads in ( 1 , 4 ) :
+            response = reader.evaluate ( { 'x' : xs , 'y' : ys } , nthreads = nthreads )
+            assert numpy.allclose ( response , expected , rtol = 1.e-6 , atol = 1.e-9 ) , \
+                   'Batch evaluation differs from Reader (nthreads=%d)' % nthreads
+            assert not getattr ( Ostap.TMVAEval.evaluate , '_threaded' , False ) , 'GIL release is not restored!'
+
+        ## add the new branch to TTree
+        tfile = ROOT.TFile ( 'tree.root' , 'RECREATE' )
+        tfile.cd ()
+        tree  = signal.CloneTree ( -1 )
+        response = reader.add_to ( tree , 'fisher' , nthreads = 2 , chunk = 500 )
+        assert numpy.allclose ( response , expected , rtol = 1.e-6 , atol = 1.e-9 ) , 'Invalid response for TTree!'
+        for i in range ( tree.GetEntries () ) :
+            tree.GetEntry ( i )
+            assert abs ( tree.fisher - expected [ i ] ) <= 1.e-6 * max ( 1 , abs ( expected [ i ] ) ) , \
+                   'Invalid branch value for entry %d' % i
+        tfile.Close ()
+
+        ## add the new variable to RooDataSet
+        vx   = ROOT.RooRealVar ( 'x' , 'x' , -100 , 100 )
+        vy   = ROOT.RooRealVar ( 'y' , 'y' , -100 , 100 )
+        args = ROOT.RooArgSet  ( vx , vy )
+        data = ROOT.RooDataSet ( dsID () , 'data' , args )
+        for x , y in zip ( xs , ys ) :
+            vx.setVal ( x )
+            vy.setVal ( y )
+            data.add ( args )
+        response = reader.add_to ( data , 'fisher' )
+        assert numpy.allclose ( response , expected , rtol = 1.e-6 , atol = 1.e-9 ) , 'Invalid response for RooDataSet!'
+        for i in range ( len ( data ) ) :
+            value = data.get ( i ).getRealValue ( 'fisher' )
+            assert abs ( value - expected [ i ] ) <= 1.e-6 * max ( 1 , abs ( expected [ i ] ) ) , \
+                   'Invalid variable value for entry %d' % i
+
+    finally :
+        os.chdir ( cwd )
+        shutil.rmtree ( tmpdir )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_tmva_batch ()  ## batch evaluation versus Reader
+
+# =============================================================================
+# The END
+# =============================================================================
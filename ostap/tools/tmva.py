@@ -318,7 +318,18 @@ class Trainer(object):
 #      )
 #  
 #  @endcode
+#
+#  For large samples use the batch evaluation:
+#  the columns are processed in blocks in C++, optionally in several threads 
+#  (each thread uses its own TMVA::Reader)
+#  @code
+#
+#  response = r.evaluate ( { 'pt' : pt_array , 'ip' : ip_array , ... } , nthreads = 4 )
+#  response = r.add_to   ( tree , 'mlp' , nthreads = 4 ) ## add new branch to TTree 
+#
+#  @endcode
 #  @see TMVA::Reader
+#  @see Ostap::TMVAEval
 #  @date   2013-10-02
 #  @author Vanya  BELYAEV Ivan.Belyaev@itep.ru
 #  - thanks to Alexander BARANOV
@@ -338,14 +349,21 @@ class Reader(object)  :
     #       ] ,
     #       weights_file = 'my_weights.xml'
     #      )
+    For large samples use the batch evaluation:
+    the columns are processed in blocks in C++, optionally in several threads 
+    (each thread uses its own TMVA::Reader)
+    >>> response = r.evaluate ( { 'pt' : pt_array , 'ip' : ip_array , ... } , nthreads = 4 )
+    >>> response = r.add_to   ( tree , 'mlp' , nthreads = 4 ) ## add new branch to TTree 
     """
     def __init__ ( self         ,
                    name         , 
                    variables    ,
                    weights_file ) :
         
-        self.reader = ROOT.TMVA.Reader()
-        self.name   = name
+        self.reader       = ROOT.TMVA.Reader()
+        self.name         = name
+        self.weights_file = weights_file
+        self._pool        = [] ## additional readers for the batch evaluation 
 
         ##  book the variables:
         #   dirty trick with arrays is needed due to a bit strange reader interface.
@@ -359,7 +377,7 @@ class Reader(object)  :
             if   isinstance ( v , str ) :
                 
                 vname  = v
-                fvun   = lambda s : getattr ( s , vname )
+                vfun   = lambda s , n = vname : getattr ( s , n )
                 vfield = array ( 'f' , [1] )                  ## NB: note the type 
                 
             elif isinstance ( v , tuple ) and 2 == len ( v ) :
@@ -404,6 +422,166 @@ class Reader(object)  :
         ## evaluate TMVA 
         return self.reader.EvaluateMVA( self.name ) 
 
+    @property
+    def variables ( self ) :
+        """``variables'' : the names of variables (the columns for the batch evaluation)"""
+        return tuple ( [ v[0] for v in self._variables ] )
+
+    # =========================================================================
+    ## get n readers for the batch evaluation: the main one and (n-1) additional
+    #  (booked on demand and kept for the next calls) 
+    def _readers ( self , n ) :
+        """Get n readers for the batch evaluation: the main one and (n-1) additional
+        (booked on demand and kept for the next calls)
+        """
+        from array import array
+        while len ( self._pool ) < n - 1 :
+            reader = ROOT.TMVA.Reader( '!Color:Silent' )
+            fields = []
+            for v in self._variables :
+                fields.append ( array ( 'f' , [1] ) ) 
+                reader.AddVariable ( v[0] , fields [ -1 ] )
+            reader.BookMVA ( self.name , self.weights_file )
+            ##                  reader   addresses 
+            self._pool.append ( ( reader , fields ) )
+        return [ self.reader ] + [ r[0] for r in self._pool [ : n - 1 ] ]
+
+    # =========================================================================
+    ## batch evaluation of TMVA for the columnar data
+    #  - the loop over entries is performed in C++ 
+    #  - the rows are split between <code>nthreads</code> threads,
+    #    each thread uses its own <code>TMVA::Reader</code>
+    #  @code
+    #  r = Reader ( ... )
+    #  response = r.evaluate ( { 'pt' : pt_array , 'ip' : ip_array } , nthreads = 4 )
+    #  response = r.evaluate ( [ pt_array , ip_array ] )   ## in the order of variables 
+    #  @endcode
+    #  @param arrays   the dictionary name->array or the list of arrays (in the order of variables)
+    #  @param nthreads the number of threads 
+    #  @return numpy array with TMVA response
+    #  @see Ostap::TMVAEval::evaluate
+    def evaluate ( self , arrays , nthreads = 1 ) :
+        """Batch evaluation of TMVA for the columnar data
+        - the loop over entries is performed in C++ 
+        - the rows are split between `nthreads` threads,
+        each thread uses its own TMVA::Reader
+        >>> r = Reader ( ... )
+        >>> response = r.evaluate ( { 'pt' : pt_array , 'ip' : ip_array } , nthreads = 4 )
+        >>> response = r.evaluate ( [ pt_array , ip_array ] )   ## in the order of variables 
+        """
+        import numpy
+        from ostap.core.core import Ostap
+
+        if isinstance ( arrays , dict ) : arrays = [ arrays [ v ] for v in self.variables ]
+        if len ( arrays ) != len ( self._variables ) :
+            raise AttributeError ( "Reader(%s): invalid number of columns %d/%d" % ( self.name , len ( arrays ) , len ( self._variables ) ) )
+        
+        ## the matrix: one row per variable 
+        values = numpy.vstack ( [ numpy.asarray ( a , dtype = numpy.float64 ) for a in arrays ] )
+        ncols , nrows = values.shape
+        if 0 == nrows : return numpy.empty ( 0 , dtype = numpy.float64 )
+
+        nthreads = max ( 1 , min ( int ( nthreads ) , nrows ) )
+        readers  = self._readers ( nthreads )
+        bounds   = [ ( nrows * i ) // nthreads for i in range ( nthreads + 1 ) ]
+        results  = [ None ] * nthreads
+        
+        def _evaluate_ ( i ) :
+            block  = numpy.ascontiguousarray ( values [ : , bounds [ i ] : bounds [ i + 1 ] ] )
+            n      = block.shape [ 1 ] 
+            result = numpy.empty ( n , dtype = numpy.float64 )
+            if n != Ostap.TMVAEval.evaluate ( readers [ i ] , self.name , block , ncols , n , result ) :
+                raise TypeError ( "Reader(%s): batch evaluation failed" % self.name ) 
+            results [ i ] = result 
+
+        if 1 == nthreads : _evaluate_ ( 0 )
+        else :
+            import threading
+            ROOT.ROOT.EnableThreadSafety ()
+            errors  = []
+            def _run_ ( i ) :
+                try                  : _evaluate_ ( i )
+                except Exception , e : errors.append ( e )
+            threads = [ threading.Thread ( target = _run_ , args = ( i , ) ) for i in range ( nthreads ) ]
+            ## release GIL for the loop in C++ (only for the threaded evaluation)
+            threaded = getattr ( Ostap.TMVAEval.evaluate , '_threaded' , False )
+            Ostap.TMVAEval.evaluate._threaded = True
+            try :
+                for t in threads : t.start ()
+                for t in threads : t.join  ()
+            finally :
+                Ostap.TMVAEval.evaluate._threaded = threaded 
+            if errors : raise errors [ 0 ]
+            
+        return numpy.concatenate ( results )
+
+    # =========================================================================
+    ## add TMVA response as the new branch to TTree or the new variable to RooDataSet
+    #  - the columns are read in bulk (the variable names are used as the expressions)
+    #  - the response is calculated by <code>evaluate</code>
+    #  @code
+    #  r = Reader ( ... )
+    #  r.add_to ( dataset , 'mlp' )
+    #  r.add_to ( tree    , 'mlp' , nthreads = 4 ) ## the tree must be in the writable file 
+    #  @endcode
+    #  @param target   TTree or RooDataSet
+    #  @param name     the name of the new branch/variable
+    #  @param nthreads the number of threads 
+    #  @param chunk    the number of entries to read in one block (for TTree)
+    #  @return the numpy array with TMVA response
+    def add_to ( self , target , name , nthreads = 1 , chunk = 1000000 ) :
+        """Add TMVA response as the new branch to TTree or the new variable to RooDataSet
+        - the columns are read in bulk (the variable names are used as the expressions)
+        - the response is calculated by `evaluate`
+        >>> r = Reader ( ... )
+        >>> r.add_to ( dataset , 'mlp' )
+        >>> r.add_to ( tree    , 'mlp' , nthreads = 4 ) ## the tree must be in the writable file 
+        """
+        import numpy
+        from ostap.core.core import Ostap, ROOTCWD
+
+        if   isinstance ( target , ROOT.RooDataSet ) :
+
+            n      = len ( target ) 
+            arrays = []
+            for c in self.variables :
+                a = numpy.empty ( n , dtype = numpy.float64 )
+                if n != Ostap.DataFill.get_column ( target , c , a , n ) :
+                    raise TypeError ( "Reader(%s): unable to get column '%s' from %s" % ( self.name , c , target.GetName() ) )
+                arrays.append ( a ) 
+            response = self.evaluate ( arrays , nthreads = nthreads )
+            
+            rmin , rmax = ( response.min () , response.max () ) if n else ( -1 , 1 )
+            var = ROOT.RooRealVar ( name , 'TMVA(%s)' % self.name , min ( -1 , rmin ) , max ( 1 , rmax ) )
+            if n != Ostap.DataFill.add_column ( target , var , response , n ) :
+                raise TypeError ( "Reader(%s): unable to add variable '%s' to %s" % ( self.name , name , target.GetName() ) )
+
+        elif isinstance ( target , ROOT.TTree ) :
+
+            if isinstance ( target , ROOT.TChain ) :
+                raise TypeError ( "Reader(%s): can't add branch to TChain, process the trees one-by-one" % self.name ) 
+
+            from ostap.trees.evaluator import evaluator
+            ev       = evaluator ( target , self.variables )
+            blocks   = [ self.evaluate ( b.values , nthreads = nthreads ) for b in ev.blocks ( target , chunk = chunk ) ]
+            response = numpy.concatenate ( blocks ) if blocks else numpy.empty ( 0 , dtype = numpy.float64 )
+            del blocks
+            
+            n = len ( response )
+            if n != Ostap.DataFill.add_branch ( target , name , response , n ) :
+                raise TypeError ( "Reader(%s): unable to add branch '%s' to %s" % ( self.name , name , target.GetName() ) )
+
+            tdir = target.GetDirectory()
+            if tdir and tdir.IsWritable() :
+                with ROOTCWD () : 
+                    tdir.cd ()
+                    target.Write ( '' , ROOT.TObject.kOverwrite )
+                    
+        else :
+            raise TypeError ( "Reader(%s): invalid target %s" % ( self.name , type ( target ) ) )
+
+        return response
+
 # =============================================================================
 ## start TMVA gui 
 def tmvaGUI ( filename , new_canvas = True ) :
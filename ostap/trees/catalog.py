@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file catalog.py
+#
+#  Catalog of ROOT-files: the number of entries in the trees for each file
+#  - the files are validated in parallel (thread pool), each file is opened
+#    only once for all requested trees
+#  - the metadata (path, size, mtime -> entries in the trees) can be persistent
+#    in the local database, the known and unmodified files are not reopened
+#
+#  @code
+#
+#  >>> catalog = Catalog ( '$HOME/catalog.msql' ) ## use the persistent database
+#  >>> for fname , entries in catalog.entries ( files , [ 'Bc/MyTree' , 'Bc/Lumi' ] , nthreads = 8 ) :
+#  ...     print fname , entries [ 'Bc/MyTree' ]
+#
+#  @endcode
+#
+#  The catalog is persistent only if the database is specified, e.g.
+#  via the environment variable <code>OSTAP_FILES_CATALOG</code>
+#
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Catalog of ROOT-files: the number of entries in the trees for each file
+- the files are validated in parallel (thread pool), each file is opened
+  only once for all requested trees
+- the metadata (path, size, mtime -> entries in the trees) can be persistent
+  in the local database, the known and unmodified files are not reopened
+
+>>> catalog = Catalog ( '$HOME/catalog.msql' ) ## use the persistent database
+>>> for fname , entries in catalog.entries ( files , [ 'Bc/MyTree' , 'Bc/Lumi' ] , nthreads = 8 ) :
+...     print fname , entries [ 'Bc/MyTree' ]
+
+The catalog is persistent only if the database is specified, e.g.
+via the environment variable OSTAP_FILES_CATALOG
+"""
+# =============================================================================
+__version__ = "$Revision$"
+__author__  = "Vanya BELYAEV Ivan.Belyaev@itep.ru"
+__date__    = "2018-05-20"
+__all__     = (
+    'Catalog'         , ## catalog of ROOT-files
+    'DEFAULT_CATALOG' , ## the name of default database
+    )
+# =============================================================================
+import ROOT, os
+# =============================================================================
+# logging
+# =============================================================================
+from   ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'ostap.trees.catalog' )
+else                       : logger = getLogger ( __name__     )
+# =============================================================================
+## the default database for the catalog (no persistent catalog if not specified)
+DEFAULT_CATALOG = os.environ.get ( 'OSTAP_FILES_CATALOG' , None )
+# =============================================================================
+## the key and the signature of the (local) file: ( path , size , mtime )
+#  @return None for non-local files
+def _signature_ ( fname ) :
+    """The key and the signature of the (local) file: ( path , size , mtime )
+    - return None for non-local files
+    """
+    if not os.path.isfile ( fname ) : return None
+    st = os.stat ( fname )
+    return os.path.abspath ( fname ) , st.st_size , st.st_mtime
+
+# =============================================================================
+## open the file (only once) and get the number of entries for all trees
+#  @return dictionary { tree : entries } , missing trees have zero entries,
+#          <code>None</code> if the file can't be opened 
+def _validate_ ( fname , trees ) :
+    """Open the file (only once) and get the number of entries for all trees
+    - return dictionary { tree : entries } , missing trees have zero entries,
+    None if the file can't be opened 
+    """
+    result = dict ( [ ( t , 0 ) for t in trees ] )
+    rfile  = ROOT.TFile.Open ( fname , 'READ' )
+    if not rfile : return None
+    try :
+        if rfile.IsZombie () : return None
+        for t in trees :
+            obj = rfile.Get ( t )
+            if obj and isinstance ( obj , ROOT.TTree ) : result [ t ] = obj.GetEntries ()
+    finally :
+        rfile.Close ()
+    return result
+
+# =============================================================================
+## validate the files in the thread pool
+#  - the GIL is released in <code>TFile::Open</code> only while the pool is running
+#  @return the list of { tree : entries } in the order of files
+def _validate_all_ ( files , trees , nthreads ) :
+    """Validate the files in the thread pool
+    - the GIL is released in TFile::Open only while the pool is running
+    - return the list of { tree : entries } in the order of files
+    """
+    from multiprocessing.pool import ThreadPool
+    ROOT.ROOT.EnableThreadSafety ()
+    threaded = getattr ( ROOT.TFile.Open , '_threaded' , False ) 
+    ROOT.TFile.Open._threaded = True
+    pool = ThreadPool ( nthreads )
+    try :
+        return pool.map ( lambda f : _validate_ ( f , trees ) , files )
+    finally :
+        pool.close ()
+        pool.join  () 
+        ROOT.TFile.Open._threaded = threaded 
+        
+# =============================================================================
+## @class Catalog
+#  Catalog of ROOT-files: the number of entries in the trees for each file
+#  - the files are validated in parallel (thread pool), each file is opened
+#    only once for all requested trees
+#  - the metadata (path, size, mtime -> entries in the trees) can be persistent
+#    in the local database, the known and unmodified files are not reopened
+#  - the files that can't be opened are not recorded: they are retried next time 
+#  @code
+#  >>> catalog = Catalog ( '$HOME/catalog.msql' ) ## use the persistent database
+#  >>> for fname , entries in catalog.entries ( files , [ 'Bc/MyTree' , 'Bc/Lumi' ] , nthreads = 8 ) :
+#  ...     print fname , entries [ 'Bc/MyTree' ]
+#  @endcode
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+class Catalog(object) :
+    """Catalog of ROOT-files: the number of entries in the trees for each file
+    - the files are validated in parallel (thread pool), each file is opened
+    only once for all requested trees
+    - the metadata (path, size, mtime -> entries in the trees) can be persistent
+    in the local database, the known and unmodified files are not reopened
+    - the files that can't be opened are not recorded: they are retried next time 
+    >>> catalog = Catalog ( '$HOME/catalog.msql' ) ## use the persistent database
+    >>> for fname , entries in catalog.entries ( files , [ 'Bc/MyTree' , 'Bc/Lumi' ] , nthreads = 8 ) :
+    ...     print fname , entries [ 'Bc/MyTree' ]
+    """
+    def __init__ ( self , dbname = DEFAULT_CATALOG ) :
+
+        self.__dbname = os.path.expanduser ( os.path.expandvars ( dbname ) ) if dbname else None
+
+    @property
+    def dbname ( self ) :
+        """``dbname'' : the name of the database (None for non-persistent catalog)"""
+        return self.__dbname
+
+    ## open the database, None if not possible
+    def __open ( self ) :
+        if not self.__dbname : return None
+        try :
+            dirname = os.path.dirname ( self.__dbname )
+            if dirname and not os.path.exists ( dirname ) : os.makedirs ( dirname )
+            import ostap.io.sqliteshelve as sqliteshelve
+            return sqliteshelve.open ( self.__dbname , 'c' )
+        except Exception , e :
+            logger.warning ( "Catalog: unable to open database '%s': %s" % ( self.__dbname , e ) )
+        return None
+
+    # =========================================================================
+    ## get the number of entries in the trees for the files
+    #  @code
+    #  >>> for fname , entries in catalog.entries ( files , [ 'Bc/MyTree' ] , nthreads = 8 ) :
+    #  ...     print fname , entries [ 'Bc/MyTree' ]
+    #  @endcode
+    #  @param files    the list of files
+    #  @param trees    the list of trees
+    #  @param nthreads the number of threads to validate the (new/modified) files
+    #  @return the generator of pairs ( file , { tree : entries } ) in the order of files,
+    #          entries are <code>None</code> for the files that can't be opened 
+    def entries ( self , files , trees , nthreads = 8 ) :
+        """Get the number of entries in the trees for the files
+        >>> for fname , entries in catalog.entries ( files , [ 'Bc/MyTree' ] , nthreads = 8 ) :
+        ...     print fname , entries [ 'Bc/MyTree' ]
+        - return the generator of pairs ( file , { tree : entries } ) in the order of files,
+        entries are None for the files that can't be opened 
+        """
+        files = list  ( files )
+        trees = tuple ( trees )
+
+        db      = self.__open ()
+        known   = {}  ## file -> entries
+        todo    = []  ## files to be validated
+        sigs    = {}  ## file -> signature
+        for f in files :
+            sig = _signature_ ( f )
+            if sig : sigs [ f ] = sig
+            rec = db.get ( sig [ 0 ] , None ) if db is not None and sig else None
+            if rec and ( rec [ 'size' ] , rec [ 'mtime' ] ) == sig [ 1: ] and \
+                   all ( [ t in rec [ 'trees' ] for t in trees ] ) :
+                known [ f ] = dict ( [ ( t , rec [ 'trees' ] [ t ] ) for t in trees ] )
+            else :
+                todo.append ( f )
+
+        if todo and not known :
+            logger.debug ( 'Catalog: validate %d files' % len ( todo ) )
+        elif todo :
+            logger.debug ( 'Catalog: validate %d files, %d files are known' % ( len ( todo ) , len ( known ) ) )
+
+        nthreads = max ( 1 , min ( int ( nthreads ) , len ( todo ) ) )
+        if 1 < nthreads : validated = iter ( _validate_all_ ( todo , trees , nthreads ) ) 
+        else            : validated = ( _validate_ ( f , trees ) for f in todo )
+
+        updates = []
+        try :
+            for f in files :
+                entries = known.get ( f , None )
+                if entries is None :
+                    entries = next ( validated )
+                    sig     = sigs.get ( f , None )
+                    ## NB: the failed open (e.g. transient problem) is not recorded 
+                    if sig and entries is not None :
+                        rec = db.get ( sig [ 0 ] , None ) if db is not None else None
+                        ## keep the entries for other trees, if file is not modified
+                        old = rec [ 'trees' ] if rec and ( rec [ 'size' ] , rec [ 'mtime' ] ) == sig [ 1: ] else {}
+                        old.update ( entries )
+                        updates.append ( ( sig [ 0 ] , { 'size' : sig [ 1 ] , 'mtime' : sig [ 2 ] , 'trees' : old } ) )
+                yield f , entries
+        finally :
+            if db is not None :
+                if updates : db.update ( updates )
+                db.close ()
+
+    # =========================================================================
+    ## remove the records for the non-existing files from the database
+    #  @return number of removed records
+    def purge ( self ) :
+        """Remove the records for the non-existing files from the database
+        - return number of removed records
+        """
+        db = self.__open ()
+        if db is None : return 0
+        removed = [ k for k in db.keys () if not os.path.isfile ( k ) ]
+        for k in removed : del db [ k ]
+        db.close ()
+        return len ( removed )
+
+    def __repr__ ( self ) : return "Catalog('%s')" % self.__dbname
+    __str__ = __repr__
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+# The END
+# =============================================================================
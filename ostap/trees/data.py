@@ -14,6 +14,11 @@
 #  >>> flist = data.files 
 #
 #  @endcode
+#
+#  The files are validated in parallel (each file is opened once for all trees)
+#  and the number of entries can be kept in the persistent catalog:
+#  the known and unmodified files are not reopened in the next sessions 
+#  @see ostap.trees.catalog.Catalog
 # 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @author Alexander BARANOV a.baranov@cern.ch
@@ -49,6 +54,12 @@ the original ``Ostap'' code by Alexander BARANOV
 >>> lumi  = data.lumi
 >>> print data.getLumi() 
 
+The files are validated in parallel (each file is opened once for all trees)
+and the number of entries can be kept in the persistent catalog:
+the known and unmodified files are not reopened in the next sessions 
+
+>>> data  = Data2('Bc/MyTree', 'Bc/Lumi' , '*.root' , nthreads = 16 )
+>>> data  = Data ('Bc/MyTree', '*.root' , catalog = 'catalog.msql' ) ## persistent catalog 
 """
 # =============================================================================
 __version__ = "$Revision$"
@@ -61,6 +72,7 @@ __all__     = (
     )
 # =============================================================================
 import ROOT, glob 
+from   ostap.trees.catalog import Catalog, DEFAULT_CATALOG 
 # =============================================================================
 # logging 
 # =============================================================================
@@ -104,21 +116,26 @@ class Files(object):
             logger.info ('Loading: %s  #patterns/files: %s/%d' % ( self.description ,
                                                                    len(  files )    , 
                                                                    len( _files )    ) )
-        from Ostap.progress_bar import ProgressBar 
+        _files = sorted ( _files )
+        if self.maxfiles < len ( _files ) :
+            logger.warning ('Maxfiles limit is reached %s ' % self.maxfiles )
+            _files = _files [ : self.maxfiles ]
+            
+        from ostap.utils.progress_bar import ProgressBar 
         with ProgressBar ( max_value = len(_files) , silent = self.silent ) as bar :
             self.progress = bar 
-            for f in _files : 
-                if len ( self.files ) < self.maxfiles : self.treatFile  ( f )
-                else :
-                    logger.warning ('Maxfiles limit is reached %s ' % self.maxfiles )
-                    break
+            self.treatFiles ( _files ) 
 
         if not self.silent :
             logger.info ('Loaded: %s' % self )
 
     ## 
     def globPattern ( self , pattern ) :
-        return [ f in glob.iglob ( pattern ) ]
+        return [ f for f in glob.iglob ( pattern ) ]
+        
+    ## the action for all files 
+    def treatFiles ( self , files ) :
+        for f in files : self.treatFile ( f )
         
     ## the specific action for each file 
     def treatFile ( self, the_file ) :
@@ -145,6 +162,10 @@ class Data(Files):
     >>> data  = Data('Bc/MyTree', '*.root' )
     >>> chain = data.chain
     >>> flist = data.files 
+    The files are validated in parallel (each file is opened once)
+    and the number of entries can be kept in the persistent catalog
+    >>> data  = Data('Bc/MyTree', '*.root' , nthreads = 16 )
+    >>> data  = Data('Bc/MyTree', '*.root' , catalog = 'catalog.msql' ) ## persistent catalog 
     """
     
     def __init__( self                  ,
@@ -152,32 +173,58 @@ class Data(Files):
                   files       = []      ,
                   description = ''      , 
                   maxfiles    = 1000000 ,
-                  silent      = False   ) :  
+                  silent      = False   ,
+                  nthreads    = 8       ,
+                  catalog     = DEFAULT_CATALOG ) :  
         
         self.e_list1    = set()  
         self.chain      = ROOT.TChain ( chain )
+        self.nthreads   = nthreads
+        self.catalog    = Catalog ( catalog ) 
+        self.entries    = {} ## file -> { tree : entries } 
         if not description :
             description = self.chain.GetName()
         Files.__init__( self , files , description  , maxfiles , silent )
+
+    ## the names of trees to be validated 
+    def trees ( self ) :
+        return self.chain.GetName() ,
+    
+    ## the action for all files: validate them in parallel, using the catalog
+    def treatFiles ( self , files ) :
+        """Validate all files in parallel (using the catalog) and add them to TChain
+        """
+        ## suppress Warning/Error messages from ROOT 
+        from ostap.logger.utils import rootError
+        with rootError() :
+            for f , entries in self.catalog.entries ( files , self.trees () , self.nthreads ) :
+                self.entries [ f ] = entries 
+                self.treatFile ( f )
+
+    ## add the file to the chain (if the tree is not empty) 
+    def _add_file ( self , chain , the_file , elist ) :
+        ## the file is not validated yet (e.g. direct call of treatFile) 
+        if not the_file in self.entries :
+            for f , entries in self.catalog.entries ( [ the_file ] , self.trees () , 1 ) :
+                self.entries [ f ] = entries
+        entries = self.entries [ the_file ]
+        if entries is None :
+            logger.warning("Can't open file '%s'" % the_file ) 
+            elist.add ( the_file )
+            return 
+        entries = entries.get ( chain.GetName() , 0 )
+        ## NB: the known number of entries: the file is not opened by TChain::Add 
+        if 0 < entries : chain.Add ( the_file , entries )
+        else           :
+            logger.warning("No/empty chain '%s' in file '%s'" % ( chain.GetName() , the_file ) ) 
+            elist.add ( the_file ) 
         
     ## the specific action for each file 
     def treatFile ( self, the_file ) :
         """Add the file to TChain
         """
         Files.treatFile ( self , the_file )
-        
-        ## suppress Warning/Error messages from ROOT 
-        from ostap.logger.utils import rootError
-        with rootError() :
-            
-            tmp = ROOT.TChain ( self.chain.GetName() )
-            tmp.Add ( the_file )
-        
-            ##if 0 < tmp.GetEntries() and 0 < tmp.GetEntry(0) : self.chain.Add ( the_file )
-            if 0 < tmp.GetEntries() : self.chain.Add ( the_file )
-            else                  :
-                logger.warning("No/empty chain '%s' in file '%s'" % ( self.chain.GetName() , the_file ) ) 
-                self.e_list1.add ( the_file ) 
+        self._add_file  ( self.chain , the_file , self.e_list1 ) 
                 
     ## printout 
     def __str__(self):
@@ -203,35 +250,29 @@ class Data2(Data):
                   files       = []      ,
                   description = ''      ,
                   maxfiles    = 1000000 ,
-                  silent      = False   ) :  
+                  silent      = False   ,
+                  nthreads    = 8       ,
+                  catalog     = DEFAULT_CATALOG ) :  
         
         self.e_list2 = set()
         self.chain2  = ROOT.TChain ( chain2 )
         if not description :
             description = chain1.GetName() if hasattr ( chain1 , 'GetName' ) else str(chain1)
             description = "%s&%s" % ( description , self.chain2.GetName() )
-        Data.__init__( self , chain1 , files , description , maxfiles , silent )
+        Data.__init__( self , chain1 , files , description , maxfiles , silent , nthreads , catalog )
         self.chain1  = self.chain 
         
+    ## the names of trees to be validated: each file is opened once for both trees 
+    def trees ( self ) :
+        return self.chain.GetName() , self.chain2.GetName() 
+
     ## the specific action for each file 
     def treatFile ( self, the_file ) :
         """
         Add the file to TChain
         """
         Data.treatFile ( self , the_file )
-
-        ## suppress Warning/Error messages from ROOT 
-        from ostap.logger.utils import rootError
-        with rootError() :
-            
-            tmp = ROOT.TChain ( self.chain2.GetName() )
-            tmp.Add ( the_file )
-        
-            ##if 0 < tmp.GetEntries() and 0 < tmp.GetEntry(0) : self.chain2.Add ( the_file ) 
-            if 0 < tmp.GetEntries() : self.chain2.Add ( the_file ) 
-            else                  :
-                logger.warning("No/empty chain '%s' in file '%s'" % ( self.chain2.GetName() , the_file ) ) 
-                self.e_list2.add ( the_file ) 
+        self._add_file ( self.chain2 , the_file , self.e_list2 ) 
         
     ## printout 
     def __str__(self):    
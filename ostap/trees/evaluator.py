@@ -0,0 +1,526 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+## @file evaluator.py
+#  Block-wise (vectorized) evaluation of expressions and cuts for TTree/TChain
+#
+#  The expressions and cuts are evaluated by ROOT (one <code>TTree::Draw</code>
+#  call per block of entries) directly into numpy arrays:
+#  the values and the weights (the result of the cut) for all selected entries
+#  of the block.
+#
+#  @code
+#  tree = ...
+#  ev   = evaluator ( tree , [ 'pt' , 'eta' ] , 'pt>5' )
+#  for block in ev.blocks ( tree ) :
+#      pt , eta = block.values
+#      weights  = block.weights
+#  @endcode
+#
+#  The prepared evaluators are cached using the tree schema
+#  (the list of leaves and their types) and the expressions as a key.
+#  The evaluated blocks (the values and the weights) for the trees/chains
+#  from the files are kept in LRU cache and reused by the subsequent
+#  evaluations of the same expressions and cuts, e.g. by
+#  <code>withCuts</code>, <code>project</code> and <code>statVar</code>.
+#  @see TTree::Draw
+#  @see TTree::GetVal
+#  @see TTree::GetW
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+# =============================================================================
+"""Block-wise (vectorized) evaluation of expressions and cuts for TTree/TChain
+
+The expressions and cuts are evaluated by ROOT (one TTree::Draw call per
+block of entries) directly into numpy arrays: the values and the weights
+(the result of the cut) for all selected entries of the block.
+
+>>> tree = ...
+>>> ev   = evaluator ( tree , [ 'pt' , 'eta' ] , 'pt>5' )
+>>> for block in ev.blocks ( tree ) :
+...     pt , eta = block.values
+...     weights  = block.weights
+
+The prepared evaluators are cached using the tree schema
+(the list of leaves and their types) and the expressions as a key.
+The evaluated blocks (the values and the weights) for the trees/chains
+from the files are kept in LRU cache and reused by the subsequent
+evaluations of the same expressions and cuts, e.g. by
+withCuts, project and statVar.
+"""
+# =============================================================================
+__version__ = "$Revision$"
+__author__  = "Vanya BELYAEV Ivan.Belyaev@itep.ru"
+__date__    = "2018-05-20"
+__all__     = (
+    'Evaluator'   , ## block-wise evaluator of expressions&cuts
+    'evaluator'   , ## get (cached) evaluator for the tree
+    'tree_schema' , ## get the schema of the tree
+    'columns'     , ## decode the list of expressions
+    'has_numpy'   , ## is numpy available?
+    'clear_blocks', ## clear the cache of evaluated blocks 
+    )
+# =============================================================================
+import ROOT, re, os
+from   collections     import namedtuple, OrderedDict
+from   ostap.core.core import cpp
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger( 'ostap.trees.evaluator' )
+else                       : logger = getLogger( __name__ )
+# =============================================================================
+try :
+    import numpy
+    has_numpy = True
+except ImportError :
+    numpy     = None
+    has_numpy = False
+    logger.debug ( 'numpy is not available: block-wise evaluation is disabled' )
+# =============================================================================
+_large = 2**64
+# =============================================================================
+## native numpy types for the simple (scalar) leaves
+#  @see TLeaf::GetTypeName
+_leaf_dtypes_ = {
+    'Char_t'    : 'int8'    ,
+    'UChar_t'   : 'uint8'   ,
+    'Short_t'   : 'int16'   ,
+    'UShort_t'  : 'uint16'  ,
+    'Int_t'     : 'int32'   ,
+    'UInt_t'    : 'uint32'  ,
+    'Long_t'    : 'int64'   ,
+    'ULong_t'   : 'uint64'  ,
+    'Long64_t'  : 'int64'   ,
+    'ULong64_t' : 'uint64'  ,
+    'Float_t'   : 'float32' ,
+    'Double_t'  : 'float64' ,
+    'Bool_t'    : 'bool'    ,
+    }
+## native types for some special expressions
+_special_dtypes_ = {
+    'Entry$'      : 'int64' ,
+    'LocalEntry$' : 'int64' ,
+    'Entries$'    : 'int64' ,
+    'Iteration$'  : 'int64' ,
+    }
+# =============================================================================
+## separators for the list of expressions: ',' , ';' and ':' (but not '::')
+_separators_ = re.compile ( r'[,;]|(?<!:):(?!:)' )
+# =============================================================================
+## decode the list of variables/expressions:
+#  list/tuple of expressions or comma/column/semicolumn-separated string
+#  @code
+#  columns ( 'pt,eta'         ) ## ( 'pt' , 'eta' )
+#  columns ( 'pt:eta'         ) ## ( 'pt' , 'eta' )
+#  columns ( [ 'pt' , 'eta' ] ) ## ( 'pt' , 'eta' )
+#  @endcode
+def columns ( expressions ) :
+    """Decode the list of variables/expressions:
+    - list/tuple of expressions
+    - comma/column/semicolumn-separated string
+    >>> columns ( 'pt,eta'         ) ## ( 'pt' , 'eta' )
+    >>> columns ( 'pt:eta'         ) ## ( 'pt' , 'eta' )
+    >>> columns ( [ 'pt' , 'eta' ] ) ## ( 'pt' , 'eta' )
+    """
+    if isinstance ( expressions , ROOT.TCut ) : expressions = str ( expressions )
+    if isinstance ( expressions , str       ) :
+        expressions = _separators_.split ( expressions )
+    result = tuple ( [ str ( e ).strip() for e in expressions ] )
+    result = tuple ( [ e for e in result if e ] )
+    if not result :
+        raise AttributeError ( "No variables/expressions are specified: %s" % expressions )
+    for e in result :
+        p1 = e.find ( '[' )
+        if 0 < p1 and p1 < e.find ( ']' , p1 + 1 ) :
+            raise AttributeError ( "Can't evaluate array-like variable '%s'" % e )
+    return result
+
+# =============================================================================
+## get the current "real" tree
+def _the_tree_ ( tree ) :
+    """Get the current ``real'' tree (for chains)"""
+    if isinstance ( tree , ROOT.TChain ) :
+        if not tree.GetTree() : tree.LoadTree ( 0 )
+        return tree.GetTree()
+    return tree
+
+# =============================================================================
+## get the schema of the tree: the name and the list of leaves and their types
+#  @code
+#  tree   = ...
+#  schema = tree_schema ( tree )
+#  @endcode
+def tree_schema ( tree ) :
+    """Get the schema of the tree: the name and the list of leaves and their types
+    >>> tree   = ...
+    >>> schema = tree_schema ( tree )
+    """
+    t      = _the_tree_ ( tree )
+    leaves = t.GetListOfLeaves() if t else None
+    leaves = tuple ( [ ( l.GetName() , l.GetTypeName() , l.GetLen() ) for l in leaves ] ) if leaves else ()
+    return ( tree.GetName() , ) + tuple ( sorted ( leaves ) )
+
+# =============================================================================
+## get the native numpy type for the expression
+#  - for simple scalar leaves the type of leaf is used
+#  - for all other expressions <code>float64</code> is used
+def _dtype_ ( tree , expression ) :
+    """Get the native numpy type for the expression
+    - for simple scalar leaves the type of leaf is used
+    - for all other expressions `float64` is used
+    """
+    if expression in _special_dtypes_ : return _special_dtypes_ [ expression ]
+    t    = _the_tree_ ( tree )
+    leaf = t.GetLeaf ( expression ) if t else None
+    if not leaf or 1 != leaf.GetLen() : return 'float64'
+    return _leaf_dtypes_.get ( leaf.GetTypeName() , 'float64' )
+
+# =============================================================================
+## check the validity of the expression
+#  @return the multiplicity of the expression (0 for scalars) or <code>None</code> for the invalid expression 
+#  @see TTreeFormula::GetMultiplicity
+def _multiplicity_ ( tree , expression ) :
+    """Check the validity of the expression
+    - return the multiplicity of the expression (0 for scalars) or None for the invalid expression
+    """
+    if expression in _special_dtypes_ : return 0 
+    t = _the_tree_ ( tree )
+    if not t : return None
+    f  = cpp.Ostap.Formula ( '' , expression , t )
+    m  = f.GetMultiplicity () if f.ok () else None 
+    del f
+    return m
+
+# =============================================================================
+## get the maximal length of the leaf
+#  - for the fixed-size arrays it is <code>TLeaf::GetLen</code>
+#  - for the variable-size arrays the maximum of the leaf-counter is used 
+def _max_len_ ( leaf ) :
+    """Get the maximal length of the leaf
+    - for the fixed-size arrays it is TLeaf.GetLen
+    - for the variable-size arrays the maximum of the leaf-counter is used 
+    """
+    counter = leaf.GetLeafCount()
+    if counter : return max ( 1 , leaf.GetLenStatic() * counter.GetMaximum() )
+    return max ( 1 , leaf.GetLen() )
+
+# =============================================================================
+## get the (estimated) maximal number of rows per entry for the expressions,
+#  i.e. the maximal length of the leaves used in the expressions 
+#  @see TTreeFormula::GetLeaf
+def _max_rows_ ( tree , expressions ) :
+    """Get the (estimated) maximal number of rows per entry for the expressions,
+    i.e. the maximal length of the leaves used in the expressions 
+    """
+    t = _the_tree_ ( tree )
+    if not t : return 1
+    rows = 1 
+    for e in expressions :
+        if not e or e in _special_dtypes_ : continue 
+        f = cpp.Ostap.Formula ( '' , e , t )
+        if f.ok () :
+            for i in range ( f.GetNcodes () ) :
+                leaf = f.GetLeaf ( i )
+                if leaf : rows = max ( rows , _max_len_ ( leaf ) )
+        del f
+    return rows
+
+# =============================================================================
+## @class Block
+#  The result of the evaluation for the block of entries
+#  - <code>first</code>   : the first entry of the block
+#  - <code>last</code>    : the last  entry of the block (exclusive)
+#  - <code>values</code>  : tuple of numpy arrays with the values of expressions for the selected entries
+#  - <code>weights</code> : numpy array with the values of the cut for the selected entries (or <code>None</code>)
+Block = namedtuple ( 'Block' , ( 'first' , 'last' , 'values' , 'weights' ) )
+
+# =============================================================================
+## @class Evaluator
+#  Block-wise evaluator of the expressions and cuts for TTree/TChain
+#  @code
+#  tree = ...
+#  ev   = Evaluator ( tree , [ 'pt' , 'eta' ] , 'pt>5' )
+#  for block in ev.blocks ( tree , chunk = 100000 ) :
+#      pt , eta = block.values
+#      weights  = block.weights
+#  @endcode
+#  The cut acts as for <code>TTree::Draw</code>: entries with zero
+#  value of cut are skipped, the value of cut is the weight
+#  @see TTree::Draw
+#  @attention the instances are better to be obtained via <code>evaluator</code> function
+class Evaluator(object) :
+    """Block-wise evaluator of the expressions and cuts for TTree/TChain
+    >>> tree = ...
+    >>> ev   = Evaluator ( tree , [ 'pt' , 'eta' ] , 'pt>5' )
+    >>> for block in ev.blocks ( tree , chunk = 100000 ) :
+    ...     pt , eta = block.values
+    ...     weights  = block.weights
+    The cut acts as for TTree::Draw: entries with zero value of cut are skipped,
+    the value of cut is the weight
+    - the instances are better to be obtained via `evaluator` function
+    """
+    def __init__ ( self , tree , expressions , cuts = '' ) :
+
+        if not has_numpy :
+            raise TypeError ( "Evaluator: numpy is not available" )
+
+        self.__columns = columns ( expressions )
+        self.__cuts    = str ( cuts ).strip() if cuts else ''
+
+        scalar = True 
+        for e in self.__columns :
+            m = _multiplicity_ ( tree , e )
+            if m is None : raise TypeError ( "Invalid Formula: %s" % e )
+            scalar = scalar and 0 == m 
+        if self.__cuts and _multiplicity_ ( tree , self.__cuts ) is None :
+            raise TypeError ( "Invalid Formula: %s" % self.__cuts )
+
+        ## NB: for scalar expressions the rows are defined by the cuts only,
+        #      and the columns are cached separately 
+        self.__scalar  = scalar 
+
+        self.__dtypes  = tuple ( [ _dtype_ ( tree , e ) for e in self.__columns ] )
+        
+        ## NB: the buffers of TTree::Draw are sized using the maximal length of the leaves 
+        self.__rows    = 1 if scalar else _max_rows_ ( tree , self.__columns + ( self.__cuts , ) )
+
+    @property
+    def columns ( self ) :
+        """``columns'' : the list of evaluated expressions"""
+        return self.__columns
+    @property
+    def cuts    ( self ) :
+        """``cuts'' : the selection criteria/weight"""
+        return self.__cuts
+    @property
+    def dtypes  ( self ) :
+        """``dtypes'' : native numpy types of the evaluated expressions"""
+        return self.__dtypes
+    @property
+    def rows    ( self ) :
+        """``rows'' : the (estimated) maximal number of rows per entry"""
+        return self.__rows
+
+    # =========================================================================
+    ## iterate over the blocks of entries and evaluate expressions&cuts
+    #  @code
+    #  for block in ev.blocks ( tree , first = 0 , last = 1000000 , chunk = 100000 ) :
+    #      ...
+    #  @endcode
+    #  @param tree  the tree/chain
+    #  @param first the first entry to process
+    #  @param last  the last  entry to process (exclusive)
+    #  @param chunk number of entries per block
+    def blocks ( self , tree , first = 0 , last = _large , chunk = 1000000 ) :
+        """Iterate over the blocks of entries and evaluate expressions&cuts
+        >>> for block in ev.blocks ( tree , first = 0 , last = 1000000 , chunk = 100000 ) :
+        ...
+        """
+        chunk = int ( chunk )
+        if chunk <= 0 : raise AttributeError ( "Evaluator: invalid chunk size %s" % chunk )
+        last  = min ( last , len ( tree ) )
+
+        dkey  = _data_key_ ( tree ) if 0 < _max_block_bytes_ else None
+        ge    = tree.GetEstimate()
+        tree.SetEstimate ( chunk * self.__rows + 1 )
+        try :
+
+            for start in range ( first , last , chunk ) :
+
+                stop = min ( start + chunk , last )
+                
+                values , weights = self.__evaluate ( tree , dkey , start , stop )
+
+                yield Block ( start , stop , values , weights )
+
+        finally :
+            tree.SetEstimate ( ge )
+
+    ## evaluate the block of entries, use the cached values, if possible 
+    def __evaluate ( self , tree , dkey , start , stop ) :
+        """Evaluate the block of entries, use the cached values, if possible"""
+        
+        if dkey is None :
+            return self.__draw ( tree , self.__columns , self.__dtypes , start , stop )
+        
+        base = dkey , self.__cuts , start , stop
+        if not self.__scalar :
+            key    = base + ( self.__columns , ) 
+            result = _get_block_ ( key )
+            if result is None :
+                result = self.__draw ( tree , self.__columns , self.__dtypes , start , stop )
+                _put_block_ ( key , result )
+            return result
+
+        ## scalar expressions: each column is cached separately 
+        keys    = [ base + ( c , ) for c in self.__columns ]
+        values  = [ _get_block_ ( k ) for k in keys ]
+        weights = _get_block_ ( base + ( None , ) ) if self.__cuts else None
+        missing = [ i for i , v in enumerate ( values ) if v is None ]
+        if self.__cuts and weights is None and not missing : missing = [ 0 ]
+        if missing :
+            vals , weights = self.__draw ( tree                                    ,
+                                           [ self.__columns [ i ] for i in missing ] ,
+                                           [ self.__dtypes  [ i ] for i in missing ] ,
+                                           start , stop )
+            for i , v in zip ( missing , vals ) :
+                values [ i ] = v
+                _put_block_ ( keys [ i ] , v )
+            if self.__cuts : _put_block_ ( base + ( None , ) , weights ) 
+        return tuple ( values ) , weights 
+        
+    ## evaluate the expressions&cuts for the block of entries by <code>TTree::Draw</code>
+    #  - the 64-bit integer leaves are read directly for the selected entries,
+    #    since the conversion to <code>double</code> is not exact above <code>2**53</code>
+    #  - the buffers are enlarged if the number of selected rows exceeds the estimate 
+    def __draw ( self , tree , exprs , dtypes , start , stop ) :
+        """Evaluate the expressions&cuts for the block of entries by TTree::Draw
+        - the 64-bit integer leaves are read directly for the selected entries,
+        since the conversion to double is not exact above 2**53
+        - the buffers are enlarged if the number of selected rows exceeds the estimate 
+        """
+        exact  = [ i for i , ( e , t ) in enumerate ( zip ( exprs , dtypes ) ) if t in ( 'int64' , 'uint64' ) and not e in _special_dtypes_ ]
+        varexp = ':'.join ( list ( exprs ) + ( [ 'Entry$' ] if exact else [] ) )
+        n      = tree.Draw ( varexp , self.__cuts , 'goff' , stop - start , start )
+        if tree.GetEstimate () <= n :
+            ## the buffers are too short: only the last rows are kept 
+            tree.SetEstimate ( n + 1 ) 
+            n  = tree.Draw ( varexp , self.__cuts , 'goff' , stop - start , start )
+        if n < 0 :
+            raise TypeError ( "Invalid Formula: '%s'/'%s'" % ( varexp , self.__cuts ) )
+        if 0 < n :
+            ## NB: copy!
+            values  = [ numpy.frombuffer ( tree.GetVal ( i ) , dtype = numpy.float64 , count = n ).astype ( t ) for i , t in enumerate ( dtypes ) ]
+            weights = numpy.frombuffer ( tree.GetW () , dtype = numpy.float64 , count = n ).copy() if self.__cuts else None
+            if exact :
+                entries = numpy.frombuffer ( tree.GetVal ( len ( exprs ) ) , dtype = numpy.float64 , count = n ).copy()
+                for i in exact :
+                    v = numpy.empty ( n , dtype = numpy.int64 )
+                    if n != cpp.Ostap.DataFill.get_column ( tree , exprs [ i ] , entries , v , n ) :
+                        raise TypeError ( "Can't read the leaf '%s'" % exprs [ i ] )
+                    values [ i ] = v.view ( dtypes [ i ] ) 
+            values  = tuple ( values ) 
+        else :
+            values  = tuple ( [ numpy.empty ( 0 , dtype = t ) for t in dtypes ] )
+            weights = numpy.empty ( 0 , dtype = numpy.float64 ) if self.__cuts else None
+        return values , weights 
+
+    def __repr__ ( self ) :
+        return "Evaluator(%s|%s)" % ( list ( self.__columns ) , self.__cuts )
+    __str__ = __repr__
+
+# =============================================================================
+## LRU cache of the evaluated blocks: { key : values }
+#  @attention the cached arrays are shared: they must not be modified 
+_blocks_          = OrderedDict ()
+_blocks_bytes_    = [ 0 ]
+## the maximal size of the cached arrays (bytes), 0 disables the cache 
+_max_block_bytes_ = 2**28
+# =============================================================================
+## the size of the cached item
+def _nbytes_ ( item ) :
+    if item is None                        : return 0 
+    if isinstance ( item , numpy.ndarray ) : return item.nbytes
+    return sum ( [ _nbytes_ ( i ) for i in item ] )
+# =============================================================================
+## get the item from the cache of evaluated blocks 
+def _get_block_ ( key ) :
+    item = _blocks_.pop ( key , None )
+    if item is not None : _blocks_ [ key ] = item  ## the most recent 
+    return item
+# =============================================================================
+## put the item into the cache of evaluated blocks 
+def _put_block_ ( key , item ) :
+    size = _nbytes_ ( item )
+    if _max_block_bytes_ < size : return 
+    old  = _blocks_.pop ( key , None )
+    _blocks_bytes_ [ 0 ] += size - _nbytes_ ( old )
+    _blocks_ [ key ] = item
+    while _blocks_ and _max_block_bytes_ < _blocks_bytes_ [ 0 ] :
+        k , v = _blocks_.popitem ( last = False ) ## the least recent 
+        _blocks_bytes_ [ 0 ] -= _nbytes_ ( v )
+# =============================================================================
+## clear the cache of evaluated blocks
+#  @code
+#  clear_blocks()
+#  @endcode 
+def clear_blocks () :
+    """Clear the cache of evaluated blocks
+    >>> clear_blocks()
+    """
+    _blocks_.clear()
+    _blocks_bytes_ [ 0 ] = 0
+
+# =============================================================================
+## the stamp of the file: ( size , mtime ) for the local files
+def _file_stamp_ ( name ) :
+    try :
+        st = os.stat ( name )
+        return st.st_size , st.st_mtime
+    except OSError :
+        return ()
+    
+# =============================================================================
+## get the key for the data of the tree/chain for the cache of evaluated blocks
+#  @return the key or <code>None</code> if the data can't be cached:
+#  the trees that are not in the files, are in the writable files or have friends 
+def _data_key_ ( tree ) :
+    """Get the key for the data of the tree/chain for the cache of evaluated blocks
+    - return the key or None if the data can't be cached: the trees that are not
+    in the files, are in the writable files or have friends 
+    """
+    friends = tree.GetListOfFriends ()
+    if friends and 0 < friends.GetSize () : return None
+    
+    if isinstance ( tree , ROOT.TChain ) :
+        files = tuple ( [ ( f.GetTitle () , ) + _file_stamp_ ( f.GetTitle () ) for f in tree.GetListOfFiles () ] )
+        if not files : return None
+    else :
+        d = tree.GetDirectory ()
+        f = d.GetFile () if d else None
+        if not f or not f.IsOpen () or f.IsWritable () : return None
+        files = ( ( f.GetName () , d.GetPath () , f.GetUUID ().AsString () ) , )
+        
+    aliases = tree.GetListOfAliases ()
+    aliases = tuple ( [ ( a.GetName () , a.GetTitle () ) for a in aliases ] ) if aliases else ()
+    return tree.GetName () , files , tree.GetEntries () , tree.GetWeight () , aliases 
+
+# =============================================================================
+## cache of prepared evaluators
+_evaluators_     = {}
+_max_evaluators_ = 1000
+# =============================================================================
+## get the (cached) evaluator for the tree, expressions and cuts
+#  @code
+#  tree = ...
+#  ev   = evaluator ( tree , 'pt,eta' , 'pt>5' )
+#  @endcode
+#  The evaluators are cached using the tree schema and expressions as the key
+#  @see Evaluator
+def evaluator ( tree , expressions , cuts = '' ) :
+    """Get the (cached) evaluator for the tree, expressions and cuts
+    >>> tree = ...
+    >>> ev   = evaluator ( tree , 'pt,eta' , 'pt>5' )
+    The evaluators are cached using the tree schema and expressions as the key
+    """
+    cols = columns ( expressions )
+    cuts = str ( cuts ).strip() if cuts else ''
+    key  = tree_schema ( tree ) , cols , cuts
+    ev   = _evaluators_.get ( key , None )
+    if ev is None :
+        ev = Evaluator ( tree , cols , cuts )
+        if _max_evaluators_ <= len ( _evaluators_ ) : _evaluators_.clear()
+        _evaluators_ [ key ] = ev
+    return ev
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    from ostap.utils.docme import docme
+    docme ( __name__ , logger = logger )
+
+# =============================================================================
+# The END
+# =============================================================================
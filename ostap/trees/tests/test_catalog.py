@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for ostap/trees/catalog.py and ostap/trees/data.py
+- the known and unmodified files are not reopened
+- the records for modified files (size/mtime) are invalidated
+- the chains are built with the known number of entries
+"""
+# =============================================================================
+import ROOT, os, array, tempfile 
+from   ostap.trees.catalog import Catalog
+from   ostap.trees.data    import Data
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_catalog' )
+else                       : logger = getLogger ( __name__       )
+# =============================================================================
+## write the file with the test tree 
+def make_file ( fname , entries ) :
+    f = ROOT.TFile ( fname , 'RECREATE' )
+    f.cd ()
+    t = ROOT.TTree ( 'T' , 'Test tree' )
+    x = array.array ( 'd' , [ 0 ] )
+    t.Branch ( 'x' , x , 'x/D' )
+    for i in range ( entries ) :
+        x [ 0 ] = i
+        t.Fill ()
+    t.Write ()
+    f.Close ()
+
+# =============================================================================
+def test_catalog_stale () :
+
+    dbname = tempfile.mktemp ( suffix = '.msql' )
+    fname  = tempfile.mktemp ( suffix = '.root' )
+    make_file ( fname , 100 )
+
+    catalog = Catalog ( dbname ) 
+    assert [ ( fname , { 'T' : 100 } ) ] == list ( catalog.entries ( [ fname ] , [ 'T' ] ) ) , 'Invalid entries!' 
+
+    ## spoil the record: the known and unmodified file is not reopened
+    import ostap.io.sqliteshelve as sqliteshelve
+    key = os.path.abspath ( fname ) 
+    with sqliteshelve.open ( dbname , 'w' ) as db :
+        rec = db [ key ]
+        rec [ 'trees' ] [ 'T' ] = 99
+        db  [ key ] = rec
+    assert [ ( fname , { 'T' : 99  } ) ] == list ( catalog.entries ( [ fname ] , [ 'T' ] ) ) , 'The known file is reopened!' 
+
+    ## the modified time invalidates the record 
+    st = os.stat ( fname )
+    os.utime ( fname , ( st.st_atime , st.st_mtime + 10 ) )
+    assert [ ( fname , { 'T' : 100 } ) ] == list ( catalog.entries ( [ fname ] , [ 'T' ] ) ) , 'Stale record (mtime)!' 
+
+    ## the modified size invalidates the record 
+    make_file ( fname , 200 )
+    os.utime ( fname , ( st.st_atime , st.st_mtime + 10 ) )
+    assert [ ( fname , { 'T' : 200 } ) ] == list ( catalog.entries ( [ fname ] , [ 'T' ] ) ) , 'Stale record (size)!' 
+
+    os.remove ( fname  )
+    os.remove ( dbname )
+    
+# =============================================================================
+def test_catalog_chain () :
+
+    files = [ tempfile.mktemp ( suffix = '.root' ) for i in range ( 5 ) ]
+    for i , f in enumerate ( files ) : make_file ( f , 10 * ( i + 1 ) )
+    empty = tempfile.mktemp ( suffix = '.root' )
+    make_file ( empty , 0 )
+    
+    for catalog in ( None , tempfile.mktemp ( suffix = '.msql' ) ) :
+        
+        data = Data ( 'T' , files + [ empty ] , silent = True , nthreads = 4 , catalog = catalog )
+        assert 150 == data.chain.GetEntries () , 'Invalid number of entries %s' % data.chain.GetEntries ()
+        assert set ( [ empty ] ) == data.e_list1 , 'The empty file is not detected!' 
+        chain = data.chain 
+        assert 150 == sum ( [ 1 for i in range ( 150 ) if 0 < chain.GetEntry ( i ) ] ) , 'Invalid chain!' 
+
+        ## direct call 
+        data = Data ( 'T' , [] , silent = True , catalog = catalog )
+        data.treatFile ( files [ 0 ] )
+        assert 10 == data.chain.GetEntries () , 'Invalid number of entries %s' % data.chain.GetEntries ()
+        
+        if catalog : os.remove ( catalog ) 
+
+    for f in files + [ empty ] : os.remove ( f )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_catalog_stale ()  ## stale records 
+    test_catalog_chain ()  ## chains with the known number of entries 
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+""" Test module for block-wise evaluation for TTree/TChain from ostap/trees/trees.py
+- iteration over the selected entries (also for array-like variables in cuts)
+- block-wise statistics versus the C++ multi-accumulator
+- the cache of evaluated blocks
+- one-pass projections for 3D-histograms, 2D-profiles and lists of expressions 
+- columnar slices versus the per-entry values (64-bit integers and arrays)
+"""
+# =============================================================================
+import ROOT, random, array 
+import ostap.trees.trees
+from   ostap.core.core         import cpp, hID 
+from   ostap.trees.evaluator   import has_numpy
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_trees' )
+else                       : logger = getLogger ( __name__     )
+# =============================================================================
+## make the test tree with scalar and array branches 
+ROOT.gROOT.cd ()
+tree = ROOT.TTree ( 'test_tree' , 'Test tree' )
+x    = array.array ( 'd' , [ 0   ] )
+n    = array.array ( 'i' , [ 0   ] )
+a    = array.array ( 'd' , [ 0 ] * 5 )
+tree.Branch ( 'x' , x , 'x/D'    )
+tree.Branch ( 'n' , n , 'n/I'    )
+tree.Branch ( 'a' , a , 'a[n]/D' )
+rows = []
+for i in range ( 10000 ) :
+    x [ 0 ] = random.gauss ( 0 , 1 )
+    n [ 0 ] = random.randint ( 0 , 5 )
+    for j in range ( n [ 0 ] ) : a [ j ] = random.uniform ( -1 , 1 ) 
+    rows.append ( ( x [ 0 ] , list ( a [ : n [ 0 ] ] ) ) )
+    tree.Fill ()
+
+# =============================================================================
+## statistics from C++ multi-accumulator 
+def cpp_stat ( expression , cut = '' ) :
+    _SV   = cpp.std.vector('std::string')
+    exprs = _SV ()
+    cuts  = _SV ()
+    exprs.push_back ( expression )
+    cuts .push_back ( cut        ) 
+    stats = cpp.std.vector ( cpp.Ostap.WStatEntity ) ()
+    cpp.Ostap.StatVar.statVars ( tree , exprs , cuts , stats , 0 , len ( tree ) )
+    return stats [ 0 ]
+
+# =============================================================================
+def test_iter_cuts () :
+
+    logger.info ( 'Test iteration over the selected entries' )
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+    
+    ## scalar cut 
+    entries  = [ t.GetReadEntry () for t in tree.withCuts ( 'x>0.5' ) ]
+    expected = [ i for i , r in enumerate ( rows ) if r [ 0 ] > 0.5 ]
+    assert entries == expected , 'Invalid entries for scalar cut!'
+
+    ## array-like cut: the first element is used, each entry only once 
+    entries  = [ t.GetReadEntry () for t in tree.withCuts ( 'a>0.5' ) ]
+    expected = [ i for i , r in enumerate ( rows ) if r [ 1 ] and r [ 1 ] [ 0 ] > 0.5 ]
+    assert entries == expected , 'Invalid entries for array-like cut!'
+
+    ## the range of entries 
+    entries  = [ t.GetReadEntry () for t in tree.withCuts ( 'x>0.5' , 100 , 1000 ) ]
+    expected = [ i for i , r in enumerate ( rows ) if r [ 0 ] > 0.5 and 100 <= i < 1000 ]
+    assert entries == expected , 'Invalid entries for the range!'
+
+# =============================================================================
+def test_stat_vars () :
+
+    logger.info ( 'Test block-wise statistics' )
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+
+    def _same_ ( s1 , s2 ) :
+        return s1.nEntries () == s2.nEntries () and \
+               abs ( s1.sum () - s2.sum () ) < 1.e-6 * ( 1 + abs ( s2.sum () ) ) and \
+               abs ( s1.weights ().sum () - s2.weights ().sum () ) < 1.e-6 * ( 1 + abs ( s2.weights ().sum () ) ) 
+
+    for weight in ( 1.0 , 2.0 ) :
+        tree.SetWeight ( weight ) 
+        for e , c in ( ( 'x' , '' ) , ( 'x' , 'x>0' ) , ( 'x*x' , '0<n' ) , ( 'a' , '' ) , ( 'x' , 'a>0' ) ) :
+            s1 = tree.statVar ( e , c )
+            s2 = cpp_stat     ( e , c )
+            assert _same_ ( s1 , s2 ) , "Invalid statistics for '%s'/'%s' weight=%s: %s vs %s" % ( e , c , weight , s1 , s2 )
+        ## NB: the tree weight is not applied 
+        s = tree.statVar ( 'x' )
+        assert abs ( s.weights ().sum () - len ( tree ) ) < 1.e-6 * len ( tree ) , 'Tree weight is applied!'
+        
+    tree.SetWeight ( 1.0 )
+    
+# =============================================================================
+def test_block_cache () :
+
+    logger.info ( 'Test the cache of evaluated blocks' )
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+
+    import os, tempfile
+    import ostap.trees.evaluator as E
+
+    fname = tempfile.mktemp ( suffix = '.root' )
+    f     = ROOT.TFile ( fname , 'RECREATE' )
+    f.cd ()
+    t     = tree.CloneTree ( -1 )
+    t.Write ()
+    f.Close ()
+    
+    f = ROOT.TFile ( fname , 'READ' )
+    t = f.Get ( 'test_tree' )
+
+    E.clear_blocks ()
+    b1 = list ( E.evaluator ( t , 'x'     , 'x>0' ).blocks ( t ) )
+    b2 = list ( E.evaluator ( t , 'n , x' , 'x>0' ).blocks ( t ) )
+    assert b1 [ 0 ].values  [ 0 ] is b2 [ 0 ].values [ 1 ] , 'The cached values are not reused!'
+    assert b1 [ 0 ].weights       is b2 [ 0 ].weights      , 'The cached weights are not reused!'
+
+    ## the same results with and without cache 
+    for c in ( 'x>0.5' , 'a>0.5' ) : 
+        e1 = [ i.GetReadEntry () for i in t.withCuts ( c ) ]
+        e2 = [ i.GetReadEntry () for i in t.withCuts ( c ) ]
+        e3 = [ i.GetReadEntry () for i in tree.withCuts ( c ) ]
+        assert e1 == e2 == e3 , "Invalid entries from the cache for '%s'" % c 
+    s1 = t   .statVar ( 'x' , 'x>0' )
+    s2 = t   .statVar ( 'x' , 'x>0' )
+    s3 = tree.statVar ( 'x' , 'x>0' )
+    assert s1.nEntries () == s2.nEntries () == s3.nEntries () and \
+           abs ( s1.sum () - s3.sum () ) < 1.e-6 and abs ( s2.sum () - s3.sum () ) < 1.e-6 , 'Invalid statistics from the cache!'
+
+    f.Close ()
+    E.clear_blocks ()
+    os.remove ( fname )
+    
+# =============================================================================
+def test_project_many () :
+
+    logger.info ( 'Test one-pass projections' )
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+
+    def _same_ ( h1 , h2 ) :
+        if h1.GetEntries () != h2.GetEntries () : return False 
+        for i in range ( h1.GetNcells () ) :
+            if abs ( h1.GetBinContent ( i ) - h2.GetBinContent ( i ) ) > 1.e-6 * ( 1 + abs ( h2.GetBinContent ( i ) ) ) : return False
+            if abs ( h1.GetBinError   ( i ) - h2.GetBinError   ( i ) ) > 1.e-6 * ( 1 + abs ( h2.GetBinError   ( i ) ) ) : return False
+        return True
+        
+    h3 = ROOT.TH3D       ( hID () , '3D' , 10 , -3 , 3 , 5 , 0 , 5 , 10 , 0 , 9 )
+    p2 = ROOT.TProfile2D ( hID () , '2D-profile' , 10 , -3 , 3 , 5 , 0 , 5 )
+    h1 = ROOT.TH1D       ( hID () , '1D' , 20 , -3 , 3 )
+    for cut in ( '' , 'x>0' , '(x>0)*n' ) : 
+        n = tree.project_many ( [ ( h3 , ( 'x' , 'n' , 'x*x' ) ) , ( p2 , 'x*x:n:x' ) , ( h1 , 'x' ) ] , cut )
+        for h , what in ( ( h3 , 'x*x:n:x' ) , ( p2 , 'x*x:n:x' ) , ( h1 , 'x' ) ) :
+            hh = h.Clone ( hID () )
+            hh.Reset ()
+            tree.Project ( hh.GetName () , what , cut )
+            assert _same_ ( h , hh ) , "Invalid projection of '%s' for '%s'" % ( what , cut )
+            
+    ## the list of expressions: one pass, the sum of distributions 
+    h1 = ROOT.TH1D ( hID () , '1D' , 20 , -3 , 3 )
+    for cut in ( '' , 'x>0' ) : 
+        n , _ = tree.project ( h1 , ( 'x' , 'x*x' , '-x' ) , cut )
+        hh    = h1.Clone ( hID () )
+        hh.Reset ()
+        nn    = 0 
+        for what in ( 'x' , 'x*x' , '-x' ) :
+            ht  = h1.Clone ( hID () )
+            ht.Reset ()
+            nn += tree.Project ( ht.GetName () , what , cut )
+            hh.Add ( ht )
+        assert n == nn            , "Invalid number of entries for the list and '%s': %s/%s" % ( cut , n , nn ) 
+        assert _same_ ( h1 , hh ) , "Invalid projection of the list for '%s'" % cut
+
+# =============================================================================
+def test_slices () :
+
+    logger.info ( 'Test columnar slices' )
+    if not has_numpy :
+        logger.warning ( 'numpy is not available, skip the test' )
+        return
+
+    import numpy 
+    
+    ROOT.gROOT.cd ()
+    t   = ROOT.TTree ( 'test_slices' , 'Test tree' )
+    big = array.array ( 'l' if 8 == array.array ( 'l' ).itemsize else 'q' , [ 0 ] )
+    m   = array.array ( 'i' , [ 0 ] )
+    v   = array.array ( 'f' , [ 0 ] * 20 )
+    t.Branch ( 'big' , big , 'big/L'    )
+    t.Branch ( 'm'   , m   , 'm/I'      )
+    t.Branch ( 'v'   , v   , 'v[m]/F'   )
+    for i in range ( 5000 ) :
+        big [ 0 ] = 2**53 + 2 * i + 1       ## not representable as double 
+        m   [ 0 ] = 20 if 0 == i % 100 else random.randint ( 0 , 3 ) 
+        for j in range ( m [ 0 ] ) : v [ j ] = random.uniform ( -1 , 1 ) 
+        t.Fill ()
+
+    ## the per-entry values 
+    entries = [ ( e.big , e.m , list ( e.v ) [ : e.m ] ) for e in t ] 
+
+    for cut in ( '' , 'm>1' ) : 
+    
+        sel = [ r for r in entries if not cut or r [ 1 ] > 1 ]
+
+        bigs = t.slice ( 'big' , cut )
+        assert numpy.int64 == bigs.dtype , 'Invalid type of Long64_t leaf: %s' % bigs.dtype 
+        assert [ r [ 0 ] for r in sel ] == list ( bigs ) , "Invalid slice of Long64_t leaf for '%s'" % cut
+
+        vs   = t.slice ( 'v' , cut )
+        assert sum ( [ r [ 2 ] for r in sel ] , [] ) == list ( vs ) , "Invalid slice of array leaf for '%s'" % cut
+
+        ## the scalar leaves are aligned with the array: one row per element 
+        arrs = t.arrays ( [ 'big' , 'm' , 'v' ] , cut , chunk = 1000 )
+        assert [ r [ 0 ] for r in sel for x in r [ 2 ] ] == list ( arrs [ 'big' ] ) , "Invalid alignment of Long64_t leaf for '%s'" % cut
+        assert [ r [ 1 ] for r in sel for x in r [ 2 ] ] == list ( arrs [ 'm'   ] ) , "Invalid alignment of Int_t leaf for '%s'"    % cut
+        assert list ( vs ) == list ( arrs [ 'v' ] ) , "Invalid array leaf for '%s'" % cut
+    
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_iter_cuts    () 
+    test_stat_vars    ()
+    test_block_cache  ()
+    test_project_many ()
+    test_slices       ()
+    
+# =============================================================================
+# The END
+# =============================================================================
@@ -15,7 +15,7 @@ __date__    = "2011-06-07"
 __all__     = () 
 # =============================================================================
 import ROOT
-from ostap.core.core import cpp, VE
+from ostap.core.core import cpp, VE, Ostap
 # =============================================================================
 # logging 
 # =============================================================================
@@ -26,8 +26,40 @@ else                       : logger = getLogger( __name__ )
 logger.debug ( 'Some useful decorations for Tree/Chain objects')
 # =============================================================================
 import ostap.trees.cuts
+from   ostap.trees.evaluator import evaluator, has_numpy 
+from   ostap.trees.evaluator import columns   as _columns_ 
 # =============================================================================
 _large = 2**64
+# =============================================================================
+## Iterator over entries selected by cuts: the cuts are evaluated block-wise
+#  by the (cached) evaluator, and <code>TTree::GetEntry</code> is invoked
+#  only for the selected entries
+#  - for array-like variables in cuts the first element is used
+#    (as for <code>Ostap::PyIterator</code>), each selected entry is visited once 
+#  @see ostap.trees.evaluator.Evaluator
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def _iter_selected_ ( tree , cuts , first , last , progress = False ) :
+    """Iterator over entries selected by cuts: the cuts are evaluated block-wise
+    by the (cached) evaluator, and TTree::GetEntry is invoked only for the
+    selected entries
+    - for array-like variables in cuts the first element is used
+    (as for Ostap::PyIterator), each selected entry is visited once 
+    """
+    ev = evaluator ( tree , 'Entry$:Iteration$' , cuts )
+    from ostap.utils.progress_bar import ProgressBar 
+    with ProgressBar ( min_value = first        ,
+                       max_value = last         ,
+                       silent    = not progress ) as bar :
+        for block in ev.blocks ( tree , first , last ) :
+            entries , instances = block.values
+            ## NB: for array-like variables TTree::Draw gives one row per array element 
+            entries = entries [ 0 == instances ]
+            for entry in entries :
+                if 0 >= tree.GetEntry ( int ( entry ) ) : return  ## RETURN 
+                yield tree                                      ## YIELD
+            if progress : bar.update_amount ( block.last )
+            
 # =============================================================================
 ## Iterator over ``good events'' in TTree/TChain:
 #  @code 
@@ -51,6 +83,12 @@ def _iter_cuts_ ( self , cuts , first = 0 , last = _large , progress = False ) :
     """
     #
     last = min ( last , len ( self )  )
+
+    ## use block-wise evaluation of cuts 
+    if has_numpy :
+        for t in _iter_selected_ ( self , cuts , first , last , progress ) : yield t
+        self.GetEntry(0)
+        return 
     
     pit = cpp.Ostap.PyIterator ( self , cuts , first , last )
     if not pit.ok() : raise TypeError ( "Invalid Formula: %s" % cuts )
@@ -121,7 +159,12 @@ def _tc_call_ ( self , first = 0 , last = _large , cuts = None , progress = Fals
         step = 13.0 * max ( bar.width , 101 ) / ( last - first ) 
 
         pit = 1 
-        if cuts :
+        if cuts and has_numpy :
+
+            ## use block-wise evaluation of cuts 
+            for t in _iter_selected_ ( self , cuts , first , last , False ) : yield t 
+            
+        elif cuts :
             
             pit = cpp.Ostap.PyIterator ( self , cuts , first , last )
             if not pit.ok() : raise TypeError ( "Invalid Formula: %s" % cuts )
@@ -172,6 +215,136 @@ def _tc_call_ ( self , first = 0 , last = _large , cuts = None , progress = Fals
 ROOT.TTree .__call__  = _tc_call_ 
 ROOT.TChain.__call__  = _tc_call_
 
+# =============================================================================
+## fill the histogram from the block of values 
+#  - 1D and 2D histograms and 1D-profiles are filled with <code>FillN</code>
+#  - 3D histograms and 2D-profiles are filled with <code>Ostap::DataFill::fill_histo</code>
+#  @param histo   the histogram
+#  @param values  the list of numpy arrays in natural order (x,y,z)
+#  @param weights the numpy array of weights 
+def _fill_histo_ ( histo , values , weights ) :
+    """Fill the histogram from the block of values
+    - 1D and 2D histograms and 1D-profiles are filled with FillN
+    - 3D histograms and 2D-profiles are filled with Ostap.DataFill.fill_histo
+    """
+    n = len ( weights )
+    if   isinstance ( histo , ( ROOT.TH3 , ROOT.TProfile2D ) ) :
+        Ostap.DataFill.fill_histo ( histo , values [ 0 ] , values [ 1 ] , values [ 2 ] , weights , n )
+    elif isinstance ( histo , ( ROOT.TH2 , ROOT.TProfile   ) ) :
+        histo.FillN ( n , values [ 0 ] , values [ 1 ] , weights )
+    else :
+        histo.FillN ( n , values [ 0 ] ,                weights )
+        
+# =============================================================================
+## Fill many histograms in one pass through the tree
+#  @code
+#  tree = ...
+#  h1 , h2 , h3 = ...
+#  n = tree.project_many ( { h1 : 'm' , h2 : 'pt' , h3 : ( 'eta' , 'phi' ) } , 'chi2<10' )
+#  n = tree.project_many ( [ ( h1 , 'm' ) , ( h2 , 'pt' ) , ( h3 , 'phi:eta' ) ] , 'chi2<10' )
+#  @endcode
+#  The tree is read once, the cut (the weight) is evaluated once per entry
+#  and all histograms are filled together.
+#  Expressions for 2D/3D histograms and profiles are specified as 
+#  - tuple/list in natural order: <code>( x , y , z )</code> 
+#  - string in ROOT order: <code>"z:y:x"</code> (as for <code>TTree::Project</code>)
+#  @param targets dictionary or list of pairs ( histogram , expression(s) )
+#  @param cuts    the selection criteria/weight (common for all histograms)
+#  @return number of selected entries 
+#  @see ostap.trees.evaluator.Evaluator
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def _tt_project_many_ ( tree , targets , cuts = '' , first = 0 , last = _large , chunk = 1000000 ) :
+    """Fill many histograms in one pass through the tree
+    
+    >>> tree = ...
+    >>> h1 , h2 , h3 = ...
+    >>> n = tree.project_many ( { h1 : 'm' , h2 : 'pt' , h3 : ( 'eta' , 'phi' ) } , 'chi2<10' )
+    >>> n = tree.project_many ( [ ( h1 , 'm' ) , ( h2 , 'pt' ) , ( h3 , 'phi:eta' ) ] , 'chi2<10' )
+    
+    The tree is read once, the cut (the weight) is evaluated once per entry
+    and all histograms are filled together.
+    Expressions for 2D/3D histograms and profiles are specified as 
+    - tuple/list in natural order: ( x , y , z ) 
+    - string in ROOT order: 'z:y:x' (as for TTree.Project)
+    - return number of selected entries 
+    """
+    if hasattr ( targets , 'items' ) : targets = targets.items()
+    if isinstance ( cuts , ROOT.TCut ) : cuts = str ( cuts ) 
+    
+    items = []
+    exprs = []
+    for histo , what in targets :
+        
+        if not isinstance ( histo , ROOT.TH1 ) :
+            raise TypeError ( "project_many: invalid histogram type %s" % type ( histo ) )
+        
+        if isinstance ( what , ROOT.TCut ) : what = str ( what )
+        if isinstance ( what , str       ) : what = tuple ( reversed ( _columns_ ( what ) ) ) 
+        else                               : what = tuple ( [ str ( w ).strip() for w in what ] )
+        
+        need = histo.GetDimension() 
+        if isinstance ( histo , ( ROOT.TProfile , ROOT.TProfile2D ) ) : need += 1
+        if need != len ( what ) :
+            raise AttributeError ( "project_many: %d expressions are required for %s, got %s" % ( need , histo.GetName() , list ( what ) ) )
+        
+        for w in what :
+            if not w in exprs : exprs.append ( w )
+            
+        histo.Reset() 
+        items.append ( ( histo , tuple ( [ exprs.index ( w ) for w in what ] ) , what ) ) 
+
+    if not items : return 0
+    
+    ## no numpy: make individual projections 
+    if not has_numpy :
+        result = 0
+        args   = '' , min ( last , len ( tree ) ) - first , first 
+        for histo , _ , what in items :
+            result , _ = tree.project ( histo , ':'.join ( reversed ( what ) ) , cuts , *args ) 
+        return result
+    
+    import numpy
+    ev     = evaluator ( tree , exprs , cuts )
+    result = 0
+    for block in ev.blocks ( tree , first , last , chunk ) :
+        n = len ( block.values [ 0 ] )
+        if 0 == n : continue
+        values  = [ numpy.ascontiguousarray ( v , dtype = numpy.float64 ) for v in block.values ]
+        weights = block.weights if block.weights is not None else numpy.ones ( n , dtype = numpy.float64 )
+        for histo , index , _ in items :
+            _fill_histo_ ( histo , [ values [ i ] for i in index ] , weights )
+        result += n
+        
+    return result 
+
+ROOT.TTree .project_many = _tt_project_many_
+ROOT.TChain.project_many = _tt_project_many_
+
+# =============================================================================
+## fill the histogram using the block-wise evaluation of expressions and cuts
+#  For the list of expressions all of them are evaluated in one pass through the tree
+#  and the histogram gets the sum of distributions
+#  @return number of selected entries (summed over the expressions) 
+#          or -1 if block-wise evaluation is not possible
+#  @see ostap.trees.evaluator.Evaluator
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def _tt_fill_ ( tree , histo , what , cuts = '' ) :
+    """Fill the histogram using the block-wise evaluation of expressions and cuts
+    - for the list of expressions all of them are evaluated in one pass through the tree
+    and the histogram gets the sum of distributions 
+    - return number of selected entries (summed over the expressions)
+    or -1 if block-wise evaluation is not possible 
+    """
+    if not has_numpy : return -1
+    
+    exprs = [ what ] if isinstance ( what , str ) else list ( what ) 
+    try :
+        return len ( exprs ) * _tt_project_many_ ( tree , [ ( histo , w ) for w in exprs ] , cuts )
+    except ( AttributeError , TypeError ) :
+        return -1
+
 # =============================================================================
 ## help project method for ROOT-trees and chains 
 #
@@ -259,6 +432,10 @@ def _tt_project_ ( tree , histo , what , cuts = '' , *args ) :
     if   isinstance ( what  , str       ) : what =     what 
     elif isinstance ( what  , ROOT.TCut ) : what = str(what)  
     elif isinstance ( histo , ROOT.TH1  ) : 
+        ## all expressions in one pass through the tree, if possible 
+        if not args :
+            result = _tt_fill_ ( tree , histo , [ str ( v ) for v in what ] , cuts )
+            if 0 <= result : return result , histo
         rr = 0 
         hh = histo.clone()
         for v in what :
@@ -282,6 +459,11 @@ def _tt_project_ ( tree , histo , what , cuts = '' , *args ) :
         del hh, h1 
         return rr , histo
 
+    ## the basic case: use block-wise evaluation, if possible  
+    if isinstance ( histo , ROOT.TH1 ) and not args :
+        result = _tt_fill_ ( tree , histo , what , cuts )
+        if 0 <= result : return result , histo
+        
     ## the basic case 
     from ostap.core.core import ROOTCWD
     with ROOTCWD() :
@@ -299,6 +481,160 @@ ROOT.TTree .project = _tt_project_
 ROOT.TChain.project = _tt_project_
 
 
+# =============================================================================
+## decode the requests for the multi-accumulator
+#  @return list of ( expression , cut ) pairs and the keys (for dictionary request) 
+def _stat_requests_ ( requests ) :
+    """Decode the requests for the multi-accumulator
+    - return list of ( expression , cut ) pairs and the keys (for dictionary request)
+    """
+    keys = None 
+    if isinstance ( requests , dict ) :
+        keys     = list ( requests.keys () )
+        requests = [ requests [ k ] for k in keys ]
+    pairs = []
+    for r in requests :
+        if isinstance ( r , ( str , ROOT.TCut ) ) : e , c = r , ''
+        else                                      : e , c = r  
+        pairs.append ( ( str ( e ).strip() , str ( c ).strip() if c else '' ) )
+    return pairs , keys 
+
+# =============================================================================
+## single-pass multi-accumulator using the block-wise evaluation:
+#  all distinct expressions and cuts are evaluated by one <code>TTree::Draw</code> per block 
+#  - the weight of the tree (<code>TTree::GetWeight</code>) is not applied,
+#    as for <code>Ostap::StatVar</code> 
+#  - array-like expressions (more than one row per entry) are not evaluated block-wise 
+#  @return the list of statistics or <code>None</code> if block-wise evaluation is not possible 
+#  @see ostap.trees.evaluator.Evaluator
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def _tt_stat_vars_ ( tree , pairs , first = 0 , last = _large ) :
+    """Single-pass multi-accumulator using the block-wise evaluation:
+    all distinct expressions and cuts are evaluated by one TTree::Draw per block
+    - the weight of the tree (TTree::GetWeight) is not applied, as for Ostap::StatVar
+    - array-like expressions (more than one row per entry) are not evaluated block-wise 
+    - return the list of statistics or None if block-wise evaluation is not possible 
+    """
+    exprs = []
+    for e , c in pairs :
+        for x in ( e , c ) :
+            if x and not x in exprs : exprs.append ( x )
+    
+    try :
+        ev = evaluator ( tree , exprs )
+    except ( AttributeError , TypeError ) :
+        return None 
+    if len ( ev.columns ) != len ( exprs ) : return None
+    
+    import numpy
+
+    inf  = float ( 'inf' )
+    ## per pair: sum_i w_i*v_i , sum_i w_i*v_i**2 ,
+    #  statistic of values with non-zero weights , statistic of weights 
+    accs = [ [ 0.0 , 0.0 , 0 , 0.0 , 0.0 , inf , -inf , 0 , 0.0 , 0.0 , inf , -inf ] for p in pairs ]
+    
+    nall = 0 
+    for block in ev.blocks ( tree , first , last ) :
+        n     = block.last - block.first 
+        nall += n 
+        if 0 == n : continue
+        ## NB: array-like expressions: one row per array element, not per entry  
+        if len ( block.values [ 0 ] ) != n : return None 
+        cols  = dict ( zip ( exprs , [ numpy.asarray ( v , dtype = numpy.float64 ) for v in block.values ] ) ) 
+        for ( e , c ) , a in zip ( pairs , accs ) :
+            if c :
+                w    = cols [ c ]
+                nz   = w != 0 
+                v    = cols [ e ] [ nz ]
+                w    = w [ nz ] 
+            else :
+                v    = cols [ e ]
+                w    = numpy.ones ( len ( v ) , dtype = numpy.float64 )
+            if 0 == len ( v ) : continue 
+            wv       = w * v 
+            a [ 0 ] += wv.sum ()
+            a [ 1 ] += numpy.dot ( wv , v )
+            a [ 2 ] += len ( v )
+            a [ 3 ] += v.sum ()
+            a [ 4 ] += numpy.dot ( v , v )
+            a [ 5 ]  = min ( a [ 5 ] , v.min () )
+            a [ 6 ]  = max ( a [ 6 ] , v.max () )
+            a [ 7 ] += len ( w ) 
+            a [ 8 ] += w.sum ()
+            a [ 9 ] += numpy.dot ( w , w )
+            a [ 10 ] = min ( a [ 10 ] , w.min () )
+            a [ 11 ] = max ( a [ 11 ] , w.max () )
+
+    SE      = cpp.Ostap.StatEntity
+    results = []
+    for a in accs :
+        ## entries with zero weights 
+        if a [ 7 ] < nall : a [ 7 ] , a [ 10 ] , a [ 11 ] = nall , min ( a [ 10 ] , 0.0 ) , max ( a [ 11 ] , 0.0 )
+        values  = SE ( int ( a [ 2 ] ) , float ( a [ 3 ] ) , float ( a [ 4 ] ) , float ( a [ 5  ] ) , float ( a [ 6  ] ) ) if a [ 2 ] else SE ()
+        weights = SE ( int ( a [ 7 ] ) , float ( a [ 8 ] ) , float ( a [ 9 ] ) , float ( a [ 10 ] ) , float ( a [ 11 ] ) ) if a [ 7 ] else SE ()
+        results.append ( cpp.Ostap.WStatEntity ( float ( a [ 0 ] ) , float ( a [ 1 ] ) , values , weights ) )
+        
+    return results 
+
+# =============================================================================
+## single-pass multi-accumulator: get the statistics (sums, counts, min/max, ...)
+#  for many ( expression , cut ) pairs in one pass through Tree/Chain
+#  @code
+#  tree  = ... 
+#  s1 , s2 , s3 = tree.statVars ( [ 'x' , ( 'y' , 'x>0' ) , ( 'x*y' , 'z<1' ) ] )
+#  stats        = tree.statVars ( { 'sx' : 'x' , 'sy' : ( 'y' , 'x>0' ) } )
+#  print stats [ 'sy' ].sum() , stats [ 'sy' ].nEntries() , stats [ 'sy' ].values().max() 
+#  # use only subset of events
+#  stats        = tree.statVars ( [ 'x' , 'y' ] , 100 , 10000 )
+#  @endcode
+#  @param requests the list (or dictionary) of expressions or ( expression , cut ) pairs
+#  @return list (or dictionary) of statistics (<code>Ostap::WStatEntity</code>)
+#  @see Ostap::StatVar::statVars
+#  @see Ostap::WStatEntity
+#  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+#  @date   2018-05-20
+def _stat_vars_ ( tree , requests , first = 0 , last = _large ) :
+    """Single-pass multi-accumulator: get the statistics (sums, counts, min/max, ...)
+    for many ( expression , cut ) pairs in one pass through Tree/Chain
+    >>> tree  = ... 
+    >>> s1 , s2 , s3 = tree.statVars ( [ 'x' , ( 'y' , 'x>0' ) , ( 'x*y' , 'z<1' ) ] )
+    >>> stats        = tree.statVars ( { 'sx' : 'x' , 'sy' : ( 'y' , 'x>0' ) } )
+    >>> print stats [ 'sy' ].sum() , stats [ 'sy' ].nEntries() , stats [ 'sy' ].values().max() 
+    Use only subset of events
+    >>> stats        = tree.statVars ( [ 'x' , 'y' ] , 100 , 10000 )
+    """
+    pairs , keys = _stat_requests_ ( requests )
+
+    results = _tt_stat_vars_ ( tree , pairs , first , last ) if has_numpy and pairs else None
+    if results is None :
+        _SV   = cpp.std.vector('std::string')
+        exprs = _SV ()
+        cuts  = _SV ()
+        for e , c in pairs :
+            exprs.push_back ( e )
+            cuts .push_back ( c ) 
+        _stats = cpp.std.vector ( cpp.Ostap.WStatEntity ) ()
+        cpp.Ostap.StatVar.statVars ( tree , exprs , cuts , _stats , first , min ( last , 2**63 ) )
+        results = [ cpp.Ostap.WStatEntity ( s ) for s in _stats ]
+
+    if keys is None : return results
+    return dict ( zip ( keys , results ) )
+
+ROOT.TTree     . statVars = _stat_vars_
+ROOT.TChain    . statVars = _stat_vars_
+
+# =============================================================================
+## decode the optional cut and the range of entries 
+def _cut_range_ ( cuts ) :
+    cut , first , last = '' , 0 , _large 
+    if cuts and isinstance ( cuts [ 0 ] , ( str , ROOT.TCut ) ) :
+        cut  = str ( cuts [ 0 ] )
+        cuts = cuts [ 1: ]
+    if 1 <= len ( cuts ) : first = cuts [ 0 ]
+    if 2 <= len ( cuts ) : last  = cuts [ 1 ]
+    return cut , first , last 
+
 # =============================================================================
 ## get the statistic for certain expression in Tree/Dataset
 #  @code
@@ -306,6 +642,7 @@ ROOT.TChain.project = _tt_project_
 #  stat1 = tree.statVar( 'S_sw/effic' )
 #  stat2 = tree.statVar( 'S_sw/effic' ,'pt>1000')
 #  @endcode
+#  @see ostap.trees.trees._stat_vars_ 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
 #  @date   2013-09-15
 def _stat_var_ ( tree , expression , *cuts ) :
@@ -316,11 +653,39 @@ def _stat_var_ ( tree , expression , *cuts ) :
     >>> stat2 = tree.statVar ( 'S_sw/effic' ,'pt>1000')
     
     """
-    return cpp.Ostap.StatVar.statVar ( tree , expression , *cuts )
+    cut , first , last = _cut_range_ ( cuts )
+    return tree.statVars ( [ ( expression , cut ) ] , first , last ) [ 0 ]
 
 ROOT.TTree     . statVar = _stat_var_
 ROOT.TChain    . statVar = _stat_var_
 
+# =============================================================================
+## get the statistics and the covariances for the list of expressions in one pass,
+#  using the multi-accumulator for the expressions and their pairwise products
+#  @return ( stats , covs , length ) , covs [ i*(i+1)/2 + j ] is cov ( i , j ) 
+def _stat_covs_list_ ( tree , expressions , cuts , first , last ) :
+    """Get the statistics and the covariances for the list of expressions in one pass,
+    using the multi-accumulator for the expressions and their pairwise products
+    - return ( stats , covs , length ) , covs [ i*(i+1)/2 + j ] is cov ( i , j ) 
+    """
+    cuts  = str ( cuts ).strip() if cuts else ''
+    l     = len ( expressions )
+    reqs  = [ ( e , cuts ) for e in expressions ]
+    for i in range ( l ) :
+        for j in range ( i + 1 ) :
+            reqs.append ( ( '(%s)*(%s)' % ( expressions [ i ] , expressions [ j ] ) , cuts ) )
+    results = tree.statVars ( reqs , first , last )
+    stats , prods = results [ : l ] , results [ l : ]
+    if not stats or 0 == stats [ 0 ].nEntries () or 0 == stats [ 0 ].nEff () :
+        return stats , [ 0.0 ] * len ( prods ) , 0
+    sumw  = stats [ 0 ].weights ().sum ()
+    covs  = []
+    for i in range ( l ) :
+        for j in range ( i + 1 ) :
+            ij = i * ( i + 1 ) / 2 + j 
+            covs.append ( prods [ ij ].sum () / sumw - stats [ i ].mean () * stats [ j ].mean () )
+    return stats , covs , stats [ 0 ].nEntries ()
+
 # =============================================================================
 ## get the statistic for pair of expressions in Tree/Dataset
 #  @code
@@ -349,29 +714,16 @@ def _stat_cov_ ( tree        ,
     >>> stat1 , stat2 , cov2 , len = tree.statCov( 'x' , 'y' , 'z>0' , 100 , 10000 )
     """
     import ostap.math.linalg 
-    stat1  = cpp.Ostap.WStatEntity       ()
-    stat2  = cpp.Ostap.WStatEntity       ()
+    cut , first , last = _cut_range_ ( ( cuts , ) + args if cuts else args ) 
+    stats , covs , length = _stat_covs_list_ ( tree , [ expression1 , expression2 ] , cut , first , last )
+    
     cov2   = cpp.Ostap.Math.SymMatrix2x2 ()
-
-    if cuts : 
-        length = cpp.Ostap.StatVar.statCov ( tree        ,
-                                             expression1 ,
-                                             expression2 ,
-                                             cuts        ,
-                                             stat1       ,
-                                             stat2       ,
-                                             cov2        , 
-                                             *args       )
-    else :
-        length = cpp.Ostap.StatVar.statCov ( tree        ,
-                                             expression1 ,
-                                             expression2 ,
-                                             stat1       ,
-                                             stat2       ,
-                                             cov2        ,
-                                             *args       )
+    if length :
+        cov2 [ 0 , 0 ] = covs [ 0 ]
+        cov2 [ 1 , 0 ] = covs [ 1 ]
+        cov2 [ 1 , 1 ] = covs [ 2 ]
         
-    return stat1 , stat2 , cov2, length
+    return stats [ 0 ] , stats [ 1 ] , cov2 , length
 
 ROOT.TTree     . statCov = _stat_cov_
 ROOT.TChain    . statCov = _stat_cov_
@@ -402,48 +754,17 @@ def _stat_covs_ ( tree        ,
     ##
     if isinstance ( expressions , str ) : expressions = [ expressions ]
     ##
-    
-    import ostap.math.linalg 
-    
-    _SV    = cpp.std.vector('std::string')
-    _vars  = _SV()
-    vars   = expressions
-    for e in vars : _vars.push_back( e )
-    
-    WSE    = cpp.Ostap.WStatEntity
-    _WV    = cpp.std.vector( WSE )
-    _stats = _WV()
-    _DV    = cpp.std.vector('double')
-    _cov2  = _DV()
-
-    if cuts : 
-        length = cpp.Ostap.StatVar._statCov ( tree   ,
-                                              _vars  ,
-                                              cuts   ,
-                                              _stats ,
-                                              _cov2  ,
-                                              *args  ) 
-    else :
-        length = cpp.Ostap.StatVar._statCov ( tree   ,
-                                              _vars  ,
-                                              _stats ,
-                                              _cov2  ,
-                                              *args  )
+    cut , first , last = _cut_range_ ( ( cuts , ) + args if cuts else args ) 
+    _stats , _cov2 , length = _stat_covs_list_ ( tree , list ( expressions ) , cut , first , last )
 
-    l = len(_vars)
     if 0 == length : 
         return None , None , 0 
-    elif l != len ( _stats ) or l*(l+1)/2 != len( _cov2 ):
-        logger.error("statCovs: unexpected output %d/%s/%s" % ( l           ,
-                                                                len(_stats) ,
-                                                                len(_cov2 ) ) )
-        return None, None, length
-
 
     ## get the statistics of variables
-    stats = tuple ( [ WSE(s) for s in _stats ] ) 
+    stats = tuple ( _stats ) 
     
     import ostap.math.linalg
+    l    = len ( stats ) 
     COV2 = cpp.Ostap.Math.SymMatrix ( l )
     cov2 = COV2 () 
 
@@ -682,6 +1003,78 @@ def _rc_getslice_ ( self , start , stop , *step ) :
 
 ROOT.TChain.__getslice__ = _rc_getslice_
 
+# =============================================================================
+## Iterate over the tree/chain in chunks and get the columns as numpy arrays
+#  All columns are filled in one pass (one <code>TTree::Draw</code> call per chunk)
+#  and simple leaves keep their native types 
+#  @code
+#  tree = ...
+#  for arrays in tree.iter_arrays ( [ 'pt' , 'eta' , 'pt/p' ] , 'eta>3' , chunk = 1000000 ) :
+#      pt  = arrays [ 'pt'   ]
+#      eta = arrays [ 'eta'  ]
+#      ...
+#  @endcode
+#  @param columns list of variables/expressions
+#  @param cut     selection criteria 
+#  @param chunk   number of entries to be processed per chunk
+#  @param first   the first entry 
+#  @param last    the last entry
+#  @return the dictionary  { column : numpy.array } for each chunk 
+#  @see numpy.array 
+def _rt_iter_arrays_ ( tree , columns , cut = '' , chunk = 1000000 , first = 0 , last = _large ) :
+    """Iterate over the tree/chain in chunks and get the columns as numpy arrays.
+    All columns are filled in one pass (one TTree::Draw call per chunk)
+    and simple leaves keep their native types 
+    >>> tree = ...
+    >>> for arrays in tree.iter_arrays ( [ 'pt' , 'eta' , 'pt/p' ] , 'eta>3' , chunk = 1000000 ) :
+    ...     pt  = arrays [ 'pt'   ]
+    ...     eta = arrays [ 'eta'  ]
+    """
+    ev = evaluator ( tree , columns , cut )
+    for block in ev.blocks ( tree , first , last , chunk ) :
+        yield dict ( zip ( ev.columns , block.values ) )
+
+# =============================================================================
+## get the columns from the tree/chain in a form of numpy arrays
+#  All columns are filled in one pass into the preallocated arrays,
+#  simple leaves keep their native types 
+#  @code
+#  tree   = ...
+#  arrays = tree.arrays ( [ 'pt' , 'eta' , 'pt/p' ] , 'eta>3' )
+#  print arrays['pt']
+#  @endcode
+#  @see numpy.array 
+def _rt_arrays_ ( tree , columns , cut = '' , chunk = 1000000 , first = 0 , last = _large ) :
+    """Get the columns from the tree/chain in a form of numpy arrays.
+    All columns are filled in one pass into the preallocated arrays,
+    simple leaves keep their native types 
+    >>> tree   = ...
+    >>> arrays = tree.arrays ( [ 'pt' , 'eta' , 'pt/p' ] , 'eta>3' )
+    >>> print arrays['pt']
+    """
+    ev      = evaluator ( tree , columns , cut )
+    columns = ev.columns 
+    last    = min ( last , len ( tree ) )
+    
+    import numpy
+    ## NB: for array-like variables there are several rows per entry 
+    size    = max ( last - first , 0 ) * ev.rows 
+    result  = dict ( [ ( c , numpy.empty ( size , dtype = t ) ) for c , t in zip ( columns , ev.dtypes ) ] ) 
+    
+    n = 0 
+    for block in ev.blocks ( tree , first , last , chunk ) :
+        l = len ( block.values [ 0 ] )
+        if size < n + l :
+            ## the estimate is too small: enlarge the arrays 
+            size = max ( n + l , 2 * size )
+            for c in columns : result [ c ] = numpy.concatenate ( ( result [ c ] [ : n ] , numpy.empty ( size - n , dtype = result [ c ].dtype ) ) )
+        for c , v in zip ( columns , block.values ) : result [ c ] [ n : n + l ] = v 
+        n += l
+        
+    ## shrink the arrays (no copy, unless the estimate is much larger)
+    for c in columns : result [ c ] = result [ c ] [ : n ] if size <= 2 * n else result [ c ] [ : n ].copy()
+    return result 
+        
 # =============================================================================
 ## get "slice" from TTree in a form of numpy.array
 #  @code
@@ -700,42 +1093,12 @@ def _rt_slice_ ( tree , varname , cut = '' ) :
     >>> print varr 
     """
     #
-    ## decode the name (if needed)
-    if isinstance ( varname , str ) :
-        varname = varname.strip()
-        varname = varname.replace ( ':' , ',' )
-        varname = varname.replace ( ';' , ',' )
-        varname = varname.replace ( ' ' , ',' )
-        varname = varname.split   (       ',' )
-        if 1 == len ( varname ) : varname = varname[0].strip()
-        else :
-            for i in range( 0 , len(varname) ) : 
-                varname[i] = varname[i].strip()  
-    #
-    if       isinstance ( varname ,  ( list , tuple ) ) :
+    columns = _columns_ ( varname )
+    if 1 != len ( columns ) :
         ## forward to appropriate method 
-        return tree.slices ( varname , cut )
-    elif not isinstance ( varname , str ) :
-        raise AttibuteError ( 'Invalid type %s' % varname )
+        return tree.slices ( columns , cut )
     
-    ##
-    p1 = varname.find( '[')
-    if 0 < p1 :
-        p2 = varname.find( ']' , p1 + 1 )
-        if p1 < p2 :
-            raise AttributeError("TTree:slice: can't slice array-like variable '%s'" % varname )
-            
-    ge   = long( tree.GetEstimate() ) 
-    tree.SetEstimate ( max ( len ( tree ) , ge ) )
-    ##
-    n    = tree.Draw ( varname , cut , "goff" )
-    ##
-    import numpy
-    sl =   numpy.array ( numpy.frombuffer ( tree.GetV1() , count = n ) , copy = True )
-    ##
-    tree.SetEstimate ( ge ) 
-    return sl 
-
+    return _rt_arrays_ ( tree , columns , cut ) [ columns [ 0 ] ] 
 
 # =============================================================================
 ## get "slices" from TTree in a form of numpy.array
@@ -766,38 +1129,25 @@ def _rt_slices_ ( tree , varnames , cut = '' ) :
     >>> print varrs3
     """
     #
-    varname = varnames 
-    ## decode the name (if needed)
-    for sep in ( ',' , ':' , ';' ) :
-        if isinstance ( varname , str ) :
-            varname = varname.strip() 
-            varname = varname.split( sep )
-            if 1 == len ( varname ) : varname = varname[0].strip()
-            else :
-                for i in range( 0 , len(varname) ) : 
-                    varname[i] = varname[i].strip()  
-    #
-    if       isinstance ( varname , str ) :
+    columns = _columns_ ( varnames )
+    if 1 == len ( columns ) :
         ## forward to appropriate method 
-        return tree.slice ( varname , cut )
-    elif not isinstance ( varname ,  ( list , tuple ) ) :
-        raise AttibuteError ( 'Invalid type %s' % varname )
-    ##
+        return tree.slice ( columns[0] , cut )
+    
+    arrays  = _rt_arrays_ ( tree , columns , cut )
     import numpy
-    a = numpy.array ( [tree.slice(name, cut) for name in varname ] )
-    a.sort()
-    return a
-
-
-ROOT.TTree .slice  = _rt_slice_
-ROOT.TTree .slices = _rt_slices_
+    return numpy.array ( [ arrays [ c ] for c in columns ] )
 
-def _not_implemented_ ( self , method , *args , **kwargs ) :
-    raise NotImplementedError('%s: the method "%s" is not implemented' % ( self.__class__ , method ) ) 
 
-ROOT.TChain.slice  = lambda s,*x : _not_implemented_( s , 'slice'  , *x ) 
-ROOT.TChain.slices = lambda s,*x : _not_implemented_( s , 'slices' , *x ) 
+ROOT.TTree .slice       = _rt_slice_
+ROOT.TTree .slices      = _rt_slices_
+ROOT.TTree .arrays      = _rt_arrays_
+ROOT.TTree .iter_arrays = _rt_iter_arrays_
 
+ROOT.TChain.slice       = _rt_slice_
+ROOT.TChain.slices      = _rt_slices_
+ROOT.TChain.arrays      = _rt_arrays_
+ROOT.TChain.iter_arrays = _rt_iter_arrays_
 
 # =============================================================================
 _decorated_classes_ = (
@@ -815,9 +1165,13 @@ _new_methods_       = (
     #
     ROOT.TTree .project   ,
     ROOT.TChain.project   ,
+    ROOT.TTree .project_many ,
+    ROOT.TChain.project_many ,
     #
     ROOT.TTree .statVar   ,
     ROOT.TChain.statVar   ,
+    ROOT.TTree .statVars  ,
+    ROOT.TChain.statVars  ,
     ROOT.TTree .statCov   ,
     ROOT.TChain.statCov   ,
     ROOT.TTree .statCovs  ,
@@ -841,6 +1195,12 @@ _new_methods_       = (
     #
     ROOT.TTree.slice        ,
     ROOT.TTree.slices       ,
+    ROOT.TTree.arrays       ,
+    ROOT.TTree.iter_arrays  ,
+    ROOT.TChain.slice       ,
+    ROOT.TChain.slices      ,
+    ROOT.TChain.arrays      ,
+    ROOT.TChain.iter_arrays ,
     # 
     )
 # =============================================================================
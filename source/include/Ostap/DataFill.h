@@ -0,0 +1,189 @@
+// $Id:$
+// ===========================================================================
+#ifndef OSTAP_DATAFILL_H 
+#define OSTAP_DATAFILL_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD & STL 
+// ============================================================================
+#include <string>
+// ============================================================================
+// ROOT 
+// ============================================================================
+#include "RtypesCore.h"
+// ============================================================================
+// Forward declarations 
+// =============================================================================
+class RooDataSet ; // RooFit 
+class RooAbsData ; // RooFit 
+class RooArgList ; // RooFit 
+class RooRealVar ; // RooFit 
+class TTree      ; // ROOT 
+class TH3        ; // ROOT 
+class TProfile2D ; // ROOT 
+// =============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  /** @class DataFill Ostap/DataFill.h
+   *  Helper class to fill RooDataSet in bulk from the columnar data 
+   *  (e.g. numpy arrays) 
+   *
+   *  @code
+   *  data   = ...                       ## RooDataSet 
+   *  vars   = ROOT.RooArgList ( x , y ) ## variables 
+   *  values = numpy.concatenate ( [ xarray , yarray ] ) 
+   *  Ostap.DataFill.fill ( data , vars , values , len ( xarray ) ) 
+   *  @endcode 
+   *
+   *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+   *  @date   2018-05-20
+   */
+  class DataFill 
+  {
+  public:
+    // ========================================================================
+    /** fill RooDataSet from the columnar data 
+     *  @param data   (UPDATE) the dataset
+     *  @param vars   (INPUT)  ordered list of variables (RooRealVar)
+     *  @param values (INPUT)  the data, column-by-column: 
+     *                         value of i-th variable for the row r is 
+     *                         <code>values [ i * nrows + r ]</code>
+     *  @param nrows  (INPUT)  number of rows 
+     *  @return number of added rows 
+     */
+    static unsigned long fill 
+    ( RooDataSet*         data   , 
+      const RooArgList&   vars   , 
+      const double*       values , 
+      const unsigned long nrows  ) ;
+    // ========================================================================
+    /** add new column to RooDataSet from the array 
+     *  @code
+     *  data   = ...                       ## RooDataSet 
+     *  weight = ROOT.RooRealVar ( 'w' , 'weight' , 0 , 1000 ) 
+     *  Ostap.DataFill.add_column ( data , weight , warray , len ( warray ) ) 
+     *  @endcode 
+     *  @param data   (UPDATE) the dataset
+     *  @param var    (INPUT)  the new variable 
+     *  @param values (INPUT)  the values: one per entry 
+     *  @param nrows  (INPUT)  number of rows, must be equal to number of entries
+     *  @return number of added rows 
+     */
+    static unsigned long add_column
+    ( RooDataSet*         data   , 
+      const RooRealVar&   var    , 
+      const double*       values , 
+      const unsigned long nrows  ) ;
+    // ========================================================================
+    /** get the column of RooAbsData into the array 
+     *  @code
+     *  data   = ...                       ## RooDataSet 
+     *  values = numpy.empty ( len ( data ) , dtype = numpy.float64 ) 
+     *  Ostap.DataFill.get_column ( data , 'pt' , values , len ( values ) ) 
+     *  @endcode 
+     *  @param data   (INPUT)  the dataset
+     *  @param name   (INPUT)  the variable name 
+     *  @param values (OUTPUT) the values: one per entry 
+     *  @param nrows  (INPUT)  the size of the array
+     *  @return number of rows filled 
+     */
+    static unsigned long get_column
+    ( const RooAbsData*   data   , 
+      const std::string&  name   , 
+      double*             values , 
+      const unsigned long nrows  ) ;
+    // ========================================================================
+    /** get the values of the integer leaf of TTree/TChain for the given entries
+     *  (without the conversion to <code>double</code>, that is not exact for 
+     *  the 64-bit integers above <code>2**53</code>) 
+     *  @code
+     *  tree    = ...                       ## TTree or TChain 
+     *  entries = ...                       ## e.g. the values of "Entry$" 
+     *  values  = numpy.empty ( len ( entries ) , dtype = numpy.int64 ) 
+     *  Ostap.DataFill.get_column ( tree , 'evt' , entries , values , len ( values ) ) 
+     *  @endcode 
+     *  @param tree    (INPUT)  the tree/chain 
+     *  @param name    (INPUT)  the leaf name 
+     *  @param entries (INPUT)  the entries, one per row 
+     *  @param values  (OUTPUT) the values: one per row 
+     *  @param nrows   (INPUT)  number of rows 
+     *  @return number of rows filled 
+     */
+    static unsigned long get_column
+    ( TTree*              tree    , 
+      const std::string&  name    , 
+      const double*       entries , 
+      Long64_t*           values  , 
+      const unsigned long nrows   ) ;
+    // ========================================================================
+    /** add new branch of doubles to TTree from the array 
+     *  @code
+     *  tree  = ...                       ## TTree 
+     *  Ostap.DataFill.add_branch ( tree , 'w' , warray , len ( warray ) ) 
+     *  @endcode 
+     *  @param tree   (UPDATE) the tree
+     *  @param name   (INPUT)  the branch name 
+     *  @param values (INPUT)  the values: one per entry 
+     *  @param nrows  (INPUT)  number of rows, must be equal to number of entries
+     *  @return number of filled entries 
+     */
+    static unsigned long add_branch
+    ( TTree*              tree   , 
+      const std::string&  name   , 
+      const double*       values , 
+      const unsigned long nrows  ) ;
+    // ========================================================================
+    /** fill 3D-histogram from the columnar data 
+     *  (<code>TH3</code> has no <code>FillN</code> method)
+     *  @code
+     *  histo = ...                       ## TH3 
+     *  Ostap.DataFill.fill_histo ( histo , xarray , yarray , zarray , warray , len ( warray ) ) 
+     *  @endcode 
+     *  @param histo   (UPDATE) the histogram
+     *  @param x       (INPUT)  x-values 
+     *  @param y       (INPUT)  y-values 
+     *  @param z       (INPUT)  z-values 
+     *  @param weights (INPUT)  the weights 
+     *  @param nrows   (INPUT)  number of rows
+     *  @return number of filled rows 
+     */
+    static unsigned long fill_histo
+    ( TH3*                histo   , 
+      const double*       x       , 
+      const double*       y       , 
+      const double*       z       , 
+      const double*       weights , 
+      const unsigned long nrows   ) ;
+    // ========================================================================
+    /** fill 2D-profile from the columnar data 
+     *  (<code>TProfile2D</code> has no <code>FillN</code> method)
+     *  @code
+     *  histo = ...                       ## TProfile2D
+     *  Ostap.DataFill.fill_histo ( histo , xarray , yarray , zarray , warray , len ( warray ) ) 
+     *  @endcode 
+     *  @param histo   (UPDATE) the profile 
+     *  @param x       (INPUT)  x-values 
+     *  @param y       (INPUT)  y-values 
+     *  @param z       (INPUT)  z-values (the profiled quantity)
+     *  @param weights (INPUT)  the weights 
+     *  @param nrows   (INPUT)  number of rows
+     *  @return number of filled rows 
+     */
+    static unsigned long fill_histo
+    ( TProfile2D*         histo   , 
+      const double*       x       , 
+      const double*       y       , 
+      const double*       z       , 
+      const double*       weights , 
+      const unsigned long nrows   ) ;
+    // ========================================================================
+  } ;
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
+#endif // OSTAP_DATAFILL_H
+// ============================================================================
@@ -9,6 +9,7 @@
 // ============================================================================
 #include <functional>
 #include <vector>
+#include <list>
 #include <complex>
 // ============================================================================
 // OStap
@@ -372,6 +373,81 @@ namespace Ostap
       // ======================================================================
     } ;
     // ========================================================================
+    /** @class IntegralCache
+     *  helper utility to keep the cache of (numerical) integrals:
+     *  ( parameters , low , high ) -> integral 
+     *  - the least recently used entries are removed 
+     *  - the statistics of hits&misses is collected 
+     *  @code
+     *  const Ostap::Math::BreitWigner& bw = ... ;
+     *  const double i = bw.integral ( 0.5 , 1.0 ) ;
+     *  const Ostap::Math::IntegralCache& cache = bw.integralCache() ;
+     *  std::cout << " hits: "   << cache.hits   () 
+     *            << " misses: " << cache.misses () << std::endl ;
+     *  @endcode
+     *  @author Vanya Belyaev Ivan.Belyaev@itep.ru
+     *  @date 2018-05-20
+     */
+    class IntegralCache
+    {
+    public:
+      // ======================================================================
+      /// the key: the parameters and the integration range 
+      typedef std::vector<double>  Key ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// constructor with the maximal number of entries 
+      IntegralCache ( const unsigned short capacity = 16 ) ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /** get the value from the cache 
+       *  @param key    (INPUT)  the key 
+       *  @param value  (OUTPUT) the value 
+       *  @return true if the value is found 
+       */
+      bool get   ( const Key& key , double& value ) const ;
+      /// add the value into the cache 
+      void add   ( const Key& key , const double value ) const ;
+      /// remove all entries 
+      void clear () const ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// the maximal number of entries 
+      unsigned short capacity () const { return m_capacity ; }
+      /// the actual number of entries 
+      unsigned long  size     () const { return m_entries.size () ; }
+      /// number of hits 
+      unsigned long  hits     () const { return m_hits   ; }
+      /// number of misses
+      unsigned long  misses   () const { return m_misses ; }
+      /// set new maximal number of entries 
+      void setCapacity ( const unsigned short capacity ) ;
+      // ======================================================================
+    public:
+      // ======================================================================
+      /// total number of hits for all caches 
+      static unsigned long totalHits   () ;
+      /// total number of misses for all caches 
+      static unsigned long totalMisses () ;
+      /// reset the total statistics 
+      static void          resetTotal  () ;
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// the maximal number of entries 
+      unsigned short          m_capacity ; // the maximal number of entries 
+      /// number of hits 
+      mutable unsigned long   m_hits     ; // number of hits 
+      /// number of misses 
+      mutable unsigned long   m_misses   ; // number of misses 
+      /// the entries: the most recently used are in front 
+      mutable std::list<std::pair<Key,double> > m_entries ; // the entries 
+      // ======================================================================
+    } ;
+    // ========================================================================
     /** @class Bukin
      *  ``Bukin-function'', aka "Modified Novosibirsk function"
      *  for description of asymmetric peaks with the exponential tails
@@ -439,6 +515,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private: // parameters
       // ======================================================================
@@ -470,6 +548,14 @@ namespace Ostap
       double m_R         ;   // right tail
       /// workspace
       Ostap::Math::WorkSpace m_workspace ;
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -524,6 +610,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private: // recalculate constants
       // ======================================================================
@@ -549,6 +637,14 @@ namespace Ostap
       double m_integral  ;
       /// workspace
       Ostap::Math::WorkSpace m_workspace ;
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -967,6 +1063,8 @@ namespace Ostap
       /// get the integral between low and high
       double integral ( const double low ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -987,6 +1085,14 @@ namespace Ostap
       // ======================================================================
       /// workspace
       Ostap::Math::WorkSpace m_workspace ;
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -1065,6 +1171,8 @@ namespace Ostap
       /// get the integral between low and high
       double integral ( const double low ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -1081,6 +1189,14 @@ namespace Ostap
       // ======================================================================
       /// workspace
       Ostap::Math::WorkSpace m_workspace ;
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -1142,6 +1258,8 @@ namespace Ostap
       /// get integral between low and high
       double integral ( const double low ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -1158,6 +1276,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -1819,6 +1945,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -1847,6 +1975,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -2039,6 +2175,8 @@ namespace Ostap
       /// get the integral between low and high limits
       virtual double integral  ( const double low  ,
                                  const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -2054,6 +2192,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -2160,6 +2306,8 @@ namespace Ostap
       /// get the integral between low and high limits
       virtual double integral ( const double low  ,
                                 const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -2171,6 +2319,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -2552,6 +2708,8 @@ namespace Ostap
       /// get the integral between low and high limits
       virtual double integral  ( const double low  ,
                                  const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -2573,6 +2731,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -2641,6 +2807,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -2661,6 +2829,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -2756,6 +2932,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -2768,6 +2946,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -2887,6 +3073,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -2915,6 +3103,14 @@ namespace Ostap
     private:
       /// integration workspace
       Ostap::Math::WorkSpace     m_workspace  ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -3054,6 +3250,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -3065,6 +3263,14 @@ namespace Ostap
     private:
       /// integration workspace
       Ostap::Math::WorkSpace     m_workspace  ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -3150,6 +3356,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -3159,6 +3367,14 @@ namespace Ostap
       Ostap::Math::PhaseSpace23L m_ps        ;    // the phase space
       /// integration workspace
       Ostap::Math::WorkSpace     m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -3242,6 +3458,8 @@ namespace Ostap
       /// get the integral between low and high limits
       virtual double integral ( const double low  ,
                                 const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -3254,6 +3472,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace m_workspace ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -3355,6 +3581,8 @@ namespace Ostap
       /// get the integral between low and high limits
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -3374,6 +3602,14 @@ namespace Ostap
       // ======================================================================
       /// integration workspace
       Ostap::Math::WorkSpace     m_workspace  ;    // integration workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -4358,6 +4594,8 @@ namespace Ostap
       // ======================================================================
       double integral ( const double low  ,
                         const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       /// integral from -infinity to +infinity
       double integral () const ;
       // ======================================================================
@@ -4372,6 +4610,14 @@ namespace Ostap
       // ======================================================================
       /// workspace
       Ostap::Math::WorkSpace m_workspace ;
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -5593,6 +5839,8 @@ namespace Ostap
       /// get the integral between low and high
       double integral    ( const double low  ,
                            const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -5604,6 +5852,14 @@ namespace Ostap
       // ======================================================================
       /// workspace
       Ostap::Math::WorkSpace m_workspace ; // workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
@@ -5694,6 +5950,8 @@ namespace Ostap
       /// get the integral between low and high
       double integral    ( const double low  ,
                            const double high ) const ;
+      /// the cache of integrals (e.g. to get the statistics of hits&misses)
+      const Ostap::Math::IntegralCache& integralCache () const { return m_cache ; }
       // ======================================================================
     private:
       // ======================================================================
@@ -5704,6 +5962,14 @@ namespace Ostap
       // ======================================================================
       /// workspace
       Ostap::Math::WorkSpace m_workspace ; // workspace
+      /// the cache of integrals: ( parameters , low , high ) -> integral 
+      mutable Ostap::Math::IntegralCache m_cache ;  // the cache of integrals
+      // ======================================================================
+    private:
+      // ======================================================================
+      /// get the integral between low and high limits (no cache)
+      double integral_ ( const double low  ,
+                         const double high ) const ;
       // ======================================================================
     } ;
     // ========================================================================
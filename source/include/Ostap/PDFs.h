@@ -11,6 +11,19 @@
 #include "RooRealProxy.h"
 #include "RooListProxy.h"
 #include "RooAbsReal.h"
+#include "RVersion.h"
+// ============================================================================
+/** @def OSTAP_MODELS_BATCH 
+ *  RooFit batch evaluation interface <code>RooAbsReal::evaluateBatch</code>
+ *  is implemented for the models (ROOT 6.20, the interface is different 
+ *  for the later versions, and they are not supported by the PySelector) 
+ */
+#if ROOT_VERSION(6,20,0) <= ROOT_VERSION_CODE && ROOT_VERSION_CODE < ROOT_VERSION(6,22,0)
+#define OSTAP_MODELS_BATCH 1
+#include "RooSpan.h"
+#else 
+#define OSTAP_MODELS_BATCH 0
+#endif 
 // ============================================================================
 // Ostap
 // ============================================================================
@@ -158,6 +171,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -394,6 +418,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t     evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -475,6 +510,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -557,6 +603,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -635,6 +692,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -721,6 +789,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -810,6 +889,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -903,6 +993,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -985,6 +1086,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1059,6 +1171,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1144,6 +1267,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1223,6 +1357,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1299,6 +1444,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1377,6 +1533,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1458,6 +1625,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1545,6 +1723,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1625,6 +1814,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1700,6 +1900,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1776,6 +1987,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -1852,6 +2074,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2006,6 +2239,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2087,6 +2331,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2162,6 +2417,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2240,6 +2506,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2386,6 +2663,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2451,6 +2739,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2524,6 +2823,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2663,6 +2973,17 @@ namespace Ostap
     public:
       // ======================================================================
       virtual Double_t evaluate () const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2830,6 +3151,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2904,6 +3236,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -2979,6 +3322,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3055,6 +3409,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3130,6 +3495,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3205,6 +3581,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3284,6 +3671,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3371,6 +3769,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3445,6 +3854,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3527,6 +3947,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3604,6 +4035,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public:
       // ======================================================================
@@ -3680,6 +4122,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3754,6 +4207,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3836,6 +4300,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3913,6 +4388,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -3989,6 +4475,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4080,6 +4577,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4177,6 +4685,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4256,6 +4775,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4343,6 +4873,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4421,6 +4962,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4496,6 +5048,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4585,6 +5148,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4672,6 +5246,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4749,6 +5334,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public: // integrals  
       // ======================================================================      
@@ -4840,6 +5436,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public:  // integrals 
       // ======================================================================
@@ -4921,6 +5528,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public:  // integrals 
       // ======================================================================
@@ -5000,6 +5618,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public:  // integrals 
       // ======================================================================
@@ -5081,6 +5710,17 @@ namespace Ostap
       // ======================================================================
       // the actual evaluation of function 
       virtual Double_t evaluate() const ;
+      /// batch evaluation for the array of x-values: the parameters are set only once 
+      unsigned long evaluate 
+      ( const double*       x      , 
+        double*             result , 
+        const unsigned long n      ) const ;
+#if OSTAP_MODELS_BATCH 
+      /// RooFit batch interface: the parameters are set only once per batch 
+      virtual RooSpan<double> evaluateBatch
+      ( std::size_t begin     , 
+        std::size_t batchSize ) const ;
+#endif
       // ======================================================================
     public:  // integrals 
       // ======================================================================
@@ -8,6 +8,8 @@
 // STD & STL
 // ============================================================================
 #include <limits>
+#include <string>
+#include <vector>
 // ============================================================================
 // Forward declarations 
 // =============================================================================
@@ -360,6 +362,33 @@ namespace Ostap
       const unsigned long  first   = 0          ,
       const unsigned long  last    = std::numeric_limits<unsigned long>::max() ) ;
     // ========================================================================
+    /** single-pass multi-accumulator: build the statistics for 
+     *  many (expression,cuts) pairs in one loop over the tree
+     *  - each distinct expression/cut is evaluated only once per entry 
+     *  - empty cut means ``no selection''
+     *  - the weight of the tree (TTree::GetWeight) is not applied
+     *  @code
+     *  tree  = ... 
+     *  stats = tree.statVars ( [ ( 'x' , 'y>0' ) , ( 'y' , '' ) ] ) 
+     *  @endcode 
+     *  @param tree        (INPUT)  the tree 
+     *  @param expressions (INPUT)  the list of expressions 
+     *  @param cuts        (INPUT)  the list of cuts, one per expression
+     *  @param stats       (UPDATE) the statistics, one per expression 
+     *  @param first       (INPUT)  the first event to process 
+     *  @param last        (INPUT)  the last  event to process
+     *  @return number of processed events 
+     *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+     *  @date   2018-05-20
+     */
+    static unsigned long statVars
+    ( TTree*                          tree        , 
+      const std::vector<std::string>& expressions , 
+      const std::vector<std::string>& cuts        ,
+      std::vector<Statistic>&         stats       ,  
+      const unsigned long  first   = 0          ,
+      const unsigned long  last    = std::numeric_limits<unsigned long>::max() ) ;
+    // ========================================================================
   public: // the same but with RooFit 
     // ========================================================================
     /** calculate the covariances for generic case 
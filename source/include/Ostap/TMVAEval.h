@@ -0,0 +1,67 @@
+// $Id:$
+// ===========================================================================
+#ifndef OSTAP_TMVAEVAL_H 
+#define OSTAP_TMVAEVAL_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD & STL 
+// ============================================================================
+#include <string>
+// ============================================================================
+// Forward declarations 
+// =============================================================================
+namespace TMVA { class Reader ; } // TMVA 
+// =============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  /** @class TMVAEval Ostap/TMVAEval.h
+   *  Helper class for batch evaluation of TMVA method 
+   *  for the columnar data (e.g. numpy arrays) 
+   *
+   *  @code
+   *  reader = ROOT.TMVA.Reader()
+   *  ...                                       ## book variables and method
+   *  values = numpy.concatenate ( [ xarray , yarray ] ) 
+   *  result = numpy.empty ( len ( xarray ) , dtype = numpy.float64 ) 
+   *  Ostap.TMVAEval.evaluate ( reader , 'MLP' , values , 2 , len ( xarray ) , result ) 
+   *  @endcode 
+   *
+   *  @see TMVA::Reader
+   *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+   *  @date   2018-05-20
+   */
+  class TMVAEval 
+  {
+  public:
+    // ========================================================================
+    /** evaluate the booked TMVA method for the columnar data 
+     *  @param reader (INPUT)  TMVA reader with booked method 
+     *  @param method (INPUT)  the method name (as booked)
+     *  @param values (INPUT)  the data, column-by-column: 
+     *                         value of i-th variable for the row r is 
+     *                         <code>values [ i * nrows + r ]</code>
+     *  @param ncols  (INPUT)  number of columns (variables), 
+     *                         must be equal to number of variables in reader 
+     *  @param nrows  (INPUT)  number of rows 
+     *  @param result (OUTPUT) the response: one per row 
+     *  @return number of evaluated rows 
+     *  @attention each thread must use its own reader 
+     */
+    static unsigned long evaluate 
+    ( TMVA::Reader&       reader , 
+      const std::string&  method , 
+      const double*       values , 
+      const unsigned long ncols  , 
+      const unsigned long nrows  , 
+      double*             result ) ;
+    // ========================================================================
+  } ;
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
+#endif // OSTAP_TMVAEVAL_H
+// ============================================================================
@@ -40,18 +40,24 @@ namespace Ostap
   public: 
     // ========================================================================
     /** calculate U-statistics 
-     *  @param pdf   (input) PDF
-     *  @param data  (input) data 
-     *  @param hist  (update) the histogram with U-statistics 
-     *  @param tStat (update) value for T-statistics 
-     *  @param args  (input)  the arguments
+     *  - the observables are extracted into the contiguous array once
+     *  - PDF is evaluated for all events in one pass 
+     *  - the nearest neighbours are found using k-d tree, 
+     *    optionally the queries are split between several threads 
+     *  @param pdf      (input) PDF
+     *  @param data     (input) data 
+     *  @param hist     (update) the histogram with U-statistics 
+     *  @param tStat    (update) value for T-statistics 
+     *  @param args     (input)  the arguments
+     *  @param nthreads (input)  number of threads for nearest-neighbour queries
      */
     static Ostap::StatusCode calculate
-    ( const RooAbsPdf&  pdf       , 
-      const RooDataSet& data      ,  
-      TH1&              hist      ,
-      double&           tStat     ,
-      RooArgSet *       args  = 0 ) ;
+    ( const RooAbsPdf&     pdf          , 
+      const RooDataSet&    data         ,  
+      TH1&                 hist         ,
+      double&              tStat        ,
+      RooArgSet *          args     = 0 , 
+      const unsigned short nthreads = 1 ) ;
     // ========================================================================
   };
   // ==========================================================================
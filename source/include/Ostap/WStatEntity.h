@@ -27,6 +27,17 @@ namespace Ostap
     WStatEntity ( const WStatEntity& ) ;
     /// constructor from StatEntity of values 
     WStatEntity ( const StatEntity& values ) ;
+    /** full constructor from all important values 
+     *  (e.g. for the statistic, accumulated elsewhere) 
+     *  @param sum     sum_i weight_i*value_i
+     *  @param sum2    sum_i weight_i*value_i**2 
+     *  @param values  statistic of values with non-zero weight 
+     *  @param weights statistic of weights 
+     */
+    WStatEntity ( const double      sum     , 
+                  const double      sum2    , 
+                  const StatEntity& values  , 
+                  const StatEntity& weights ) ;
     // ======================================================================
   public:
     // ======================================================================
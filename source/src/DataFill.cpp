@@ -0,0 +1,267 @@
+// $Id:$ 
+// ============================================================================
+// Include files
+// ============================================================================
+// STD & STL 
+// ============================================================================
+#include <vector>
+#include <algorithm>
+// ============================================================================
+// ROOT 
+// ============================================================================
+#include "RooAbsData.h"
+#include "RooAbsReal.h"
+#include "RooDataSet.h"
+#include "RooArgList.h"
+#include "RooArgSet.h"
+#include "RooRealVar.h"
+#include "TTree.h"
+#include "TBranch.h"
+#include "TLeaf.h"
+#include "TH3.h"
+#include "TProfile2D.h"
+// ============================================================================
+// Local: 
+// ============================================================================
+#include "Ostap/DataFill.h"
+// ============================================================================
+/** @file
+ *  Implementation file for class Ostap::DataFill
+ *  @see Ostap::DataFill
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date   2018-05-20
+ */
+// ============================================================================
+/*  fill RooDataSet from the columnar data 
+ *  @param data   (UPDATE) the dataset
+ *  @param vars   (INPUT)  ordered list of variables (RooRealVar)
+ *  @param values (INPUT)  the data, column-by-column 
+ *  @param nrows  (INPUT)  number of rows 
+ *  @return number of added rows 
+ */
+// ============================================================================
+unsigned long 
+Ostap::DataFill::fill 
+( RooDataSet*         data   , 
+  const RooArgList&   vars   , 
+  const double*       values , 
+  const unsigned long nrows  ) 
+{
+  if ( nullptr == data || nullptr == values || 0 == nrows ) { return 0 ; }
+  //
+  const unsigned long ncols = vars.getSize() ;
+  std::vector<RooRealVar*> rvars ( ncols , nullptr ) ;
+  for ( unsigned long i = 0 ; i < ncols ; ++i ) 
+  {
+    rvars[i] = dynamic_cast<RooRealVar*> ( vars.at ( i ) ) ;
+    if ( nullptr == rvars[i] ) { return 0 ; }                    // RETURN 
+  }
+  //
+  const RooArgSet varset ( vars ) ;
+  for ( unsigned long r = 0 ; r < nrows ; ++r ) 
+  {
+    for ( unsigned long i = 0 ; i < ncols ; ++i ) 
+    { rvars[i]->setVal ( values [ i * nrows + r ] ) ; }
+    data->add ( varset ) ;
+  }
+  //
+  return nrows ;
+}
+// ============================================================================
+/*  add new column to RooDataSet from the array 
+ *  @param data   (UPDATE) the dataset
+ *  @param var    (INPUT)  the new variable 
+ *  @param values (INPUT)  the values: one per entry 
+ *  @param nrows  (INPUT)  number of rows, must be equal to number of entries
+ *  @return number of added rows 
+ */
+// ============================================================================
+unsigned long 
+Ostap::DataFill::add_column
+( RooDataSet*         data   , 
+  const RooRealVar&   var    , 
+  const double*       values , 
+  const unsigned long nrows  ) 
+{
+  if ( nullptr == data || nullptr == values ) { return 0 ; }
+  if ( (unsigned long) data->numEntries() != nrows ) { return 0 ; }
+  //
+  RooRealVar      v ( var ) ;
+  const RooArgSet vset ( v ) ;
+  RooDataSet      column ( "" , "" , vset ) ;
+  for ( unsigned long r = 0 ; r < nrows ; ++r ) 
+  {
+    v.setVal     ( values [ r ] ) ;
+    column.add   ( vset         ) ;
+  }
+  //
+  // NB: RooDataSet::merge returns true in case of error
+  return data->merge ( &column ) ? 0 : nrows ;
+}
+// ============================================================================
+/*  get the column of RooAbsData into the array 
+ *  @param data   (INPUT)  the dataset
+ *  @param name   (INPUT)  the variable name 
+ *  @param values (OUTPUT) the values: one per entry 
+ *  @param nrows  (INPUT)  the size of the array
+ *  @return number of rows filled 
+ */
+// ============================================================================
+unsigned long 
+Ostap::DataFill::get_column
+( const RooAbsData*   data   , 
+  const std::string&  name   , 
+  double*             values , 
+  const unsigned long nrows  ) 
+{
+  if ( nullptr == data || nullptr == values ) { return 0 ; }
+  const RooArgSet* vars = data->get() ;
+  if ( nullptr == vars ) { return 0 ; }
+  const RooAbsReal* var = dynamic_cast<const RooAbsReal*> ( vars->find ( name.c_str() ) ) ;
+  if ( nullptr == var  ) { return 0 ; }
+  //
+  const unsigned long n = std::min ( nrows , (unsigned long) data->numEntries() ) ;
+  for ( unsigned long r = 0 ; r < n ; ++r ) 
+  {
+    data->get ( r ) ;
+    values [ r ] = var->getVal () ;
+  }
+  //
+  return n ;
+}
+// ============================================================================
+/*  get the values of the integer leaf of TTree/TChain for the given entries
+ *  @param tree    (INPUT)  the tree/chain 
+ *  @param name    (INPUT)  the leaf name 
+ *  @param entries (INPUT)  the entries, one per row 
+ *  @param values  (OUTPUT) the values: one per row 
+ *  @param nrows   (INPUT)  number of rows 
+ *  @return number of rows filled 
+ */
+// ============================================================================
+unsigned long 
+Ostap::DataFill::get_column
+( TTree*              tree    , 
+  const std::string&  name    , 
+  const double*       entries , 
+  Long64_t*           values  , 
+  const unsigned long nrows   ) 
+{
+  if ( nullptr == tree || nullptr == entries || nullptr == values ) { return 0 ; }
+  //
+  TLeaf*   leaf    = nullptr ;
+  Int_t    number  = -1      ;
+  Long64_t current = -1      ;
+  for ( unsigned long r = 0 ; r < nrows ; ++r ) 
+  {
+    const Long64_t entry = static_cast<Long64_t> ( entries [ r ] ) ;
+    if ( entry != current ) 
+    {
+      const Long64_t local = tree->LoadTree ( entry ) ;
+      if ( local < 0 ) { return r ; }                               // RETURN 
+      // new tree in the chain: get the leaf 
+      if ( nullptr == leaf || number != tree->GetTreeNumber() ) 
+      {
+        leaf   = tree->GetLeaf ( name.c_str() ) ;
+        number = tree->GetTreeNumber() ;
+        if ( nullptr == leaf ) { return r ; }                       // RETURN
+      }
+      leaf->GetBranch()->GetEntry ( local ) ;
+      current = entry ;
+    }
+    values [ r ] = leaf->GetValueLong64 () ;
+  }
+  //
+  return nrows ;
+}
+// ============================================================================
+/*  add new branch of doubles to TTree from the array 
+ *  @param tree   (UPDATE) the tree
+ *  @param name   (INPUT)  the branch name 
+ *  @param values (INPUT)  the values: one per entry 
+ *  @param nrows  (INPUT)  number of rows, must be equal to number of entries
+ *  @return number of filled entries 
+ */
+// ============================================================================
+unsigned long 
+Ostap::DataFill::add_branch
+( TTree*              tree   , 
+  const std::string&  name   , 
+  const double*       values , 
+  const unsigned long nrows  ) 
+{
+  if ( nullptr == tree || nullptr == values ) { return 0 ; }
+  if ( (unsigned long) tree->GetEntries() != nrows ) { return 0 ; }
+  if ( nullptr != tree->GetBranch ( name.c_str() ) ) { return 0 ; }
+  //
+  double   value  = 0 ;
+  TBranch* branch = tree->Branch ( name.c_str() , &value , ( name + "/D" ).c_str() ) ;
+  if ( nullptr == branch ) { return 0 ; }
+  //
+  for ( unsigned long r = 0 ; r < nrows ; ++r ) 
+  {
+    value = values [ r ] ;
+    branch->Fill () ;
+  }
+  // the branch must not refer to the local buffer 
+  branch->ResetAddress () ;
+  //
+  return nrows ;
+}
+// ============================================================================
+/*  fill 3D-histogram from the columnar data 
+ *  @param histo   (UPDATE) the histogram
+ *  @param x       (INPUT)  x-values 
+ *  @param y       (INPUT)  y-values 
+ *  @param z       (INPUT)  z-values 
+ *  @param weights (INPUT)  the weights 
+ *  @param nrows   (INPUT)  number of rows
+ *  @return number of filled rows 
+ */
+// ============================================================================
+unsigned long 
+Ostap::DataFill::fill_histo
+( TH3*                histo   , 
+  const double*       x       , 
+  const double*       y       , 
+  const double*       z       , 
+  const double*       weights , 
+  const unsigned long nrows   ) 
+{
+  if ( nullptr == histo || nullptr == x || nullptr == y || nullptr == z || nullptr == weights ) { return 0 ; }
+  //
+  for ( unsigned long r = 0 ; r < nrows ; ++r ) 
+  { histo->Fill ( x [ r ] , y [ r ] , z [ r ] , weights [ r ] ) ; }
+  //
+  return nrows ;
+}
+// ============================================================================
+/*  fill 2D-profile from the columnar data 
+ *  @param histo   (UPDATE) the profile 
+ *  @param x       (INPUT)  x-values 
+ *  @param y       (INPUT)  y-values 
+ *  @param z       (INPUT)  z-values (the profiled quantity)
+ *  @param weights (INPUT)  the weights 
+ *  @param nrows   (INPUT)  number of rows
+ *  @return number of filled rows 
+ */
+// ============================================================================
+unsigned long 
+Ostap::DataFill::fill_histo
+( TProfile2D*         histo   , 
+  const double*       x       , 
+  const double*       y       , 
+  const double*       z       , 
+  const double*       weights , 
+  const unsigned long nrows   ) 
+{
+  if ( nullptr == histo || nullptr == x || nullptr == y || nullptr == z || nullptr == weights ) { return 0 ; }
+  //
+  for ( unsigned long r = 0 ; r < nrows ; ++r ) 
+  { histo->Fill ( x [ r ] , y [ r ] , z [ r ] , weights [ r ] ) ; }
+  //
+  return nrows ;
+}
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
@@ -1759,6 +1759,90 @@ Ostap::Math::WorkSpace&
 Ostap::Math::WorkSpace::operator=
   ( const Ostap::Math::WorkSpace& /* right */ ) { return *this ; }
 // ============================================================================
+// IntegralCache
+// ============================================================================
+namespace 
+{
+  // ==========================================================================
+  /// total number of hits for all caches 
+  unsigned long s_IC_hits   = 0 ;
+  /// total number of misses for all caches 
+  unsigned long s_IC_misses = 0 ;
+  // ==========================================================================
+}
+// ============================================================================
+// constructor with the maximal number of entries 
+// ============================================================================
+Ostap::Math::IntegralCache::IntegralCache 
+( const unsigned short capacity ) 
+  : m_capacity ( capacity ) 
+  , m_hits     ( 0 ) 
+  , m_misses   ( 0 ) 
+  , m_entries  (   )
+{}
+// ============================================================================
+// get the value from the cache 
+// ============================================================================
+bool Ostap::Math::IntegralCache::get 
+( const Ostap::Math::IntegralCache::Key& key   , 
+  double&                                value ) const 
+{
+  for ( auto it = m_entries.begin() ; m_entries.end() != it ; ++it ) 
+  {
+    if ( it->first != key ) { continue ; }
+    // move the entry to the front 
+    if ( m_entries.begin() != it ) 
+    { m_entries.splice ( m_entries.begin() , m_entries , it ) ; }
+    value = m_entries.front().second ;
+    ++m_hits   ;
+    ++s_IC_hits ;
+    return true ;                                                   // RETURN 
+  }
+  ++m_misses   ;
+  ++s_IC_misses ;
+  return false ;
+}
+// ============================================================================
+// add the value into the cache 
+// ============================================================================
+void Ostap::Math::IntegralCache::add 
+( const Ostap::Math::IntegralCache::Key& key   , 
+  const double                           value ) const 
+{
+  if ( 0 == m_capacity ) { return ; }                               // RETURN 
+  m_entries.emplace_front ( key , value ) ;
+  while ( m_capacity < m_entries.size() ) { m_entries.pop_back() ; }
+}
+// ============================================================================
+// remove all entries 
+// ============================================================================
+void Ostap::Math::IntegralCache::clear () const { m_entries.clear() ; }
+// ============================================================================
+// set new maximal number of entries 
+// ============================================================================
+void Ostap::Math::IntegralCache::setCapacity 
+( const unsigned short capacity ) 
+{
+  m_capacity = capacity ;
+  while ( m_capacity < m_entries.size() ) { m_entries.pop_back() ; }
+}
+// ============================================================================
+// total number of hits for all caches 
+// ============================================================================
+unsigned long Ostap::Math::IntegralCache::totalHits   () { return s_IC_hits   ; }
+// ============================================================================
+// total number of misses for all caches 
+// ============================================================================
+unsigned long Ostap::Math::IntegralCache::totalMisses () { return s_IC_misses ; }
+// ============================================================================
+// reset the total statistics 
+// ============================================================================
+void Ostap::Math::IntegralCache::resetTotal () 
+{
+  s_IC_hits   = 0 ;
+  s_IC_misses = 0 ;
+}
+// ============================================================================
 
 
 // ============================================================================
@@ -1938,24 +2022,40 @@ double Ostap::Math::Bukin::pdf ( const double x ) const
   return my_exp ( - s_ln2 * dx * dx * A * A * m_B2 ) ;
 }
 // =========================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Bukin::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_peak , m_sigma , m_xi , m_rho_L , m_rho_R , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // =========================================================================
-double Ostap::Math::Bukin::integral
+double Ostap::Math::Bukin::integral_
 ( const double low  ,
   const double high ) const
 {
   //
   if      ( s_equal ( low , high ) ) { return                 0.0        ; } // RETURN
-  else if (           low > high   ) { return - integral ( high , low  ) ; } // RETURN
+  else if (           low > high   ) { return - integral_ ( high , low  ) ; } // RETURN
   //
   // split into reasonable sub-intervals
   //
   if ( low < m_x1    && m_x1   < high )
-  { return integral (  low , m_x1   ) + integral ( m_x1   , high ) ; }
+  { return integral_ (  low , m_x1   ) + integral_ ( m_x1   , high ) ; }
   if ( low < m_x2    && m_x2   < high )
-  { return integral (  low , m_x2   ) + integral ( m_x2   , high ) ; }
+  { return integral_ (  low , m_x2   ) + integral_ ( m_x2   , high ) ; }
   if ( low < m_peak  && m_peak < high )
-  { return integral (  low , m_peak ) + integral ( m_peak , high ) ; }
+  { return integral_ (  low , m_peak ) + integral_ ( m_peak , high ) ; }
   //
   // the left tail
   //
@@ -2136,16 +2236,32 @@ double Ostap::Math::Novosibirsk::pdf  ( const double x ) const
   //
   return  my_exp ( -0.5 * result ) ;
 }
+// ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Novosibirsk::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_m0 , m_sigma , m_tau , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
 // =========================================================================
 // get the integral between low and high limits
 // =========================================================================
-double Ostap::Math::Novosibirsk::integral
+double Ostap::Math::Novosibirsk::integral_
 ( const double low  ,
   const double high ) const
 {
   //
   if      ( s_equal ( low , high ) ) { return                  0.0 ; } // RETURN
-  else if (           low > high   ) { return - integral ( high ,
+  else if (           low > high   ) { return - integral_ ( high ,
                                                            low   ) ; } // RETURN
   //
   // split into reasonable sub intervals
@@ -2158,14 +2274,14 @@ double Ostap::Math::Novosibirsk::integral
   if      ( low < x_low  && x_low < high )
   {
     return
-      integral (   low , x_low  ) +
-      integral ( x_low ,   high ) ;
+      integral_ (   low , x_low  ) +
+      integral_ ( x_low ,   high ) ;
   }
   else if ( low <  x_high && x_high < high )
   {
     return
-      integral (   low  , x_high  ) +
-      integral ( x_high ,   high  ) ;
+      integral_ (   low  , x_high  ) +
+      integral_ ( x_high ,   high  ) ;
   }
   //
   // split, if the interval is too large
@@ -2174,8 +2290,8 @@ double Ostap::Math::Novosibirsk::integral
   if ( 0 < width &&  3 * width < high - low  )
   {
     return
-      integral ( low                   , 0.5 *  ( high + low ) ) +
-      integral ( 0.5 *  ( high + low ) ,          high         ) ;
+      integral_ ( low                   , 0.5 *  ( high + low ) ) +
+      integral_ ( 0.5 *  ( high + low ) ,          high         ) ;
   }
   //
   //
@@ -2933,15 +3049,31 @@ double Ostap::Math::Apolonios::pdf ( const double x ) const
   return my_exp ( -b() * std::sqrt ( 1 + dx*dx ) ) * s_SQRT2PIi / sigma() ;  
 }
 // ============================================================================
-// get the integral between low and high
+// get the integral between low and high limits (using the cache) 
 // ============================================================================
 double Ostap::Math::Apolonios::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_m0 , m_sigma , m_alpha , m_n , m_b , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
+// get the integral between low and high
+// ============================================================================
+double Ostap::Math::Apolonios::integral_
 ( const double low ,
   const double high ) const
 {
   //
   if      ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  else if (           low > high   ) { return - integral ( high ,
+  else if (           low > high   ) { return - integral_ ( high ,
                                                            low  ) ; } // RETURN
   //
   const double x0 = m_m0 - m_alpha * m_sigma ;
@@ -2949,7 +3081,7 @@ double Ostap::Math::Apolonios::integral
   // split into proper subintervals
   //
   if      ( low < x0 && x0 < high )
-  { return integral ( low , x0 ) + integral ( x0 , high ) ; }
+  { return integral_ ( low , x0 ) + integral_ ( x0 , high ) ; }
   //
   // Z = (x-x0)/sigma 
   //
@@ -3099,24 +3231,40 @@ double Ostap::Math::Apolonios2::pdf ( const double x ) const
   return my_exp ( beta() * ( beta()  - std::sqrt ( b2 () + dx * dx ) ) ) * s_SQRT2PIi / sigma()  ;  
 }
 // ============================================================================
-// get the integral between low and high
+// get the integral between low and high limits (using the cache) 
 // ============================================================================
 double Ostap::Math::Apolonios2::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_m0 , m_sigmaL , m_sigmaR , m_beta , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
+// get the integral between low and high
+// ============================================================================
+double Ostap::Math::Apolonios2::integral_
 ( const double low ,
   const double high ) const
 {
   //
   if      ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  else if (           low > high   ) { return - integral ( high ,
+  else if (           low > high   ) { return - integral_ ( high ,
                                                            low  ) ; } // RETURN
   //
   const double xR = m_m0 + 4.0 * m_sigmaR ;
   if ( low < xR && xR < high ) 
-  { return integral ( low , xR ) + integral ( xR , high ) ; }
+  { return integral_ ( low , xR ) + integral_ ( xR , high ) ; }
   //
   const double xL = m_m0 - 4.0 * m_sigmaL ;
   if ( low < xL && xL < high ) 
-  { return integral ( low , xL ) + integral ( xL , high ) ; }
+  { return integral_ ( low , xL ) + integral_ ( xL , high ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -3208,15 +3356,31 @@ double Ostap::Math::GramCharlierA::pdf ( const double x ) const
 // ============================================================================
 double Ostap::Math::GramCharlierA::integral () const { return 1 ; }
 // ============================================================================
-// integral
+// get the integral between low and high limits (using the cache) 
 // ============================================================================
 double Ostap::Math::GramCharlierA::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_mean , m_sigma , m_kappa3 , m_kappa4 , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
+// integral
+// ============================================================================
+double Ostap::Math::GramCharlierA::integral_
 ( const double low  ,
   const double high ) const
 {
   //
   if      ( s_equal ( low , high ) ) { return                  0.0 ; } // RETURN
-  else if (           low > high   ) { return - integral ( high ,
+  else if (           low > high   ) { return - integral_ ( high ,
                                                            low   ) ; } // RETURN
   //
   const double x_low  = m_mean - 5 * m_sigma ;
@@ -3227,14 +3391,14 @@ double Ostap::Math::GramCharlierA::integral
   if      ( low < x_low  && x_low < high )
   {
     return
-      integral (   low , x_low  ) +
-      integral ( x_low ,   high ) ;
+      integral_ (   low , x_low  ) +
+      integral_ ( x_low ,   high ) ;
   }
   else if ( low <  x_high && x_high < high )
   {
     return
-      integral (   low  , x_high  ) +
-      integral ( x_high ,   high  ) ;
+      integral_ (   low  , x_high  ) +
+      integral_ ( x_high ,   high  ) ;
   }
   //
   //
@@ -3244,8 +3408,8 @@ double Ostap::Math::GramCharlierA::integral
   if ( 0 < width &&  3 * width < high - low  )
   {
     return
-      integral ( low                   , 0.5 *  ( high + low ) ) +
-      integral ( 0.5 *  ( high + low ) ,          high         ) ;
+      integral_ ( low                   , 0.5 *  ( high + low ) ) +
+      integral_ ( 0.5 *  ( high + low ) ,          high         ) ;
   }
   //
   // use GSL to evaluate the integral
@@ -4245,18 +4409,34 @@ bool Ostap::Math::BreitWigner::setGamma0 ( const double x )
   return true ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::BreitWigner::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_m0 , m_gam0 , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::BreitWigner::integral
+double Ostap::Math::BreitWigner::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( m_m1 + m_m2 >= high ) { return                              0   ; }
-  if ( m_m1 + m_m2 >  low  ) { return integral  ( m_m1 + m_m2 , high ) ; }
+  if ( m_m1 + m_m2 >  low  ) { return integral_  ( m_m1 + m_m2 , high ) ; }
   //
   //
   // split into reasonable sub intervals
@@ -4269,14 +4449,14 @@ double  Ostap::Math::BreitWigner::integral
   if ( low < x_low  && x_low < high )
   {
     return
-      integral (   low , x_low  ) +
-      integral ( x_low ,   high ) ;
+      integral_ (   low , x_low  ) +
+      integral_ ( x_low ,   high ) ;
   }
   if ( low <  x_high && x_high < high )
   {
     return
-      integral (   low  , x_high  ) +
-      integral ( x_high ,   high  ) ;
+      integral_ (   low  , x_high  ) +
+      integral_ ( x_high ,   high  ) ;
   }
   //
   // split, if interval too large
@@ -4285,8 +4465,8 @@ double  Ostap::Math::BreitWigner::integral
   if ( 0 < width &&  3 * width < high - low  )
   {
     return
-      integral ( low                   , 0.5 *  ( high + low ) ) +
-      integral ( 0.5 *  ( high + low ) ,          high         ) ;
+      integral_ ( low                   , 0.5 *  ( high + low ) ) +
+      integral_ ( 0.5 *  ( high + low ) ,          high         ) ;
   }
   //
   // use GSL to evaluate the integral
@@ -4729,27 +4909,43 @@ double Ostap::Math::Flatte::flatte2 ( const double x ) const
   return x * ps * std::norm ( amp ) * 2 / M_PI * m0g1 () * g2og1 () ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Flatte::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_m0 , m_m0g1 , m_g2og1 , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::Flatte::integral
+double Ostap::Math::Flatte::integral_
 ( const double low  ,
   const double high ) const
 {
   //
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   const double a = threshold() ;
   if ( a >= high ) { return                     0 ; }
-  if ( a >  low  ) { return integral ( a , high ) ; }
+  if ( a >  low  ) { return integral_ ( a , high ) ; }
   //
   const double b = std::max ( thresholdA () , thresholdB () ) ;
   if ( low < b     && b    < high ) 
-  { return integral ( low , b ) + integral ( b , high ) ; }
+  { return integral_ ( low , b ) + integral_ ( b , high ) ; }
   //
   if ( low < m_m0  && m_m0 < high ) 
-  { return integral ( low , m_m0 ) + integral ( m_m0 , high ) ; }
+  { return integral_ ( low , m_m0 ) + integral_ ( m_m0 , high ) ; }
   //
   const double width =
     0 > m_m0 ? 0.0 :
@@ -4759,9 +4955,9 @@ double  Ostap::Math::Flatte::integral
   for ( unsigned int i = 0 ; ( i < 5 ) && ( 0 < width ) ; ++ i ) 
   {
     const double x1 = m_m0 + i * width ;
-    if ( low < x1  && x1 < high ) { return integral ( low , x1 ) + integral ( x1 , high ) ; }
+    if ( low < x1  && x1 < high ) { return integral_ ( low , x1 ) + integral_ ( x1 , high ) ; }
     const double x2 = m_m0 - i * width ;
-    if ( low < x2  && x2 < high ) { return integral ( low , x2 ) + integral ( x2 , high ) ; }
+    if ( low < x2  && x2 < high ) { return integral_ ( low , x2 ) + integral_ ( x2 , high ) ; }
   }
   //
   const double x_low  = 0 < width ? m_m0 - 20 * width : low  ;
@@ -4959,15 +5155,31 @@ double Ostap::Math::Voigt::operator() ( const double x ) const
     ( std::complex<double> ( x - m_m0 , m_gamma ) * s1 ).real() * s2 ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Voigt::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_m0 , m_gamma , m_sigma , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::Voigt::integral
+double Ostap::Math::Voigt::integral_
 ( const double low  ,
   const double high ) const
 {
   //
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   const double width = std::max ( m_sigma , m_gamma ) ;
@@ -4980,14 +5192,14 @@ double  Ostap::Math::Voigt::integral
   if      ( low <  x_low  && x_low  < high )
   {
     return
-      integral (   low  , x_low   ) +
-      integral ( x_low  ,   high  ) ;
+      integral_ (   low  , x_low   ) +
+      integral_ ( x_low  ,   high  ) ;
   }
   else if ( low <  x_high && x_high < high )
   {
     return
-      integral (   low  , x_high  ) +
-      integral ( x_high ,   high  ) ;
+      integral_ (   low  , x_high  ) +
+      integral_ ( x_high ,   high  ) ;
   }
   //
   // split, if interval too large
@@ -4995,8 +5207,8 @@ double  Ostap::Math::Voigt::integral
   if ( 0 < width && 10 * width < high - low  )
   {
     return
-      integral ( low                   , 0.5 *  ( high + low ) ) +
-      integral ( 0.5 *  ( high + low ) ,          high         ) ;
+      integral_ ( low                   , 0.5 *  ( high + low ) ) +
+      integral_ ( 0.5 *  ( high + low ) ,          high         ) ;
   }
   //
   // use GSL to evaluate the integral
@@ -5587,19 +5799,35 @@ double Ostap::Math::Swanson::swanson ( const double x ) const
   return 2 * x * std::norm ( a ) * g / m_bw.gam0() / M_PI ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Swanson::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_beta0 , m_m1 , m_m2 , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::Swanson::integral
+double Ostap::Math::Swanson::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   const double x_min  = m_bw.m1() + m_bw.m2() ;
   if ( x_min >= high ) { return                        0   ; }
-  if ( x_min >  low  ) { return integral  ( x_min , high ) ; }
+  if ( x_min >  low  ) { return integral_  ( x_min , high ) ; }
   //
   // split into reasonable sub intervals
   //
@@ -5608,10 +5836,10 @@ double  Ostap::Math::Swanson::integral
   const double x5   = x_min +  5 * ( m_m1 + m_m2 ) ;
   const double x10  = x_min + 10 * ( m_m1 + m_m2 ) ;
   //
-  if ( low <  x1 &&  x1 < high ) { return integral ( low ,  x1 ) + integral (  x1 , high ) ; }
-  if ( low <  x2 &&  x2 < high ) { return integral ( low ,  x2 ) + integral (  x2 , high ) ; }
-  if ( low <  x5 &&  x5 < high ) { return integral ( low ,  x5 ) + integral (  x5 , high ) ; }
-  if ( low < x10 && x10 < high ) { return integral ( low , x10 ) + integral ( x10 , high ) ; }
+  if ( low <  x1 &&  x1 < high ) { return integral_ ( low ,  x1 ) + integral_ (  x1 , high ) ; }
+  if ( low <  x2 &&  x2 < high ) { return integral_ ( low ,  x2 ) + integral_ (  x2 , high ) ; }
+  if ( low <  x5 &&  x5 < high ) { return integral_ ( low ,  x5 ) + integral_ (  x5 , high ) ; }
+  if ( low < x10 && x10 < high ) { return integral_ ( low , x10 ) + integral_ ( x10 , high ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -5847,20 +6075,36 @@ double Ostap::Math::LASS::operator () ( const double x ) const
   return result * std::norm ( amplitude( x ) ) ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::LASS::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_m0 , m_g0 , m_a , m_r , m_e , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::LASS::integral
+double Ostap::Math::LASS::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( high <= m_ps2.lowEdge  () ) { return 0 ; }
   //
   if ( low  <  m_ps2.lowEdge  () )
-  { return integral ( m_ps2.lowEdge() , high ) ; }
+  { return integral_ ( m_ps2.lowEdge() , high ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -6125,23 +6369,39 @@ double Ostap::Math::LASS23L::operator () ( const double x ) const
   return result * std::norm ( amplitude( x ) ) ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::LASS23L::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m0 () , g0 () , a () , r () , e () , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::LASS23L::integral
+double Ostap::Math::LASS23L::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( high <= m_ps.lowEdge  () ) { return 0 ; }
   if ( low  >= m_ps.highEdge () ) { return 0 ; }
   //
   if ( low  <  m_ps.lowEdge  () )
-  { return integral ( m_ps.lowEdge() , high             ) ; }
+  { return integral_ ( m_ps.lowEdge() , high             ) ; }
   if ( high >  m_ps.highEdge () )
-  { return integral ( low            , m_ps.highEdge () ) ; }
+  { return integral_ ( low            , m_ps.highEdge () ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -6404,20 +6664,36 @@ bool Ostap::Math::Bugg::setA ( const double x )
   return true ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Bugg::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_M , m_g2 , m_b1 , m_b2 , m_s1 , m_s2 , m_a , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::Bugg::integral
+double Ostap::Math::Bugg::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( high <= lowEdge  () ) { return 0 ; }
   //
   if ( low  <  lowEdge  () )
-  { return integral ( lowEdge() , high        ) ; }
+  { return integral_ ( lowEdge() , high        ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -6532,24 +6808,40 @@ double Ostap::Math::Bugg23L::pdf ( const double x ) const
   return result * std::norm ( amplitude ( x ) ) ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Bugg23L::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { M () , g2 () , b1 () , b2 () , s1 () , s2 () , a () , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::Bugg23L::integral
+double Ostap::Math::Bugg23L::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( high <= lowEdge  () ) { return 0 ; }
   if ( low  >= highEdge () ) { return 0 ; }
   //
   if ( low  <  lowEdge  () )
-  { return integral ( lowEdge() , high        ) ; }
+  { return integral_ ( lowEdge() , high        ) ; }
   //
   if ( high >  highEdge () )
-  { return integral ( low       , highEdge () ) ; }
+  { return integral_ ( low       , highEdge () ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -6678,24 +6970,40 @@ double Ostap::Math::BW23L::operator() ( const double x ) const
   return bw * m_ps ( x ) ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::BW23L::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m0 () , gam0 () , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::BW23L::integral
+double Ostap::Math::BW23L::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( high <= lowEdge  () ) { return 0 ; }
   if ( low  >= highEdge () ) { return 0 ; }
   //
   if ( low  <  lowEdge  () )
-  { return integral ( lowEdge() , high        ) ; }
+  { return integral_ ( lowEdge() , high        ) ; }
   //
   if ( high >  highEdge () )
-  { return integral ( low       , highEdge () ) ; }
+  { return integral_ ( low       , highEdge () ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -6804,24 +7112,40 @@ double Ostap::Math::Flatte23L::operator() ( const double x ) const
   return m_ps ( x ) * std::norm ( amp ) * 2 / M_PI * m0g1() ;
 }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Flatte23L::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m0 () , m0g1 () , g2og1 () , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::Flatte23L::integral
+double Ostap::Math::Flatte23L::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( high <= lowEdge  () ) { return 0 ; }
   if ( low  >= highEdge () ) { return 0 ; }
   //
   if ( low  <  lowEdge  () )
-  { return integral ( lowEdge() , high        ) ; }
+  { return integral_ ( lowEdge() , high        ) ; }
   //
   if ( high >  highEdge () )
-  { return integral ( low       , highEdge () ) ; }
+  { return integral_ ( low       , highEdge () ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -7008,25 +7332,41 @@ double Ostap::Math::Gounaris23L::operator() ( const double x ) const
   return x * ps * std::norm ( amp ) * 2 / M_PI  ;
 }
 
+// ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Gounaris23L::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_M , m_g0 , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
 // ============================================================================
 // get the integral between low and high limits
 // ============================================================================
-double  Ostap::Math::Gounaris23L::integral
+double Ostap::Math::Gounaris23L::integral_
 ( const double low  ,
   const double high ) const
 {
   if ( s_equal ( low , high ) ) { return                 0.0 ; } // RETURN
-  if (           low > high   ) { return - integral ( high ,
+  if (           low > high   ) { return - integral_ ( high ,
                                                       low  ) ; } // RETURN
   //
   if ( high <= lowEdge  () ) { return 0 ; }
   if ( low  >= highEdge () ) { return 0 ; }
   //
   if ( low  <  lowEdge  () )
-  { return integral ( lowEdge() , high        ) ; }
+  { return integral_ ( lowEdge() , high        ) ; }
   //
   if ( high >  highEdge () )
-  { return integral ( low       , highEdge () ) ; }
+  { return integral_ ( low       , highEdge () ) ; }
   //
   // use GSL to evaluate the integral
   //
@@ -8616,24 +8956,40 @@ double Ostap::Math::Atlas::pdf        ( const double x ) const
   return std::exp ( -0.5 * x2 ) / ( s_ATLAS * m_sigma )  ;
 }
 // ============================================================================
-double Ostap::Math::Atlas::integral ( const double low  ,
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Atlas::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_mean , m_sigma , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
+double Ostap::Math::Atlas::integral_ ( const double low  ,
                                       const double high ) const 
 {
   //
   if      ( s_equal ( low ,high ) ) { return 0 ; }
-  else if ( low > high            ) { return -integral ( high , low ) ; }
+  else if ( low > high            ) { return -integral_ ( high , low ) ; }
   //
   // split 
   if ( low < m_mean && m_mean < high ) 
-  { return integral ( low , m_mean ) + integral ( m_mean , high ) ; }
+  { return integral_ ( low , m_mean ) + integral_ ( m_mean , high ) ; }
   //
   const double left  = m_mean - 5 * m_sigma ;  
   if ( low < left   &&  left < high ) 
-  { return integral ( low , left   ) + integral ( left   , high ) ; }
+  { return integral_ ( low , left   ) + integral_ ( left   , high ) ; }
   //
   const double right = m_mean + 5 * m_sigma ;  
   if ( low < right  && right  < high ) 
-  { return integral ( low , right  ) + integral ( right  , high ) ; }
+  { return integral_ ( low , right  ) + integral_ ( right  , high ) ; }
   //
   //
   // use GSL to evaluate the integral
@@ -10358,14 +10714,30 @@ bool Ostap::Math::Tsallis::setT ( const double value )
 double Ostap::Math::Tsallis::pdf ( const double x ) const 
 { return x <= 0 ? 0.0 : x * std::pow ( 1.0 + eTkin ( x ) / ( m_T * m_n ) , -m_n ) ; }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::Tsallis::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_mass , m_n , m_T , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 //  get Tsallis integrals  
 // ============================================================================
-double Ostap::Math::Tsallis::integral 
+double Ostap::Math::Tsallis::integral_ 
 ( const double low  , 
   const double high ) const
 {
   if      ( s_equal ( low , high ) ) { return 0 ; }
-  else if ( high < low             ) { return - integral ( high , low ) ; }
+  else if ( high < low             ) { return - integral_ ( high , low ) ; }
   else if ( high <= xmin ()        ) { return 0 ; }
   //
   const double _low = std::max ( low , xmin () ) ;
@@ -10379,7 +10751,7 @@ double Ostap::Math::Tsallis::integral
     {
       const double middle = m_mass * p ;
       if (  _low < middle && middle < high ) 
-      { return integral ( _low , middle ) + integral ( middle , high ) ; }
+      { return integral_ ( _low , middle ) + integral_ ( middle , high ) ; }
     }
   }
   //
@@ -10463,14 +10835,30 @@ bool Ostap::Math::QGSM::setB ( const double value )
 double Ostap::Math::QGSM::pdf ( const double x ) const 
 { return x <= 0 ? 0.0 : x * std::exp ( -m_b * eTkin ( x ) ) ; }
 // ============================================================================
+// get the integral between low and high limits (using the cache) 
+// ============================================================================
+double Ostap::Math::QGSM::integral
+( const double low  ,
+  const double high ) const
+{
+  const Ostap::Math::IntegralCache::Key key { m_mass , m_b , low , high } ;
+  double result = 0 ;
+  if ( m_cache.get ( key , result ) ) { return result ; }         // RETURN 
+  //
+  result = integral_ ( low , high ) ;
+  m_cache.add ( key , result ) ;
+  //
+  return result ;
+}
+// ============================================================================
 //  get QGSM integrals  
 // ============================================================================
-double Ostap::Math::QGSM::integral 
+double Ostap::Math::QGSM::integral_ 
 ( const double low  , 
   const double high ) const
 {
   if      ( s_equal ( low , high ) ) { return 0 ; }
-  else if ( high < low             ) { return - integral ( high , low ) ; }
+  else if ( high < low             ) { return - integral_ ( high , low ) ; }
   else if ( high <= xmin()         ) { return 0 ; }
   //
   const double _low = std::max ( low , xmin() ) ;
@@ -10484,7 +10872,7 @@ double Ostap::Math::QGSM::integral
     {
       const double middle = m_mass * p ;
       if (  _low < middle && middle < high ) 
-      { return integral ( _low , middle ) + integral ( middle , high ) ; }
+      { return integral_ ( _low , middle ) + integral_ ( middle , high ) ; }
     }
   }
   //
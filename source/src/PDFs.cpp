@@ -28,6 +28,58 @@
  *  @date   2011-11-30
  */
 // ============================================================================
+namespace 
+{
+  // ==========================================================================
+  /** evaluate the function for the array of x-values
+   *  @param fun    (INPUT)  the function
+   *  @param x      (INPUT)  the array of x-values 
+   *  @param result (OUTPUT) the array of results 
+   *  @param n      (INPUT)  the size of arrays 
+   *  @return number of evaluated points 
+   *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+   *  @date   2018-05-20
+   */
+  template <class FUNCTION>
+  inline unsigned long _batch_ 
+  ( FUNCTION&           fun    , 
+    const double*       x      , 
+    double*             result , 
+    const unsigned long n      ) 
+  {
+    if ( nullptr == x || nullptr == result ) { return 0 ; }
+    for ( unsigned long i = 0 ; i < n ; ++i ) { result [ i ] = fun ( x [ i ] ) ; }
+    return n ;
+  }
+  // ==========================================================================
+#if OSTAP_MODELS_BATCH 
+  // ==========================================================================
+  /** get the batch of x-values for RooFit batch interface 
+   *  @return the empty span if some parameters are not scalars 
+   *  (e.g. depend on other observables), 
+   *  and the parameters can't be set once per batch 
+   *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+   *  @date   2018-05-20
+   */
+  RooSpan<const double> _xbatch_ 
+  ( const RooAbsArg&  pdf       , 
+    const RooAbsReal& x         , 
+    const std::size_t begin     , 
+    const std::size_t batchSize ) 
+  {
+    for ( const RooAbsArg* a : pdf.servers() ) 
+    {
+      if ( a == &x ) { continue ; }
+      const RooAbsReal* p = dynamic_cast<const RooAbsReal*> ( a ) ;
+      if ( nullptr != p && !p->getValBatch ( begin , batchSize ).empty() ) { return {} ; }
+    }
+    return x.getValBatch ( begin , batchSize ) ;
+  }
+  // ==========================================================================
+#endif 
+  // ==========================================================================
+}
+// ============================================================================
 ClassImp(Ostap::Models::BreitWigner) ;
 ClassImp(Ostap::Models::Rho0) ;
 ClassImp(Ostap::Models::Kstar) ;
@@ -210,6 +262,37 @@ Double_t Ostap::Models::BreitWigner::evaluate() const
   return m_bw ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::BreitWigner::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_bw , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::BreitWigner::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_bw , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::BreitWigner::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -487,6 +570,37 @@ Double_t Ostap::Models::BW23L::evaluate() const
   return m_bw ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::BW23L::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_bw , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::BW23L::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_bw , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::BW23L::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -579,6 +693,37 @@ Double_t Ostap::Models::Flatte::evaluate() const
   return m_flatte ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Flatte::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_flatte , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Flatte::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_flatte , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Flatte::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -680,6 +825,37 @@ Double_t Ostap::Models::Flatte2::evaluate() const
   return m_flatte2 ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Flatte2::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_flatte2 , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Flatte2::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_flatte2 , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Flatte2::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -796,6 +972,37 @@ Double_t Ostap::Models::LASS::evaluate() const
   return m_lass ( m_x  ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::LASS::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_lass , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::LASS::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_lass , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::LASS::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -913,6 +1120,37 @@ Double_t Ostap::Models::LASS23L::evaluate() const
   return m_lass ( m_x  ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::LASS23L::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_lass , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::LASS23L::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_lass , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::LASS23L::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1028,6 +1266,37 @@ Double_t Ostap::Models::Bugg::evaluate() const
   return m_bugg ( m_x  ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Bugg::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_bugg , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Bugg::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_bugg , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Bugg::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1146,6 +1415,37 @@ Double_t Ostap::Models::Bugg23L::evaluate() const
   return m_bugg ( m_x  ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Bugg23L::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_bugg , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Bugg23L::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_bugg , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Bugg23L::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1251,6 +1551,37 @@ Double_t Ostap::Models::Voigt::evaluate() const
   return m_voigt    ( m_x     ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Voigt::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_voigt , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Voigt::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_voigt , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Voigt::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1345,6 +1676,37 @@ Double_t Ostap::Models::PseudoVoigt::evaluate() const
   return m_voigt    ( m_x     ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PseudoVoigt::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_voigt , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PseudoVoigt::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_voigt , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PseudoVoigt::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1456,6 +1818,37 @@ Double_t Ostap::Models::Swanson::evaluate() const
   return m_swanson ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Swanson::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_swanson , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Swanson::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_swanson , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Swanson::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1553,6 +1946,37 @@ Double_t Ostap::Models::CrystalBall::evaluate() const
   return m_cb ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::CrystalBall::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_cb , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::CrystalBall::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_cb , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::CrystalBall::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1653,6 +2077,37 @@ Double_t Ostap::Models::CrystalBallRS::evaluate() const
   return m_cb ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::CrystalBallRS::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_cb , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::CrystalBallRS::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_cb , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::CrystalBallRS::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1758,6 +2213,37 @@ Double_t Ostap::Models::CrystalBallDS::evaluate() const
   return m_cb2     ( m_x      ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::CrystalBallDS::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_cb2 , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::CrystalBallDS::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_cb2 , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::CrystalBallDS::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1862,6 +2348,37 @@ Double_t Ostap::Models::Needham::evaluate() const
   return m_needham     ( m_x      ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Needham::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_needham , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Needham::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_needham , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Needham::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -1976,6 +2493,37 @@ Double_t Ostap::Models::Apolonios::evaluate() const
   return m_apo ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Apolonios::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_apo , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Apolonios::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_apo , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Apolonios::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2074,6 +2622,37 @@ Double_t Ostap::Models::Apolonios2::evaluate() const
   return m_apo2 ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Apolonios2::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_apo2 , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Apolonios2::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_apo2 , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Apolonios2::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2169,17 +2748,48 @@ Double_t Ostap::Models::BifurcatedGauss::evaluate() const
   return m_bg    ( m_x      ) ;
 }
 // ============================================================================
-Int_t Ostap::Models::BifurcatedGauss::getAnalyticalIntegral
-( RooArgSet&     allVars      , 
-  RooArgSet&     analVars     ,
-  const char* /* rangename */ ) const 
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::BifurcatedGauss::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
 {
-  if ( matchArgs ( allVars , analVars , m_x ) ) { return 1 ; }
-  return 0 ;
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_bg , x , result , n ) ;
 }
+#if OSTAP_MODELS_BATCH 
 // ============================================================================
-Double_t Ostap::Models::BifurcatedGauss::analyticalIntegral 
-( Int_t       code      , 
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::BifurcatedGauss::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_bg , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
+Int_t Ostap::Models::BifurcatedGauss::getAnalyticalIntegral
+( RooArgSet&     allVars      , 
+  RooArgSet&     analVars     ,
+  const char* /* rangename */ ) const 
+{
+  if ( matchArgs ( allVars , analVars , m_x ) ) { return 1 ; }
+  return 0 ;
+}
+// ============================================================================
+Double_t Ostap::Models::BifurcatedGauss::analyticalIntegral 
+( Int_t       code      , 
   const char* rangeName ) const 
 {
   assert ( code == 1 ) ;
@@ -2264,6 +2874,37 @@ Double_t Ostap::Models::GenGaussV1::evaluate() const
   return m_ggv1    ( m_x      ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::GenGaussV1::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_ggv1 , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::GenGaussV1::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_ggv1 , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::GenGaussV1::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2360,6 +3001,37 @@ Double_t Ostap::Models::GenGaussV2::evaluate() const
   return m_ggv2    ( m_x      ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::GenGaussV2::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_ggv2 , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::GenGaussV2::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_ggv2 , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::GenGaussV2::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2559,6 +3231,37 @@ Double_t Ostap::Models::Bukin::evaluate() const
   return m_bukin    ( m_x     ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Bukin::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_bukin , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Bukin::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_bukin , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Bukin::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2650,6 +3353,37 @@ Double_t Ostap::Models::StudentT::evaluate() const
   return m_stt   ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::StudentT::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_stt , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::StudentT::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_stt , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::StudentT::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2749,6 +3483,37 @@ Double_t Ostap::Models::BifurcatedStudentT::evaluate() const
   return m_stt   ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::BifurcatedStudentT::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_stt , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::BifurcatedStudentT::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_stt , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::BifurcatedStudentT::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2849,6 +3614,37 @@ Double_t Ostap::Models::GramCharlierA::evaluate() const
   return m_gca ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::GramCharlierA::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_gca , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::GramCharlierA::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_gca , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::GramCharlierA::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -2998,6 +3794,37 @@ Double_t Ostap::Models::PhaseSpaceLeft::evaluate() const
   return m_left ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PhaseSpaceLeft::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_left , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PhaseSpaceLeft::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_left , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PhaseSpaceLeft::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -3084,6 +3911,37 @@ Double_t Ostap::Models::PhaseSpaceRight::evaluate() const
   return m_right ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PhaseSpaceRight::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_right , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PhaseSpaceRight::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_right , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PhaseSpaceRight::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -3171,6 +4029,37 @@ Double_t Ostap::Models::PhaseSpaceNL::evaluate() const
   return m_ps ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PhaseSpaceNL::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_ps , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PhaseSpaceNL::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_ps , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PhaseSpaceNL::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -3584,6 +4473,37 @@ Double_t Ostap::Models::PhaseSpacePol::evaluate () const
   return m_ps ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PhaseSpacePol::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_ps , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PhaseSpacePol::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_ps , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PhaseSpacePol::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -3695,6 +4615,37 @@ Double_t Ostap::Models::PolyPositive::evaluate() const
   return m_positive ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PolyPositive::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_positive , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PolyPositive::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_positive , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PolyPositive::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -3806,6 +4757,37 @@ Double_t Ostap::Models::PolyPositiveEven::evaluate() const
   return m_even ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PolyPositiveEven::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_even , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PolyPositiveEven::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_even , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PolyPositiveEven::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -3916,6 +4898,37 @@ Double_t Ostap::Models::PolyMonothonic::evaluate() const
   return m_monothonic ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PolyMonothonic::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_monothonic , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PolyMonothonic::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_monothonic , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PolyMonothonic::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4028,6 +5041,37 @@ Double_t Ostap::Models::PolyConvex::evaluate() const
   return m_convex ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PolyConvex::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_convex , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PolyConvex::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_convex , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PolyConvex::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4139,6 +5183,37 @@ Double_t Ostap::Models::PolyConvexOnly::evaluate() const
   return m_convex ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PolyConvexOnly::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_convex , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PolyConvexOnly::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_convex , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PolyConvexOnly::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4258,6 +5333,37 @@ Double_t Ostap::Models::PolySigmoid::evaluate() const
   return m_sigmoid ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PolySigmoid::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_sigmoid , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PolySigmoid::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_sigmoid , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PolySigmoid::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4375,6 +5481,37 @@ Double_t Ostap::Models::PositiveSpline::evaluate() const
   return m_spline ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::PositiveSpline::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_spline , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::PositiveSpline::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_spline , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::PositiveSpline::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4494,6 +5631,37 @@ Double_t Ostap::Models::MonothonicSpline::evaluate() const
   return m_spline ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::MonothonicSpline::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_spline , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::MonothonicSpline::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_spline , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::MonothonicSpline::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4609,6 +5777,37 @@ Double_t Ostap::Models::ConvexSpline::evaluate() const
   return m_spline ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::ConvexSpline::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_spline , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::ConvexSpline::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_spline , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::ConvexSpline::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4724,6 +5923,37 @@ Double_t Ostap::Models::ConvexOnlySpline::evaluate() const
   return m_spline ( m_x ) ; 
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::ConvexOnlySpline::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_spline , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::ConvexOnlySpline::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_spline , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::ConvexOnlySpline::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4843,6 +6073,37 @@ Double_t Ostap::Models::ExpoPositive::evaluate() const
   return m_positive ( m_x   ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::ExpoPositive::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_positive , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::ExpoPositive::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_positive , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::ExpoPositive::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -4968,6 +6229,37 @@ Double_t Ostap::Models::TwoExpoPositive::evaluate() const
   return m_2expopos( m_x   ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::TwoExpoPositive::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_2expopos , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::TwoExpoPositive::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_2expopos , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::TwoExpoPositive::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5055,6 +6347,37 @@ Double_t Ostap::Models::GammaDist::evaluate() const
   return m_gamma   ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::GammaDist::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_gamma , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::GammaDist::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_gamma , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::GammaDist::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5151,6 +6474,37 @@ Double_t Ostap::Models::GenGammaDist::evaluate() const
   return m_ggamma   ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::GenGammaDist::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_ggamma , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::GenGammaDist::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_ggamma , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::GenGammaDist::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5249,6 +6603,37 @@ Double_t Ostap::Models::Amoroso::evaluate() const
   return m_amoroso   ( m_x     ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Amoroso::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_amoroso , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Amoroso::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_amoroso , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Amoroso::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5339,6 +6724,37 @@ Double_t Ostap::Models::LogGammaDist::evaluate() const
   return m_gamma   ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::LogGammaDist::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_gamma , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::LogGammaDist::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_gamma , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::LogGammaDist::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5427,6 +6843,37 @@ Double_t Ostap::Models::Log10GammaDist::evaluate() const
   return m_gamma   ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Log10GammaDist::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_gamma , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Log10GammaDist::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_gamma , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Log10GammaDist::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5518,6 +6965,37 @@ Double_t Ostap::Models::LogGamma::evaluate() const
   return m_lgamma    ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::LogGamma::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_lgamma , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::LogGamma::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_lgamma , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::LogGamma::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5613,6 +7091,37 @@ Double_t Ostap::Models::BetaPrime::evaluate() const
   return m_betap    ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::BetaPrime::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_betap , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::BetaPrime::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_betap , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::BetaPrime::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5708,6 +7217,37 @@ Double_t Ostap::Models::SinhAsinh::evaluate() const
   return m_sinhasinh ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::SinhAsinh::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_sinhasinh , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::SinhAsinh::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_sinhasinh , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::SinhAsinh::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5803,6 +7343,37 @@ Double_t Ostap::Models::JohnsonSU::evaluate() const
   return m_johnsonSU ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::JohnsonSU::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_johnsonSU , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::JohnsonSU::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_johnsonSU , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::JohnsonSU::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5890,6 +7461,37 @@ Double_t Ostap::Models::Landau::evaluate() const
   return m_landau ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Landau::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_landau , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Landau::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_landau , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Landau::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -5977,6 +7579,37 @@ Double_t Ostap::Models::Atlas::evaluate() const
   return m_atlas ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Atlas::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_atlas , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Atlas::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_atlas , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Atlas::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -6065,6 +7698,37 @@ Double_t Ostap::Models::Sech::evaluate() const
   return m_sech ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Sech::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_sech , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Sech::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_sech , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Sech::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -6153,6 +7817,37 @@ Double_t Ostap::Models::Logistic::evaluate() const
   return m_logistic ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Logistic::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_logistic , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Logistic::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_logistic , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Logistic::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -6245,6 +7940,37 @@ Double_t Ostap::Models::Argus::evaluate() const
   return m_argus ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Argus::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_argus , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Argus::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_argus , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Argus::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -6337,6 +8063,37 @@ Double_t Ostap::Models::Tsallis::evaluate() const
   return m_tsallis ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::Tsallis::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_tsallis , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::Tsallis::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_tsallis , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::Tsallis::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -6425,6 +8182,37 @@ Double_t Ostap::Models::QGSM::evaluate() const
   return m_qgsm ( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::QGSM::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_qgsm , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::QGSM::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_qgsm , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::QGSM::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -6518,6 +8306,37 @@ Double_t Ostap::Models::TwoExpos::evaluate() const
   return m_2expos( m_x ) ;
 }
 // ============================================================================
+// batch evaluation: the parameters are set only once 
+// ============================================================================
+unsigned long Ostap::Models::TwoExpos::evaluate
+( const double*       x      , 
+  double*             result , 
+  const unsigned long n      ) const 
+{
+  //
+  setPars() ;
+  //
+  return _batch_ ( m_2expos , x , result , n ) ;
+}
+#if OSTAP_MODELS_BATCH 
+// ============================================================================
+// RooFit batch interface: the parameters are set only once per batch
+// ============================================================================
+RooSpan<double> Ostap::Models::TwoExpos::evaluateBatch 
+( std::size_t begin     , 
+  std::size_t batchSize ) const 
+{
+  const RooSpan<const double> xs = _xbatch_ ( *this , m_x.arg() , begin , batchSize ) ;
+  if ( xs.empty() ) { return RooAbsPdf::evaluateBatch ( begin , batchSize ) ; }
+  //
+  setPars() ;
+  //
+  RooSpan<double> output = _batchData.makeWritableBatchUnInit ( begin , xs.size() ) ;
+  _batch_ ( m_2expos , xs.data() , output.data() , xs.size() ) ;
+  return output ;
+}
+#endif
+// ============================================================================
 Int_t Ostap::Models::TwoExpos::getAnalyticalIntegral
 ( RooArgSet&     allVars      , 
   RooArgSet&     analVars     ,
@@ -6,6 +6,7 @@
 // ============================================================================
 #include <vector>
 #include <memory>
+#include <algorithm>
 // ============================================================================
 // ROOT 
 // ============================================================================
@@ -958,6 +959,99 @@ unsigned long Ostap::StatVar::_statCov
   const std::string _cuts = cuts.GetTitle() ;
   return _statCov ( tree , vars , _cuts , stats , covs , first , last ) ;
 }
+// ============================================================================
+/*  single-pass multi-accumulator: build the statistics for 
+ *  many (expression,cuts) pairs in one loop over the tree
+ *  - each distinct expression/cut is evaluated only once per entry 
+ *  - empty cut means ``no selection''
+ *  - the weight of the tree (TTree::GetWeight) is not applied
+ *  @param tree        (INPUT)  the tree 
+ *  @param expressions (INPUT)  the list of expressions 
+ *  @param cuts        (INPUT)  the list of cuts, one per expression
+ *  @param stats       (UPDATE) the statistics, one per expression 
+ *  @return number of processed events 
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date   2018-05-20
+ */
+// ============================================================================
+unsigned long Ostap::StatVar::statVars
+( TTree*                                  tree        ,  
+  const std::vector<std::string>&         expressions ,
+  const std::vector<std::string>&         cuts        ,
+  std::vector<Ostap::StatVar::Statistic>& stats       , 
+  const unsigned long                     first       ,
+  const unsigned long                     last        )
+{
+  //
+  const unsigned long n = expressions.size() ;
+  stats.clear  (     ) ;
+  stats.resize ( n   ) ;
+  if ( 0 == tree || last <= first || 0 == n ) { return 0 ; }    // RETURN 
+  if ( cuts.size() != n                     ) { return 0 ; }    // RETURN 
+  //
+  // the distinct formulas: expressions and cuts  
+  std::vector<std::string>                      names    ;
+  std::vector<std::unique_ptr<Ostap::Formula> > formulas ;
+  auto _index = [&names,&formulas,tree] ( const std::string& e ) -> long 
+    {
+      if ( e.empty() ) { return -1 ; }
+      auto ifind = std::find ( names.begin() , names.end() , e ) ;
+      if ( names.end() != ifind ) { return ifind - names.begin() ; }
+      auto f = std::unique_ptr<Ostap::Formula> ( new Ostap::Formula ( "" , e , tree ) ) ;
+      if ( !f || !f->ok() ) { return -2 ; }
+      names   .push_back ( e ) ;
+      formulas.push_back ( std::move ( f ) ) ;
+      return formulas.size() - 1 ;
+    } ;
+  //
+  std::vector<long> iexpr ( n , -1 ) ;
+  std::vector<long> icut  ( n , -1 ) ;
+  for ( unsigned long i = 0 ; i < n ; ++i ) 
+  {
+    iexpr [ i ] = _index ( expressions [ i ] ) ;
+    icut  [ i ] = _index ( cuts        [ i ] ) ;
+    if ( iexpr [ i ] < 0 || -2 == icut [ i ] ) { return 0 ; }   // RETURN
+  }
+  //
+  std::vector<TObject*> tobjs ;
+  for ( auto& f : formulas ) { tobjs.push_back ( f.get() ) ; }
+  Notifier notifier ( tobjs.begin() , tobjs.end() , tree ) ;
+  //
+  // the values of formulas for the current entry (evaluated on demand)
+  const unsigned long nf = formulas.size() ;
+  std::vector<double> values ( nf , 0.0   ) ;
+  std::vector<bool>   done   ( nf , false ) ;
+  auto _value = [&values,&done,&formulas] ( const long i ) -> double 
+    {
+      if ( !done [ i ] ) { values [ i ] = formulas [ i ]->evaluate() ; done [ i ] = true ; }
+      return values [ i ] ;
+    } ;
+  //
+  const unsigned long nEntries = 
+    std::min ( last , (unsigned long) tree->GetEntries() ) ;
+  //
+  unsigned long processed = 0 ;
+  for ( unsigned long entry = first ; entry < nEntries ; ++entry )   
+  {
+    long ievent = tree->GetEntryNumber ( entry ) ;
+    if ( 0 > ievent ) { break ; }                              // BREAK
+    //
+    ievent      = tree->LoadTree ( ievent ) ;
+    if ( 0 > ievent ) { break ; }                              // BREAK
+    //
+    std::fill ( done.begin() , done.end() , false ) ;
+    //
+    for ( unsigned long i = 0 ; i < n ; ++i ) 
+    {
+      const double w = 0 <= icut [ i ] ? _value ( icut [ i ] ) : 1.0 ;
+      const double v = !w ? 0.0 : _value ( iexpr [ i ] ) ;
+      stats [ i ].add ( v , w ) ;
+    }
+    ++processed ;
+  } //                                    the end of loop over entries in TTree
+  //
+  return processed ;
+}
 // ========================================================================
 /*  calculate the covariances for generic case 
  *  @param data  (INPUT)  the inpout dataset 
@@ -0,0 +1,58 @@
+// $Id:$ 
+// ============================================================================
+// Include files
+// ============================================================================
+// STD & STL 
+// ============================================================================
+#include <vector>
+// ============================================================================
+// ROOT 
+// ============================================================================
+#include "TMVA/Reader.h"
+// ============================================================================
+// Local: 
+// ============================================================================
+#include "Ostap/TMVAEval.h"
+// ============================================================================
+/** @file
+ *  Implementation file for class Ostap::TMVAEval
+ *  @see Ostap::TMVAEval
+ *  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
+ *  @date   2018-05-20
+ */
+// ============================================================================
+/*  evaluate the booked TMVA method for the columnar data 
+ *  @param reader (INPUT)  TMVA reader with booked method 
+ *  @param method (INPUT)  the method name (as booked)
+ *  @param values (INPUT)  the data, column-by-column 
+ *  @param ncols  (INPUT)  number of columns (variables)
+ *  @param nrows  (INPUT)  number of rows 
+ *  @param result (OUTPUT) the response: one per row 
+ *  @return number of evaluated rows 
+ */
+// ============================================================================
+unsigned long 
+Ostap::TMVAEval::evaluate 
+( TMVA::Reader&       reader , 
+  const std::string&  method , 
+  const double*       values , 
+  const unsigned long ncols  , 
+  const unsigned long nrows  , 
+  double*             result ) 
+{
+  if ( nullptr == values || nullptr == result || 0 == nrows || 0 == ncols ) { return 0 ; }
+  //
+  const TString       tag ( method ) ;
+  std::vector<float>  row ( ncols , 0.0f ) ;
+  for ( unsigned long r = 0 ; r < nrows ; ++r ) 
+  {
+    for ( unsigned long i = 0 ; i < ncols ; ++i ) 
+    { row [ i ] = values [ i * nrows + r ] ; }
+    result [ r ] = reader.EvaluateMVA ( row , tag ) ;
+  }
+  //
+  return nrows ;
+}
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
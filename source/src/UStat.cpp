@@ -9,6 +9,8 @@
 #include <algorithm>
 #include <numeric>
 #include <memory>
+#include <limits>
+#include <thread>
 // ============================================================================
 // ROOT & RooFit 
 // ============================================================================
@@ -40,27 +42,127 @@
 namespace 
 {
   // ==========================================================================
-  double getDistance ( const RooArgSet* x , 
-                       const RooArgSet* y )
+  /** @class KDTree
+   *  simple static k-d tree for nearest-neighbour queries 
+   *  - the points are stored in the contiguous array row-by-row 
+   *  - the tree is implicit: the node for the range <code>[lo,hi)</code>
+   *    is the median element <code>(lo+hi)/2</code> of the index array
+   *  - the split axis is the axis with the largest spread 
+   */
+  class KDTree 
   {
-    if ( 0 == x || 0 == y ) { return -1 ; } // RETURN 
-    //
-    double result = 0.;
-    //
-    Ostap::Utils::Iterator xIter ( *x ) ;
-    Ostap::Utils::Iterator yIter ( *y ) ;
-    //
-    RooRealVar* xVar = 0 ;
-    RooRealVar* yVar = 0 ;
-    while ( ( xVar = (RooRealVar*)xIter -> Next() ) && 
-            ( yVar = (RooRealVar*)yIter -> Next() )    ) 
+  public:
+    // ========================================================================
+    KDTree ( const std::vector<double>& points , 
+             const unsigned int         dim    ) 
+      : m_points ( points                )
+      , m_dim    ( dim                   ) 
+      , m_index  ( points.size () / dim  ) 
+      , m_axis   ( points.size () / dim  , 0 ) 
     {
-      const double val  = xVar->getVal() - yVar->getVal() ;
-      result           += val*val ;
+      std::iota ( m_index.begin() , m_index.end() , 0u ) ;
+      build ( 0 , m_index.size() ) ;
     }
-    //
-    return std::sqrt ( result ) ;
-  }
+    // ========================================================================
+    /** squared distance from the point <code>i</code> to its 
+     *  nearest neighbour (the point itself is excluded) 
+     *  @attention the result is 1.e+200 if there are no other points 
+     */
+    double nearest2 ( const unsigned int i ) const 
+    {
+      double best = 1.e+200 ;
+      search ( 0 , m_index.size() , &m_points [ i * m_dim ] , i , best ) ;
+      return best ;
+    }
+    // ========================================================================
+  private:
+    // ========================================================================
+    inline double coord ( const unsigned int i , const unsigned int k ) const 
+    { return m_points [ i * m_dim + k ] ; }
+    // ========================================================================
+    inline double dist2 ( const double* q , const unsigned int i ) const 
+    {
+      const double* p = &m_points [ i * m_dim ] ;
+      double result = 0 ;
+      for ( unsigned int k = 0 ; k < m_dim ; ++k ) 
+      {
+        const double val = q [ k ] - p [ k ] ;
+        result += val * val ;
+      }
+      return result ;
+    }
+    // ========================================================================
+    void build ( const std::size_t lo , const std::size_t hi ) 
+    {
+      if ( hi <= lo + 1 ) { return ; }
+      //
+      // find the axis with the largest spread 
+      unsigned int axis   =  0 ;
+      double       spread = -1 ;
+      for ( unsigned int k = 0 ; k < m_dim ; ++k ) 
+      {
+        double vmin = std::numeric_limits<double>::max    () ;
+        double vmax = std::numeric_limits<double>::lowest () ;
+        for ( std::size_t j = lo ; j < hi ; ++j ) 
+        {
+          const double v = coord ( m_index [ j ] , k ) ;
+          vmin = std::min ( vmin , v ) ;
+          vmax = std::max ( vmax , v ) ;
+        }
+        if ( spread < vmax - vmin ) { spread = vmax - vmin ; axis = k ; }
+      }
+      //
+      const std::size_t mid = ( lo + hi ) / 2 ;
+      std::nth_element ( m_index.begin () + lo  , 
+                         m_index.begin () + mid , 
+                         m_index.begin () + hi  , 
+                         [this,axis] ( const unsigned int a , const unsigned int b ) 
+                         { return coord ( a , axis ) < coord ( b , axis ) ; } ) ;
+      m_axis [ mid ] = axis ;
+      //
+      build ( lo      , mid ) ;
+      build ( mid + 1 , hi  ) ;
+    }
+    // ========================================================================
+    void search ( const std::size_t  lo   , 
+                  const std::size_t  hi   , 
+                  const double*      q    , 
+                  const unsigned int self , 
+                  double&            best ) const 
+    {
+      if ( hi <= lo ) { return ; }
+      //
+      const std::size_t  mid = ( lo + hi ) / 2 ;
+      const unsigned int p   = m_index [ mid ] ;
+      if ( p != self ) 
+      {
+        const double d2 = dist2 ( q , p ) ;
+        if ( d2 < best ) { best = d2 ; }
+      }
+      if ( hi == lo + 1 ) { return ; }
+      //
+      const unsigned int axis = m_axis [ mid ] ;
+      const double       diff = q [ axis ] - coord ( p , axis ) ;
+      if ( diff < 0 ) 
+      {
+        search ( lo      , mid , q , self , best ) ;
+        if ( diff * diff < best ) { search ( mid + 1 , hi  , q , self , best ) ; }
+      }
+      else 
+      {
+        search ( mid + 1 , hi  , q , self , best ) ;
+        if ( diff * diff < best ) { search ( lo      , mid , q , self , best ) ; }
+      }
+    }
+    // ========================================================================
+  private:
+    // ========================================================================
+    const std::vector<double>& m_points ; // the points 
+    const unsigned int         m_dim    ; // the dimension 
+    std::vector<unsigned int>  m_index  ; // the index array 
+    std::vector<unsigned int>  m_axis   ; // the split axes 
+    // ========================================================================
+  } ;
   // ==========================================================================
   /// get the volume of n-ball with unit radius 
   double nBallVolume ( const unsigned int n )
@@ -75,19 +177,25 @@ namespace
 } //                                                 end of anonymous namespace  
 // ============================================================================
 /*  calculate U-statistics 
- *  @param pdf   (input) PDF
- *  @param data  (input) data 
- *  @param hist  (update) the histogram with U-statistics 
- *  @param args  (input)  the arguments
- *  @param tStat (output,optional) value for T-statistics 
+ *  - the observables are extracted into the contiguous array once
+ *  - PDF is evaluated for all events in one pass 
+ *  - the nearest neighbours are found using k-d tree, 
+ *    optionally the queries are split between several threads 
+ *  @param pdf      (input) PDF
+ *  @param data     (input) data 
+ *  @param hist     (update) the histogram with U-statistics 
+ *  @param tStat    (update) value for T-statistics 
+ *  @param args     (input)  the arguments
+ *  @param nthreads (input)  number of threads for nearest-neighbour queries
  */
 // ============================================================================
 Ostap::StatusCode Ostap::UStat::calculate
-( const RooAbsPdf&  pdf   , 
-  const RooDataSet& data  ,  
-  TH1&              hist  ,
-  double&           tStat ,
-  RooArgSet*        args  ) 
+( const RooAbsPdf&     pdf      , 
+  const RooDataSet&    data     ,  
+  TH1&                 hist     ,
+  double&              tStat    ,
+  RooArgSet*           args     , 
+  const unsigned short nthreads ) 
 {
   //
   if ( 0 == args ) { args = pdf.getObservables ( data ) ; }
@@ -100,65 +208,79 @@ Ostap::StatusCode Ostap::UStat::calculate
   typedef std::vector<double> TStat ;
   TStat tstat ;
   //
-  const RooDataSet*  cloned = (RooDataSet*)data.Clone() ;
-  //
   const unsigned int num    = data.numEntries () ;
   //
-  const RooArgSet * event_x = 0 ;
-  const RooArgSet * event_y = 0 ;
+  // 1. extract the observables into the contiguous array 
+  //    and evaluate PDF for all events 
+  std::vector<RooRealVar*> vars ;
+  {
+    Ostap::Utils::Iterator iter  ( *args ) ;
+    RooRealVar * var = 0 ;
+    while ( (var = (RooRealVar*)iter->Next() ) ) { vars.push_back ( var ) ; }
+  }
   //
+  std::vector<double> points    ( num * dim ) ;
+  std::vector<double> pdfValues ( num       ) ;
+  std::vector<const RooAbsReal*> columns ( dim , nullptr ) ;
   for ( unsigned int i = 0 ; i < num ; ++i ) 
   {
     //
-    // 1. Get "Event"
-    event_x = data . get(i) ;      
-    if ( 0 == event_x || 0 == event_x->getSize() ) 
+    const RooArgSet* event = data . get(i) ;      
+    if ( 0 == event || 0 == event->getSize() ) 
     { return Ostap::StatusCode ( InvalidItem1 ) ; }             // RETURN 
     //
-    std::unique_ptr<RooArgSet> event_i ( ( RooArgSet*)event_x->selectCommon( *args ) ) ;
-    if ( !event_i || 0 == event_i->getSize() ) 
-    { return Ostap::StatusCode ( InvalidItem2 ) ; }             // RETURN 
-    //
-    // 2.Evaluate PDF 
-    Ostap::Utils::Iterator iter  ( *args ) ;
-    RooRealVar * var = 0 ;
-    while ( (var = (RooRealVar*)iter->Next() ) ) 
-    { var->setVal( event_i->getRealValue( var->GetName() ) ); }
-    //
-    const double pdfValue = pdf . getVal( args ) ;
+    // NB: the event is the same object for all entries  
+    if ( 0 == i ) 
+    {
+      for ( unsigned int k = 0 ; k < dim ; ++k ) 
+      {
+        columns [ k ] = dynamic_cast<const RooAbsReal*>( event->find ( vars [ k ]->GetName() ) ) ;
+        if ( 0 == columns [ k ] ) { return Ostap::StatusCode ( InvalidItem2 ) ; } // RETURN 
+      }
+    }
     //
-    double min_distance  = 1.e+100 ;
-    for ( unsigned int j = 0 ; j < num ; ++j ) 
+    for ( unsigned int k = 0 ; k < dim ; ++k ) 
     {
-      if ( i == j ) { continue ; }
-      //
-      event_y = cloned->get(j) ;      
-      if ( 0 == event_y || 0 == event_y->getSize() ) 
-      { return Ostap::StatusCode ( InvalidItem1 ) ; }            // RETURN 
-      //
-      std::unique_ptr<RooArgSet> event_j ( ( RooArgSet*)event_y->selectCommon( *args ) ) ;
-      if ( !event_j || 0 == event_j->getSize() )  
-      { return Ostap::StatusCode ( InvalidItem2 ) ; }            // RETURN 
-      //
-      const double distance = getDistance ( event_i.get() , event_j.get() ) ;
-      if ( 0 > distance ) { return Ostap::StatusCode( InvalidDist ) ; }  // RETURN 
-      //
-      if ( 0 == j || distance < min_distance ) 
-      { min_distance = distance  ; }
-      //
+      const double value = columns [ k ]->getVal () ;
+      points [ i * dim + k ] = value ;
+      vars   [ k ] -> setVal ( value ) ;
     }
     //
+    pdfValues [ i ] = pdf . getVal( args ) ;
+  }
+  //
+  // 2. nearest neighbours: k-d tree 
+  const KDTree        tree  ( points , dim ) ;
+  std::vector<double> dist2 ( num , 1.e+200 ) ;
+  auto query = [&tree,&dist2] ( const unsigned int first , const unsigned int last ) 
+    { for ( unsigned int i = first ; i < last ; ++i ) { dist2 [ i ] = tree.nearest2 ( i ) ; } } ;
+  //
+  const unsigned int nt = std::max ( 1u , std::min ( (unsigned int) nthreads , num ) ) ;
+  if ( 1 == nt ) { query ( 0 , num ) ; }
+  else 
+  {
+    const unsigned int chunk = ( num + nt - 1 ) / nt ;
+    std::vector<std::thread> threads ;
+    for ( unsigned int first = 0 ; first < num ; first += chunk ) 
+    { threads.emplace_back ( query , first , std::min ( first + chunk , num ) ) ; }
+    for ( auto& t : threads ) { t.join () ; }
+  }
+  //
+  // 3. U-statistics 
+  for ( unsigned int i = 0 ; i < num ; ++i ) 
+  {
+    const double min_distance = std::sqrt ( dist2 [ i ] ) ;
+    //
     // volume of n-ball: 
     const double val1 = volume * Ostap::Math::pow ( min_distance , dim ) ;
     //
-    const double value = std::exp ( -val1 * num * pdfValue ) ;
+    const double value = std::exp ( -val1 * num * pdfValues [ i ] ) ;
     //
     hist.Fill ( value ) ;
     //
     tstat.push_back ( value ) ; 
     //
   } 
-  delete cloned ;
   //
   // calculate T-statistics
   //
@@ -59,6 +59,19 @@ Ostap::WStatEntity::WStatEntity ( const Ostap::StatEntity& values )
                 values.nEntries () , 1 , 1 ) 
 {}
 // ============================================================================
+// full constructor from all important values 
+// ============================================================================
+Ostap::WStatEntity::WStatEntity 
+( const double             sum     , 
+  const double             sum2    , 
+  const Ostap::StatEntity& values  , 
+  const Ostap::StatEntity& weights ) 
+  : m_sum     ( sum     ) 
+  , m_sum2    ( sum2    ) 
+  , m_values  ( values  ) 
+  , m_weights ( weights )  
+{}
+// ============================================================================
 // update statistics 
 // ============================================================================
 Ostap::WStatEntity&
@@ -13,6 +13,7 @@
 #include "Ostap/Choose.h"
 #include "Ostap/Clenshaw.h"
 #include "Ostap/Combine.h"
+#include "Ostap/DataFill.h"
 #include "Ostap/Digit.h"
 #include "Ostap/EigenSystem.h"
 #include "Ostap/Error2Exception.h"
@@ -59,6 +60,7 @@
 #include "Ostap/SVectorWithError.h"
 #include "Ostap/SymmetricMatrixTypes.h"
 #include "Ostap/Tee.h"
+#include "Ostap/TMVAEval.h"
 #include "Ostap/ToStream.h"
 #include "Ostap/TypeWrapper.h"
 #include "Ostap/ValueWithError.h"